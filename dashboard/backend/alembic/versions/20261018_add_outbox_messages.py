@@ -0,0 +1,46 @@
+"""add outbox_messages table
+
+Revision ID: 20261018_outbox
+Revises: 20260329_onboarding
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision = '20261018_outbox'
+down_revision = '20260329_onboarding'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create transactional outbox table"""
+    op.create_table(
+        'outbox_messages',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('destination', sa.String(64), nullable=False),
+        sa.Column('payload', JSONB(), nullable=False, server_default='{}'),
+        sa.Column('status', sa.String(20), nullable=False, server_default='pending'),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('max_attempts', sa.Integer(), nullable=False, server_default='8'),
+        sa.Column('available_at', sa.DateTime(), nullable=False, server_default=sa.text('NOW()')),
+        sa.Column('locked_until', sa.DateTime(), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('NOW()')),
+        sa.Column('delivered_at', sa.DateTime(), nullable=True),
+    )
+
+    # Dispatcher claim query: pending/expired messages ordered by availability
+    op.create_index('idx_outbox_messages_status_available', 'outbox_messages', ['status', 'available_at'])
+    # Queue depth metrics and dead-letter listing
+    op.create_index('idx_outbox_messages_destination_status', 'outbox_messages', ['destination', 'status'])
+
+
+def downgrade():
+    """Drop transactional outbox table"""
+    op.drop_index('idx_outbox_messages_destination_status', 'outbox_messages')
+    op.drop_index('idx_outbox_messages_status_available', 'outbox_messages')
+    op.drop_table('outbox_messages')
@@ -10,7 +10,8 @@ from typing import List
 from database import get_db_session
 from services.oauth_service import oauth_service, OAuthService
 from services.api_key_service import api_key_service, get_user_from_api_key
-from services.auth_service import login_for_access_token, get_current_user
+from fastapi.security import HTTPAuthorizationCredentials
+from services.auth_service import login_for_access_token, get_current_user, security, token_cache
 from schemas import (
     LoginRequest, TokenResponse, OAuthLoginRequest, OAuthUrlResponse,
     ApiKeyCreate, ApiKeyResponse, UserCreate, UserResponse, RefreshTokenRequest
@@ -118,9 +119,11 @@ async def refresh_token(
 
 @router.post("/logout")
 async def logout(
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     """Logout current user (client should discard token)"""
+    token_cache.invalidate(credentials.credentials)
     logger.info("User logged out", user_id=current_user.id, username=current_user.username)
     # Note: JWT tokens are stateless, so logout is handled client-side by discarding the token
     # For more advanced logout (token blacklist), implement Redis-based token blacklist
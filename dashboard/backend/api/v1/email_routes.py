@@ -18,6 +18,7 @@ from services.email_service import (
     send_test_report,
     send_password_reset
 )
+from services.outbox_service import enqueue_test_report
 from models import User
 from core.logging_config import get_logger
 
@@ -174,19 +175,20 @@ async def send_test_report_endpoint(
     try:
         logger.info(f"Test report email requested by user {current_user.id} to {request.email}")
         
-        # Send email in background
-        background_tasks.add_task(
-            send_test_report,
-            request.email,
-            request.project_name,
-            request.execution_date,
-            request.total_tests,
-            request.passed,
-            request.failed,
-            request.duration,
-            request.report_url,
-            request.failed_tests
+        # Deliver through the outbox so the email survives restarts and retries
+        enqueue_test_report(
+            db,
+            to_email=request.email,
+            project_name=request.project_name,
+            execution_date=request.execution_date,
+            total_tests=request.total_tests,
+            passed=request.passed,
+            failed=request.failed,
+            duration=request.duration,
+            report_url=request.report_url,
+            failed_tests=request.failed_tests
         )
+        await db.commit()
         
         return {
             "success": True,
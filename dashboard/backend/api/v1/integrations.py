@@ -5,6 +5,7 @@ Provides REST API endpoints for managing and using integrations.
 SECURITY FIX: Added authentication to all endpoints - BETA LAUNCH PREP 2026-03-27
 """
 from fastapi import APIRouter, HTTPException, Depends, Body
+from fastapi.responses import StreamingResponse
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel
 
@@ -37,6 +38,7 @@ class SyncRequest(BaseModel):
     providers: Optional[List[str]] = None
     project_key: Optional[str] = None
     cycle_name: Optional[str] = None
+    bulk: bool = False
 
 
 class TestCaseRequest(BaseModel):
@@ -283,7 +285,8 @@ async def sync_results(
             results=request.results,
             providers=request.providers,
             project_key=request.project_key,
-            cycle_name=request.cycle_name
+            cycle_name=request.cycle_name,
+            bulk=request.bulk
         )
 
         # Convert SyncResult objects to dictionaries
@@ -304,6 +307,36 @@ async def sync_results(
         raise HTTPException(status_code=500, detail=f"Error syncing results: {str(e)}")
 
 
+@router.post("/sync/stream")
+async def stream_sync_results(
+    request: SyncRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db_session)
+):
+    """
+    Synchronize test results and stream per-result outcomes (AUTH REQUIRED).
+
+    Providers are synced concurrently and every outcome is emitted as one
+    NDJSON line as soon as it completes.
+
+    Args:
+        request: Sync request with results and target providers
+
+    Returns:
+        application/x-ndjson stream of ResultSyncOutcome objects
+    """
+    async def outcome_lines():
+        async for outcome in integration_manager.stream_sync_results(
+            results=request.results,
+            providers=request.providers,
+            project_key=request.project_key,
+            cycle_name=request.cycle_name
+        ):
+            yield outcome.model_dump_json() + "\n"
+
+    return StreamingResponse(outcome_lines(), media_type="application/x-ndjson")
+
+
 @router.post("/sync/bulk")
 async def bulk_sync(
     request: BulkSyncRequest,
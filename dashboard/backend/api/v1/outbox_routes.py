@@ -0,0 +1,63 @@
+"""
+Outbox Routes
+
+Admin endpoints for the transactional outbox: queue stats and dead letters.
+"""
+
+from typing import Optional, List
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import get_db_session as get_db
+from services.auth_service import get_current_user
+from services.outbox_service import outbox_dispatcher, list_dead_letters, requeue_dead_letters
+from models import User
+
+router = APIRouter(prefix="/outbox", tags=["Outbox"])
+
+
+class RequeueRequest(BaseModel):
+    message_ids: Optional[List[int]] = None
+    destination: Optional[str] = None
+
+
+def _require_admin(current_user: User):
+    if not current_user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only admins can manage the outbox",
+        )
+
+
+@router.get("/stats")
+async def get_outbox_stats(current_user: User = Depends(get_current_user)):
+    """Queue depth and lag per destination (admin only)."""
+    _require_admin(current_user)
+    queue = await outbox_dispatcher.get_queue_stats()
+    return {"dispatcher": outbox_dispatcher.get_stats(), **queue}
+
+
+@router.get("/dead-letters")
+async def get_dead_letters(
+    destination: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """List dead-lettered messages (admin only)."""
+    _require_admin(current_user)
+    messages = await list_dead_letters(db, destination=destination, limit=limit)
+    return {"items": [message.to_dict() for message in messages], "total": len(messages)}
+
+
+@router.post("/dead-letters/requeue")
+async def requeue_outbox_dead_letters(
+    request: RequeueRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Move dead-lettered messages back to the queue (admin only)."""
+    _require_admin(current_user)
+    requeued = await requeue_dead_letters(db, message_ids=request.message_ids, destination=request.destination)
+    return {"requeued": requeued}
@@ -0,0 +1,82 @@
+"""
+Profiler Routes
+
+Admin endpoints for the sampling profiler: start/stop, status and
+flamegraph export. Each call reaches one worker; responses carry its pid.
+"""
+
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel, Field
+
+from core.profiler import (
+    GROUP_BY_TAGS,
+    ProfilerBusyError,
+    ProfilerUnavailableError,
+    sampling_profiler,
+)
+from services.auth_service import get_current_user
+from models import User
+
+router = APIRouter(prefix="/profiler", tags=["Profiler"])
+
+
+class ProfileRequest(BaseModel):
+    duration_seconds: float = Field(30.0, gt=0, le=600)
+    interval_ms: float = Field(10.0, ge=1, le=1000)
+
+
+def _require_admin(current_user: User):
+    if not current_user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only admins can use the profiler",
+        )
+
+
+@router.post("/start")
+async def start_profiler(request: ProfileRequest, current_user: User = Depends(get_current_user)):
+    """Sample this worker for duration_seconds (admin only)."""
+    _require_admin(current_user)
+    try:
+        return sampling_profiler.start(request.duration_seconds, request.interval_ms / 1000)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except ProfilerUnavailableError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+
+
+@router.post("/stop")
+async def stop_profiler(current_user: User = Depends(get_current_user)):
+    """Stop sampling early, keeping the results (admin only)."""
+    _require_admin(current_user)
+    return sampling_profiler.stop()
+
+
+@router.get("/status")
+async def get_profiler_status(
+    limit: int = Query(20, ge=1, le=200),
+    current_user: User = Depends(get_current_user),
+):
+    """Progress, overhead and hottest routes/functions so far (admin only)."""
+    _require_admin(current_user)
+    return sampling_profiler.summary(limit=limit)
+
+
+@router.get("/flamegraph", response_class=PlainTextResponse)
+async def get_flamegraph(
+    group_by: List[str] = Query(["route"]),
+    route: Optional[str] = None,
+    tenant: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+):
+    """Collapsed stacks for flamegraph.pl/speedscope (admin only)."""
+    _require_admin(current_user)
+    unknown = set(group_by) - set(GROUP_BY_TAGS)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"group_by must be among {list(GROUP_BY_TAGS)}",
+        )
+    return PlainTextResponse(sampling_profiler.collapsed(group_by=group_by, route=route, tenant=tenant))
@@ -60,6 +60,43 @@ class Settings(BaseSettings):
     GROQ_API_KEY: Optional[str] = os.getenv("GROQ_API_KEY")
     BROWSER_USE_MODEL: str = os.getenv("BROWSER_USE_MODEL", "llama-3.3-70b-versatile")
 
+    # GitHub (check runs delivered through the outbox)
+    GITHUB_TOKEN: Optional[str] = os.getenv("GITHUB_TOKEN")
+
+    # Shared HTTP connection pools (integrations, GitHub)
+    HTTP_POOL_MAX_CONNECTIONS: int = int(os.getenv("HTTP_POOL_MAX_CONNECTIONS", "100"))
+    HTTP_POOL_MAX_KEEPALIVE: int = int(os.getenv("HTTP_POOL_MAX_KEEPALIVE", "20"))
+    HTTP_POOL_KEEPALIVE_EXPIRY: float = float(os.getenv("HTTP_POOL_KEEPALIVE_EXPIRY", "30"))
+    HTTP2_ENABLED: bool = os.getenv("HTTP2_ENABLED", "true").lower() == "true"
+
+    # API key authentication cache
+    API_KEY_CACHE_TTL: float = float(os.getenv("API_KEY_CACHE_TTL", "30"))
+    API_KEY_LAST_USED_FLUSH_INTERVAL: float = float(os.getenv("API_KEY_LAST_USED_FLUSH_INTERVAL", "5"))
+
+    # Password hashing pool and decoded token cache
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+    PASSWORD_HASH_MAX_QUEUE: int = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "64"))
+    TOKEN_CACHE_TTL: float = float(os.getenv("TOKEN_CACHE_TTL", "60"))
+    TOKEN_CACHE_MAX_ENTRIES: int = int(os.getenv("TOKEN_CACHE_MAX_ENTRIES", "10000"))
+
+    # Batched audit log writer (rows spill to AUDIT_SPILL_PATH while the DB is down)
+    AUDIT_QUEUE_SIZE: int = int(os.getenv("AUDIT_QUEUE_SIZE", "10000"))
+    AUDIT_BATCH_SIZE: int = int(os.getenv("AUDIT_BATCH_SIZE", "500"))
+    AUDIT_FLUSH_INTERVAL: float = float(os.getenv("AUDIT_FLUSH_INTERVAL", "1.0"))
+    AUDIT_SPILL_PATH: Optional[str] = os.getenv("AUDIT_SPILL_PATH")
+
+    # Feature flag hot reload from Redis (seconds between polls, 0 disables)
+    FEATURE_FLAGS_RELOAD_INTERVAL: float = float(os.getenv("FEATURE_FLAGS_RELOAD_INTERVAL", "0"))
+
+    # Failure classification keywords (JSON/YAML with "patterns" and "error_types")
+    FAILURE_CLASSIFIER_CONFIG: Optional[str] = os.getenv("FAILURE_CLASSIFIER_CONFIG")
+
+    # Transactional outbox dispatcher
+    OUTBOX_ENABLED: bool = os.getenv("OUTBOX_ENABLED", "true").lower() == "true"
+    OUTBOX_BATCH_SIZE: int = int(os.getenv("OUTBOX_BATCH_SIZE", "50"))
+    OUTBOX_POLL_INTERVAL: float = float(os.getenv("OUTBOX_POLL_INTERVAL", "1.0"))
+    OUTBOX_MAX_ATTEMPTS: int = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "8"))
+
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
     
     def __init__(self, **kwargs):
@@ -1,13 +1,60 @@
 """
 Feature Flags for QA-Framework
 System for gradual rollout and A/B testing
+
+Flags are compiled into evaluation closures on first use (frozensets for
+user lists and segments, precomputed bucket thresholds), and users are
+bucketed with a seeded CRC32 plus a murmur3 finalizer instead of MD5.
+Evaluations can be memoized per request with ``evaluation_scope()``.
 """
 
-from typing import Dict, Any, Optional, List, Callable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Iterator, Optional, List, Callable, Tuple
 from datetime import datetime
 from enum import Enum
-import hashlib
+import asyncio
 import json
+import zlib
+
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+Evaluator = Callable[[str, Optional[Dict[str, Any]]], bool]
+
+# Memoized evaluations of the current request, keyed by (flag, user, segment)
+_request_evaluations: ContextVar[Optional[Dict[Tuple[str, str, Any], bool]]] = ContextVar(
+    "feature_flag_evaluations", default=None
+)
+
+# Attributes that change how a flag evaluates
+_COMPILED_ATTRIBUTES = frozenset({"name", "enabled", "strategy", "config"})
+
+
+def _mix32(value: int) -> int:
+    """murmur3 32-bit finalizer"""
+    value ^= value >> 16
+    value = (value * 0x85EBCA6B) & 0xFFFFFFFF
+    value ^= value >> 13
+    value = (value * 0xC2B2AE35) & 0xFFFFFFFF
+    value ^= value >> 16
+    return value
+
+
+def bucket_for(seed: int, key: str) -> int:
+    """
+    Stable bucket in [0, 100) for a key
+
+    Args:
+        seed: CRC32 of the flag prefix (see ``FeatureFlag``)
+        key: User identifier
+    """
+    return (_mix32(zlib.crc32(key.encode(), seed)) * 100) >> 32
+
+
+def _disabled(user_id: str, context: Optional[Dict[str, Any]] = None) -> bool:
+    return False
 
 
 class FeatureFlagStrategy(str, Enum):
@@ -43,6 +90,7 @@ class FeatureFlag:
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None
     ):
+        self._evaluator: Optional[Evaluator] = None
         self.name = name
         self.enabled = enabled
         self.strategy = strategy
@@ -51,6 +99,16 @@ class FeatureFlag:
         self.created_at = created_at or datetime.utcnow()
         self.updated_at = updated_at or datetime.utcnow()
     
+    def __setattr__(self, key: str, value: Any) -> None:
+        # Reassigning anything the evaluator was compiled from recompiles it
+        if key in _COMPILED_ATTRIBUTES:
+            object.__setattr__(self, "_evaluator", None)
+        object.__setattr__(self, key, value)
+    
+    def recompile(self) -> None:
+        """Drop the compiled evaluator after mutating ``config`` in place."""
+        self._evaluator = None
+    
     def is_enabled_for_user(self, user_id: str, context: Optional[Dict[str, Any]] = None) -> bool:
         """
         Check if feature is enabled for a specific user.
@@ -62,102 +120,116 @@ class FeatureFlag:
         Returns:
             True if feature is enabled for this user
         """
+        evaluator = self._evaluator
+        if evaluator is None:
+            evaluator = self._evaluator = self._compile()
+        return evaluator(user_id, context)
+    
+    def _compile(self) -> Evaluator:
+        """Build the evaluation closure for the current strategy and config."""
         if not self.enabled:
-            return False
+            return _disabled
         
         if self.strategy == FeatureFlagStrategy.PERCENTAGE:
-            return self._check_percentage(user_id)
+            return self._compile_percentage()
         
         elif self.strategy == FeatureFlagStrategy.USER_LIST:
-            return self._check_user_list(user_id)
+            return self._compile_user_list()
         
         elif self.strategy == FeatureFlagStrategy.USER_SEGMENT:
-            return self._check_user_segment(user_id, context)
+            return self._compile_user_segment()
         
         elif self.strategy == FeatureFlagStrategy.GRADUAL:
-            return self._check_gradual()
+            return self._compile_gradual()
         
         elif self.strategy == FeatureFlagStrategy.A_B_TEST:
-            return self._check_ab_test(user_id)
+            return self._compile_ab_test()
         
-        return False
+        return _disabled
+    
+    @property
+    def _seed(self) -> int:
+        return zlib.crc32(f"{self.name}:".encode())
     
-    def _check_percentage(self, user_id: str) -> bool:
-        """Check percentage-based rollout."""
+    def _compile_percentage(self) -> Evaluator:
+        """Compile percentage-based rollout."""
         percentage = self.config.get("percentage", 0)
+        seed = self._seed
         
-        # Hash user ID to get consistent result
-        hash_value = int(hashlib.md5(f"{self.name}:{user_id}".encode()).hexdigest(), 16)
-        user_bucket = hash_value % 100
+        def evaluate(user_id: str, context: Optional[Dict[str, Any]] = None) -> bool:
+            return bucket_for(seed, user_id) < percentage
         
-        return user_bucket < percentage
+        return evaluate
     
-    def _check_user_list(self, user_id: str) -> bool:
-        """Check user list-based rollout."""
-        allowed_users = self.config.get("users", [])
-        return user_id in allowed_users
+    def _compile_user_list(self) -> Evaluator:
+        """Compile user list-based rollout."""
+        allowed_users = frozenset(self.config.get("users", []))
+        
+        def evaluate(user_id: str, context: Optional[Dict[str, Any]] = None) -> bool:
+            return user_id in allowed_users
+        
+        return evaluate
     
-    def _check_user_segment(self, user_id: str, context: Optional[Dict[str, Any]] = None) -> bool:
-        """Check user segment-based rollout."""
-        if not context:
-            return False
+    def _compile_user_segment(self) -> Evaluator:
+        """Compile user segment-based rollout."""
+        allowed_segments = frozenset(self.config.get("segments", []))
         
-        allowed_segments = self.config.get("segments", [])
-        user_segment = context.get("segment")
+        def evaluate(user_id: str, context: Optional[Dict[str, Any]] = None) -> bool:
+            if not context:
+                return False
+            return context.get("segment") in allowed_segments
         
-        return user_segment in allowed_segments
+        return evaluate
     
-    def _check_gradual(self) -> bool:
-        """Check gradual rollout based on time."""
+    def _compile_gradual(self) -> Evaluator:
+        """Compile gradual rollout based on time."""
         start_date = self.config.get("start_date")
         end_date = self.config.get("end_date")
         start_percentage = self.config.get("start_percentage", 0)
         end_percentage = self.config.get("end_percentage", 100)
         
         if not start_date or not end_date:
-            return False
+            return _disabled
         
         start_dt = datetime.fromisoformat(start_date) if isinstance(start_date, str) else start_date
         end_dt = datetime.fromisoformat(end_date) if isinstance(end_date, str) else end_date
-        
-        now = datetime.utcnow()
-        
-        if now < start_dt:
-            return False
-        
-        if now > end_dt:
-            return end_percentage == 100
-        
-        # Calculate current percentage based on time progress
         total_duration = (end_dt - start_dt).total_seconds()
-        elapsed = (now - start_dt).total_seconds()
-        progress = elapsed / total_duration
-        
-        current_percentage = start_percentage + (end_percentage - start_percentage) * progress
         
         # Use a fixed bucket for gradual (not user-specific)
-        current_bucket = int(hashlib.md5(self.name.encode()).hexdigest(), 16) % 100
+        current_bucket = bucket_for(0, self.name)
         
-        return current_bucket < current_percentage
+        def evaluate(user_id: str, context: Optional[Dict[str, Any]] = None) -> bool:
+            now = datetime.utcnow()
+            
+            if now < start_dt:
+                return False
+            
+            if now > end_dt:
+                return end_percentage == 100
+            
+            # Calculate current percentage based on time progress
+            progress = (now - start_dt).total_seconds() / total_duration
+            current_percentage = start_percentage + (end_percentage - start_percentage) * progress
+            
+            return current_bucket < current_percentage
+        
+        return evaluate
     
-    def _check_ab_test(self, user_id: str) -> bool:
-        """Check A/B test assignment."""
-        variants = self.config.get("variants", ["A", "B"])
+    def _compile_ab_test(self) -> Evaluator:
+        """Compile A/B test assignment."""
         weights = self.config.get("weights", [50, 50])
+        if not weights:
+            return _disabled
         
-        # Hash user ID to get consistent variant
-        hash_value = int(hashlib.md5(f"{self.name}:{user_id}".encode()).hexdigest(), 16)
-        bucket = hash_value % 100
+        # Buckets below the first weight get variant A (control); buckets in
+        # the remaining weights get a test variant
+        control, total = weights[0], sum(weights)
+        seed = self._seed
         
-        # Determine variant based on weights
-        cumulative = 0
-        for i, weight in enumerate(weights):
-            cumulative += weight
-            if bucket < cumulative:
-                # Return True if this is variant B (or the "test" variant)
-                return i > 0
+        def evaluate(user_id: str, context: Optional[Dict[str, Any]] = None) -> bool:
+            return control <= bucket_for(seed, user_id) < total
         
-        return False
+        return evaluate
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -194,21 +266,28 @@ class FeatureFlagManager:
     - Evaluate flags for users
     - Track flag usage
     - Hot reload support
+    
+    ``flags`` is replaced, never mutated, on every change, so evaluations
+    read a consistent snapshot without taking a lock while a reload runs.
     """
     
-    def __init__(self):
+    def __init__(self, redis_key: str = "feature_flags"):
         self.flags: Dict[str, FeatureFlag] = {}
         self.evaluation_count: Dict[str, int] = {}
+        self.redis_key = redis_key
+        self._redis_factory: Optional[Callable[[], Any]] = None
+        self._loaded_payload: Optional[str] = None
+        self._reload_task: Optional[asyncio.Task] = None
     
     def register_flag(self, flag: FeatureFlag) -> None:
         """Register a feature flag."""
-        self.flags[flag.name] = flag
+        self.flags = {**self.flags, flag.name: flag}
         self.evaluation_count[flag.name] = 0
     
     def unregister_flag(self, name: str) -> bool:
         """Unregister a feature flag."""
         if name in self.flags:
-            del self.flags[name]
+            self.flags = {n: f for n, f in self.flags.items() if n != name}
             del self.evaluation_count[name]
             return True
         return False
@@ -221,6 +300,9 @@ class FeatureFlagManager:
         """
         Check if a feature is enabled for a user.
         
+        Inside ``evaluation_scope()`` the result is memoized for the rest
+        of the request.
+        
         Args:
             name: Flag name
             user_id: User identifier
@@ -229,14 +311,37 @@ class FeatureFlagManager:
         Returns:
             True if feature is enabled
         """
-        flag = self.get_flag(name)
+        memo = _request_evaluations.get()
+        if memo is not None:
+            key = (name, user_id, context.get("segment") if context else None)
+            result = memo.get(key)
+            if result is not None:
+                return result
+        
+        flag = self.flags.get(name)
         if not flag:
             return False  # Default to disabled for unknown flags
         
         # Track evaluation
         self.evaluation_count[name] = self.evaluation_count.get(name, 0) + 1
         
-        return flag.is_enabled_for_user(user_id, context)
+        result = flag.is_enabled_for_user(user_id, context)
+        if memo is not None:
+            memo[key] = result
+        return result
+    
+    def evaluate_all(self, user_id: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, bool]:
+        """
+        Evaluate every flag for a user in one pass.
+        
+        Args:
+            user_id: User identifier
+            context: Additional context
+            
+        Returns:
+            Flag name to enabled state
+        """
+        return {name: self.is_enabled(name, user_id, context) for name in self.flags}
     
     def get_all_flags(self) -> List[Dict[str, Any]]:
         """Get all registered flags."""
@@ -262,14 +367,131 @@ class FeatureFlagManager:
             Number of flags imported
         """
         data = json.loads(json_str)
-        count = 0
+        flags = dict(self.flags)
         
         for flag_data in data:
             flag = FeatureFlag.from_dict(flag_data)
-            self.register_flag(flag)
-            count += 1
+            flags[flag.name] = flag
+            self.evaluation_count[flag.name] = 0
+        
+        self.flags = flags
+        return len(data)
+    
+    def replace_flags(self, json_str: str) -> int:
+        """
+        Swap in the flag set described by a JSON export.
+        
+        Flags missing from the export are removed; evaluation counts of
+        flags that stay are kept.
         
-        return count
+        Returns:
+            Number of flags loaded
+        """
+        flags = {}
+        for flag_data in json.loads(json_str):
+            flag = FeatureFlag.from_dict(flag_data)
+            flag.is_enabled_for_user("")  # compile before publishing
+            flags[flag.name] = flag
+        
+        self.evaluation_count = {name: self.evaluation_count.get(name, 0) for name in flags}
+        self.flags = flags
+        return len(flags)
+    
+    def _redis(self):
+        if self._redis_factory is None:
+            from services.cache_service import get_redis_client
+            self._redis_factory = get_redis_client
+        return self._redis_factory()
+    
+    async def publish_to_redis(self) -> None:
+        """Store the current flags in Redis for other workers to load."""
+        payload = self.export_flags()
+        await self._redis().set(self.redis_key, payload)
+        self._loaded_payload = payload
+    
+    async def reload_from_redis(self) -> bool:
+        """
+        Load flags from Redis if they changed since the last load.
+        
+        Returns:
+            True if a new flag set was swapped in
+        """
+        payload = await self._redis().get(self.redis_key)
+        if payload is None:
+            return False
+        if isinstance(payload, bytes):
+            payload = payload.decode()
+        if payload == self._loaded_payload:
+            return False
+        
+        count = self.replace_flags(payload)
+        self._loaded_payload = payload
+        logger.info("Feature flags reloaded", flags=count)
+        return True
+    
+    @property
+    def is_reloading(self) -> bool:
+        return self._reload_task is not None and not self._reload_task.done()
+    
+    def start_hot_reload(
+        self,
+        interval: float = 10.0,
+        redis_factory: Optional[Callable[[], Any]] = None
+    ) -> None:
+        """Poll Redis for flag changes every ``interval`` seconds."""
+        if redis_factory is not None:
+            self._redis_factory = redis_factory
+        if self.is_reloading:
+            return
+        self._reload_task = asyncio.create_task(self._reload_loop(interval))
+    
+    async def stop_hot_reload(self) -> None:
+        if self._reload_task is None:
+            return
+        self._reload_task.cancel()
+        try:
+            await self._reload_task
+        except asyncio.CancelledError:
+            pass
+        self._reload_task = None
+    
+    async def _reload_loop(self, interval: float) -> None:
+        while True:
+            try:
+                await self.reload_from_redis()
+            except Exception as e:
+                # Keep serving the last loaded flags
+                logger.warning("Feature flag reload failed", error=str(e))
+            await asyncio.sleep(interval)
+
+
+@contextmanager
+def evaluation_scope() -> Iterator[Dict[Tuple[str, str, Any], bool]]:
+    """
+    Memoize flag evaluations until the scope exits.
+    
+    Wrap one request (see ``FeatureFlagScopeMiddleware``) so repeated
+    checks of the same flag for the same user are evaluated once.
+    """
+    token = _request_evaluations.set({})
+    try:
+        yield _request_evaluations.get()
+    finally:
+        _request_evaluations.reset(token)
+
+
+class FeatureFlagScopeMiddleware:
+    """ASGI middleware giving each HTTP request its own evaluation scope."""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with evaluation_scope():
+            await self.app(scope, receive, send)
 
 
 # Global feature flag manager
@@ -287,6 +509,11 @@ def is_feature_enabled(name: str, user_id: str, context: Optional[Dict[str, Any]
     return flag_manager.is_enabled(name, user_id, context)
 
 
+def evaluate_all_features(user_id: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, bool]:
+    """Evaluate every registered feature for a user."""
+    return flag_manager.evaluate_all(user_id, context)
+
+
 def register_feature_flag(
     name: str,
     enabled: bool = True,
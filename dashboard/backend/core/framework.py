@@ -0,0 +1,41 @@
+"""
+QA-FRAMEWORK Modules Shared With the Backend
+
+The backend runs with its own directory on sys.path, so ``src`` here is
+the backend's tree rather than the framework's. Modules both sides use are
+kept once, in the framework, and the backend module at the same path
+loads the framework file with ``load_framework_module``.
+"""
+
+import os
+import sys
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+from types import ModuleType
+
+# Repository root (the directory above dashboard/), unless overridden
+FRAMEWORK_ROOT = Path(os.environ.get("QA_FRAMEWORK_PATH") or Path(__file__).resolve().parents[3])
+
+
+def load_framework_module(name: str, relative_path: str) -> ModuleType:
+    """
+    Execute a framework source file as the module ``name``
+
+    Called by the backend module of that name, which the framework module
+    replaces in sys.modules.
+
+    Args:
+        name: Module name to register, normally the caller's ``__name__``
+        relative_path: Source file relative to FRAMEWORK_ROOT
+
+    Raises:
+        ImportError: The framework file does not exist
+    """
+    path = FRAMEWORK_ROOT / relative_path
+    if not path.is_file():
+        raise ImportError(f"QA-FRAMEWORK module not found: {path}", name=name, path=str(path))
+    spec = spec_from_file_location(name, path)
+    module = module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
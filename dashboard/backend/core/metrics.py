@@ -113,6 +113,45 @@ system_load_gauge = Gauge(
     ['period']  # 1m, 5m, 15m
 )
 
+# Transactional outbox
+outbox_queue_depth_gauge = Gauge(
+    'qa_outbox_queue_depth',
+    'Number of outbox messages by destination and status',
+    ['destination', 'status']  # pending, processing, dead
+)
+
+outbox_lag_seconds_gauge = Gauge(
+    'qa_outbox_lag_seconds',
+    'Age in seconds of the oldest undelivered outbox message',
+    ['destination']
+)
+
+outbox_messages_total = Counter(
+    'qa_outbox_messages_total',
+    'Outbox delivery attempts by outcome',
+    ['destination', 'outcome']  # delivered, retried, dead
+)
+
+outbox_delivery_seconds = Histogram(
+    'qa_outbox_delivery_seconds',
+    'Outbox message delivery duration in seconds',
+    ['destination'],
+    buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0]
+)
+
+# Password hashing pool
+password_hash_wait_seconds = Histogram(
+    'qa_password_hash_wait_seconds',
+    'Time password hashing calls wait for a pool worker',
+    buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0]
+)
+
+password_hash_pool_gauge = Gauge(
+    'qa_password_hash_pool',
+    'Password hashing calls by state',
+    ['state']  # queued, active
+)
+
 
 # ============================================================================
 # METRICS MANAGER
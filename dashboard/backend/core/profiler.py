@@ -0,0 +1,355 @@
+"""
+Sampling Profiler - On-demand CPU profiling of a worker
+
+A statistical stack sampler driven by ``SIGPROF``: while active, the
+process CPU timer interrupts the main thread every ``interval`` seconds of
+CPU time and the handler records the interrupted stack. Each sample is
+tagged with the route template and tenant of the request being served
+(see ``ProfilerMiddleware`` and ``tag_request``). Samples are aggregated
+into collapsed stacks that flamegraph.pl, inferno and speedscope read.
+
+Only the main thread is sampled, which is where the event loop and every
+``async def`` endpoint run. Work handed to a thread pool shows up as the
+event loop waiting in its selector.
+
+Each worker process has its own profiler; enable it through the admin
+endpoints (``api/v1/profiler_routes.py``) once per worker.
+"""
+
+import os
+import signal
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Tag used when a sample has no request, route or tenant
+UNTAGGED = "-"
+
+GROUP_BY_TAGS = ("route", "tenant")
+
+
+class ProfilerError(Exception):
+    """Base exception for profiler errors"""
+    pass
+
+
+class ProfilerBusyError(ProfilerError):
+    """Raised when a profile is already running"""
+    pass
+
+
+class ProfilerUnavailableError(ProfilerError):
+    """Raised when signal-based sampling is not possible here"""
+    pass
+
+
+class _RequestTags:
+    """Tags of the request being served; route is read from the scope once routed"""
+
+    __slots__ = ("scope", "tenant")
+
+    def __init__(self, scope: Dict[str, Any]):
+        self.scope = scope
+        self.tenant: Optional[str] = None
+
+
+_request_tags: ContextVar[Optional[_RequestTags]] = ContextVar("profiler_tags", default=None)
+
+
+def tag_request(tenant: Optional[Any] = None) -> None:
+    """
+    Tag the current request's samples (no-op when it is not being profiled)
+
+    Args:
+        tenant: Tenant the request is served for
+    """
+    tags = _request_tags.get()
+    if tags is not None and tenant is not None:
+        tags.tenant = str(tenant)
+
+
+def _frame_name(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """
+    Signal-based stack sampler
+
+    The handler only walks frame pointers and bumps a counter keyed by
+    (route, tenant, code objects); frame names are formatted on export. It
+    keeps its own run time under ``max_overhead`` of the process CPU time
+    by doubling the sampling interval when it gets above it.
+    """
+
+    def __init__(
+        self,
+        max_stacks: int = 50_000,
+        max_depth: int = 128,
+        max_overhead: float = 0.02,
+    ):
+        """
+        Args:
+            max_stacks: Distinct (tags, stack) entries kept; later ones are dropped
+            max_depth: Frames recorded per sample, from the innermost
+            max_overhead: Share of CPU time the sampler may use
+        """
+        self.max_stacks = max_stacks
+        self.max_depth = max_depth
+        self.max_overhead = max_overhead
+        self._counts: Dict[Tuple[Optional[str], Optional[str], tuple], int] = {}
+        self._armed = False
+        self._previous_handler = None
+        self._deadline = 0.0
+        self._interval = 0.0
+        self._requested_interval = 0.0
+        self._started_at: Optional[datetime] = None
+        self._started = 0.0
+        self._stopped = 0.0
+        self._cpu_started = 0.0
+        self._cpu_stopped = 0.0
+        self._handler_seconds = 0.0
+        self.samples = 0
+        self.dropped = 0
+
+    @property
+    def active(self) -> bool:
+        """Whether samples are being taken"""
+        if self._armed and time.monotonic() >= self._deadline:
+            self._disarm()
+        return self._armed
+
+    def start(self, duration: float, interval: float = 0.01) -> Dict[str, Any]:
+        """
+        Start sampling for ``duration`` seconds, discarding previous results
+
+        Args:
+            duration: Seconds to sample for
+            interval: Seconds of CPU time between samples
+
+        Raises:
+            ProfilerBusyError: A profile is already running
+            ProfilerUnavailableError: No SIGPROF, or not on the main thread
+        """
+        if self.active:
+            raise ProfilerBusyError("Profiler is already running")
+        if not hasattr(signal, "SIGPROF") or not hasattr(signal, "setitimer"):
+            raise ProfilerUnavailableError("Signal-based profiling is not supported on this platform")
+        if threading.current_thread() is not threading.main_thread():
+            raise ProfilerUnavailableError("Profiler must be started from the main thread")
+
+        self._counts = {}
+        self.samples = 0
+        self.dropped = 0
+        self._handler_seconds = 0.0
+        self._interval = self._requested_interval = interval
+        self._started_at = datetime.utcnow()
+        self._started = time.monotonic()
+        self._deadline = self._started + duration
+        self._cpu_started = time.process_time()
+
+        self._previous_handler = signal.signal(signal.SIGPROF, self._on_sample)
+        self._armed = True
+        signal.setitimer(signal.ITIMER_PROF, interval, interval)
+
+        logger.info("Profiler started", duration=duration, interval=interval, pid=os.getpid())
+        return self.status()
+
+    def stop(self) -> Dict[str, Any]:
+        """Stop sampling; results are kept until the next start"""
+        if self._armed:
+            self._disarm()
+            logger.info("Profiler stopped", samples=self.samples, pid=os.getpid())
+        return self.status()
+
+    def _disarm(self) -> None:
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        # Handlers can only be replaced on the main thread; with the timer
+        # off, leaving ours installed is harmless
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+            self._previous_handler = None
+        self._armed = False
+        self._stopped = time.monotonic()
+        self._cpu_stopped = time.process_time()
+
+    def _on_sample(self, signum, frame) -> None:
+        started = time.perf_counter()
+        if time.monotonic() >= self._deadline:
+            self._disarm()
+            return
+
+        codes = []
+        depth = self.max_depth
+        while frame is not None and depth:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+            depth -= 1
+
+        tags = _request_tags.get()
+        if tags is None:
+            route = tenant = None
+        else:
+            route = getattr(tags.scope.get("route"), "path", None)
+            tenant = tags.tenant
+
+        key = (route, tenant, tuple(codes))
+        counts = self._counts
+        if key in counts:
+            counts[key] += 1
+        elif len(counts) < self.max_stacks:
+            counts[key] = 1
+        else:
+            self.dropped += 1
+        self.samples += 1
+
+        self._handler_seconds += time.perf_counter() - started
+        if self.samples % 64 == 0:
+            self._limit_overhead()
+
+    def _limit_overhead(self) -> None:
+        """Back off the sampling rate if the handler uses too much CPU"""
+        cpu = time.process_time() - self._cpu_started
+        if cpu > 0 and self._handler_seconds / cpu > self.max_overhead and self._interval < 1.0:
+            self._interval *= 2
+            signal.setitimer(signal.ITIMER_PROF, self._interval, self._interval)
+
+    def overhead(self) -> float:
+        """Share of the process CPU time spent in the sampler"""
+        cpu_now = time.process_time() if self._armed else self._cpu_stopped
+        cpu = cpu_now - self._cpu_started
+        return self._handler_seconds / cpu if cpu > 0 else 0.0
+
+    def status(self) -> Dict[str, Any]:
+        """Current state and counters of this worker's profiler"""
+        active = self.active
+        if self._started_at is None:
+            elapsed = 0.0
+        else:
+            elapsed = (time.monotonic() if active else self._stopped) - self._started
+        return {
+            "pid": os.getpid(),
+            "active": active,
+            "started_at": self._started_at.isoformat() if self._started_at else None,
+            "elapsed_seconds": round(elapsed, 3),
+            "remaining_seconds": round(max(0.0, self._deadline - time.monotonic()), 3) if active else 0.0,
+            "interval_ms": self._requested_interval * 1000,
+            "effective_interval_ms": self._interval * 1000,
+            "samples": self.samples,
+            "dropped_samples": self.dropped,
+            "distinct_stacks": len(self._counts),
+            "overhead_percent": round(self.overhead() * 100, 3),
+        }
+
+    def _stacks(
+        self,
+        route: Optional[str] = None,
+        tenant: Optional[str] = None,
+    ) -> List[Tuple[str, str, tuple, int]]:
+        """Samples as (route, tenant, codes innermost first, count), filtered by tag"""
+        stacks = []
+        for (sample_route, sample_tenant, codes), count in list(self._counts.items()):
+            sample_route = sample_route or UNTAGGED
+            sample_tenant = sample_tenant or UNTAGGED
+            if route is not None and sample_route != route:
+                continue
+            if tenant is not None and sample_tenant != tenant:
+                continue
+            stacks.append((sample_route, sample_tenant, codes, count))
+        return stacks
+
+    def collapsed(
+        self,
+        group_by: Sequence[str] = ("route",),
+        route: Optional[str] = None,
+        tenant: Optional[str] = None,
+    ) -> str:
+        """
+        Samples in collapsed stack format (``frame;frame;frame count``)
+
+        Args:
+            group_by: Tags added as root frames, any of "route" and "tenant"
+            route: Only samples of this route template
+            tenant: Only samples of this tenant
+        """
+        unknown = set(group_by) - set(GROUP_BY_TAGS)
+        if unknown:
+            raise ValueError(f"Unknown group_by tags: {sorted(unknown)}")
+
+        names: Dict[Any, str] = {}
+        lines: Dict[str, int] = {}
+        for sample_route, sample_tenant, codes, count in self._stacks(route, tenant):
+            frames = []
+            for tag in group_by:
+                frames.append(f"route {sample_route}" if tag == "route" else f"tenant {sample_tenant}")
+            for code in reversed(codes):
+                name = names.get(code)
+                if name is None:
+                    name = names[code] = _frame_name(code).replace(";", ":")
+                frames.append(name)
+            line = ";".join(frames)
+            lines[line] = lines.get(line, 0) + count
+        return "".join(f"{line} {count}\n" for line, count in sorted(lines.items()))
+
+    def summary(self, limit: int = 20) -> Dict[str, Any]:
+        """Sample counts per route and tenant, and the hottest functions"""
+        by_route: Dict[str, int] = {}
+        by_tenant: Dict[str, int] = {}
+        self_samples: Dict[Any, int] = {}
+        total_samples: Dict[Any, int] = {}
+        total = 0
+        for sample_route, sample_tenant, codes, count in self._stacks():
+            total += count
+            by_route[sample_route] = by_route.get(sample_route, 0) + count
+            by_tenant[sample_tenant] = by_tenant.get(sample_tenant, 0) + count
+            if codes:
+                self_samples[codes[0]] = self_samples.get(codes[0], 0) + count
+            for code in set(codes):
+                total_samples[code] = total_samples.get(code, 0) + count
+
+        def top(counts: Dict[Any, int], name=str) -> List[Dict[str, Any]]:
+            ranked = sorted(counts.items(), key=lambda item: item[1], reverse=True)[:limit]
+            return [
+                {
+                    "name": name(key),
+                    "samples": count,
+                    "percent": round(count / total * 100, 2) if total else 0.0,
+                }
+                for key, count in ranked
+            ]
+
+        return {
+            **self.status(),
+            "by_route": top(by_route),
+            "by_tenant": top(by_tenant),
+            "top_self": top(self_samples, _frame_name),
+            "top_total": top(total_samples, _frame_name),
+        }
+
+
+class ProfilerMiddleware:
+    """ASGI middleware tagging profiler samples with the request's route and tenant."""
+
+    def __init__(self, app, profiler: Optional[SamplingProfiler] = None):
+        self.app = app
+        self.profiler = profiler or sampling_profiler
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.profiler._armed:
+            await self.app(scope, receive, send)
+            return
+        token = _request_tags.set(_RequestTags(scope))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_tags.reset(token)
+
+
+# Profiler of this worker process
+sampling_profiler = SamplingProfiler()
@@ -64,10 +64,10 @@ class ALMIntegration(IntegrationBase):
         self._session_cookies: Optional[dict] = None
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client"""
+        """Get HTTP client backed by the shared connection pool"""
         if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
+            self._client = self._pooled_client(
+                self.base_url,
                 headers=self.headers,
                 timeout=30.0,
                 follow_redirects=True
@@ -173,51 +173,44 @@ class ALMIntegration(IntegrationBase):
         cycle_name: Optional[str] = None,
         **kwargs
     ) -> SyncResult:
-        """Sync test results to ALM"""
+        """Sync test results to ALM (runs are created concurrently)"""
         # Implementation similar to Zephyr but using ALM's XML API
         # This is a simplified version
+        return await self._collect_sync_results(
+            results, project_key=project_key, cycle_name=cycle_name, **kwargs
+        )
+    
+    async def _prepare_sync(
+        self,
+        project_key: Optional[str] = None,
+        cycle_name: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """ALM runs need no shared setup"""
+        return {}
+    
+    async def _sync_result(self, result: TestResult, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a run in ALM Test Lab for one result"""
+        run_xml = f"""
+        <Entity Type="run">
+            <Fields>
+                <Field Name="name"><Value>{result.test_name}</Value></Field>
+                <Field Name="status"><Value>{getattr(result.status, "value", result.status).upper()}</Value></Field>
+                <Field Name="duration"><Value>{result.duration}</Value></Field>
+            </Fields>
+        </Entity>
+        """
         
-        synced = 0
-        failed = 0
-        errors = []
-        
-        for result in results:
-            try:
-                # Create run in ALM Test Lab
-                run_xml = f"""
-                <Entity Type="run">
-                    <Fields>
-                        <Field Name="name"><Value>{result.test_name}</Value></Field>
-                        <Field Name="status"><Value>{result.status.value.upper()}</Value></Field>
-                        <Field Name="duration"><Value>{result.duration}</Value></Field>
-                    </Fields>
-                </Entity>
-                """
-                
-                client = await self._get_client()
-                response = await client.post(
-                    f'{self.api_base}/runs',
-                    content=run_xml,
-                    cookies=self._session_cookies
-                )
-                
-                if response.status_code == 201:
-                    synced += 1
-                else:
-                    failed += 1
-                    errors.append(f"{result.test_name}: Failed to create run")
-                    
-            except Exception as e:
-                failed += 1
-                errors.append(f"{result.test_name}: {str(e)}")
+        client = await self._get_client()
+        response = await self._send(lambda: client.post(
+            f'{self.api_base}/runs',
+            content=run_xml,
+            cookies=self._session_cookies
+        ))
         
-        return SyncResult(
-            provider=self.provider_name,
-            success=(failed == 0),
-            synced_count=synced,
-            failed_count=failed,
-            errors=errors
-        )
+        if response.status_code != 201:
+            raise Exception("Failed to create run")
+        return {}
     
     # ==================== Test Case Methods ====================
     
@@ -333,7 +326,8 @@ class ALMIntegration(IntegrationBase):
         """Get list of ALM projects"""
         client = await self._get_client()
         
-        response = await client.get(
+        response = await self._cached_get(
+            client,
             f'/rest/domains/{self.domain}/projects',
             cookies=self._session_cookies
         )
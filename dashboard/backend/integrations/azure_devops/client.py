@@ -6,7 +6,9 @@ Supports both Azure DevOps Services (cloud) and Azure DevOps Server (on-premise)
 
 API Reference: https://docs.microsoft.com/en-us/rest/api/azure/devops/
 """
+import asyncio
 import base64
+import json
 import time
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
@@ -38,6 +40,9 @@ class AzureDevOpsIntegration(IntegrationBase):
     supports_bugs = True
     supports_cycles = True
     
+    # Azure DevOps accepts up to 200 operations per $batch request
+    bulk_chunk_size = 200
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         
@@ -66,10 +71,10 @@ class AzureDevOpsIntegration(IntegrationBase):
         self._client: Optional[httpx.AsyncClient] = None
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client"""
+        """Get HTTP client backed by the shared connection pool"""
         if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                base_url=self.organization_url,
+            self._client = self._pooled_client(
+                self.organization_url,
                 headers=self.headers,
                 timeout=30.0,
                 follow_redirects=True
@@ -160,17 +165,21 @@ class AzureDevOpsIntegration(IntegrationBase):
         cycle_name: Optional[str] = None,
         **kwargs
     ) -> SyncResult:
-        """Sync test results to Azure DevOps test runs"""
-        if not self.is_connected:
-            await self.connect()
-        
+        """Sync test results to Azure DevOps test runs (results are synced concurrently)"""
+        return await self._collect_sync_results(
+            results, project_key=project_key, cycle_name=cycle_name, **kwargs
+        )
+    
+    async def _prepare_sync(
+        self,
+        project_key: Optional[str] = None,
+        cycle_name: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Create a test run if cycle_name is provided"""
         project = project_key or self.project_name
-        
-        synced = 0
-        failed = 0
         errors = []
         
-        # Create a test run if cycle_name is provided
         test_run_id = None
         if cycle_name:
             try:
@@ -179,36 +188,27 @@ class AzureDevOpsIntegration(IntegrationBase):
             except Exception as e:
                 errors.append(f"Failed to create test run: {str(e)}")
         
-        for result in results:
-            try:
-                # Create or update test result
-                if result.status == TestStatus.FAILED:
-                    # Create bug for failed test
-                    if result.test_id:
-                        await self.create_bug(
-                            title=f"[QA] Test Failed: {result.test_name}",
-                            description=self._format_test_result_for_bug(result),
-                            project_key=project,
-                            test_result=result
-                        )
-                
-                # Associate with test run if applicable
-                if test_run_id:
-                    await self._add_test_result_to_run(test_run_id, result)
-                
-                synced += 1
-                
-            except Exception as e:
-                failed += 1
-                errors.append(f"{result.test_name}: {str(e)}")
+        return {"project": project, "test_run_id": test_run_id, "errors": errors}
+    
+    async def _sync_result(self, result: TestResult, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a bug for a failed test and attach the result to the test run"""
+        details = {}
+        
+        if result.status == TestStatus.FAILED and result.test_id:
+            # Create bug for failed test
+            bug = await self.create_bug(
+                title=f"[QA] Test Failed: {result.test_name}",
+                description=self._format_test_result_for_bug(result),
+                project_key=context["project"],
+                test_result=result
+            )
+            details["bug"] = bug
         
-        return SyncResult(
-            provider=self.provider_name,
-            success=(failed == 0),
-            synced_count=synced,
-            failed_count=failed,
-            errors=errors
-        )
+        # Associate with test run if applicable
+        if context["test_run_id"]:
+            await self._add_test_result_to_run(context["test_run_id"], result)
+        
+        return details
     
     async def _create_test_run(self, name: str, project: str) -> Dict[str, Any]:
         """Create a test run in Azure DevOps"""
@@ -233,8 +233,26 @@ class AzureDevOpsIntegration(IntegrationBase):
     
     async def _add_test_result_to_run(self, run_id: str, result: TestResult):
         """Add a test result to a test run"""
+        await self._add_test_results_to_run(run_id, [result])
+    
+    async def _add_test_results_to_run(self, run_id: str, results: List[TestResult]):
+        """Add test results to a test run (one request per chunk)"""
         client = await self._get_client()
         
+        for chunk in self._chunked(results):
+            payload = [self._build_run_result(result) for result in chunk]
+            
+            response = await self._send(lambda: client.patch(
+                f"/{self.project_name}/_apis/test/runs/{run_id}/results",
+                params={'api-version': '7.0'},
+                json=payload
+            ))
+            
+            if response.status_code not in [200, 201]:
+                raise Exception(f"Failed to add test result: {response.text}")
+    
+    def _build_run_result(self, result: TestResult) -> Dict[str, Any]:
+        """Build a test run result payload"""
         # Map test status to Azure DevOps status
         ado_status = {
             TestStatus.PASSED: "Passed",
@@ -244,21 +262,12 @@ class AzureDevOpsIntegration(IntegrationBase):
             TestStatus.UNTESTED: "NotExecuted"
         }.get(result.status, "Failed")
         
-        payload = {
+        return {
             "testCaseTitle": result.test_name,
             "outcome": ado_status,
             "comment": f"Duration: {result.duration}s",
             "errorMessage": result.error
         }
-        
-        response = await client.patch(
-            f"/{self.project_name}/_apis/test/runs/{run_id}/results",
-            params={'api-version': '7.0'},
-            json=[payload]
-        )
-        
-        if response.status_code not in [200, 201]:
-            raise Exception(f"Failed to add test result: {response.text}")
     
     async def _get_project_id(self, project_name: str) -> str:
         """Get project ID by name"""
@@ -373,7 +382,8 @@ class AzureDevOpsIntegration(IntegrationBase):
             
             for item in data.get('workItems', []):
                 # Get full details for each work item
-                detail_response = await client.get(
+                detail_response = await self._cached_get(
+                    client,
                     f"/{project_key or self.project_name}/_apis/wit/workitems/{item['id']}",
                     params={'api-version': '7.0'}
                 )
@@ -404,28 +414,7 @@ class AzureDevOpsIntegration(IntegrationBase):
         
         client = await self._get_client()
         
-        patch_document = []
-        
-        if updates.get('name'):
-            patch_document.append({
-                "op": "replace",
-                "path": "/fields/System.Title",
-                "value": updates['name']
-            })
-        
-        if updates.get('description'):
-            patch_document.append({
-                "op": "replace",
-                "path": "/fields/System.Description",
-                "value": updates['description']
-            })
-        
-        if updates.get('labels'):
-            patch_document.append({
-                "op": "replace",
-                "path": "/fields/System.Tags",
-                "value": "; ".join(updates['labels'])
-            })
+        patch_document = self._build_test_case_update_document(updates)
         
         response = await client.patch(
             f"/{self.project_name}/_apis/wit/workitems/{test_id}",
@@ -457,39 +446,20 @@ class AzureDevOpsIntegration(IntegrationBase):
         
         client = await self._get_client()
         
-        work_item_fields = {
-            "System.Title": title,
-            "System.Description": description,
-            "System.WorkItemType": "Bug",
-            "Microsoft.VSTS.Common.Priority": priority or 2,
-            "Microsoft.VSTS.Common.Severity": severity or "3 - Medium"
-        }
-        
-        if self.area_path:
-            work_item_fields["System.AreaPath"] = self.area_path
-        if self.iteration_path:
-            work_item_fields["System.IterationPath"] = self.iteration_path
-        
-        if labels:
-            work_item_fields["System.Tags"] = "; ".join(labels)
-        
-        if test_result:
-            work_item_fields["System.Tags"] = work_item_fields.get("System.Tags", "") + f"; test-{test_result.test_id}"
-        
-        # Format for Azure DevOps PATCH API
-        patch_document = []
-        for field, value in work_item_fields.items():
-            patch_document.append({
-                "op": "add",
-                "path": f"/fields/{field}",
-                "value": value
-            })
+        patch_document = self._build_bug_patch_document(
+            title=title,
+            description=description,
+            test_result=test_result,
+            severity=severity,
+            priority=priority,
+            labels=labels
+        )
         
-        response = await client.patch(
+        response = await self._send(lambda: client.patch(
             f"/{project_key or self.project_name}/_apis/wit/workitems/$Bug",
             params={'api-version': '7.0'},
             json=patch_document
-        )
+        ))
         
         if response.status_code == 200:
             work_item = response.json()
@@ -543,7 +513,8 @@ class AzureDevOpsIntegration(IntegrationBase):
             
             for item in data.get('workItems', []):
                 # Get full details for each work item
-                detail_response = await client.get(
+                detail_response = await self._cached_get(
+                    client,
                     f"/{project_key or self.project_name}/_apis/wit/workitems/{item['id']}",
                     params={'api-version': '7.0'}
                 )
@@ -563,6 +534,188 @@ class AzureDevOpsIntegration(IntegrationBase):
         
         return []
     
+    # ==================== Bulk Methods ====================
+    
+    async def create_bugs_bulk(
+        self,
+        bugs: List[Dict[str, Any]],
+        project_key: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Create bug work items through the work item $batch API"""
+        requests = []
+        for bug in bugs:
+            project = bug.get("project_key") or project_key or self.project_name
+            fields = {k: v for k, v in bug.items() if k != "project_key"}
+            requests.append({
+                "method": "PATCH",
+                "uri": f"/{project}/_apis/wit/workitems/$Bug?api-version=7.0",
+                "headers": {"Content-Type": "application/json-patch+json"},
+                "body": self._build_bug_patch_document(**fields)
+            })
+        
+        responses = await self._batch(requests)
+        
+        results = []
+        for response in responses:
+            if response is None:
+                results.append(None)
+            elif "error" in response:
+                results.append({"error": f"Failed to create bug: {response['error']}"})
+            else:
+                work_item = response["body"]
+                results.append({
+                    "id": work_item.get("id"),
+                    "key": str(work_item.get("id")),
+                    "url": work_item.get("_links", {}).get("html", {}).get("href")
+                })
+        
+        # Only the bugs of rejected chunks go through individual requests
+        retry = [i for i, result in enumerate(results) if result is None]
+        if retry:
+            retried = await self._create_bugs_individually([bugs[i] for i in retry], project_key)
+            for i, result in zip(retry, retried):
+                results[i] = result
+        
+        return results
+    
+    async def update_test_cases_bulk(
+        self,
+        updates: Dict[str, Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Update test case work items through the work item $batch API"""
+        test_ids = list(updates.keys())
+        requests = [
+            {
+                "method": "PATCH",
+                "uri": f"/{self.project_name}/_apis/wit/workitems/{test_id}?api-version=7.0",
+                "headers": {"Content-Type": "application/json-patch+json"},
+                "body": self._build_test_case_update_document(updates[test_id])
+            }
+            for test_id in test_ids
+        ]
+        
+        responses = await self._batch(requests)
+        
+        results = [
+            None if response is None
+            else {"id": test_id, "error": f"Failed to update test case: {response['error']}"}
+            if "error" in response else {"id": test_id, "updated": True}
+            for test_id, response in zip(test_ids, responses)
+        ]
+        
+        # Only the updates of rejected chunks go through individual requests
+        retry = [i for i, result in enumerate(results) if result is None]
+        if retry:
+            retried = await self._update_test_cases_individually(
+                {test_ids[i]: updates[test_ids[i]] for i in retry}
+            )
+            for i, result in zip(retry, retried):
+                results[i] = result
+        
+        return results
+    
+    async def sync_test_results_bulk(
+        self,
+        results: List[TestResult],
+        project_key: Optional[str] = None,
+        cycle_name: Optional[str] = None,
+        **kwargs
+    ) -> SyncResult:
+        """
+        Sync test results using $batch for bugs and chunked test run updates.
+        """
+        if not self.is_connected:
+            await self.connect()
+        
+        context = await self._prepare_sync(project_key=project_key, cycle_name=cycle_name, **kwargs)
+        errors = list(context["errors"])
+        failed_names = set()
+        
+        bug_results = [r for r in results if r.status == TestStatus.FAILED and r.test_id]
+        created = await self.create_bugs_bulk([
+            {
+                "title": f"[QA] Test Failed: {result.test_name}",
+                "description": self._format_test_result_for_bug(result),
+                "test_result": result
+            }
+            for result in bug_results
+        ], project_key=context["project"])
+        
+        for result, bug in zip(bug_results, created):
+            if "error" in bug:
+                failed_names.add(result.test_name)
+                errors.append(f"{result.test_name}: {bug['error']}")
+        
+        if context["test_run_id"]:
+            try:
+                await self._add_test_results_to_run(context["test_run_id"], results)
+            except Exception as e:
+                failed_names.update(r.test_name for r in results)
+                errors.append(f"Failed to add results to test run: {str(e)}")
+        
+        failed = sum(1 for r in results if r.test_name in failed_names)
+        return SyncResult(
+            provider=self.provider_name,
+            success=(failed == 0),
+            synced_count=len(results) - failed,
+            failed_count=failed,
+            errors=errors
+        )
+    
+    async def _batch(self, requests: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Execute work item operations through the $batch endpoint.
+        
+        Returns:
+            One entry per request: {"body": dict} or {"error": str}, or None
+            for each request of a chunk the endpoint rejected as a whole, which
+            callers retry with individual requests.
+        """
+        if not requests:
+            return []
+        
+        if not self.is_connected:
+            await self.connect()
+        
+        client = await self._get_client()
+        
+        async def send(chunk: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+            response = await self._send(lambda: client.post(
+                "/_apis/wit/$batch",
+                params={'api-version': '7.0'},
+                json=chunk
+            ))
+            if response.status_code != 200:
+                return None
+            
+            values = response.json().get("value", [])
+            if len(values) != len(chunk):
+                return None
+            
+            parsed = []
+            for value in values:
+                body = value.get("body")
+                if isinstance(body, str):
+                    try:
+                        body = json.loads(body) if body else {}
+                    except ValueError:
+                        body = {"message": body}
+                if value.get("code") in (200, 201):
+                    parsed.append({"body": body or {}})
+                else:
+                    message = (body or {}).get("message") if isinstance(body, dict) else None
+                    parsed.append({"error": message or f"HTTP {value.get('code')}"})
+            return parsed
+        
+        chunks = self._chunked(requests)
+        chunk_responses = await asyncio.gather(*[send(chunk) for chunk in chunks])
+        
+        return [
+            response
+            for chunk, responses in zip(chunks, chunk_responses)
+            for response in (responses if responses is not None else [None] * len(chunk))
+        ]
+    
     # ==================== Project Methods ====================
     
     async def get_projects(self) -> List[Dict[str, Any]]:
@@ -572,7 +725,8 @@ class AzureDevOpsIntegration(IntegrationBase):
         
         client = await self._get_client()
         
-        response = await client.get(
+        response = await self._cached_get(
+            client,
             "/_apis/projects",
             params={'api-version': '7.0'}
         )
@@ -590,6 +744,71 @@ class AzureDevOpsIntegration(IntegrationBase):
         
         return []
     
+    # ==================== Helpers ====================
+    
+    def _build_bug_patch_document(
+        self,
+        title: str,
+        description: str,
+        test_result: Optional[TestResult] = None,
+        severity: Optional[str] = None,
+        priority: Optional[str] = None,
+        labels: Optional[List[str]] = None,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """Build the JSON patch document for a bug work item"""
+        work_item_fields = {
+            "System.Title": title,
+            "System.Description": description,
+            "System.WorkItemType": "Bug",
+            "Microsoft.VSTS.Common.Priority": priority or 2,
+            "Microsoft.VSTS.Common.Severity": severity or "3 - Medium"
+        }
+        
+        if self.area_path:
+            work_item_fields["System.AreaPath"] = self.area_path
+        if self.iteration_path:
+            work_item_fields["System.IterationPath"] = self.iteration_path
+        
+        if labels:
+            work_item_fields["System.Tags"] = "; ".join(labels)
+        
+        if test_result:
+            work_item_fields["System.Tags"] = work_item_fields.get("System.Tags", "") + f"; test-{test_result.test_id}"
+        
+        # Format for Azure DevOps PATCH API
+        return [
+            {"op": "add", "path": f"/fields/{field}", "value": value}
+            for field, value in work_item_fields.items()
+        ]
+    
+    def _build_test_case_update_document(self, updates: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Build the JSON patch document for a test case update"""
+        patch_document = []
+        
+        if updates.get('name'):
+            patch_document.append({
+                "op": "replace",
+                "path": "/fields/System.Title",
+                "value": updates['name']
+            })
+        
+        if updates.get('description'):
+            patch_document.append({
+                "op": "replace",
+                "path": "/fields/System.Description",
+                "value": updates['description']
+            })
+        
+        if updates.get('labels'):
+            patch_document.append({
+                "op": "replace",
+                "path": "/fields/System.Tags",
+                "value": "; ".join(updates['labels'])
+            })
+        
+        return patch_document
+    
     # ==================== Configuration ====================
     
     def validate_config(self) -> Tuple[bool, List[str]]:
@@ -4,12 +4,18 @@ Base Integration Interface
 All integrations must implement this interface for consistency.
 Uses Adapter Pattern for different providers.
 """
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Tuple
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple
 from pydantic import BaseModel, Field
 from datetime import datetime
 from enum import Enum
 
+import httpx
+
+from integrations.http_client import client_registry, credential_scope, etag_cache
+from integrations.throttle import AdaptiveThrottle
+
 
 class TestStatus(str, Enum):
     """Test execution status"""
@@ -65,6 +71,21 @@ class SyncResult(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 
+class ResultSyncOutcome(BaseModel):
+    """Outcome of synchronizing a single test result to one provider"""
+    provider: str
+    test_id: Optional[str] = None
+    test_name: Optional[str] = None
+    success: bool
+    error: Optional[str] = None
+    details: Dict[str, Any] = {}
+
+
+class SyncSetupError(Exception):
+    """Raised when a sync cannot start (missing project, cycle creation failed, ...)"""
+    pass
+
+
 class IntegrationBase(ABC):
     """
     Abstract base class for all integrations.
@@ -83,6 +104,12 @@ class IntegrationBase(ABC):
     supports_bugs: bool = True
     supports_cycles: bool = False
     
+    # Default number of concurrent requests per provider during a sync
+    sync_concurrency: int = 8
+    
+    # Maximum number of items sent in one native bulk request
+    bulk_chunk_size: int = 50
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize integration with configuration.
@@ -93,6 +120,17 @@ class IntegrationBase(ABC):
         self.config = config
         self.is_connected = False
         self._last_error: Optional[str] = None
+        
+        max_concurrency = (
+            config.get('max_concurrency') if isinstance(config, dict) else None
+        ) or self.sync_concurrency
+        self._throttle = AdaptiveThrottle(max_concurrency=max_concurrency)
+        
+        # Scope for pooled clients and cached responses (never shared across credentials)
+        self._http_scope = credential_scope(
+            type(self).__name__,
+            sorted((k, repr(v)) for k, v in config.items()) if isinstance(config, dict) else repr(config)
+        )
     
     # ==================== Connection Methods ====================
     
@@ -158,6 +196,345 @@ class IntegrationBase(ABC):
         """
         pass
     
+    async def _prepare_sync(
+        self,
+        project_key: Optional[str] = None,
+        cycle_name: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Prepare shared state for a per-result sync (project, cycle, run...).
+        
+        Override together with `_sync_result` to enable concurrent per-result
+        synchronization. Raise SyncSetupError to abort the whole sync.
+        
+        Returns:
+            Context dictionary handed to every `_sync_result` call
+        """
+        raise NotImplementedError
+    
+    async def _sync_result(
+        self,
+        result: TestResult,
+        context: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Synchronize a single test result.
+        
+        Args:
+            result: Test result to sync
+            context: Context returned by `_prepare_sync`
+        
+        Returns:
+            Provider-specific details for the result
+        """
+        raise NotImplementedError
+    
+    def supports_result_streaming(self) -> bool:
+        """Whether this provider implements per-result synchronization"""
+        return type(self)._sync_result is not IntegrationBase._sync_result
+    
+    async def stream_sync_results(
+        self,
+        results: List[TestResult],
+        project_key: Optional[str] = None,
+        cycle_name: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[ResultSyncOutcome]:
+        """
+        Synchronize test results concurrently, yielding outcomes as they complete.
+        
+        Providers implementing `_sync_result` run one task per result; the
+        number of concurrent HTTP requests is bounded by the provider throttle.
+        Other providers fall back to `sync_test_results` and yield the
+        outcomes once the batch is done.
+        
+        Args:
+            results: List of test results to sync
+            project_key: Target project key
+            cycle_name: Test cycle name (if supported)
+            **kwargs: Provider-specific options
+        
+        Yields:
+            ResultSyncOutcome per test result
+        
+        Raises:
+            SyncSetupError: If the sync could not be prepared
+        """
+        if not self.supports_result_streaming():
+            async for outcome in self._stream_from_batch(results, project_key, cycle_name, **kwargs):
+                yield outcome
+            return
+        
+        if not self.is_connected:
+            await self.connect()
+        
+        context = await self._prepare_sync(project_key=project_key, cycle_name=cycle_name, **kwargs)
+        async for outcome in self._stream_prepared(results, context):
+            yield outcome
+    
+    async def _stream_prepared(
+        self,
+        results: List[TestResult],
+        context: Dict[str, Any]
+    ) -> AsyncIterator[ResultSyncOutcome]:
+        """Run one `_sync_result` task per result and yield in completion order"""
+        tasks = [
+            asyncio.create_task(self._run_result_sync(result, context))
+            for result in results
+        ]
+        try:
+            for completed in asyncio.as_completed(tasks):
+                yield await completed
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+    
+    async def _run_result_sync(
+        self,
+        result: TestResult,
+        context: Dict[str, Any]
+    ) -> ResultSyncOutcome:
+        """Run `_sync_result` for one result and wrap it into an outcome"""
+        try:
+            details = await self._sync_result(result, context)
+            return ResultSyncOutcome(
+                provider=self.provider_name,
+                test_id=result.test_id,
+                test_name=result.test_name,
+                success=True,
+                details=details or {}
+            )
+        except Exception as e:
+            return ResultSyncOutcome(
+                provider=self.provider_name,
+                test_id=result.test_id,
+                test_name=result.test_name,
+                success=False,
+                error=str(e)
+            )
+    
+    async def _stream_from_batch(
+        self,
+        results: List[TestResult],
+        project_key: Optional[str] = None,
+        cycle_name: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[ResultSyncOutcome]:
+        """Yield per-result outcomes from a classic batch `sync_test_results` call"""
+        sync_result = await self.sync_test_results(
+            results=results,
+            project_key=project_key,
+            cycle_name=cycle_name,
+            **kwargs
+        )
+        
+        result_errors: Dict[str, str] = {}
+        for error in sync_result.errors:
+            name, sep, message = error.partition(": ")
+            if sep:
+                result_errors.setdefault(name, message)
+        
+        if not sync_result.success and sync_result.synced_count == 0 and not result_errors:
+            # The batch failed before any result was processed
+            raise SyncSetupError("; ".join(sync_result.errors) or "Sync failed")
+        
+        for result in results:
+            error = result_errors.get(result.test_name)
+            yield ResultSyncOutcome(
+                provider=self.provider_name,
+                test_id=result.test_id,
+                test_name=result.test_name,
+                success=error is None,
+                error=error
+            )
+    
+    async def _collect_sync_results(
+        self,
+        results: List[TestResult],
+        project_key: Optional[str] = None,
+        cycle_name: Optional[str] = None,
+        **kwargs
+    ) -> SyncResult:
+        """
+        Run a concurrent per-result sync to completion and aggregate a SyncResult.
+        
+        The context returned by `_prepare_sync` may carry a "details" dict
+        (merged into SyncResult.details) and an "errors" list of non-fatal
+        setup errors.
+        
+        Args:
+            results: List of test results to sync
+            project_key: Target project key
+            cycle_name: Test cycle name
+            **kwargs: Provider-specific options
+        
+        Returns:
+            Aggregated SyncResult
+        """
+        if not self.is_connected:
+            await self.connect()
+        
+        try:
+            context = await self._prepare_sync(project_key=project_key, cycle_name=cycle_name, **kwargs)
+        except SyncSetupError as e:
+            return SyncResult(
+                provider=self.provider_name,
+                success=False,
+                errors=[str(e)]
+            )
+        
+        outcomes: List[ResultSyncOutcome] = []
+        async for outcome in self._stream_prepared(results, context):
+            outcomes.append(outcome)
+        
+        failed = [o for o in outcomes if not o.success]
+        return SyncResult(
+            provider=self.provider_name,
+            success=not failed,
+            synced_count=len(outcomes) - len(failed),
+            failed_count=len(failed),
+            errors=list(context.get("errors", [])) + [f"{o.test_name}: {o.error}" for o in failed],
+            details=context.get("details", {})
+        )
+    
+    async def _send(self, request):
+        """
+        Send an HTTP request through the provider throttle.
+        
+        Args:
+            request: Zero-argument coroutine factory, e.g.
+                ``lambda: client.post('/rest/api/3/issue', json=payload)``
+        
+        Returns:
+            Provider response (429 responses are retried transparently)
+        """
+        return await self._throttle.run(request)
+
+    def _pooled_client(self, base_url: str, **client_kwargs) -> httpx.AsyncClient:
+        """
+        Get a client backed by the shared connection pool for `base_url`.
+
+        Closing the returned client does not close the pool; pools are owned
+        by `integrations.http_client.client_registry`.
+
+        Args:
+            base_url: Provider base URL
+            **client_kwargs: httpx.AsyncClient options (headers, auth, timeout, ...)
+        """
+        return client_registry.get_client(base_url, scope=self._http_scope, **client_kwargs)
+
+    async def _cached_get(self, client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+        """
+        GET revalidated with If-None-Match against the shared ETag cache.
+
+        Args:
+            client: Client to send the request with
+            url: Request path
+            **kwargs: Extra arguments for client.get (params, headers, ...)
+
+        Returns:
+            Provider response; a 304 is answered from cache as a 200
+        """
+        return await etag_cache.get(client, url, scope=self._http_scope, **kwargs)
+
+    # ==================== Bulk Methods ====================
+    
+    async def create_bugs_bulk(
+        self,
+        bugs: List[Dict[str, Any]],
+        project_key: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Create many bugs, using the provider's native bulk API when available.
+        
+        The default implementation issues one `create_bug` call per item
+        concurrently (bounded by the provider throttle).
+        
+        Args:
+            bugs: List of `create_bug` keyword arguments (title, description,
+                test_result, severity, priority, labels, project_key)
+            project_key: Default project key for items without one
+        
+        Returns:
+            List aligned with `bugs`; each entry is the created bug info or
+            {"error": str} if that bug could not be created
+        """
+        return await self._create_bugs_individually(bugs, project_key)
+    
+    async def update_test_cases_bulk(
+        self,
+        updates: Dict[str, Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Update many test cases, using the provider's native bulk API when available.
+        
+        Args:
+            updates: Mapping of test case ID to the fields to update
+        
+        Returns:
+            List of {"id": str, "updated": True} or {"id": str, "error": str}
+        """
+        return await self._update_test_cases_individually(updates)
+    
+    async def sync_test_results_bulk(
+        self,
+        results: List[TestResult],
+        project_key: Optional[str] = None,
+        cycle_name: Optional[str] = None,
+        **kwargs
+    ) -> SyncResult:
+        """
+        Synchronize test results using native bulk APIs where the provider has them.
+        
+        Falls back to `sync_test_results` for providers without bulk support.
+        
+        Args:
+            results: List of test results to sync
+            project_key: Target project key
+            cycle_name: Test cycle name (if supported)
+            **kwargs: Provider-specific options
+        
+        Returns:
+            SyncResult with synchronization status
+        """
+        return await self.sync_test_results(
+            results=results,
+            project_key=project_key,
+            cycle_name=cycle_name,
+            **kwargs
+        )
+    
+    async def _create_bugs_individually(
+        self,
+        bugs: List[Dict[str, Any]],
+        project_key: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Per-request fallback for `create_bugs_bulk`"""
+        async def create(bug: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                return await self.create_bug(**{"project_key": project_key, **bug})
+            except Exception as e:
+                return {"error": str(e)}
+        
+        return list(await asyncio.gather(*[create(bug) for bug in bugs]))
+    
+    async def _update_test_cases_individually(
+        self,
+        updates: Dict[str, Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Per-request fallback for `update_test_cases_bulk`"""
+        async def update(test_id: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                return await self.update_test_case(test_id, fields)
+            except Exception as e:
+                return {"id": test_id, "error": str(e)}
+        
+        return list(await asyncio.gather(*[
+            update(test_id, fields) for test_id, fields in updates.items()
+        ]))
+    
     # ==================== Test Case Methods ====================
     
     @abstractmethod
@@ -398,6 +775,11 @@ class IntegrationBase(ABC):
     
     # ==================== Utility Methods ====================
     
+    def _chunked(self, items: List[Any], size: Optional[int] = None) -> List[List[Any]]:
+        """Split items into chunks of at most `size` (default: bulk_chunk_size)"""
+        size = size or self.bulk_chunk_size
+        return [items[i:i + size] for i in range(0, len(items), size)]
+    
     def _set_error(self, error: str):
         """Store last error for debugging"""
         self._last_error = error
@@ -416,11 +798,12 @@ class IntegrationBase(ABC):
         Returns:
             Formatted string for bug description
         """
+        status = getattr(result.status, 'value', result.status)
         desc = f"""**Test Failure Report**
 
 **Test:** {result.test_name}
 **Class:** {result.classname or 'N/A'}
-**Status:** {result.status.value.upper()}
+**Status:** {status.upper()}
 **Duration:** {result.duration}s
 **Timestamp:** {result.timestamp.isoformat()}
 
@@ -0,0 +1,303 @@
+"""
+Shared HTTP Client Registry
+
+One connection pool per origin (scheme, host, port) shared by every
+integration and service talking to that host, instead of one
+httpx.AsyncClient per integration instance. Pools use configurable limits,
+keep-alive and HTTP/2 (when the `h2` package is installed).
+
+Also provides ETagCache for conditional GETs (If-None-Match) on read paths:
+an unchanged resource costs a 304 without a body, and GitHub does not count
+304 responses against the rate limit.
+"""
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Headers that describe the wire encoding of the original body, not the cached one
+_HOP_BY_HOP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+def credential_scope(*parts: Any) -> str:
+    """
+    Build an opaque cache scope from credentials.
+
+    Clients with different credentials never share cached responses, while
+    integration instances configured with the same credentials do.
+    """
+    digest = hashlib.sha256(repr(parts).encode()).hexdigest()
+    return digest[:16]
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """Per-client view of a shared pool; closing a client leaves the pool open"""
+
+    def __init__(self, base_url: str, registry: "HTTPClientRegistry"):
+        self._base_url = base_url
+        self._registry = registry
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        # Resolved per request so clients survive the registry closing its pools
+        pool = self._registry.get_pool(self._base_url)
+        self._registry._in_flight += 1
+        try:
+            return await pool.handle_async_request(request)
+        finally:
+            self._registry._in_flight -= 1
+
+    async def aclose(self) -> None:
+        # The registry owns the pool
+        return None
+
+
+class HTTPClientRegistry:
+    """
+    Registry of pooled httpx clients keyed by base URL.
+
+    Example:
+        client = client_registry.get_client(
+            "https://acme.atlassian.net",
+            scope=credential_scope(email, token),
+            auth=(email, token),
+        )
+        response = await client.get("/rest/api/3/project")
+
+    Clients returned for the same (base URL, scope) are reused; clients for
+    the same origin share one connection pool. `close()` drains in-flight
+    requests and closes every pool; it matches ShutdownManager's resource
+    protocol (ResourceType.HTTP_CLIENT).
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True
+    ):
+        """
+        Initialize registry.
+
+        Args:
+            max_connections: Maximum connections per origin
+            max_keepalive_connections: Idle connections kept open per origin
+            keepalive_expiry: Seconds an idle connection is kept
+            http2: Negotiate HTTP/2 when available
+        """
+        self._pools: Dict[str, httpx.AsyncHTTPTransport] = {}
+        self._clients: Dict[Tuple[str, str], httpx.AsyncClient] = {}
+        self._in_flight = 0
+        self._closing = False
+        self.configure(max_connections, max_keepalive_connections, keepalive_expiry, http2)
+
+    def configure(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None
+    ):
+        """Update pool settings; applies to pools created afterwards"""
+        current = getattr(self, "limits", httpx.Limits())
+        self.limits = httpx.Limits(
+            max_connections=max_connections if max_connections is not None else current.max_connections,
+            max_keepalive_connections=(
+                max_keepalive_connections if max_keepalive_connections is not None
+                else current.max_keepalive_connections
+            ),
+            keepalive_expiry=keepalive_expiry if keepalive_expiry is not None else current.keepalive_expiry,
+        )
+        if http2 is not None:
+            if http2 and not HTTP2_AVAILABLE:
+                logger.warning("HTTP/2 requested but the 'h2' package is not installed; using HTTP/1.1")
+            self.http2 = http2 and HTTP2_AVAILABLE
+
+    @staticmethod
+    def origin(base_url: str) -> str:
+        """Normalize a base URL to its origin (scheme://host:port)"""
+        url = httpx.URL(base_url)
+        port = url.port or (443 if url.scheme == "https" else 80)
+        return f"{url.scheme}://{url.host}:{port}"
+
+    def get_pool(self, base_url: str) -> httpx.AsyncHTTPTransport:
+        """Get or create the connection pool for a base URL's origin"""
+        origin = self.origin(base_url)
+        pool = self._pools.get(origin)
+        if pool is None:
+            pool = httpx.AsyncHTTPTransport(limits=self.limits, http2=self.http2)
+            self._pools[origin] = pool
+        return pool
+
+    def get_client(self, base_url: str, scope: str = "", **client_kwargs: Any) -> httpx.AsyncClient:
+        """
+        Get a pooled client.
+
+        Args:
+            base_url: Base URL for relative request paths
+            scope: Credential scope (see credential_scope); clients are cached per scope
+            **client_kwargs: httpx.AsyncClient options (headers, auth, timeout, ...)
+
+        Returns:
+            An AsyncClient backed by the shared pool for the origin
+        """
+        if self._closing:
+            raise RuntimeError("HTTP client registry is shutting down")
+
+        key = (str(base_url).rstrip("/"), scope)
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                base_url=base_url,
+                transport=_SharedTransport(base_url, self),
+                **client_kwargs
+            )
+            self._clients[key] = client
+        return client
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently being sent through the registry's pools"""
+        return self._in_flight
+
+    async def close(self, timeout: float = 10.0):
+        """
+        Drain and close all pools.
+
+        New clients are refused, in-flight requests get up to `timeout`
+        seconds to finish, then every connection is closed.
+        """
+        self._closing = True
+        deadline = time.monotonic() + timeout
+        while self._in_flight and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        if self._in_flight:
+            logger.warning("Closing HTTP pools with %d request(s) in flight", self._in_flight)
+
+        pools, self._pools = self._pools, {}
+        self._clients.clear()
+        for pool in pools.values():
+            await pool.aclose()
+        self._closing = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get registry statistics"""
+        return {
+            "pools": sorted(self._pools),
+            "clients": len(self._clients),
+            "in_flight": self._in_flight,
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+        }
+
+
+@dataclass
+class _CachedResponse:
+    etag: str
+    content: bytes
+    headers: Dict[str, str]
+
+
+class ETagCache:
+    """
+    Bounded LRU cache of response bodies revalidated with If-None-Match.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum cached responses (least recently used are evicted)
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str, str], _CachedResponse]" = OrderedDict()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    async def get(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        scope: str = "",
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs: Any
+    ) -> httpx.Response:
+        """
+        Perform a conditional GET.
+
+        Args:
+            client: Client to send the request with
+            url: Request URL or path
+            scope: Credential scope isolating cached entries
+            params: Query parameters
+            headers: Extra request headers
+
+        Returns:
+            The response; a 304 is answered from cache as a 200
+        """
+        key = (scope, f"{client.base_url}{url}", repr(sorted((params or {}).items())))
+        entry = self._entries.get(key)
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            request_headers["If-None-Match"] = entry.etag
+
+        response = await client.get(url, params=params, headers=request_headers, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return httpx.Response(200, headers=entry.headers, content=entry.content, request=response.request)
+
+        self.misses += 1
+        etag = response.headers.get("ETag")
+        if response.status_code == 200 and isinstance(etag, str):
+            self._entries[key] = _CachedResponse(
+                etag=etag,
+                content=response.content,
+                headers={k: v for k, v in response.headers.items() if k.lower() not in _HOP_BY_HOP_HEADERS},
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        elif entry is not None and response.status_code != 304:
+            del self._entries[key]
+
+        return response
+
+    def clear(self):
+        """Drop all cached responses"""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+# Global instances
+client_registry = HTTPClientRegistry()
+etag_cache = ETagCache()
@@ -14,10 +14,59 @@ from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import httpx
 
-from integrations.base import IntegrationBase, TestResult, SyncResult, TestStatus
+from integrations.base import IntegrationBase, TestResult, SyncResult, TestStatus, SyncSetupError
 from integrations.jira.config import JiraConfig
 
 
+def parse_bulk_issue_response(response: Any, count: int, base_url: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Map a /rest/api/3/issue/bulk response back onto the submitted issues.
+    
+    Args:
+        response: HTTP response of the bulk request
+        count: Number of issues submitted
+        base_url: Jira base URL used to build browse links
+    
+    Returns:
+        One entry per submitted issue ({"id", "key", "url"} or {"error"}),
+        or None if the response is not a bulk response at all
+    """
+    try:
+        data = response.json() if response.status_code in (200, 201, 400) else None
+    except ValueError:
+        data = None
+    
+    if not isinstance(data, dict) or ("issues" not in data and "errors" not in data):
+        return None
+    
+    # Jira reports failures by element index; created issues keep request order
+    failed: Dict[int, str] = {}
+    for error in data.get("errors", []):
+        element_errors = error.get("elementErrors", {})
+        messages = list(element_errors.get("errors", {}).values()) + element_errors.get("errorMessages", [])
+        failed[error.get("failedElementNumber")] = "; ".join(messages) or "rejected by Jira"
+    
+    issues = iter(data.get("issues", []))
+    results = []
+    for index in range(count):
+        if index in failed:
+            results.append({"error": failed[index]})
+            continue
+        
+        issue = next(issues, None)
+        if issue is None:
+            results.append({"error": "missing from bulk response"})
+            continue
+        
+        results.append({
+            "id": issue.get("id"),
+            "key": issue.get("key"),
+            "url": f"{base_url}/browse/{issue.get('key')}"
+        })
+    
+    return results
+
+
 class JiraIntegration(IntegrationBase):
     """
     Jira integration for test management.
@@ -61,10 +110,10 @@ class JiraIntegration(IntegrationBase):
         self._client: Optional[httpx.AsyncClient] = None
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client"""
+        """Get HTTP client backed by the shared connection pool"""
         if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
+            self._client = self._pooled_client(
+                self.base_url,
                 headers=self.headers,
                 auth=self.auth,
                 timeout=30.0,
@@ -155,63 +204,53 @@ class JiraIntegration(IntegrationBase):
         
         For failed tests: Creates bugs
         For passed tests: Optionally adds comments to linked issues
-        """
-        if not self.is_connected:
-            await self.connect()
         
+        Results are synced concurrently through the provider throttle.
+        """
+        sync_result = await self._collect_sync_results(
+            results, project_key=project_key, cycle_name=cycle_name, **kwargs
+        )
+        if "bugs" in sync_result.details:
+            sync_result.details["created_bugs"] = len(sync_result.details["bugs"])
+        return sync_result
+    
+    async def _prepare_sync(
+        self,
+        project_key: Optional[str] = None,
+        cycle_name: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Resolve the target project for a sync"""
         project = project_key or self.jira_config.default_project
         if not project:
-            return SyncResult(
-                provider=self.provider_name,
-                success=False,
-                errors=["No project key specified"]
-            )
-        
-        synced = 0
-        failed = 0
-        errors = []
-        created_bugs = []
+            raise SyncSetupError("No project key specified")
         
-        for result in results:
-            try:
-                if result.status == TestStatus.FAILED and self.jira_config.auto_create_bugs:
-                    # Create bug for failed test
-                    bug = await self.create_bug(
-                        title=f"[QA] Test Failed: {result.test_name}",
-                        description=self._format_test_result_for_bug(result),
-                        project_key=project,
-                        test_result=result,
-                        labels=[self.jira_config.label_prefix, "auto-generated"]
-                    )
-                    created_bugs.append(bug)
-                    synced += 1
-                    
-                elif result.issue_key:
-                    # Add comment to existing issue
-                    await self.add_comment(
-                        issue_key=result.issue_key,
-                        comment=f"✅ Test passed automatically\n\nDuration: {result.duration}s"
-                    )
-                    synced += 1
-                    
-                else:
-                    synced += 1  # Count as synced even if no action needed
-                    
-            except Exception as e:
-                failed += 1
-                errors.append(f"{result.test_name}: {str(e)}")
+        return {"project": project, "details": {"bugs": []}}
+    
+    async def _sync_result(self, result: TestResult, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a bug for a failed test or comment on its linked issue"""
+        if result.status == TestStatus.FAILED and self.jira_config.auto_create_bugs:
+            # Create bug for failed test
+            bug = await self.create_bug(
+                title=f"[QA] Test Failed: {result.test_name}",
+                description=self._format_test_result_for_bug(result),
+                project_key=context["project"],
+                test_result=result,
+                labels=[self.jira_config.label_prefix, "auto-generated"]
+            )
+            context["details"]["bugs"].append(bug)
+            return {"bug": bug}
+        
+        if result.issue_key:
+            # Add comment to existing issue
+            await self.add_comment(
+                issue_key=result.issue_key,
+                comment=f"✅ Test passed automatically\n\nDuration: {result.duration}s"
+            )
+            return {"commented_issue": result.issue_key}
         
-        return SyncResult(
-            provider=self.provider_name,
-            success=(failed == 0),
-            synced_count=synced,
-            failed_count=failed,
-            errors=errors,
-            details={
-                "created_bugs": len(created_bugs),
-                "bugs": created_bugs
-            }
-        )
+        # Count as synced even if no action needed
+        return {}
     
     # ==================== Test Case Methods ====================
     
@@ -354,31 +393,18 @@ class JiraIntegration(IntegrationBase):
         
         client = await self._get_client()
         
-        # Build issue payload
         payload = {
-            "fields": {
-                "project": {"key": project_key},
-                "summary": title,
-                "description": self._build_description(description),
-                "issuetype": {"name": self.jira_config.default_issue_type}
-            }
+            "fields": self._build_bug_fields(
+                title=title,
+                description=description,
+                project_key=project_key,
+                test_result=test_result,
+                priority=priority,
+                labels=labels
+            )
         }
         
-        if priority:
-            payload["fields"]["priority"] = {"name": priority}
-        else:
-            payload["fields"]["priority"] = {"name": "Medium"}
-        
-        if labels:
-            payload["fields"]["labels"] = labels
-        
-        # Add QA-specific labels
-        payload["fields"]["labels"] = payload["fields"].get("labels", []) + [
-            self.jira_config.label_prefix,
-            f"test-{test_result.test_id}" if test_result else ""
-        ]
-        
-        response = await client.post('/rest/api/3/issue', json=payload)
+        response = await self._send(lambda: client.post('/rest/api/3/issue', json=payload))
         
         if response.status_code == 201:
             data = response.json()
@@ -442,7 +468,7 @@ class JiraIntegration(IntegrationBase):
             await self.connect()
         
         client = await self._get_client()
-        response = await client.get('/rest/api/3/project')
+        response = await self._cached_get(client, '/rest/api/3/project')
         
         if response.status_code == 200:
             projects = response.json()
@@ -457,6 +483,121 @@ class JiraIntegration(IntegrationBase):
         
         return []
     
+    # ==================== Bulk Methods ====================
+    
+    async def create_bugs_bulk(
+        self,
+        bugs: List[Dict[str, Any]],
+        project_key: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Create bugs with Jira's bulk issue API (/rest/api/3/issue/bulk).
+        
+        Bugs are sent in chunks of `bulk_chunk_size` (Jira's limit is 50).
+        Chunks the endpoint rejects as a whole fall back to one request per bug.
+        """
+        if not bugs:
+            return []
+        
+        if not self.is_connected:
+            await self.connect()
+        
+        chunks = self._chunked([{"project_key": project_key, **bug} for bug in bugs])
+        chunk_results = await asyncio.gather(*[self._create_bug_chunk(chunk) for chunk in chunks])
+        
+        return [created for chunk in chunk_results for created in chunk]
+    
+    async def _create_bug_chunk(self, bugs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create up to 50 bugs in a single bulk request"""
+        client = await self._get_client()
+        payload = {"issueUpdates": [{"fields": self._build_bug_fields(**bug)} for bug in bugs]}
+        
+        response = await self._send(lambda: client.post('/rest/api/3/issue/bulk', json=payload))
+        
+        created = parse_bulk_issue_response(response, len(bugs), self.base_url)
+        if created is None:
+            # Bulk endpoint unavailable (e.g. older Jira Server): one request per bug
+            return await self._create_bugs_individually(bugs)
+        
+        return [
+            {"error": f"Failed to create bug: {issue['error']}"} if "error" in issue else issue
+            for issue in created
+        ]
+    
+    async def sync_test_results_bulk(
+        self,
+        results: List[TestResult],
+        project_key: Optional[str] = None,
+        cycle_name: Optional[str] = None,
+        **kwargs
+    ) -> SyncResult:
+        """
+        Sync test results to Jira using bulk issue creation.
+        
+        Bugs for failed tests are created 50 per request; comments on linked
+        issues have no bulk API and are sent concurrently.
+        """
+        if not self.is_connected:
+            await self.connect()
+        
+        project = project_key or self.jira_config.default_project
+        if not project:
+            return SyncResult(
+                provider=self.provider_name,
+                success=False,
+                errors=["No project key specified"]
+            )
+        
+        bug_results = [
+            r for r in results
+            if r.status == TestStatus.FAILED and self.jira_config.auto_create_bugs
+        ]
+        bug_result_ids = {id(r) for r in bug_results}
+        comment_results = [r for r in results if id(r) not in bug_result_ids and r.issue_key]
+        
+        created = await self.create_bugs_bulk([
+            {
+                "title": f"[QA] Test Failed: {result.test_name}",
+                "description": self._format_test_result_for_bug(result),
+                "test_result": result,
+                "labels": [self.jira_config.label_prefix, "auto-generated"]
+            }
+            for result in bug_results
+        ], project_key=project)
+        
+        async def comment(result: TestResult) -> Optional[str]:
+            try:
+                await self.add_comment(
+                    issue_key=result.issue_key,
+                    comment=f"✅ Test passed automatically\n\nDuration: {result.duration}s"
+                )
+                return None
+            except Exception as e:
+                return str(e)
+        
+        comment_errors = await asyncio.gather(*[comment(r) for r in comment_results])
+        
+        errors = [
+            f"{result.test_name}: {bug['error']}"
+            for result, bug in zip(bug_results, created) if "error" in bug
+        ] + [
+            f"{result.test_name}: {error}"
+            for result, error in zip(comment_results, comment_errors) if error
+        ]
+        bugs = [bug for bug in created if "error" not in bug]
+        
+        return SyncResult(
+            provider=self.provider_name,
+            success=not errors,
+            synced_count=len(results) - len(errors),
+            failed_count=len(errors),
+            errors=errors,
+            details={
+                "created_bugs": len(bugs),
+                "bugs": bugs
+            }
+        )
+    
     # ==================== Additional Jira Methods ====================
     
     async def add_comment(self, issue_key: str, comment: str) -> Dict[str, Any]:
@@ -476,7 +617,9 @@ class JiraIntegration(IntegrationBase):
             }
         }
         
-        response = await client.post(f'/rest/api/3/issue/{issue_key}/comment', json=payload)
+        response = await self._send(
+            lambda: client.post(f'/rest/api/3/issue/{issue_key}/comment', json=payload)
+        )
         
         if response.status_code == 201:
             return response.json()
@@ -588,6 +731,34 @@ class JiraIntegration(IntegrationBase):
     
     # ==================== Helpers ====================
     
+    def _build_bug_fields(
+        self,
+        title: str,
+        description: str,
+        project_key: str,
+        test_result: Optional[TestResult] = None,
+        severity: Optional[str] = None,
+        priority: Optional[str] = None,
+        labels: Optional[List[str]] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Build the issue fields for a bug"""
+        fields = {
+            "project": {"key": project_key},
+            "summary": title,
+            "description": self._build_description(description),
+            "issuetype": {"name": self.jira_config.default_issue_type},
+            "priority": {"name": priority or "Medium"}
+        }
+        
+        # Add QA-specific labels
+        fields["labels"] = (labels or []) + [
+            self.jira_config.label_prefix,
+            f"test-{test_result.test_id}" if test_result else ""
+        ]
+        
+        return fields
+    
     def _build_description(self, text: str) -> Dict[str, Any]:
         """Build Atlassian Document Format description"""
         return {
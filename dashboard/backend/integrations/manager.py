@@ -4,8 +4,9 @@ Integration Manager
 Centralized manager for all integrations.
 Handles registration, configuration, and orchestration of multiple providers.
 """
-from typing import Dict, List, Optional, Type, Any, Union
-from integrations.base import IntegrationBase, TestResult, SyncResult
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional, Type, Any, Union
+from integrations.base import IntegrationBase, TestResult, SyncResult, ResultSyncOutcome, SyncSetupError
 from .jira.client import JiraIntegration
 from .zephyr.client import ZephyrIntegration
 from .alm.client import ALMIntegration
@@ -250,58 +251,135 @@ class IntegrationManager:
         providers: Optional[List[str]] = None,
         project_key: Optional[str] = None,
         cycle_name: Optional[str] = None,
+        bulk: bool = False,
         **kwargs
     ) -> Dict[str, SyncResult]:
         """
         Synchronize test results across multiple providers.
         
+        Providers are synced concurrently; each provider bounds its own
+        request concurrency and backs off on HTTP 429.
+        
         Args:
             results: List of test results to sync
             providers: List of providers to sync to (None = all active)
             project_key: Project key for the sync
             cycle_name: Test cycle name
+            bulk: Use the providers' native bulk APIs (sync_test_results_bulk)
             **kwargs: Additional arguments passed to providers
         
         Returns:
             Dictionary with provider name as key and SyncResult as value
         """
         target_providers = providers or self._active_providers
-        sync_results = {}
-        
-        for provider in target_providers:
-            if provider not in self._instances:
-                sync_results[provider] = SyncResult(
-                    provider=provider,
-                    success=False,
-                    errors=[f"Integration not configured: {provider}"]
-                )
-                continue
+        
+        provider_results = await asyncio.gather(*[
+            self._sync_provider(provider, results, project_key, cycle_name, bulk, **kwargs)
+            for provider in target_providers
+        ])
+        
+        return dict(zip(target_providers, provider_results))
+    
+    async def _sync_provider(
+        self,
+        provider: str,
+        results: List[TestResult],
+        project_key: Optional[str] = None,
+        cycle_name: Optional[str] = None,
+        bulk: bool = False,
+        **kwargs
+    ) -> SyncResult:
+        """Sync results to a single provider, converting failures into a SyncResult"""
+        if provider not in self._instances:
+            return SyncResult(
+                provider=provider,
+                success=False,
+                errors=[f"Integration not configured: {provider}"]
+            )
+        
+        try:
+            integration = self._instances[provider]
+            
+            # Connect if not already connected
+            if not integration.is_connected:
+                await integration.connect()
+            
+            # Perform sync
+            sync = integration.sync_test_results_bulk if bulk else integration.sync_test_results
+            return await sync(
+                results=results,
+                project_key=project_key,
+                cycle_name=cycle_name,
+                **kwargs
+            )
             
+        except Exception as e:
+            return SyncResult(
+                provider=provider,
+                success=False,
+                errors=[str(e)]
+            )
+    
+    async def stream_sync_results(
+        self,
+        results: List[TestResult],
+        providers: Optional[List[str]] = None,
+        project_key: Optional[str] = None,
+        cycle_name: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[ResultSyncOutcome]:
+        """
+        Synchronize test results across providers, yielding outcomes as they complete.
+        
+        Outcomes of all providers are interleaved in completion order. A
+        provider that cannot sync at all (not configured, setup failure)
+        yields a single outcome without test_id.
+        
+        Args:
+            results: List of test results to sync
+            providers: List of providers to sync to (None = all active)
+            project_key: Project key for the sync
+            cycle_name: Test cycle name
+            **kwargs: Additional arguments passed to providers
+        
+        Yields:
+            ResultSyncOutcome for every (provider, result) pair
+        """
+        target_providers = providers or self._active_providers
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+        
+        async def pump(provider: str):
             try:
-                integration = self._instances[provider]
+                if provider not in self._instances:
+                    raise SyncSetupError(f"Integration not configured: {provider}")
                 
-                # Connect if not already connected
+                integration = self._instances[provider]
                 if not integration.is_connected:
                     await integration.connect()
                 
-                # Perform sync
-                result = await integration.sync_test_results(
-                    results=results,
-                    project_key=project_key,
-                    cycle_name=cycle_name,
-                    **kwargs
-                )
-                
-                sync_results[provider] = result
-                
+                async for outcome in integration.stream_sync_results(
+                    results, project_key=project_key, cycle_name=cycle_name, **kwargs
+                ):
+                    await queue.put(outcome)
             except Exception as e:
-                sync_results[provider] = SyncResult(
-                    provider=provider,
-                    success=False,
-                    errors=[str(e)]
-                )
-        
-        return sync_results
+                await queue.put(ResultSyncOutcome(provider=provider, success=False, error=str(e)))
+            finally:
+                await queue.put(done)
+        
+        tasks = [asyncio.create_task(pump(provider)) for provider in target_providers]
+        remaining = len(tasks)
+        try:
+            while remaining:
+                item = await queue.get()
+                if item is done:
+                    remaining -= 1
+                    continue
+                yield item
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
     
     async def create_test_case(
         self,
@@ -533,11 +611,13 @@ class IntegrationManager:
         """
         Perform bulk synchronization with different configurations per provider.
         
+        All mappings are synced concurrently.
+        
         Args:
             results: Test results to sync
             mappings: Provider-specific configurations
                 {
-                    "jira": {"project_key": "QA", "cycle_name": "Release 1.0"},
+                    "jira": {"project_key": "QA", "cycle_name": "Release 1.0", "bulk": True},
                     "zephyr": {"project_key": "QA", "cycle_name": "Sprint 1"},
                     "testlink": {"project_key": "QA Project", "cycle_name": "Cycle 1"}
                 }
@@ -545,20 +625,20 @@ class IntegrationManager:
         Returns:
             Nested dictionary with sync results per provider and configuration
         """
-        bulk_results = {}
+        providers = list(mappings.keys())
         
-        for provider, config in mappings.items():
-            project_key = config.get('project_key')
-            cycle_name = config.get('cycle_name')
-            
-            bulk_results[provider] = await self.sync_test_results(
+        provider_results = await asyncio.gather(*[
+            self.sync_test_results(
                 results=results,
                 providers=[provider],
-                project_key=project_key,
-                cycle_name=cycle_name
+                project_key=config.get('project_key'),
+                cycle_name=config.get('cycle_name'),
+                bulk=config.get('bulk', False)
             )
+            for provider, config in mappings.items()
+        ])
         
-        return bulk_results
+        return dict(zip(providers, provider_results))
 
 
 # Global singleton instance
@@ -0,0 +1,217 @@
+"""
+Adaptive Request Throttle
+
+Bounded-concurrency request pool shared by every call an integration makes
+during a sync. The concurrency limit follows an AIMD policy: it is halved
+whenever the provider answers HTTP 429 (honouring Retry-After) and grows back
+by one slot after a full window of successful requests.
+"""
+import asyncio
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+THROTTLE_STATUS_CODES = (429, 503)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP-date
+
+    Returns:
+        Seconds to wait, or None if the header is missing/invalid
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class AdaptiveThrottle:
+    """
+    Concurrency limiter with adaptive throttling for a single provider.
+
+    Features:
+    - At most `limit` requests in flight at any time
+    - Multiplicative decrease of the limit on HTTP 429/503
+    - Global pause until Retry-After has elapsed
+    - Additive increase back to `max_concurrency` on success
+    - Bounded retries with exponential backoff
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        min_concurrency: int = 1,
+        max_retries: int = 5,
+        base_backoff: float = 0.5,
+        max_backoff: float = 60.0
+    ):
+        """
+        Initialize throttle.
+
+        Args:
+            max_concurrency: Upper bound for concurrent requests
+            min_concurrency: Lower bound the limit never drops below
+            max_retries: Retries per request after a throttling response
+            base_backoff: Backoff (seconds) used when no Retry-After is sent
+            max_backoff: Cap for any single wait
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = max(1, min(min_concurrency, max_concurrency))
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        self._limit = max_concurrency
+        self._in_flight = 0
+        self._successes = 0
+        self._resume_at = 0.0
+        self._condition: Optional[asyncio.Condition] = None
+
+        # Statistics
+        self.total_requests = 0
+        self.throttled_responses = 0
+        self.retries = 0
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit"""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently in flight"""
+        return self._in_flight
+
+    def _get_condition(self) -> asyncio.Condition:
+        """Create the condition lazily so the throttle binds to the running loop"""
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def acquire(self):
+        """Wait for a free slot and for any Retry-After pause to end"""
+        condition = self._get_condition()
+
+        while True:
+            delay = self._resume_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            async with condition:
+                if self._in_flight < self._limit and self._resume_at <= time.monotonic():
+                    self._in_flight += 1
+                    return
+                await condition.wait()
+
+    async def release(self):
+        """Release a slot and wake up waiters"""
+        condition = self._get_condition()
+        async with condition:
+            self._in_flight -= 1
+            condition.notify_all()
+
+    def record_throttled(self, retry_after: Optional[float], attempt: int) -> float:
+        """
+        Register a throttling response.
+
+        Args:
+            retry_after: Seconds requested by the provider (if any)
+            attempt: Zero-based retry attempt for the request
+
+        Returns:
+            Seconds all requests will pause for
+        """
+        self.throttled_responses += 1
+        self._successes = 0
+        self._limit = max(self.min_concurrency, self._limit // 2)
+
+        if retry_after is None:
+            retry_after = self.base_backoff * (2 ** attempt)
+        delay = min(retry_after, self.max_backoff)
+
+        self._resume_at = max(self._resume_at, time.monotonic() + delay)
+        return delay
+
+    def record_success(self):
+        """Register a successful response (additive increase)"""
+        if self._limit >= self.max_concurrency:
+            return
+
+        self._successes += 1
+        if self._successes >= self._limit:
+            self._successes = 0
+            # Waiters pick up the extra slot on the next release
+            self._limit += 1
+
+    async def run(self, send: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Execute a request through the throttle.
+
+        Args:
+            send: Zero-argument coroutine factory performing the HTTP call
+
+        Returns:
+            The provider response (the last one if retries are exhausted)
+        """
+        attempt = 0
+
+        while True:
+            await self.acquire()
+            try:
+                self.total_requests += 1
+                response = await send()
+            finally:
+                await self.release()
+
+            status_code = getattr(response, "status_code", None)
+            if status_code not in THROTTLE_STATUS_CODES:
+                self.record_success()
+                return response
+
+            headers = getattr(response, "headers", None) or {}
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            if status_code == 503 and retry_after is None:
+                # Plain 503 without Retry-After is an outage, not throttling
+                return response
+
+            self.record_throttled(retry_after, attempt)
+            if attempt >= self.max_retries:
+                return response
+
+            attempt += 1
+            self.retries += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get throttle statistics"""
+        return {
+            "limit": self._limit,
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self._in_flight,
+            "total_requests": self.total_requests,
+            "throttled_responses": self.throttled_responses,
+            "retries": self.retries,
+        }
@@ -6,13 +6,15 @@ Zephyr uses Jira authentication and extends Jira with test management.
 
 API Reference: https://support.smartbear.com/zephyr-squad-cloud/api-docs/
 """
+import asyncio
 import time
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import httpx
 
-from integrations.base import IntegrationBase, TestResult, SyncResult, TestStatus
+from integrations.base import IntegrationBase, TestResult, SyncResult, TestStatus, SyncSetupError
 from integrations.zephyr.config import ZephyrConfig
+from integrations.jira.client import parse_bulk_issue_response
 
 
 class ZephyrIntegration(IntegrationBase):
@@ -62,10 +64,10 @@ class ZephyrIntegration(IntegrationBase):
         self._project_id_cache: Dict[str, str] = {}
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client"""
+        """Get HTTP client backed by the shared connection pool"""
         if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
+            self._client = self._pooled_client(
+                self.base_url,
                 headers=self.headers,
                 auth=self.auth,
                 timeout=30.0,
@@ -177,17 +179,21 @@ class ZephyrIntegration(IntegrationBase):
         cycle_name: Optional[str] = None,
         **kwargs
     ) -> SyncResult:
-        """Sync test results to Zephyr test cycle"""
-        if not self.is_connected:
-            await self.connect()
-        
+        """Sync test results to Zephyr test cycle (executions are created concurrently)"""
+        return await self._collect_sync_results(
+            results, project_key=project_key, cycle_name=cycle_name, **kwargs
+        )
+    
+    async def _prepare_sync(
+        self,
+        project_key: Optional[str] = None,
+        cycle_name: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Create the test cycle shared by all executions of this sync"""
         project = project_key or self.zephyr_config.default_project
         if not project:
-            return SyncResult(
-                provider=self.provider_name,
-                success=False,
-                errors=["No project key specified"]
-            )
+            raise SyncSetupError("No project key specified")
         
         # Create or get test cycle
         cycle_naming = cycle_name or self.zephyr_config.cycle_naming.format(
@@ -204,82 +210,65 @@ class ZephyrIntegration(IntegrationBase):
             )
             cycle_id = cycle.get('id')
         except Exception as e:
-            return SyncResult(
-                provider=self.provider_name,
-                success=False,
-                errors=[f"Failed to create test cycle: {str(e)}"]
-            )
+            raise SyncSetupError(f"Failed to create test cycle: {str(e)}")
         
-        synced = 0
-        failed = 0
-        errors = []
-        project_id = await self._get_project_id(project)
-        
-        for result in results:
-            try:
-                # Get or create test case
-                test_case_key = result.issue_key
-                if not test_case_key:
-                    test_case = await self.create_test_case(
-                        name=result.test_name,
-                        description=f"Auto-generated from {result.classname or 'test suite'}",
-                        project_key=project
-                    )
-                    test_case_key = test_case.get('key')
-                
-                # Get issue ID
-                client = await self._get_client()
-                issue_response = await client.get(f'/rest/api/3/issue/{test_case_key}')
-                if issue_response.status_code != 200:
-                    raise Exception(f"Issue not found: {test_case_key}")
-                
-                issue_id = issue_response.json().get('id')
-                
-                # Create execution record
-                execution_payload = {
-                    "issueId": issue_id,
-                    "projectId": project_id,
-                    "cycleId": cycle_id,
-                    "status": self._map_status_to_zephyr(result.status)
-                }
-                
-                exec_response = await client.post(
-                    '/rest/zapi/latest/execution',
-                    json=execution_payload
-                )
-                
-                if exec_response.status_code == 200:
-                    # Update execution with details
-                    exec_id = list(exec_response.json().keys())[0]
-                    
-                    await client.put(
-                        f'/rest/zapi/latest/execution/{exec_id}',
-                        json={
-                            "status": self._map_status_to_zephyr(result.status),
-                            "comment": f"Duration: {result.duration}s\n{result.error or ''}"
-                        }
-                    )
-                    synced += 1
-                else:
-                    failed += 1
-                    errors.append(f"{result.test_name}: Failed to create execution")
-                    
-            except Exception as e:
-                failed += 1
-                errors.append(f"{result.test_name}: {str(e)}")
-        
-        return SyncResult(
-            provider=self.provider_name,
-            success=(failed == 0),
-            synced_count=synced,
-            failed_count=failed,
-            errors=errors,
-            details={
+        return {
+            "project": project,
+            "project_id": await self._get_project_id(project),
+            "cycle_id": cycle_id,
+            "details": {
                 "cycle_id": cycle_id,
                 "cycle_name": cycle_naming,
                 "cycle_url": f"{self.base_url}/browse/{project}?selectedItem=zephyr-test-cycles"
             }
+        }
+    
+    async def _sync_result(self, result: TestResult, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Create (and annotate) a Zephyr execution for one result"""
+        # Get or create test case
+        test_case_key = result.issue_key
+        if not test_case_key:
+            test_case = await self.create_test_case(
+                name=result.test_name,
+                description=f"Auto-generated from {result.classname or 'test suite'}",
+                project_key=context["project"]
+            )
+            test_case_key = test_case.get('key')
+        
+        # Get issue ID
+        client = await self._get_client()
+        issue_response = await self._send(lambda: client.get(f'/rest/api/3/issue/{test_case_key}'))
+        if issue_response.status_code != 200:
+            raise Exception(f"Issue not found: {test_case_key}")
+        
+        issue_id = issue_response.json().get('id')
+        
+        # Create execution record
+        execution_payload = {
+            "issueId": issue_id,
+            "projectId": context["project_id"],
+            "cycleId": context["cycle_id"],
+            "status": self._map_status_to_zephyr(result.status)
+        }
+        
+        exec_response = await self._send(
+            lambda: client.post('/rest/zapi/latest/execution', json=execution_payload)
         )
+        
+        if exec_response.status_code != 200:
+            raise Exception("Failed to create execution")
+        
+        # Update execution with details
+        exec_id = list(exec_response.json().keys())[0]
+        
+        await self._send(lambda: client.put(
+            f'/rest/zapi/latest/execution/{exec_id}',
+            json={
+                "status": self._map_status_to_zephyr(result.status),
+                "comment": f"Duration: {result.duration}s\n{result.error or ''}"
+            }
+        ))
+        return {"execution_id": exec_id, "issue_key": test_case_key}
     
     def _map_status_to_zephyr(self, status: TestStatus) -> int:
         """Map test status to Zephyr status codes"""
@@ -309,26 +298,9 @@ class ZephyrIntegration(IntegrationBase):
         
         client = await self._get_client()
         
-        payload = {
-            "fields": {
-                "project": {"key": project_key},
-                "summary": name,
-                "description": {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [{
-                        "type": "paragraph",
-                        "content": [{"type": "text", "text": description}]
-                    }]
-                },
-                "issuetype": {"name": "Test"}  # Zephyr test case issue type
-            }
-        }
-        
-        if labels:
-            payload["fields"]["labels"] = labels
+        payload = {"fields": self._build_test_case_fields(name, description, project_key, labels)}
         
-        response = await client.post('/rest/api/3/issue', json=payload)
+        response = await self._send(lambda: client.post('/rest/api/3/issue', json=payload))
         
         if response.status_code == 201:
             data = response.json()
@@ -355,7 +327,8 @@ class ZephyrIntegration(IntegrationBase):
         project_id = await self._get_project_id(project_key)
         
         # Use Zephyr API to get tests
-        response = await client.get(
+        response = await self._cached_get(
+            client,
             '/rest/zapi/latest/zql',
             params={
                 'zqlQuery': f'project = "{project_key}" AND issueType = "Test"'
@@ -428,32 +401,17 @@ class ZephyrIntegration(IntegrationBase):
         client = await self._get_client()
         
         payload = {
-            "fields": {
-                "project": {"key": project_key},
-                "summary": title,
-                "description": {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [{
-                        "type": "paragraph",
-                        "content": [{"type": "text", "text": description}]
-                    }]
-                },
-                "issuetype": {"name": "Bug"},
-                "priority": {"name": priority or "Medium"}
-            }
+            "fields": self._build_bug_fields(
+                title=title,
+                description=description,
+                project_key=project_key,
+                test_result=test_result,
+                priority=priority,
+                labels=labels
+            )
         }
         
-        if labels:
-            payload["fields"]["labels"] = labels
-        
-        if test_result:
-            payload["fields"]["labels"] = payload["fields"].get("labels", []) + [
-                "auto-generated",
-                f"test-{test_result.test_id}"
-            ]
-        
-        response = await client.post('/rest/api/3/issue', json=payload)
+        response = await self._send(lambda: client.post('/rest/api/3/issue', json=payload))
         
         if response.status_code == 201:
             data = response.json()
@@ -509,7 +467,7 @@ class ZephyrIntegration(IntegrationBase):
             await self.connect()
         
         client = await self._get_client()
-        response = await client.get('/rest/api/3/project')
+        response = await self._cached_get(client, '/rest/api/3/project')
         
         if response.status_code == 200:
             projects = response.json()
@@ -561,6 +519,298 @@ class ZephyrIntegration(IntegrationBase):
         else:
             raise Exception(f"Failed to create cycle: {response.text}")
     
+    # ==================== Bulk Methods ====================
+    
+    async def create_bugs_bulk(
+        self,
+        bugs: List[Dict[str, Any]],
+        project_key: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Create bugs with Jira's bulk issue API (chunks of 50)"""
+        bugs = [{"project_key": project_key, **bug} for bug in bugs]
+        created = await self._create_issues_bulk([self._build_bug_fields(**bug) for bug in bugs])
+        
+        return [
+            issue if issue and "error" not in issue
+            else {"error": f"Failed to create bug: {issue['error'] if issue else 'request rejected'}"}
+            for issue in created
+        ]
+    
+    async def sync_test_results_bulk(
+        self,
+        results: List[TestResult],
+        project_key: Optional[str] = None,
+        cycle_name: Optional[str] = None,
+        **kwargs
+    ) -> SyncResult:
+        """
+        Sync test results to a Zephyr cycle using bulk operations.
+        
+        - Missing test cases are created with Jira's bulk issue API
+        - Issue IDs of existing test cases are resolved 50 keys per search
+        - Execution statuses are set with one updateBulkStatus call per status
+        - Comments are only written for results carrying an error
+        
+        Executions themselves are still created one request per result
+        (ZAPI has no synchronous bulk create).
+        """
+        if not self.is_connected:
+            await self.connect()
+        
+        try:
+            context = await self._prepare_sync(project_key=project_key, cycle_name=cycle_name, **kwargs)
+        except SyncSetupError as e:
+            return SyncResult(provider=self.provider_name, success=False, errors=[str(e)])
+        
+        project = context["project"]
+        errors: Dict[int, str] = {}
+        issue_ids: Dict[int, str] = {}
+        
+        # 1. Create missing test cases in bulk
+        missing = [i for i, r in enumerate(results) if not r.issue_key]
+        created = await self._create_issues_bulk([
+            self._build_test_case_fields(
+                results[i].test_name,
+                f"Auto-generated from {results[i].classname or 'test suite'}",
+                project
+            )
+            for i in missing
+        ])
+        for i, issue in zip(missing, created):
+            if issue is None:
+                errors[i] = "Failed to create test case"
+            elif "error" in issue:
+                errors[i] = f"Failed to create test case: {issue['error']}"
+            else:
+                issue_ids[i] = issue["id"]
+        
+        # 2. Resolve issue IDs of existing test cases
+        linked = [i for i, r in enumerate(results) if r.issue_key]
+        ids_by_key = await self._get_issue_ids([results[i].issue_key for i in linked])
+        for i in linked:
+            if results[i].issue_key in ids_by_key:
+                issue_ids[i] = ids_by_key[results[i].issue_key]
+            else:
+                errors[i] = f"Issue not found: {results[i].issue_key}"
+        
+        # 3. Create executions (concurrently, bounded by the throttle)
+        client = await self._get_client()
+        
+        async def create_execution(i: int) -> Optional[str]:
+            payload = {
+                "issueId": issue_ids[i],
+                "projectId": context["project_id"],
+                "cycleId": context["cycle_id"],
+                "status": self._map_status_to_zephyr(results[i].status)
+            }
+            try:
+                response = await self._send(
+                    lambda: client.post('/rest/zapi/latest/execution', json=payload)
+                )
+                if response.status_code == 200:
+                    return list(response.json().keys())[0]
+            except Exception as e:
+                errors[i] = str(e)
+                return None
+            errors[i] = "Failed to create execution"
+            return None
+        
+        pending = sorted(issue_ids)
+        execution_ids = dict(zip(pending, await asyncio.gather(*[create_execution(i) for i in pending])))
+        execution_ids = {i: exec_id for i, exec_id in execution_ids.items() if exec_id}
+        
+        # 4. Update statuses in bulk, one call per status
+        by_status: Dict[int, List[int]] = {}
+        for i in execution_ids:
+            by_status.setdefault(self._map_status_to_zephyr(results[i].status), []).append(i)
+        
+        await asyncio.gather(*[
+            self._update_execution_status_bulk(
+                {i: execution_ids[i] for i in indexes}, status, results, errors
+            )
+            for status, indexes in by_status.items()
+        ])
+        
+        # 5. Comments only where there is something to report
+        async def comment(i: int):
+            try:
+                await self._send(lambda: client.put(
+                    f'/rest/zapi/latest/execution/{execution_ids[i]}',
+                    json={
+                        "status": self._map_status_to_zephyr(results[i].status),
+                        "comment": f"Duration: {results[i].duration}s\n{results[i].error}"
+                    }
+                ))
+            except Exception as e:
+                errors[i] = str(e)
+        
+        await asyncio.gather(*[comment(i) for i in execution_ids if results[i].error and i not in errors])
+        
+        return SyncResult(
+            provider=self.provider_name,
+            success=not errors,
+            synced_count=len(results) - len(errors),
+            failed_count=len(errors),
+            errors=[f"{results[i].test_name}: {errors[i]}" for i in sorted(errors)],
+            details=context["details"]
+        )
+    
+    async def _update_execution_status_bulk(
+        self,
+        execution_ids: Dict[int, str],
+        status: int,
+        results: List[TestResult],
+        errors: Dict[int, str]
+    ):
+        """Set the status of many executions, falling back to one request each"""
+        client = await self._get_client()
+        
+        response = await self._send(lambda: client.put(
+            '/rest/zapi/latest/execution/updateBulkStatus',
+            json={"executions": list(execution_ids.values()), "status": status}
+        ))
+        if response.status_code == 200:
+            return
+        
+        async def update(i: int, exec_id: str):
+            response = await self._send(lambda: client.put(
+                f'/rest/zapi/latest/execution/{exec_id}',
+                json={
+                    "status": status,
+                    "comment": f"Duration: {results[i].duration}s\n{results[i].error or ''}"
+                }
+            ))
+            if response.status_code != 200:
+                errors[i] = "Failed to update execution"
+        
+        await asyncio.gather(*[update(i, exec_id) for i, exec_id in execution_ids.items()])
+    
+    async def _create_issues_bulk(
+        self,
+        issue_fields: List[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Create Jira issues 50 per request.
+        
+        Chunks the bulk endpoint rejects as a whole fall back to one request
+        per issue.
+        
+        Returns:
+            One entry per issue: {"id", "key", "url"}, {"error": str}, or None
+            if the single-request fallback failed too
+        """
+        if not issue_fields:
+            return []
+        
+        client = await self._get_client()
+        
+        async def create_chunk(chunk: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+            response = await self._send(lambda: client.post(
+                '/rest/api/3/issue/bulk',
+                json={"issueUpdates": [{"fields": fields} for fields in chunk]}
+            ))
+            created = parse_bulk_issue_response(response, len(chunk), self.base_url)
+            if created is not None:
+                return created
+            
+            # Bulk endpoint unavailable: one request per issue
+            async def create_one(fields: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                single = await self._send(lambda: client.post('/rest/api/3/issue', json={"fields": fields}))
+                if single.status_code != 201:
+                    return None
+                data = single.json()
+                return {
+                    "id": data.get("id"),
+                    "key": data.get("key"),
+                    "url": f"{self.base_url}/browse/{data.get('key')}"
+                }
+            
+            return list(await asyncio.gather(*[create_one(fields) for fields in chunk]))
+        
+        chunks = await asyncio.gather(*[create_chunk(chunk) for chunk in self._chunked(issue_fields)])
+        return [issue for chunk in chunks for issue in chunk]
+    
+    async def _get_issue_ids(self, issue_keys: List[str]) -> Dict[str, str]:
+        """Resolve issue keys to IDs, 50 keys per JQL search"""
+        client = await self._get_client()
+        unique_keys = list(dict.fromkeys(issue_keys))
+        
+        async def search(keys: List[str]) -> Dict[str, str]:
+            response = await self._send(lambda: client.post(
+                '/rest/api/3/search',
+                json={"jql": f"key in ({', '.join(keys)})", "maxResults": len(keys), "fields": ["id"]}
+            ))
+            if response.status_code != 200:
+                return {}
+            return {issue.get("key"): issue.get("id") for issue in response.json().get("issues", [])}
+        
+        ids: Dict[str, str] = {}
+        for chunk_ids in await asyncio.gather(*[search(keys) for keys in self._chunked(unique_keys)]):
+            ids.update(chunk_ids)
+        return ids
+    
+    def _build_test_case_fields(
+        self,
+        name: str,
+        description: str,
+        project_key: str,
+        labels: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Build the issue fields for a Zephyr test case"""
+        fields = {
+            "project": {"key": project_key},
+            "summary": name,
+            "description": self._build_description(description),
+            "issuetype": {"name": "Test"}  # Zephyr test case issue type
+        }
+        
+        if labels:
+            fields["labels"] = labels
+        
+        return fields
+    
+    def _build_bug_fields(
+        self,
+        title: str,
+        description: str,
+        project_key: str,
+        test_result: Optional[TestResult] = None,
+        severity: Optional[str] = None,
+        priority: Optional[str] = None,
+        labels: Optional[List[str]] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Build the issue fields for a bug linked to a test"""
+        fields = {
+            "project": {"key": project_key},
+            "summary": title,
+            "description": self._build_description(description),
+            "issuetype": {"name": "Bug"},
+            "priority": {"name": priority or "Medium"}
+        }
+        
+        if labels:
+            fields["labels"] = labels
+        
+        if test_result:
+            fields["labels"] = fields.get("labels", []) + [
+                "auto-generated",
+                f"test-{test_result.test_id}"
+            ]
+        
+        return fields
+    
+    def _build_description(self, text: str) -> Dict[str, Any]:
+        """Build Atlassian Document Format description"""
+        return {
+            "type": "doc",
+            "version": 1,
+            "content": [{
+                "type": "paragraph",
+                "content": [{"type": "text", "text": text}]
+            }]
+        }
+    
     # ==================== Configuration ====================
     
     def validate_config(self) -> Tuple[bool, List[str]]:
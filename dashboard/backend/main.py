@@ -11,12 +11,19 @@ from api.v1 import router as api_router
 from api.v1.health import router as health_router, set_startup_complete
 from api.v1.integrations import include_router as include_integrations_router
 from services.auth_service import get_current_user
+from services.outbox_service import outbox_dispatcher
+from services.api_key_service import api_key_cache, last_used_recorder
+from services.auth_service import password_pool
+from services.audit_service import audit_writer
+from integrations.http_client import client_registry
 from core.logging_config import configure_logging, get_logger
 from models import User
 from integration.qa_framework_client import get_qa_test_suites
 from middleware.apm import APMMiddleware, init_app_info
 from middleware.security_headers import SecurityHeadersMiddleware
 from middleware.rate_limit import RateLimitMiddleware
+from core.feature_flags import FeatureFlagScopeMiddleware, flag_manager
+from core.profiler import ProfilerMiddleware
 from prometheus_client import make_asgi_app
 
 # Configure structured logging
@@ -58,6 +65,12 @@ app.add_middleware(RateLimitMiddleware)
 # Add APM middleware
 app.add_middleware(APMMiddleware)
 
+# Memoize feature flag evaluations per request
+app.add_middleware(FeatureFlagScopeMiddleware)
+
+# Tag profiler samples with route and tenant (only while a profile runs)
+app.add_middleware(ProfilerMiddleware)
+
 # Include API routers
 app.include_router(api_router, prefix="/api/v1")
 app.include_router(health_router, prefix="/api/v1")
@@ -83,9 +96,43 @@ async def startup_event():
         environment=settings.ENVIRONMENT
     )
     
+    # Shared connection pools for integration and GitHub clients
+    client_registry.configure(
+        max_connections=settings.HTTP_POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_POOL_MAX_KEEPALIVE,
+        keepalive_expiry=settings.HTTP_POOL_KEEPALIVE_EXPIRY,
+        http2=settings.HTTP2_ENABLED
+    )
+    
+    # API key revocations from other workers and batched last_used_at writes
+    api_key_cache.start()
+    last_used_recorder.start()
+    
+    # Audit events are queued by requests and bulk-inserted in the background
+    audit_writer.start()
+    
+    if settings.FEATURE_FLAGS_RELOAD_INTERVAL > 0:
+        flag_manager.start_hot_reload(settings.FEATURE_FLAGS_RELOAD_INTERVAL)
+    
+    # Drain integration syncs, check runs, emails and notifications
+    if settings.OUTBOX_ENABLED:
+        outbox_dispatcher.start()
+    
     logger.info("QA-Framework Dashboard initialized successfully")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background workers, letting in-flight deliveries finish"""
+    await outbox_dispatcher.stop()
+    await client_registry.close()
+    await api_key_cache.stop()
+    await last_used_recorder.stop()
+    await audit_writer.stop()
+    await flag_manager.stop_hot_reload()
+    password_pool.shutdown(wait=False)
+
+
 @app.get("/")
 async def root():
     return {"message": "QA-Framework Dashboard API", "version": "0.1.0"}
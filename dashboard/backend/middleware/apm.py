@@ -4,19 +4,23 @@ APM Middleware - Application Performance Monitoring
 Provides comprehensive performance monitoring with Prometheus metrics:
 - Response time histograms (p50, p95, p99)
 - Throughput counters (requests/min)
-- Error rate gauges
+- Error rate over a sliding window
 - Database query time tracking
 - Cache hit/miss rates
 - Active requests gauge
+- Optional exemplars linking latency samples to trace IDs
 """
 
+import re
 import time
-from typing import Callable
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from prometheus_client import Counter, Histogram, Gauge, Info
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from prometheus_client import Counter, Histogram, Gauge, Info, REGISTRY
+from prometheus_client.core import GaugeMetricFamily
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import structlog
 
+from core.logging_config import get_request_id
+
 logger = structlog.get_logger()
 
 # Prometheus metrics
@@ -39,11 +43,6 @@ ACTIVE_REQUESTS = Gauge(
     ['method']
 )
 
-ERROR_RATE = Gauge(
-    'http_error_rate',
-    'HTTP error rate percentage',
-    ['endpoint']
-)
 
 DB_QUERY_LATENCY = Histogram(
     'db_query_duration_seconds',
@@ -70,7 +69,89 @@ APP_INFO = Info(
 )
 
 
-class APMMiddleware(BaseHTTPMiddleware):
+class _ErrorWindow:
+    """Requests and errors of one endpoint in per-second slots"""
+    
+    __slots__ = ("seconds", "totals", "errors")
+    
+    def __init__(self, size: int):
+        self.seconds = [-1] * size
+        self.totals = [0] * size
+        self.errors = [0] * size
+    
+    def record(self, second: int, is_error: bool) -> None:
+        slot = second % len(self.seconds)
+        if self.seconds[slot] != second:
+            self.seconds[slot] = second
+            self.totals[slot] = 0
+            self.errors[slot] = 0
+        self.totals[slot] += 1
+        if is_error:
+            self.errors[slot] += 1
+    
+    def rate(self, now: int) -> Optional[float]:
+        """Error percentage over the window, None without requests"""
+        size = len(self.seconds)
+        total = errors = 0
+        for slot, second in enumerate(self.seconds):
+            if now - size < second <= now:
+                total += self.totals[slot]
+                errors += self.errors[slot]
+        return errors / total * 100 if total else None
+
+
+class SlidingWindowErrorRate:
+    """
+    Per-endpoint error rate over the last ``window_seconds``
+    
+    Requests are counted into per-second slots; the percentage of 4xx/5xx
+    responses is computed when Prometheus scrapes, so recording a request
+    is two integer increments. Endpoints without requests in the window
+    are not exported.
+    """
+    
+    def __init__(self, name: str, documentation: str, window_seconds: int = 60):
+        self.name = name
+        self.documentation = documentation
+        self.window_seconds = window_seconds
+        self._windows: Dict[str, _ErrorWindow] = {}
+    
+    def window(self, endpoint: str) -> _ErrorWindow:
+        """Window of an endpoint, created on first use"""
+        window = self._windows.get(endpoint)
+        if window is None:
+            window = self._windows[endpoint] = _ErrorWindow(self.window_seconds)
+        return window
+    
+    def rate(self, endpoint: str) -> Optional[float]:
+        """Current error percentage of an endpoint"""
+        window = self._windows.get(endpoint)
+        return window.rate(int(time.monotonic())) if window else None
+    
+    def describe(self) -> List[GaugeMetricFamily]:
+        return [GaugeMetricFamily(self.name, self.documentation, labels=["endpoint"])]
+    
+    def collect(self) -> Iterable[GaugeMetricFamily]:
+        family = GaugeMetricFamily(self.name, self.documentation, labels=["endpoint"])
+        now = int(time.monotonic())
+        for endpoint, window in list(self._windows.items()):
+            rate = window.rate(now)
+            if rate is not None:
+                family.add_metric([endpoint], rate)
+        yield family
+
+
+ERROR_RATE = SlidingWindowErrorRate(
+    'http_error_rate',
+    'HTTP error rate percentage over the last 60 seconds'
+)
+REGISTRY.register(ERROR_RATE)
+
+# Endpoint label for requests no route matched (keeps label cardinality bounded)
+UNMATCHED_ENDPOINT = "unmatched"
+
+
+class APMMiddleware:
     """
     APM Middleware for FastAPI
     
@@ -78,104 +159,161 @@ class APMMiddleware(BaseHTTPMiddleware):
     - Request count by method, endpoint, status code
     - Request latency with histogram buckets
     - Active requests gauge
-    - Error rates
+    - Error rates over a sliding window
+    
+    A pure ASGI middleware: the response is passed through untouched, the
+    endpoint label is the matched route template (read from the scope after
+    routing, or from a lookup cached per path), and the metric children
+    for each (method, endpoint, status) are bound once and reused.
+    
+    With ``exemplars=True`` the request counter and latency histogram carry
+    the trace ID (W3C ``traceparent`` header, falling back to the request
+    ID) as an exemplar, visible when metrics are scraped as OpenMetrics.
     
     Usage:
         app.add_middleware(APMMiddleware)
+        app.add_middleware(APMMiddleware, exemplars=True)
     """
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Process request and collect metrics"""
+    def __init__(
+        self,
+        app: ASGIApp,
+        exemplars: bool = False,
+        trace_id_getter: Optional[Callable[[Scope], Optional[str]]] = None,
+        skip_paths: Tuple[str, ...] = ("/metrics",),
+        max_cached_paths: int = 10_000,
+    ):
+        """
+        Args:
+            app: ASGI application
+            exemplars: Attach trace ID exemplars to request metrics
+            trace_id_getter: Returns the trace ID of a request scope
+            skip_paths: Paths (and their sub-paths) not measured
+            max_cached_paths: Paths whose route template is remembered
+        """
+        self.app = app
+        self.exemplars = exemplars
+        self.trace_id_getter = trace_id_getter or _trace_id
+        self.skip_paths = frozenset(skip_paths)
+        self.skip_prefixes = tuple(f"{path.rstrip('/')}/" for path in skip_paths)
+        self.max_cached_paths = max_cached_paths
+        self._templates: Dict[str, str] = {}
+        self._active: Dict[str, Gauge] = {}
+        self._children: Dict[Tuple[str, str, int], tuple] = {}
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        path = scope["path"]
         
         # Skip metrics endpoint to avoid recursion
-        if request.url.path == "/metrics":
-            return await call_next(request)
+        if path in self.skip_paths or path.startswith(self.skip_prefixes):
+            await self.app(scope, receive, send)
+            return
         
-        method = request.method
-        endpoint = self._get_endpoint_pattern(request)
+        method = scope["method"]
+        active = self._active.get(method)
+        if active is None:
+            active = self._active[method] = ACTIVE_REQUESTS.labels(method=method)
         
-        # Track active requests
-        ACTIVE_REQUESTS.labels(method=method).inc()
+        status_code = 500
         
-        # Start timer
-        start_time = time.time()
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
         
+        active.inc()
+        start_time = time.perf_counter()
         try:
-            # Process request
-            response = await call_next(request)
-            
-            # Record metrics
-            status_code = str(response.status_code)
-            duration = time.time() - start_time
-            
-            # Update counters and histograms
-            REQUEST_COUNT.labels(
-                method=method,
-                endpoint=endpoint,
-                status_code=status_code
-            ).inc()
-            
-            REQUEST_LATENCY.labels(
-                method=method,
-                endpoint=endpoint
-            ).observe(duration)
-            
-            # Track error rate (4xx and 5xx)
-            if response.status_code >= 400:
-                ERROR_RATE.labels(endpoint=endpoint).set(1)
-            else:
-                ERROR_RATE.labels(endpoint=endpoint).set(0)
-            
-            return response
-            
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            # Record error
-            duration = time.time() - start_time
-            
-            REQUEST_COUNT.labels(
-                method=method,
-                endpoint=endpoint,
-                status_code='500'
-            ).inc()
-            
-            REQUEST_LATENCY.labels(
-                method=method,
-                endpoint=endpoint
-            ).observe(duration)
-            
-            ERROR_RATE.labels(endpoint=endpoint).set(1)
-            
             logger.error(
                 "Request failed",
                 method=method,
-                endpoint=endpoint,
+                endpoint=self._endpoint(scope, path),
                 error=str(e),
-                duration=duration
+                duration=time.perf_counter() - start_time
             )
-            
             raise
-            
         finally:
-            # Decrement active requests
-            ACTIVE_REQUESTS.labels(method=method).dec()
+            duration = time.perf_counter() - start_time
+            active.dec()
+            
+            key = (method, self._endpoint(scope, path), status_code)
+            children = self._children.get(key)
+            if children is None:
+                children = self._children[key] = self._bind(*key)
+            count, latency, window = children
+            
+            if self.exemplars:
+                trace_id = self.trace_id_getter(scope)
+                exemplar = {"trace_id": trace_id} if trace_id else None
+                count.inc(1, exemplar)
+                latency.observe(duration, exemplar)
+            else:
+                count.inc()
+                latency.observe(duration)
+            window.record(int(time.monotonic()), status_code >= 400)
     
-    def _get_endpoint_pattern(self, request: Request) -> str:
+    def _bind(self, method: str, endpoint: str, status_code: int) -> tuple:
+        """Metric children of one (method, endpoint, status) combination"""
+        return (
+            REQUEST_COUNT.labels(method=method, endpoint=endpoint, status_code=str(status_code)),
+            REQUEST_LATENCY.labels(method=method, endpoint=endpoint),
+            ERROR_RATE.window(endpoint),
+        )
+    
+    def _endpoint(self, scope: Scope, path: str) -> str:
+        """Route template of the request (e.g. /users/{user_id})"""
+        # FastAPI routes put themselves in the scope when they match
+        route = scope.get("route")
+        if route is not None:
+            template = getattr(route, "path", None)
+            if template is not None:
+                return template
+        
+        template = self._templates.get(path)
+        if template is None:
+            template = self._get_endpoint_pattern(scope, path)
+            if len(self._templates) < self.max_cached_paths:
+                self._templates[path] = template
+        return template
+    
+    def _get_endpoint_pattern(self, scope: Scope, path: str) -> str:
         """
-        Extract endpoint pattern from request
+        Extract endpoint pattern from the app's routes
         
         Converts /users/123 -> /users/{id}
         """
-        path = request.url.path
-        
-        # Try to get route pattern from FastAPI app
-        if hasattr(request.app, 'routes'):
-            for route in request.app.routes:
-                if hasattr(route, 'path') and hasattr(route, 'path_regex'):
-                    if route.path_regex.match(path):
-                        return route.path
-        
-        # Fallback to raw path if no pattern found
-        return path
+        app = scope.get("app")
+        for route in getattr(app, "routes", ()):
+            path_regex = getattr(route, "path_regex", None)
+            if path_regex is not None and path_regex.match(path):
+                return route.path
+        return UNMATCHED_ENDPOINT
+
+
+# W3C trace-id: 32 lowercase hex digits, not all zero
+_TRACE_ID = re.compile(r"(?!0{32})[0-9a-f]{32}")
+
+
+def _trace_id(scope: Scope) -> Optional[str]:
+    """Trace ID from a valid W3C traceparent header, else the request ID
+
+    Malformed trace IDs are ignored: an oversized one would make the
+    exemplar exceed Prometheus' label length limit.
+    """
+    for name, value in scope.get("headers", ()):
+        if name == b"traceparent":
+            parts = value.decode("latin-1").split("-")
+            if len(parts) >= 2 and _TRACE_ID.fullmatch(parts[1]):
+                return parts[1]
+            break
+    return get_request_id() or None
 
 
 def track_db_query(query_type: str):
@@ -314,3 +314,6 @@ class UsageRecord(Base):
 
 # Browser-Use Task Model
 from models.browser_use_task import BrowserUseTask, TaskStatus
+
+# Transactional outbox
+from models.outbox import OutboxMessage, OutboxStatus
@@ -0,0 +1,58 @@
+"""Transactional outbox model for QA-FRAMEWORK Dashboard."""
+from datetime import datetime
+from typing import Dict, Any
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Index
+
+from models import Base
+
+
+class OutboxStatus:
+    """Outbox message lifecycle states"""
+    PENDING = "pending"
+    PROCESSING = "processing"
+    DELIVERED = "delivered"
+    DEAD = "dead"
+
+
+class OutboxMessage(Base):
+    """
+    Side effect (integration sync, check run, email, notification) recorded in
+    the same transaction as the data that triggered it and delivered later by
+    the outbox dispatcher.
+    """
+    __tablename__ = "outbox_messages"
+
+    id = Column(Integer, primary_key=True, index=True)
+    destination = Column(String(64), nullable=False)  # integration_sync, github_check_run, email_test_report, notification
+    payload = Column(JSON, nullable=False, default=dict)
+    status = Column(String(20), nullable=False, default=OutboxStatus.PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=8)
+    available_at = Column(DateTime, nullable=False, default=datetime.utcnow)  # Next delivery attempt
+    locked_until = Column(DateTime, nullable=True)  # Lease held by a dispatcher while processing
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    delivered_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("idx_outbox_messages_status_available", "status", "available_at"),
+        Index("idx_outbox_messages_destination_status", "destination", "status"),
+    )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert outbox message to dictionary."""
+        return {
+            "id": self.id,
+            "destination": self.destination,
+            "payload": self.payload,
+            "status": self.status,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "available_at": self.available_at.isoformat() if self.available_at else None,
+            "last_error": self.last_error,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "delivered_at": self.delivered_at.isoformat() if self.delivered_at else None,
+        }
+
+    def __repr__(self):
+        return f"<OutboxMessage(id={self.id}, destination={self.destination}, status={self.status})>"
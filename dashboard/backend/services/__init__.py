@@ -6,6 +6,8 @@ Provides all business logic services for the QA-Framework Dashboard.
 from services.auth_service import (
     hash_password,
     verify_password,
+    hash_password_async,
+    verify_password_async,
     create_access_token,
     authenticate_user,
     get_current_user,
@@ -66,6 +68,8 @@ __all__ = [
     # Auth
     'hash_password',
     'verify_password',
+    'hash_password_async',
+    'verify_password_async',
     'create_access_token',
     'authenticate_user',
     'get_current_user',
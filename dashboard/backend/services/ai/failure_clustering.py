@@ -0,0 +1,233 @@
+"""
+Failure Clustering
+
+Groups test failures by error signature in a single streaming pass:
+- Normalize messages and stack traces (ids, numbers, paths, urls)
+- Mine message templates with a Drain-style fixed-depth parse tree
+- Keep counts and a few exemplars per cluster
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+WILDCARD = "<*>"
+
+# Applied in order; earlier masks protect their matches from later ones
+_MASKS: List[Tuple[re.Pattern, str]] = [
+    (re.compile(r"[a-zA-Z][a-zA-Z0-9+.\-]*://[^\s'\"<>]+"), "<URL>"),
+    (re.compile(r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b"), "<UUID>"),
+    (re.compile(r"(?:[A-Za-z]:)?(?:[\\/][\w.\-@]+){2,}[\\/]?"), "<PATH>"),
+    (re.compile(r"\b\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?\b"), "<IP>"),
+    (re.compile(r"\b0x[0-9a-fA-F]+\b|\b(?=[0-9a-fA-F]*\d)[0-9a-fA-F]{12,}\b"), "<HEX>"),
+    (re.compile(r"(?<![\w<])[-+]?\d+(?:\.\d+)?(?:e[-+]?\d+)?(?:ms|s|px|%|[kKMG]i?B)?(?![\w>])"), "<NUM>"),
+]
+
+# Innermost frame of Python ("File ..., line N, in func") and JS ("at func (") traces
+_PY_FRAME_RE = re.compile(r'File "[^"]*", line \d+, in (\S+)')
+_JS_FRAME_RE = re.compile(r"^\s*at (?:async )?([\w$.<>]+) \(", re.MULTILINE)
+
+_HAS_DIGIT_RE = re.compile(r"\d")
+
+
+def normalize_error(error_message: Optional[str], stack_trace: Optional[str] = None) -> str:
+    """
+    Reduce an error to its signature text
+
+    Only the first non-empty line of the message is kept, variable parts
+    are masked, and the innermost stack frame's function is appended so
+    identical messages raised from different places stay apart.
+    """
+    message = ""
+    for line in (error_message or "").splitlines():
+        if line.strip():
+            message = line.strip()
+            break
+
+    for pattern, replacement in _MASKS:
+        message = pattern.sub(replacement, message)
+
+    frame = _innermost_frame(stack_trace)
+    if frame:
+        message = f"{message} @ {frame}" if message else f"@ {frame}"
+    return message
+
+
+def _innermost_frame(stack_trace: Optional[str]) -> Optional[str]:
+    """Function name of the frame that raised, if the trace is recognized"""
+    if not stack_trace:
+        return None
+    python_frames = _PY_FRAME_RE.findall(stack_trace)
+    if python_frames:
+        return python_frames[-1]
+    js_frame = _JS_FRAME_RE.search(stack_trace)
+    return js_frame.group(1) if js_frame else None
+
+
+@dataclass
+class FailureCluster:
+    """Failures sharing one message template"""
+    cluster_id: int
+    template: List[str]
+    count: int = 0
+    exemplars: List[Dict[str, Any]] = field(default_factory=list)
+    test_names: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def signature(self) -> str:
+        return " ".join(self.template)
+
+    def to_dict(self, max_tests: int = 10) -> Dict[str, Any]:
+        """Serialize the cluster, listing its most frequent tests"""
+        top_tests = sorted(self.test_names.items(), key=lambda x: x[1], reverse=True)
+        return {
+            "cluster_id": self.cluster_id,
+            "signature": self.signature,
+            "count": self.count,
+            "distinct_tests": len(self.test_names),
+            "top_tests": [
+                {"test_name": name, "count": count}
+                for name, count in top_tests[:max_tests]
+            ],
+            "exemplars": self.exemplars,
+        }
+
+
+class DrainClusterer:
+    """
+    Streaming log-template miner (Drain)
+
+    Signatures are routed through a parse tree keyed by token count and
+    their first ``depth - 2`` tokens; within a leaf the most similar
+    template above ``similarity_threshold`` absorbs the signature, with
+    differing positions generalized to ``<*>``. Already-seen signatures
+    are resolved through an exact-match table without touching the tree.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.5,
+        depth: int = 4,
+        max_children: int = 100,
+        max_exemplars: int = 3,
+        max_signatures: int = 100_000
+    ):
+        if depth < 3:
+            raise ValueError("depth must be at least 3")
+        self.similarity_threshold = similarity_threshold
+        self.prefix_depth = depth - 2
+        self.max_children = max_children
+        self.max_exemplars = max_exemplars
+        self.max_signatures = max_signatures
+        self._root: Dict[Any, Any] = {}
+        self._clusters: List[FailureCluster] = []
+        self._by_signature: Dict[str, FailureCluster] = {}
+
+    @property
+    def clusters(self) -> List[FailureCluster]:
+        """Clusters by decreasing size"""
+        return sorted(self._clusters, key=lambda c: c.count, reverse=True)
+
+    def add(
+        self,
+        error_message: Optional[str],
+        stack_trace: Optional[str] = None,
+        test_name: Optional[str] = None,
+        exemplar: Optional[Dict[str, Any]] = None
+    ) -> FailureCluster:
+        """
+        Assign one failure to a cluster
+
+        Args:
+            error_message: Error message
+            stack_trace: Stack trace (optional)
+            test_name: Name of the failed test, counted per cluster (optional)
+            exemplar: Payload kept as an example of the cluster (optional)
+
+        Returns:
+            The cluster the failure was added to
+        """
+        signature = normalize_error(error_message, stack_trace)
+        cluster = self._by_signature.get(signature)
+        if cluster is None:
+            cluster = self._match_or_create(signature.split())
+            if len(self._by_signature) < self.max_signatures:
+                self._by_signature[signature] = cluster
+
+        cluster.count += 1
+        if test_name is not None:
+            cluster.test_names[test_name] = cluster.test_names.get(test_name, 0) + 1
+        if len(cluster.exemplars) < self.max_exemplars:
+            cluster.exemplars.append(exemplar if exemplar is not None else {
+                "test_name": test_name,
+                "error_message": error_message,
+            })
+        return cluster
+
+    def _match_or_create(self, tokens: List[str]) -> FailureCluster:
+        leaf = self._leaf(tokens)
+        best, best_similarity = None, -1.0
+        for cluster in leaf:
+            similarity = self._similarity(cluster.template, tokens)
+            if similarity > best_similarity:
+                best, best_similarity = cluster, similarity
+
+        if best is not None and best_similarity >= self.similarity_threshold:
+            best.template = [
+                current if current == token else WILDCARD
+                for current, token in zip(best.template, tokens)
+            ]
+            return best
+
+        cluster = FailureCluster(cluster_id=len(self._clusters) + 1, template=list(tokens))
+        self._clusters.append(cluster)
+        leaf.append(cluster)
+        return cluster
+
+    def _leaf(self, tokens: List[str]) -> List[FailureCluster]:
+        """Cluster list at the end of the token's parse tree path"""
+        node = self._root.setdefault(len(tokens), {})
+        for token in tokens[:self.prefix_depth]:
+            if _HAS_DIGIT_RE.search(token):
+                token = WILDCARD
+            child = node.get(token)
+            if child is None:
+                # Full nodes send new branches to the wildcard child
+                if len(node) >= self.max_children:
+                    token = WILDCARD
+                child = node.setdefault(token, {})
+            node = child
+        return node.setdefault(None, [])
+
+    @staticmethod
+    def _similarity(template: List[str], tokens: List[str]) -> float:
+        if not tokens:
+            return 1.0
+        same = sum(1 for current, token in zip(template, tokens) if current == token)
+        return same / len(tokens)
+
+
+def cluster_failures(
+    failures: Iterable[Dict[str, Any]],
+    clusterer: Optional[DrainClusterer] = None
+) -> List[FailureCluster]:
+    """
+    Cluster failures in one pass
+
+    Args:
+        failures: Dicts with ``error_message`` and optional ``stack_trace``
+            and ``test_name``
+        clusterer: Clusterer to feed (a fresh one by default)
+
+    Returns:
+        Clusters by decreasing size
+    """
+    clusterer = clusterer or DrainClusterer()
+    for failure in failures:
+        clusterer.add(
+            failure.get("error_message"),
+            failure.get("stack_trace"),
+            test_name=failure.get("test_name"),
+            exemplar=failure,
+        )
+    return clusterer.clusters
@@ -8,18 +8,79 @@ Analyzes test failures and suggests root causes:
 - Historical correlation
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 from datetime import datetime
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
 
+from config import settings
+from models import TestExecutionDetail
+from services.ai.failure_clustering import DrainClusterer
+from src.infrastructure.classification.failure_classifier import FailureClassifier
+
 logger = structlog.get_logger()
 
 
+# Common error patterns
+ERROR_PATTERNS = {
+    "assertion_failed": ["AssertionError", "assert", "expected"],
+    "timeout": ["TimeoutError", "timed out", "timeout"],
+    "element_not_found": ["NoSuchElement", "not found", "Unable to locate"],
+    "connection_refused": ["ConnectionRefused", "connection refused", "ECONNREFUSED"],
+    "null_pointer": ["NullPointerException", "NoneType", "undefined"],
+    "permission_denied": ["PermissionDenied", "403", "Forbidden"],
+    "not_found": ["404", "Not Found", "does not exist"],
+    "rate_limit": ["RateLimitExceeded", "429", "Too Many Requests"]
+}
+
+# Error categories, first match wins
+ERROR_TYPES = {
+    "assertion": ["assert", "expected", "should"],
+    "timeout": ["timeout", "timed out"],
+    "network": ["connection", "network", "ECONNREFUSED", "ETIMEDOUT"],
+    "element": ["element", "selector", "not found", "locate"],
+    "data": ["data", "null", "undefined", "NoneType"],
+    "permission": ["permission", "403", "forbidden"],
+    "resource": ["404", "not found", "does not exist"]
+}
+
+_classifiers: Dict[Optional[str], Tuple[FailureClassifier, FailureClassifier]] = {}
+
+
+def load_classifiers(
+    config_path: Optional[str] = None
+) -> Tuple[FailureClassifier, FailureClassifier]:
+    """
+    Compiled (pattern, error type) classifiers, built once per config
+    
+    Args:
+        config_path: JSON/YAML file with optional "patterns" and
+            "error_types" sections replacing the built-in keyword tables
+    
+    Returns:
+        Pattern classifier and error type classifier
+    """
+    
+    classifiers = _classifiers.get(config_path)
+    if classifiers is None:
+        config = FailureClassifier.load_config(config_path) if config_path else {}
+        classifiers = (
+            FailureClassifier.from_config(config.get("patterns", ERROR_PATTERNS)),
+            FailureClassifier.from_config(config.get("error_types", ERROR_TYPES))
+        )
+        _classifiers[config_path] = classifiers
+    return classifiers
+
+
 class RootCauseAnalyzer:
     """AI-powered root cause analysis"""
     
-    def __init__(self, llm_provider=None):
+    def __init__(self, llm_provider=None, classifier_config: Optional[str] = None):
         self.llm_provider = llm_provider
+        self.pattern_classifier, self.type_classifier = load_classifiers(
+            classifier_config or settings.FAILURE_CLASSIFIER_CONFIG
+        )
     
     async def analyze_failure(
         self,
@@ -83,25 +144,12 @@ class RootCauseAnalyzer:
         
         patterns = []
         
-        # Common error patterns
-        error_patterns = {
-            "assertion_failed": ["AssertionError", "assert", "expected"],
-            "timeout": ["TimeoutError", "timed out", "timeout"],
-            "element_not_found": ["NoSuchElement", "not found", "Unable to locate"],
-            "connection_refused": ["ConnectionRefused", "connection refused", "ECONNREFUSED"],
-            "null_pointer": ["NullPointerException", "NoneType", "undefined"],
-            "permission_denied": ["PermissionDenied", "403", "Forbidden"],
-            "not_found": ["404", "Not Found", "does not exist"],
-            "rate_limit": ["RateLimitExceeded", "429", "Too Many Requests"]
-        }
-        
-        for pattern_type, keywords in error_patterns.items():
-            if any(keyword in error_message for keyword in keywords):
-                patterns.append({
-                    "type": pattern_type,
-                    "keywords": [k for k in keywords if k in error_message],
-                    "severity": "high" if pattern_type in ["assertion_failed", "timeout"] else "medium"
-                })
+        for pattern_type, keywords in self.pattern_classifier.classify(error_message).items():
+            patterns.append({
+                "type": pattern_type,
+                "keywords": keywords,
+                "severity": "high" if pattern_type in ["assertion_failed", "timeout"] else "medium"
+            })
         
         # Stack trace patterns
         if stack_trace:
@@ -116,21 +164,8 @@ class RootCauseAnalyzer:
     def _cluster_error(self, error_message: str) -> Dict[str, str]:
         """Cluster error into category"""
         
-        error_types = {
-            "assertion": ["assert", "expected", "should"],
-            "timeout": ["timeout", "timed out"],
-            "network": ["connection", "network", "ECONNREFUSED", "ETIMEDOUT"],
-            "element": ["element", "selector", "not found", "locate"],
-            "data": ["data", "null", "undefined", "NoneType"],
-            "permission": ["permission", "403", "forbidden"],
-            "resource": ["404", "not found", "does not exist"]
-        }
-        
-        for error_type, keywords in error_types.items():
-            if any(keyword.lower() in error_message.lower() for keyword in keywords):
-                return {"type": error_type, "category": "test_failure"}
-        
-        return {"type": "unknown", "category": "test_failure"}
+        error_type = self.type_classifier.primary(error_message, default="unknown")
+        return {"type": error_type, "category": "test_failure"}
     
     async def _generate_root_cause_hypothesis(
         self,
@@ -231,24 +266,53 @@ class RootCauseAnalyzer:
     
     async def batch_analyze(
         self,
-        failures: List[Dict[str, Any]]
+        failures: Iterable[Dict[str, Any]],
+        max_clusters: int = 50
     ) -> Dict[str, Any]:
-        """Analyze multiple failures for patterns"""
+        """
+        Analyze multiple failures for patterns
+        
+        Failures are grouped by error signature in a single pass and root
+        cause analysis runs once per cluster, on its first exemplar.
+        
+        Args:
+            failures: Failures with test_name, error_message and stack_trace
+            max_clusters: Number of largest clusters to analyze
         
+        Returns:
+            Clusters with their analysis, ordered by size
+        """
+        
+        clusterer = DrainClusterer()
+        total_failures = 0
+        for failure in failures:
+            total_failures += 1
+            clusterer.add(
+                failure.get("error_message"),
+                failure.get("stack_trace"),
+                test_name=failure.get("test_name"),
+                exemplar=failure
+            )
+        
+        clusters = []
         analyses = []
         error_types = {}
         
-        for failure in failures:
+        for cluster in clusterer.clusters[:max_clusters]:
+            exemplar = cluster.exemplars[0]
             analysis = await self.analyze_failure(
-                test_name=failure.get("test_name"),
-                error_message=failure.get("error_message"),
-                stack_trace=failure.get("stack_trace")
+                test_name=exemplar.get("test_name"),
+                error_message=exemplar.get("error_message") or "",
+                stack_trace=exemplar.get("stack_trace")
             )
+            analysis["cluster_id"] = cluster.cluster_id
+            analysis["occurrences"] = cluster.count
             analyses.append(analysis)
+            clusters.append({**cluster.to_dict(), "analysis": analysis})
             
-            # Track error types
+            # Track error types, weighted by cluster size
             error_type = analysis["error_type"]
-            error_types[error_type] = error_types.get(error_type, 0) + 1
+            error_types[error_type] = error_types.get(error_type, 0) + cluster.count
         
         # Find most common root causes
         common_causes = sorted(
@@ -258,12 +322,61 @@ class RootCauseAnalyzer:
         )[:5]
         
         return {
-            "total_failures": len(failures),
+            "total_failures": total_failures,
+            "total_clusters": len(clusterer.clusters),
+            "clusters": clusters,
             "analyses": analyses,
             "common_causes": common_causes,
             "recommendation": await self._generate_batch_recommendation(common_causes)
         }
     
+    async def classify_stored_failures(
+        self,
+        db: AsyncSession,
+        since: Optional[datetime] = None,
+        batch_size: int = 5000
+    ) -> Dict[str, Any]:
+        """
+        Classify stored failure messages in one streaming pass
+        
+        Rows are fetched in batches of ``batch_size`` through a server-side
+        cursor, so memory stays flat however many failures are stored.
+        
+        Args:
+            db: Database session
+            since: Only failures started at or after this time (optional)
+            batch_size: Rows fetched per round trip
+        
+        Returns:
+            Failure counts by error type
+        """
+        
+        query = (
+            select(TestExecutionDetail.error_message)
+            .where(TestExecutionDetail.error_message.isnot(None))
+            .execution_options(yield_per=batch_size)
+        )
+        if since is not None:
+            query = query.where(TestExecutionDetail.started_at >= since)
+        
+        primary = self.type_classifier.primary
+        error_types: Dict[str, int] = {}
+        total = 0
+        
+        result = await db.stream(query)
+        async for batch in result.scalars().partitions():
+            for error_message in batch:
+                error_type = primary(error_message, default="unknown")
+                error_types[error_type] = error_types.get(error_type, 0) + 1
+            total += len(batch)
+        
+        logger.info("Stored failures classified", total=total, error_types=len(error_types))
+        
+        return {
+            "total_failures": total,
+            "error_types": dict(sorted(error_types.items(), key=lambda x: x[1], reverse=True))
+        }
+    
     async def _generate_batch_recommendation(
         self,
         common_causes: List[tuple]
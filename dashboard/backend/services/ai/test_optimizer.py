@@ -8,17 +8,130 @@ Suggests test optimizations:
 - Reduce flakiness
 """
 
-from typing import List, Dict, Any
+import hashlib
+import re
+from collections import OrderedDict, defaultdict
+from typing import List, Dict, Any, Optional, Tuple
 import structlog
 
 logger = structlog.get_logger()
 
+# Comments are dropped, string literals kept whole, everything else split
+# into identifiers/numbers and single punctuation characters
+_CODE_TOKEN_RE = re.compile(
+    r"""(?P<comment>\#[^\n]*)"""
+    r"""|(?P<token>"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'|\w+|[^\w\s])"""
+)
+
+
+def tokenize_code(code: str) -> List[str]:
+    """Split test code into tokens, ignoring comments and whitespace"""
+    return [
+        match.group("token")
+        for match in _CODE_TOKEN_RE.finditer(code or "")
+        if match.group("token") is not None
+    ]
+
+
+class MinHasher:
+    """
+    Shingled MinHash signatures
+
+    Each shingle is expanded by SHAKE-128 into ``num_perm`` independent
+    32-bit hash values; a signature keeps the minimum per position. The
+    Jaccard similarity of two shingle sets is estimated by the fraction of
+    positions that agree.
+    """
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self._digest_size = num_perm * 4
+
+    def shingles(self, tokens: List[str]) -> set:
+        """Every run of ``shingle_size`` consecutive tokens"""
+        size = self.shingle_size
+        if len(tokens) <= size:
+            return {" ".join(tokens).encode()} if tokens else set()
+        return {
+            " ".join(tokens[i:i + size]).encode()
+            for i in range(len(tokens) - size + 1)
+        }
+
+    def signature(self, code: str) -> Optional[Tuple[int, ...]]:
+        """MinHash signature of the code, or None when it has no tokens"""
+        shingles = self.shingles(tokenize_code(code))
+        if not shingles:
+            return None
+        digest_size = self._digest_size
+        rows = [
+            memoryview(hashlib.shake_128(shingle).digest(digest_size)).cast("I")
+            for shingle in shingles
+        ]
+        return tuple(map(min, zip(*rows)))
+
+    @staticmethod
+    def similarity(first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        matches = sum(1 for a, b in zip(first, second) if a == b)
+        return matches / len(first)
+
+
+class LSHIndex:
+    """
+    Locality-sensitive hashing over MinHash signatures
+
+    Signatures are cut into ``bands`` bands; two signatures become
+    candidates when any band is identical, so lookups only touch the
+    buckets they hash into instead of every indexed signature.
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 16):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[Any]] = defaultdict(list)
+
+    def _band_keys(self, signature: Tuple[int, ...]):
+        rows = self.rows
+        for band in range(self.bands):
+            yield band, signature[band * rows:(band + 1) * rows]
+
+    def insert(self, key: Any, signature: Tuple[int, ...]) -> None:
+        """Index a signature under ``key``"""
+        for band_key in self._band_keys(signature):
+            self._buckets[band_key].append(key)
+
+    def query(self, signature: Tuple[int, ...]) -> set:
+        """Keys sharing at least one band with the signature"""
+        candidates = set()
+        for band_key in self._band_keys(signature):
+            bucket = self._buckets.get(band_key)
+            if bucket:
+                candidates.update(bucket)
+        return candidates
+
 
 class TestOptimizer:
     """AI-powered test optimization"""
     
-    def __init__(self):
-        pass
+    def __init__(
+        self,
+        similarity_threshold: float = 0.8,
+        num_perm: int = 128,
+        bands: int = 16,
+        shingle_size: int = 5,
+        max_cached_signatures: int = 200_000
+    ):
+        self.similarity_threshold = similarity_threshold
+        self.bands = bands
+        self.minhasher = MinHasher(num_perm=num_perm, shingle_size=shingle_size)
+        self.max_cached_signatures = max_cached_signatures
+        # test id -> (version stamp, signature); reused while the test is unchanged
+        self._signature_cache: "OrderedDict[Any, Tuple[Any, Optional[Tuple[int, ...]]]]" = OrderedDict()
+        self.signature_cache_hits = 0
+        self.signature_cache_misses = 0
     
     async def analyze_suite(
         self,
@@ -96,43 +209,81 @@ class TestOptimizer:
         self,
         test_cases: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
-        """Detect potentially redundant tests"""
+        """
+        Detect near-duplicate tests
+
+        Each test is compared only against the earlier tests that share an
+        LSH band with it. A test is reported once, against the most similar
+        earlier test whose estimated Jaccard similarity reaches
+        ``similarity_threshold``.
+        """
         
         redundant = []
-        seen_signatures = {}
+        index = LSHIndex(num_perm=self.minhasher.num_perm, bands=self.bands)
+        signatures: List[Tuple[int, ...]] = []
+        indexed: List[Dict[str, Any]] = []
+        exact: Dict[Tuple[int, ...], int] = {}
         
         for test in test_cases:
-            # Create signature from test code
-            code = test.get("test_code", "")
-            signature = self._create_code_signature(code)
+            signature = self._get_signature(test)
+            if signature is None:
+                continue
+            
+            position = len(signatures)
+            signatures.append(signature)
             
-            if signature in seen_signatures:
+            # Identical signatures are already represented in the index
+            original = exact.get(signature)
+            if original is not None:
+                best, best_similarity = original, 1.0
+            else:
+                exact[signature] = position
+                best, best_similarity = None, 0.0
+                for candidate in sorted(index.query(signature)):
+                    similarity = MinHasher.similarity(signature, signatures[candidate])
+                    if similarity > best_similarity:
+                        best, best_similarity = candidate, similarity
+                index.insert(position, signature)
+            
+            if best is not None and best_similarity >= self.similarity_threshold:
+                duplicate_of = indexed[best]
                 redundant.append({
                     "test_id": test.get("id"),
                     "test_name": test.get("name"),
-                    "duplicate_of": seen_signatures[signature],
-                    "similarity": 0.95
+                    "duplicate_of": duplicate_of.get("name"),
+                    "duplicate_of_id": duplicate_of.get("id"),
+                    "similarity": round(best_similarity, 3)
                 })
-            else:
-                seen_signatures[signature] = test.get("name")
+            indexed.append(test)
         
         return redundant
     
-    def _create_code_signature(self, code: str) -> str:
-        """Create signature from code (normalize whitespace, remove comments)"""
-        
-        # Simple normalization (would be more sophisticated in production)
-        lines = []
-        for line in code.split("\n"):
-            # Remove comments
-            if "#" in line:
-                line = line[:line.index("#")]
-            # Normalize whitespace
-            line = " ".join(line.split())
-            if line:
-                lines.append(line)
-        
-        return "\n".join(lines)
+    def _get_signature(self, test: Dict[str, Any]) -> Optional[Tuple[int, ...]]:
+        """MinHash signature of a test, cached until its ``updated_at`` changes"""
+        
+        code = test.get("test_code", "") or ""
+        test_id = test.get("id")
+        if test_id is None:
+            return self.minhasher.signature(code)
+        
+        # Without a modification time, the code itself is the version
+        stamp = test.get("updated_at")
+        if stamp is None:
+            stamp = hashlib.blake2b(code.encode(), digest_size=16).digest()
+        
+        cached = self._signature_cache.get(test_id)
+        if cached is not None and cached[0] == stamp:
+            self._signature_cache.move_to_end(test_id)
+            self.signature_cache_hits += 1
+            return cached[1]
+        
+        self.signature_cache_misses += 1
+        signature = self.minhasher.signature(code)
+        self._signature_cache[test_id] = (stamp, signature)
+        self._signature_cache.move_to_end(test_id)
+        if len(self._signature_cache) > self.max_cached_signatures:
+            self._signature_cache.popitem(last=False)
+        return signature
     
     async def _identify_parallelizable_tests(
         self,
@@ -1,25 +1,265 @@
 """
 API Key Service - API Key Authentication for Integrations
+
+Verified keys are cached in-process by key hash for a short TTL, so repeat
+requests from CI systems authenticate without touching the database.
+Revocations are broadcast over Redis pub/sub to evict the key on every
+worker, and last_used_at updates are coalesced and flushed in batches.
 """
 
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List
+from typing import Any, Callable, Dict, Optional, List
 from fastapi import Depends, HTTPException, status
 from fastapi.security import APIKeyHeader
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, bindparam
 import secrets
 import hashlib
 
 from models import User, ApiKey
 from schemas import ApiKeyCreate, ApiKeyResponse
 from database import get_db_session
+from config import settings
 from core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
+REVOCATION_CHANNEL = "api_keys:revoked"
+
+
+@dataclass
+class VerifiedApiKey:
+    """An API key that passed validation, with its owner and scopes"""
+    key_id: str
+    user: User
+    scopes: List[str] = field(default_factory=list)
+    expires_at: Optional[datetime] = None
+
+    @property
+    def is_expired(self) -> bool:
+        return self.expires_at is not None and self.expires_at < datetime.utcnow()
+
+
+class ApiKeyCache:
+    """
+    In-process cache of verified API keys, keyed by key hash
+
+    Entries live for ``ttl`` seconds at most (and never past the key's own
+    expiry). Revocations are published on a Redis channel; every worker
+    subscribed through ``start()`` evicts the key immediately, the TTL bounds
+    staleness if a message is missed.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 30.0,
+        max_entries: int = 10_000,
+        channel: str = REVOCATION_CHANNEL,
+        redis_factory: Optional[Callable[[], Any]] = None
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.channel = channel
+        self._redis_factory = redis_factory
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._listener: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+        self.revocations = 0
+
+    def _redis(self):
+        if self._redis_factory is None:
+            from services.cache_service import get_redis_client
+            self._redis_factory = get_redis_client
+        return self._redis_factory()
+
+    def get(self, hashed_key: str) -> Optional[VerifiedApiKey]:
+        """Cached verification for a key hash, if still fresh"""
+        entry = self._entries.get(hashed_key)
+        if entry is None:
+            self.misses += 1
+            return None
+        deadline, verified = entry
+        if deadline < time.monotonic() or verified.is_expired:
+            self._entries.pop(hashed_key, None)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return verified
+
+    def put(self, hashed_key: str, verified: VerifiedApiKey):
+        """Cache a verification for ``ttl`` seconds"""
+        self._entries[hashed_key] = (time.monotonic() + self.ttl, verified)
+        self._entries.move_to_end(hashed_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, hashed_key: str) -> bool:
+        """Evict a key from this worker's cache"""
+        return self._entries.pop(hashed_key, None) is not None
+
+    def clear(self):
+        self._entries.clear()
+
+    async def revoke(self, hashed_key: str):
+        """Evict a key here and on every subscribed worker"""
+        self.invalidate(hashed_key)
+        self.revocations += 1
+        try:
+            await self._redis().publish(self.channel, hashed_key)
+        except Exception as e:
+            # Other workers drop the key when its TTL runs out
+            logger.warning("API key revocation broadcast failed", error=str(e))
+
+    @property
+    def is_listening(self) -> bool:
+        return self._listener is not None and not self._listener.done()
+
+    def start(self):
+        """Subscribe to revocations from other workers"""
+        if self.is_listening:
+            return
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        if self._listener is None:
+            return
+        self._listener.cancel()
+        try:
+            await self._listener
+        except (asyncio.CancelledError, Exception):
+            pass
+        self._listener = None
+
+    async def _listen(self):
+        while True:
+            pubsub = None
+            try:
+                pubsub = self._redis().pubsub()
+                await pubsub.subscribe(self.channel)
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    data = message["data"]
+                    self.invalidate(data.decode() if isinstance(data, bytes) else data)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Missed revocations are bounded by the TTL; flush to be safe
+                logger.warning("API key revocation listener failed", error=str(e))
+                self.clear()
+                await asyncio.sleep(5)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "revocations": self.revocations,
+            "listening": self.is_listening,
+        }
+
+
+class LastUsedRecorder:
+    """
+    Coalesces API key last_used_at updates
+
+    Requests only record a timestamp in memory; a background task writes
+    the latest timestamp per key in one batched UPDATE every
+    ``flush_interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = 5.0,
+        session_factory: Optional[Callable[[], AsyncSession]] = None
+    ):
+        self.flush_interval = flush_interval
+        self._session_factory = session_factory
+        self._pending: Dict[str, datetime] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self.flushed = 0
+
+    def _session(self) -> AsyncSession:
+        if self._session_factory is None:
+            from database import AsyncSessionFactory
+            self._session_factory = AsyncSessionFactory
+        return self._session_factory()
+
+    def touch(self, key_id: str, used_at: Optional[datetime] = None):
+        """Record a use of the key; only the latest timestamp is kept"""
+        self._pending[key_id] = used_at or datetime.utcnow()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    async def flush(self) -> int:
+        """Write pending timestamps in one batch; returns keys updated"""
+        if not self._pending:
+            return 0
+        pending, self._pending = self._pending, {}
+        table = ApiKey.__table__
+        statement = (
+            table.update()
+            .where(table.c.id == bindparam("key_id"))
+            .values(last_used_at=bindparam("used_at"))
+        )
+        try:
+            async with self._session() as session:
+                await session.execute(
+                    statement,
+                    [{"key_id": key_id, "used_at": used_at} for key_id, used_at in pending.items()]
+                )
+                await session.commit()
+        except Exception as e:
+            # Keep the timestamps for the next flush unless newer ones arrived
+            for key_id, used_at in pending.items():
+                self._pending.setdefault(key_id, used_at)
+            logger.error("API key last_used_at flush failed", keys=len(pending), error=str(e))
+            return 0
+        self.flushed += len(pending)
+        return len(pending)
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """Start the background flush loop"""
+        if self.is_running:
+            return
+        self._stop_event = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the loop and flush what is left"""
+        if self.is_running:
+            self._stop_event.set()
+            await self._task
+        await self.flush()
+
+    async def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
 
 class ApiKeyService:
     @staticmethod
@@ -57,28 +297,94 @@ class ApiKeyService:
         )
     
     @staticmethod
-    async def validate_api_key(db: AsyncSession, api_key: str) -> Optional[User]:
+    async def verify_api_key(db: AsyncSession, api_key: str) -> Optional[VerifiedApiKey]:
+        """
+        Verify an API key, from cache when possible
+        
+        A cache hit makes no database round trip; misses load the key and
+        its owner once. Neither path writes: last_used_at is recorded in
+        memory and flushed in batches.
+        
+        Args:
+            db: Database session
+            api_key: Raw API key
+        
+        Returns:
+            Verified key with user and scopes, or None
+        """
         if not api_key or not api_key.startswith("qaf_live_"):
             return None
         
         hashed_key = ApiKeyService.hash_api_key(api_key)
         
+        verified = api_key_cache.get(hashed_key)
+        if verified is None:
+            result = await db.execute(
+                select(ApiKey).where(and_(ApiKey.hashed_key == hashed_key, ApiKey.is_active == True))
+            )
+            key_record = result.scalar_one_or_none()
+            
+            if not key_record:
+                return None
+            
+            if key_record.expires_at and key_record.expires_at < datetime.utcnow():
+                return None
+            
+            result = await db.execute(select(User).where(User.id == key_record.user_id))
+            user = result.scalar_one_or_none()
+            if user is None:
+                return None
+            
+            verified = VerifiedApiKey(
+                key_id=key_record.id,
+                user=user,
+                scopes=list(key_record.scopes or []),
+                expires_at=key_record.expires_at
+            )
+            api_key_cache.put(hashed_key, verified)
+        
+        last_used_recorder.touch(verified.key_id)
+        return verified
+    
+    @staticmethod
+    async def validate_api_key(db: AsyncSession, api_key: str) -> Optional[User]:
+        verified = await ApiKeyService.verify_api_key(db, api_key)
+        return verified.user if verified else None
+    
+    @staticmethod
+    async def list_api_keys(db: AsyncSession, user_id: int) -> List[ApiKeyResponse]:
         result = await db.execute(
-            select(ApiKey).where(and_(ApiKey.hashed_key == hashed_key, ApiKey.is_active == True))
+            select(ApiKey)
+            .where(and_(ApiKey.user_id == user_id, ApiKey.is_active == True))
+            .order_by(ApiKey.created_at.desc())
+        )
+        return [
+            ApiKeyResponse(
+                id=key.id,
+                name=key.name,
+                key="qaf_live_********",  # raw keys are only shown once
+                scopes=key.scopes or [],
+                created_at=key.created_at,
+                expires_at=key.expires_at,
+                last_used_at=key.last_used_at
+            )
+            for key in result.scalars().all()
+        ]
+    
+    @staticmethod
+    async def revoke_api_key(db: AsyncSession, user_id: int, key_id: str) -> bool:
+        result = await db.execute(
+            select(ApiKey).where(and_(ApiKey.id == key_id, ApiKey.user_id == user_id))
         )
         key_record = result.scalar_one_or_none()
+        if not key_record or not key_record.is_active:
+            return False
         
-        if not key_record:
-            return None
-        
-        if key_record.expires_at and key_record.expires_at < datetime.utcnow():
-            return None
-        
-        key_record.last_used_at = datetime.utcnow()
+        key_record.is_active = False
         await db.commit()
-        
-        result = await db.execute(select(User).where(User.id == key_record.user_id))
-        return result.scalar_one_or_none()
+        await api_key_cache.revoke(key_record.hashed_key)
+        logger.info("API key revoked", key_id=key_id, user_id=user_id)
+        return True
 
 
 async def get_user_from_api_key(
@@ -90,4 +396,6 @@ async def get_user_from_api_key(
     return await ApiKeyService.validate_api_key(db, api_key)
 
 
+api_key_cache = ApiKeyCache(ttl=settings.API_KEY_CACHE_TTL)
+last_used_recorder = LastUsedRecorder(flush_interval=settings.API_KEY_LAST_USED_FLUSH_INTERVAL)
 api_key_service = ApiKeyService()
@@ -7,16 +7,23 @@ Logs critical actions for security and compliance:
 - API key creation/deletion
 - User permission changes
 - Data exports
+
+Events are written by a background AuditWriter: requests only enqueue the
+row, and the writer bulk-inserts batches outside the request transaction.
 """
 
+import asyncio
 import json
+import os
 from datetime import datetime
-from typing import Optional, Dict, Any
-from sqlalchemy import Column, Integer, String, DateTime, JSON, Text
+from typing import Optional, Dict, Any, Callable, List
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Text, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 import structlog
 
+from config import settings
+
 logger = structlog.get_logger()
 
 Base = declarative_base()
@@ -39,11 +46,300 @@ class AuditLog(Base):
     error_message = Column(Text, nullable=True)
 
 
+AUDIT_COLUMNS = (
+    "timestamp", "user_id", "action", "resource_type", "resource_id",
+    "ip_address", "user_agent", "details", "status", "error_message",
+)
+
+
+class AuditWriter:
+    """
+    Bounded queue of audit rows drained by a background bulk writer
+
+    A batch is written when ``batch_size`` rows are queued or
+    ``flush_interval`` seconds have passed, with COPY on PostgreSQL
+    (asyncpg) and one executemany INSERT elsewhere. When the queue is full
+    callers wait up to ``put_timeout`` seconds (backpressure); rows that
+    still do not fit, or whose batch fails to write, are appended to
+    ``spill_path`` as JSON lines and replayed once the database accepts
+    writes again. Without a spill file a failed batch goes back on the
+    queue and the writer backs off, doubling its wait from
+    ``flush_interval`` up to ``max_retry_delay`` seconds.
+    ``close()`` matches ShutdownManager's resource protocol.
+    """
+
+    def __init__(
+        self,
+        max_queue: int = 10_000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        put_timeout: float = 5.0,
+        spill_path: Optional[str] = None,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+        max_retry_delay: float = 30.0
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.spill_path = spill_path
+        self.max_retry_delay = max_retry_delay
+        self._session_factory = session_factory
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._task: Optional[asyncio.Task] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._has_spill = bool(spill_path and os.path.exists(spill_path))
+        self.written = 0
+        self.batches = 0
+        self.spilled = 0
+        self.dropped = 0
+        self.backpressure_waits = 0
+
+    def _session(self) -> AsyncSession:
+        if self._session_factory is None:
+            from database import AsyncSessionFactory
+            self._session_factory = AsyncSessionFactory
+        return self._session_factory()
+
+    @property
+    def queued(self) -> int:
+        return self._queue.qsize()
+
+    async def submit(self, row: Dict[str, Any]) -> bool:
+        """
+        Queue one audit row
+
+        Args:
+            row: Column values keyed by AUDIT_COLUMNS
+
+        Returns:
+            False if the row was dropped (queue full and no spill file)
+        """
+        try:
+            self._queue.put_nowait(row)
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        self.backpressure_waits += 1
+        try:
+            await asyncio.wait_for(self._queue.put(row), timeout=self.put_timeout)
+            return True
+        except asyncio.TimeoutError:
+            pass
+
+        if self.spill_path:
+            self._spill([row])
+            return True
+        self.dropped += 1
+        logger.error("Audit queue full - event dropped", action=row.get("action"))
+        return False
+
+    def _drain(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        batch = []
+        limit = self.batch_size if limit is None else limit
+        while len(batch) < limit:
+            try:
+                row = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if row is not None:
+                batch.append(row)
+        return batch
+
+    async def flush(self) -> int:
+        """
+        Write everything queued now; returns rows handed to the database or spill file
+
+        Stops at the first batch that can neither be written nor spilled,
+        leaving it and the rest on the queue.
+        """
+        total = 0
+        while True:
+            batch = self._drain()
+            if not batch:
+                return total
+            if not await self._write_or_spill(batch):
+                return total
+            total += len(batch)
+
+    async def _write_or_spill(self, batch: List[Dict[str, Any]]) -> bool:
+        """Write or spill a batch; False if it was put back on the queue"""
+        try:
+            await self._write(batch)
+        except Exception as e:
+            logger.error("Audit batch write failed", rows=len(batch), error=str(e))
+            if self.spill_path:
+                self._spill(batch)
+                return True
+            # Keep what fits for the next attempt
+            for index, row in enumerate(batch):
+                try:
+                    self._queue.put_nowait(row)
+                except asyncio.QueueFull:
+                    self.dropped += len(batch) - index
+                    break
+            return False
+        if self._has_spill:
+            await self.replay_spill()
+        return True
+
+    async def _write(self, rows: List[Dict[str, Any]]):
+        async with self._session() as session:
+            connection = await session.connection()
+            if connection.dialect.name == "postgresql":
+                raw = await connection.get_raw_connection()
+                driver = raw.driver_connection
+            else:
+                driver = None
+            if driver is not None and hasattr(driver, "copy_records_to_table"):
+                await driver.copy_records_to_table(
+                    AuditLog.__tablename__,
+                    records=[_copy_record(row) for row in rows],
+                    columns=list(AUDIT_COLUMNS),
+                )
+            else:
+                await session.execute(insert(AuditLog.__table__), rows)
+            await session.commit()
+        self.written += len(rows)
+        self.batches += 1
+
+    def _spill(self, rows: List[Dict[str, Any]]):
+        try:
+            with open(self.spill_path, "a", encoding="utf-8") as spill:
+                for row in rows:
+                    spill.write(json.dumps(row, default=_json_default) + "\n")
+        except OSError as e:
+            self.dropped += len(rows)
+            logger.error("Audit spill failed - events dropped", rows=len(rows), error=str(e))
+            return
+        self._has_spill = True
+        self.spilled += len(rows)
+        logger.warning("Audit events spilled to file", rows=len(rows), path=self.spill_path)
+
+    async def replay_spill(self) -> int:
+        """Write spilled rows back to the database; returns rows replayed"""
+        if not self.spill_path or not os.path.exists(self.spill_path):
+            self._has_spill = False
+            return 0
+        replay_path = self.spill_path + ".replay"
+        os.replace(self.spill_path, replay_path)
+        self._has_spill = False
+        with open(replay_path, encoding="utf-8") as spill:
+            rows = [_load_row(line) for line in spill if line.strip()]
+
+        replayed = 0
+        for start in range(0, len(rows), self.batch_size):
+            batch = rows[start:start + self.batch_size]
+            try:
+                await self._write(batch)
+            except Exception as e:
+                logger.error("Audit spill replay failed", rows=len(rows) - replayed, error=str(e))
+                self._spill(rows[start:])
+                break
+            replayed += len(batch)
+        os.remove(replay_path)
+        if replayed:
+            logger.info("Audit spill replayed", rows=replayed)
+        return replayed
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """Start the background writer"""
+        if self.is_running:
+            return
+        self._stop_event = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the writer and flush what is left"""
+        if self.is_running:
+            self._stop_event.set()
+            try:
+                # Wake the writer if it is waiting for the first row
+                self._queue.put_nowait(None)
+            except asyncio.QueueFull:
+                pass
+            await self._task
+        await self.flush()
+
+    async def close(self):
+        await self.stop()
+
+    async def _next_batch(self) -> List[Dict[str, Any]]:
+        """Rows until the batch is full or flush_interval has passed"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval
+        batch = self._drain()
+        while len(batch) < self.batch_size and not self._stop_event.is_set():
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                row = await asyncio.wait_for(self._queue.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                break
+            if row is not None:
+                batch.append(row)
+            batch.extend(self._drain(self.batch_size - len(batch)))
+        return batch
+
+    async def _run(self):
+        if self._has_spill:
+            await self.replay_spill()
+        retry_delay = 0.0
+        while not self._stop_event.is_set():
+            batch = await self._next_batch()
+            if not batch or await self._write_or_spill(batch):
+                retry_delay = 0.0
+                continue
+            # The database is down: wait before retrying the requeued rows
+            retry_delay = min(max(retry_delay * 2, self.flush_interval), self.max_retry_delay)
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=retry_delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "queued": self.queued,
+            "written": self.written,
+            "batches": self.batches,
+            "spilled": self.spilled,
+            "dropped": self.dropped,
+            "backpressure_waits": self.backpressure_waits,
+        }
+
+
+def _copy_record(row: Dict[str, Any]) -> tuple:
+    record = [row.get(column) for column in AUDIT_COLUMNS]
+    details_index = AUDIT_COLUMNS.index("details")
+    if record[details_index] is not None:
+        record[details_index] = json.dumps(record[details_index], default=str)
+    return tuple(record)
+
+
+def _json_default(value: Any):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _load_row(line: str) -> Dict[str, Any]:
+    row = json.loads(line)
+    if row.get("timestamp"):
+        row["timestamp"] = datetime.fromisoformat(row["timestamp"])
+    return row
+
+
 class AuditService:
     """Service for logging audit events"""
     
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, writer: Optional[AuditWriter] = None):
         self.db = db
+        self.writer = writer if writer is not None else audit_writer
     
     async def log_event(
         self,
@@ -72,23 +368,28 @@ class AuditService:
             error_message: Error message if failed
         
         Returns:
-            Created audit log entry
+            Audit log entry (not yet persisted when queued to the writer)
         """
-        log_entry = AuditLog(
-            user_id=user_id,
-            action=action,
-            resource_type=resource_type,
-            resource_id=resource_id,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            details=details,
-            status=status,
-            error_message=error_message
-        )
+        row = {
+            "timestamp": datetime.utcnow(),
+            "user_id": user_id,
+            "action": action,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+            "details": details,
+            "status": status,
+            "error_message": error_message,
+        }
+        log_entry = AuditLog(**row)
         
-        self.db.add(log_entry)
-        await self.db.commit()
-        await self.db.refresh(log_entry)
+        if self.writer.is_running:
+            await self.writer.submit(row)
+        else:
+            self.db.add(log_entry)
+            await self.db.commit()
+            await self.db.refresh(log_entry)
         
         logger.info(
             "Audit event logged",
@@ -233,3 +534,11 @@ class AuditService:
         )
         
         return result.scalar() or 0
+
+
+audit_writer = AuditWriter(
+    max_queue=settings.AUDIT_QUEUE_SIZE,
+    batch_size=settings.AUDIT_BATCH_SIZE,
+    flush_interval=settings.AUDIT_FLUSH_INTERVAL,
+    spill_path=settings.AUDIT_SPILL_PATH,
+)
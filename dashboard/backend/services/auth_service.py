@@ -2,10 +2,17 @@
 Authentication Service
 
 Provides JWT token generation and validation, password hashing, and user authentication.
+
+bcrypt runs on a dedicated bounded pool so logins never block the event
+loop, and decoded access tokens are cached with their user by ``jti``.
 """
 
+import hmac
+import time
+import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
@@ -18,6 +25,9 @@ from models import User
 from schemas import UserCreate, UserResponse, LoginRequest, TokenResponse
 from database import get_db_session
 from core.logging_config import get_logger, set_request_id
+from core.metrics import password_hash_pool_gauge, password_hash_wait_seconds
+from core.profiler import tag_request
+from src.infrastructure.auth.hashing_pool import HashingPool, HashingPoolFullError
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -25,6 +35,19 @@ logger = get_logger(__name__)
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+
+def _observe_hash_wait(wait: float):
+    password_hash_wait_seconds.observe(wait)
+    password_hash_pool_gauge.labels(state="queued").set(password_pool.queued)
+    password_hash_pool_gauge.labels(state="active").set(password_pool.active)
+
+
+password_pool = HashingPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+    on_wait=_observe_hash_wait,
+)
+
 # Security scheme
 security = HTTPBearer()
 
@@ -42,6 +65,93 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the hashing pool"""
+    return await password_pool.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the hashing pool"""
+    return await password_pool.run(verify_password, plain_password, hashed_password)
+
+
+class TokenCache:
+    """
+    Bounded cache of decoded access tokens and their users, keyed by jti
+
+    Entries live for ``ttl`` seconds at most and never past the token's
+    ``exp``. A hit requires the presented token to equal the cached one,
+    so a forged token reusing a jti still goes through full validation.
+    """
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 10_000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _jti(token: str) -> Optional[str]:
+        try:
+            return jwt.get_unverified_claims(token).get("jti")
+        except JWTError:
+            return None
+
+    def get(self, token: str) -> Optional[Tuple[Dict[str, Any], User]]:
+        """Cached payload and user for a token, if still fresh"""
+        jti = self._jti(token)
+        entry = self._entries.get(jti) if jti else None
+        if entry is None:
+            self.misses += 1
+            return None
+        deadline, cached_token, payload, user = entry
+        if deadline < time.time():
+            self._entries.pop(jti, None)
+            self.misses += 1
+            return None
+        if not hmac.compare_digest(cached_token, token):
+            self.misses += 1
+            return None
+        self._entries.move_to_end(jti)
+        self.hits += 1
+        return payload, user
+
+    def put(self, token: str, payload: Dict[str, Any], user: User):
+        """Cache a validated token; tokens without a jti are not cached"""
+        jti = payload.get("jti")
+        if not jti:
+            return
+        deadline = time.time() + self.ttl
+        if payload.get("exp") is not None:
+            deadline = min(deadline, float(payload["exp"]))
+        self._entries[jti] = (deadline, token, payload, user)
+        self._entries.move_to_end(jti)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, token: str) -> bool:
+        """Evict a token's cached principal"""
+        jti = self._jti(token)
+        return jti is not None and self._entries.pop(jti, None) is not None
+
+    def clear(self):
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+token_cache = TokenCache(
+    ttl=settings.TOKEN_CACHE_TTL,
+    max_entries=settings.TOKEN_CACHE_MAX_ENTRIES,
+)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token"""
     to_encode = data.copy()
@@ -53,6 +163,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         )
 
     to_encode.update({"exp": expire})
+    to_encode.setdefault("jti", uuid.uuid4().hex)
     encoded_jwt = jwt.encode(
         to_encode, settings.secret_key, algorithm=settings.algorithm
     )
@@ -72,7 +183,7 @@ async def authenticate_user(
         logger.warning("Authentication failed - user not found", username=username)
         return None
 
-    if not verify_password(password, user.hashed_password):
+    if not await verify_password_async(password, user.hashed_password):
         logger.warning(
             "Authentication failed - invalid password",
             username=username,
@@ -91,6 +202,11 @@ async def get_current_user(
     """Get current authenticated user from JWT token"""
     logger.debug("Validating JWT token")
 
+    cached = token_cache.get(credentials.credentials)
+    if cached is not None:
+        tag_request(tenant=cached[1].tenant_id)
+        return cached[1]
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -118,6 +234,8 @@ async def get_current_user(
         logger.warning("JWT validation failed - user not found", username=username)
         raise credentials_exception
 
+    token_cache.put(credentials.credentials, payload, user)
+    tag_request(tenant=user.tenant_id)
     logger.debug("JWT token validated successfully", username=username, user_id=user.id)
     return user
 
@@ -128,7 +246,15 @@ async def login_for_access_token(
     """Login and return access token"""
     logger.info("Login attempt", username=auth_request.username)
 
-    user = await authenticate_user(db, auth_request.username, auth_request.password)
+    try:
+        user = await authenticate_user(db, auth_request.username, auth_request.password)
+    except HashingPoolFullError:
+        logger.warning("Login rejected - password hashing pool saturated")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many concurrent logins, please retry",
+            headers={"Retry-After": "1"},
+        )
     if not user:
         logger.warning(
             "Login failed - invalid credentials", username=auth_request.username
@@ -238,6 +364,14 @@ async def get_current_user_optional(
         logger.debug("No credentials provided - returning None for optional auth")
         return None
     
+    cached = token_cache.get(credentials.credentials)
+    if cached is not None:
+        user = cached[1]
+        if not user.is_active:
+            return None
+        tag_request(tenant=user.tenant_id)
+        return user
+
     try:
         payload = jwt.decode(
             credentials.credentials,
@@ -251,9 +385,13 @@ async def get_current_user_optional(
         result = await db.execute(select(User).where(User.username == username))
         user = result.scalar_one_or_none()
         
-        if user is None or not user.is_active:
+        if user is None:
+            return None
+        token_cache.put(credentials.credentials, payload, user)
+        if not user.is_active:
             return None
         
+        tag_request(tenant=user.tenant_id)
         logger.debug("Optional auth - user found", username=username, user_id=user.id)
         return user
         
@@ -19,6 +19,7 @@ from schemas import TestExecutionCreate, TestExecutionUpdate
 from config import settings
 from core.logging_config import get_logger
 from core.cache import cache_manager, CacheManager
+from services.outbox_service import enqueue_execution_events
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -128,7 +129,7 @@ async def run_tests(execution_id: int, db: AsyncSession):
         result = await db.execute(
             select(TestExecution)
             .where(TestExecution.id == execution_id)
-            .options(selectinload(TestExecution.details))
+            .options(selectinload(TestExecution.details), selectinload(TestExecution.suite))
         )
         execution = result.scalar_one()
 
@@ -142,6 +143,7 @@ async def run_tests(execution_id: int, db: AsyncSession):
         passed = 0
         failed = 0
         skipped = 0
+        test_results = []
 
         for detail in execution.details:
             test_case = await db.execute(
@@ -198,6 +200,13 @@ async def run_tests(execution_id: int, db: AsyncSession):
                     error=str(e),
                 )
 
+            test_results.append({
+                "test_id": test.id,
+                "test_name": test.name,
+                "status": detail.status,
+                "duration": detail.duration,
+                "error": detail.error_message,
+            })
             await db.commit()
 
         # Update execution summary
@@ -216,6 +225,11 @@ async def run_tests(execution_id: int, db: AsyncSession):
             "skipped": skipped,
         }
 
+        # Integration syncs, check runs, report emails and notifications are
+        # delivered by the outbox dispatcher; queuing them in this commit
+        # means they are never lost or sent for an unsaved result.
+        enqueue_execution_events(db, execution, test_results, suite=execution.suite)
+
         await db.commit()
 
         # Invalidate execution and dashboard cache after completion
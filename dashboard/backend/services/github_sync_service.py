@@ -8,11 +8,13 @@ Bidirectional sync with GitHub:
 - Sync with GitHub Actions
 """
 
-import aiohttp
+import httpx
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import structlog
 
+from integrations.http_client import client_registry, credential_scope, etag_cache
+
 logger = structlog.get_logger()
 
 
@@ -26,6 +28,27 @@ class GitHubSyncService:
             "Authorization": f"token {access_token}",
             "Accept": "application/vnd.github.v3+json"
         }
+        self._scope = credential_scope("github", access_token)
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get HTTP client backed by the shared connection pool"""
+        return client_registry.get_client(
+            self.base_url,
+            scope=self._scope,
+            headers=self.headers,
+            timeout=30.0
+        )
+    
+    async def _get_json(self, url: str) -> Any:
+        """
+        GET revalidated with If-None-Match.
+        
+        GitHub answers unchanged resources with 304, which does not count
+        against the rate limit.
+        """
+        response = await etag_cache.get(self._get_client(), url, scope=self._scope)
+        response.raise_for_status()
+        return response.json()
     
     async def get_repository_info(
         self,
@@ -33,11 +56,7 @@ class GitHubSyncService:
         repo: str
     ) -> Dict[str, Any]:
         """Get repository information"""
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.base_url}/repos/{owner}/{repo}"
-            async with session.get(url, headers=self.headers) as response:
-                response.raise_for_status()
-                return await response.json()
+        return await self._get_json(f"/repos/{owner}/{repo}")
     
     async def list_test_files(
         self,
@@ -54,23 +73,19 @@ class GitHubSyncService:
         - *.test.js
         - *.spec.ts
         """
-        async with aiohttp.ClientSession() as session:
-            # Get tree
-            url = f"{self.base_url}/repos/{owner}/{repo}/git/trees/{branch}?recursive=1"
-            async with session.get(url, headers=self.headers) as response:
-                response.raise_for_status()
-                data = await response.json()
-            
-            # Filter test files
-            test_patterns = ["test_", "_test.py", ".test.js", ".spec.ts"]
-            test_files = [
-                file["path"]
-                for file in data.get("tree", [])
-                if file["type"] == "blob"
-                and any(pattern in file["path"] for pattern in test_patterns)
-            ]
-            
-            return test_files
+        # Get tree
+        data = await self._get_json(f"/repos/{owner}/{repo}/git/trees/{branch}?recursive=1")
+        
+        # Filter test files
+        test_patterns = ["test_", "_test.py", ".test.js", ".spec.ts"]
+        test_files = [
+            file["path"]
+            for file in data.get("tree", [])
+            if file["type"] == "blob"
+            and any(pattern in file["path"] for pattern in test_patterns)
+        ]
+        
+        return test_files
     
     async def create_pr_comment(
         self,
@@ -80,15 +95,12 @@ class GitHubSyncService:
         body: str
     ) -> Dict[str, Any]:
         """Create comment on pull request"""
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.base_url}/repos/{owner}/{repo}/issues/{pr_number}/comments"
-            async with session.post(
-                url,
-                headers=self.headers,
-                json={"body": body}
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
+        response = await self._get_client().post(
+            f"/repos/{owner}/{repo}/issues/{pr_number}/comments",
+            json={"body": body}
+        )
+        response.raise_for_status()
+        return response.json()
     
     async def create_status_check(
         self,
@@ -104,19 +116,16 @@ class GitHubSyncService:
         
         States: pending, success, failure, error
         """
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.base_url}/repos/{owner}/{repo}/statuses/{sha}"
-            async with session.post(
-                url,
-                headers=self.headers,
-                json={
-                    "state": state,
-                    "description": description,
-                    "context": context
-                }
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
+        response = await self._get_client().post(
+            f"/repos/{owner}/{repo}/statuses/{sha}",
+            json={
+                "state": state,
+                "description": description,
+                "context": context
+            }
+        )
+        response.raise_for_status()
+        return response.json()
     
     async def create_check_run(
         self,
@@ -134,27 +143,24 @@ class GitHubSyncService:
         Status: queued, in_progress, completed
         Conclusion: success, failure, neutral, cancelled, timed_out, action_required
         """
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.base_url}/repos/{owner}/{repo}/check-runs"
-            payload = {
-                "name": name,
-                "head_sha": head_sha,
-                "status": status
-            }
-            
-            if conclusion:
-                payload["conclusion"] = conclusion
-            
-            if output:
-                payload["output"] = output
-            
-            async with session.post(
-                url,
-                headers=self.headers,
-                json=payload
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
+        payload = {
+            "name": name,
+            "head_sha": head_sha,
+            "status": status
+        }
+        
+        if conclusion:
+            payload["conclusion"] = conclusion
+        
+        if output:
+            payload["output"] = output
+        
+        response = await self._get_client().post(
+            f"/repos/{owner}/{repo}/check-runs",
+            json=payload
+        )
+        response.raise_for_status()
+        return response.json()
     
     async def get_pull_request_files(
         self,
@@ -163,11 +169,7 @@ class GitHubSyncService:
         pr_number: int
     ) -> List[Dict[str, Any]]:
         """Get files changed in pull request"""
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.base_url}/repos/{owner}/{repo}/pulls/{pr_number}/files"
-            async with session.get(url, headers=self.headers) as response:
-                response.raise_for_status()
-                return await response.json()
+        return await self._get_json(f"/repos/{owner}/{repo}/pulls/{pr_number}/files")
     
     async def format_test_results_comment(
         self,
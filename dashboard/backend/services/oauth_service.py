@@ -13,7 +13,7 @@ import secrets
 
 from models import User
 from schemas import TokenResponse, OAuthLoginRequest
-from services.auth_service import create_access_token, hash_password
+from services.auth_service import create_access_token, hash_password_async
 from core.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -162,7 +162,7 @@ class OAuthService:
             user = User(
                 email=email,
                 username=username,
-                hashed_password=hash_password(secrets.token_urlsafe(32)),
+                hashed_password=await hash_password_async(secrets.token_urlsafe(32)),
                 full_name=name,
                 tenant_id=tenant_id,
                 oauth_provider=oauth_request.provider,
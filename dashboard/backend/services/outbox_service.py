@@ -0,0 +1,842 @@
+"""
+Outbox Service
+
+Transactional outbox for the side effects of a test execution:
+- Integration syncs (Jira, Zephyr, Azure DevOps, ...)
+- GitHub check runs
+- Test report emails
+- Notification fan-out
+
+Producers add OutboxMessage rows to the caller's session, so they commit (or
+roll back) atomically with the execution result. OutboxDispatcher drains the
+table in the background: batched claims, bounded concurrency per destination,
+exponential backoff with jitter and a dead-letter status once a message runs
+out of attempts.
+"""
+
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import select, update, delete, and_, or_, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import settings
+from core.logging_config import get_logger
+from core.metrics import (
+    outbox_queue_depth_gauge,
+    outbox_lag_seconds_gauge,
+    outbox_messages_total,
+    outbox_delivery_seconds,
+)
+from models.outbox import OutboxMessage, OutboxStatus
+
+logger = get_logger(__name__)
+
+
+# Destinations
+INTEGRATION_SYNC = "integration_sync"
+GITHUB_CHECK_RUN = "github_check_run"
+EMAIL_TEST_REPORT = "email_test_report"
+NOTIFICATION = "notification"
+
+OutboxHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+class OutboxPermanentError(Exception):
+    """Delivery failure that retrying cannot fix; the message is dead-lettered"""
+
+
+# ==================== Producers ====================
+
+def enqueue(
+    db: AsyncSession,
+    destination: str,
+    payload: Dict[str, Any],
+    max_attempts: Optional[int] = None,
+    delay: float = 0.0
+) -> OutboxMessage:
+    """
+    Add a message to the outbox within the caller's transaction.
+
+    The message is only visible to the dispatcher once the caller commits.
+
+    Args:
+        db: Session holding the business transaction
+        destination: Handler key (e.g. "integration_sync")
+        payload: JSON-serializable handler arguments
+        max_attempts: Attempts before the message is dead-lettered
+        delay: Seconds before the first delivery attempt
+
+    Returns:
+        The pending OutboxMessage
+    """
+    now = datetime.utcnow()
+    message = OutboxMessage(
+        destination=destination,
+        payload=payload,
+        status=OutboxStatus.PENDING,
+        attempts=0,
+        max_attempts=max_attempts or settings.OUTBOX_MAX_ATTEMPTS,
+        available_at=now + timedelta(seconds=delay),
+        created_at=now,
+    )
+    db.add(message)
+    return message
+
+
+def enqueue_integration_sync(
+    db: AsyncSession,
+    results: List[Dict[str, Any]],
+    providers: List[str],
+    project_key: Optional[str] = None,
+    bulk: bool = False
+) -> List[OutboxMessage]:
+    """
+    Queue a test result sync, one message per provider.
+
+    Splitting by provider keeps retries scoped: a Jira outage does not
+    re-sync results that Azure DevOps already accepted.
+
+    Args:
+        db: Session holding the business transaction
+        results: Serialized integrations.base.TestResult dicts
+        providers: Integration providers to sync to
+        project_key: Project key for the sync
+        bulk: Use the providers' native bulk APIs
+
+    Returns:
+        The pending OutboxMessages
+    """
+    return [
+        enqueue(db, INTEGRATION_SYNC, {
+            "provider": provider,
+            "results": results,
+            "project_key": project_key,
+            "bulk": bulk,
+        })
+        for provider in providers
+    ]
+
+
+def enqueue_check_run(
+    db: AsyncSession,
+    owner: str,
+    repo: str,
+    head_sha: str,
+    name: str,
+    status: str,
+    conclusion: Optional[str] = None,
+    output: Optional[Dict[str, str]] = None
+) -> OutboxMessage:
+    """Queue a GitHub check run (see GitHubSyncService.create_check_run)"""
+    return enqueue(db, GITHUB_CHECK_RUN, {
+        "owner": owner,
+        "repo": repo,
+        "head_sha": head_sha,
+        "name": name,
+        "status": status,
+        "conclusion": conclusion,
+        "output": output,
+    })
+
+
+def enqueue_test_report(
+    db: AsyncSession,
+    to_email: str,
+    project_name: str,
+    execution_date: str,
+    total_tests: int,
+    passed: int,
+    failed: int,
+    duration: str,
+    report_url: str,
+    failed_tests: Optional[List[Dict[str, Any]]] = None
+) -> OutboxMessage:
+    """Queue a test report email (see EmailService.send_test_report)"""
+    return enqueue(db, EMAIL_TEST_REPORT, {
+        "to_email": to_email,
+        "project_name": project_name,
+        "execution_date": execution_date,
+        "total_tests": total_tests,
+        "passed": passed,
+        "failed": failed,
+        "duration": duration,
+        "report_url": report_url,
+        "failed_tests": failed_tests,
+    })
+
+
+def enqueue_notification(
+    db: AsyncSession,
+    user_ids: Iterable[int],
+    type: str,
+    title: str,
+    message: str,
+    data: Optional[Dict[str, Any]] = None
+) -> OutboxMessage:
+    """Queue an in-app notification fanned out to several users"""
+    return enqueue(db, NOTIFICATION, {
+        "user_ids": sorted(set(user_ids)),
+        "type": type,
+        "title": title,
+        "message": message,
+        "data": data or {},
+    })
+
+
+def enqueue_execution_events(
+    db: AsyncSession,
+    execution: Any,
+    results: List[Dict[str, Any]],
+    suite: Optional[Any] = None
+) -> List[OutboxMessage]:
+    """
+    Queue every side effect of a finished execution.
+
+    Destinations beyond the owner's notification are opted into through the
+    suite config:
+
+        {
+            "report_emails": ["qa@example.com"],
+            "integrations": {"providers": ["jira"], "project_key": "QA", "bulk": true},
+            "github": {"owner": "org", "repo": "app", "head_sha": "abc123"}
+        }
+
+    Args:
+        db: Session holding the execution update
+        execution: Completed TestExecution
+        results: Per-test results ({test_id, test_name, status, duration, error})
+        suite: TestSuite the execution belongs to
+
+    Returns:
+        The pending OutboxMessages
+    """
+    config = (getattr(suite, "config", None) or {}) if suite is not None else {}
+    suite_name = getattr(suite, "name", None) or f"Suite {execution.suite_id}"
+    total = execution.total_tests or len(results)
+    passed = execution.passed_tests or 0
+    failed = execution.failed_tests or 0
+    pass_rate = (passed / total * 100) if total else 0.0
+    failed_results = [r for r in results if r.get("status") not in ("passed", "skipped")]
+    messages = []
+
+    if execution.executed_by:
+        if failed:
+            messages.append(enqueue_notification(
+                db, [execution.executed_by], "test_failed", "Test Suite Failed",
+                f"{suite_name} failed with {failed} test(s) failing",
+                {"suite_id": execution.suite_id, "execution_id": execution.id, "failed_tests": failed}
+            ))
+        else:
+            status = "passed" if pass_rate == 100 else "completed"
+            messages.append(enqueue_notification(
+                db, [execution.executed_by], "test_completed", f"Test Suite {status.title()}",
+                f"{suite_name} completed with {pass_rate:.1f}% pass rate",
+                {"suite_id": execution.suite_id, "execution_id": execution.id, "pass_rate": pass_rate}
+            ))
+
+    for email in config.get("report_emails") or []:
+        messages.append(enqueue_test_report(
+            db,
+            to_email=email,
+            project_name=suite_name,
+            execution_date=(execution.ended_at or datetime.utcnow()).isoformat(),
+            total_tests=total,
+            passed=passed,
+            failed=failed,
+            duration=f"{execution.duration or 0}s",
+            report_url=f"{settings.frontend_url}/executions/{execution.id}",
+            failed_tests=[{"name": r["test_name"], "error": r.get("error")} for r in failed_results],
+        ))
+
+    integrations = config.get("integrations") or {}
+    if integrations.get("providers"):
+        sync_results = [
+            {
+                "test_id": str(r["test_id"]),
+                "test_name": r["test_name"],
+                "status": r["status"] if r.get("status") in ("passed", "failed", "skipped") else "failed",
+                "duration": float(r.get("duration") or 0),
+                "error": r.get("error"),
+            }
+            for r in results
+        ]
+        messages.extend(enqueue_integration_sync(
+            db,
+            sync_results,
+            providers=integrations["providers"],
+            project_key=integrations.get("project_key"),
+            bulk=bool(integrations.get("bulk", False)),
+        ))
+
+    github = config.get("github") or {}
+    if github.get("owner") and github.get("repo") and github.get("head_sha"):
+        messages.append(enqueue_check_run(
+            db,
+            owner=github["owner"],
+            repo=github["repo"],
+            head_sha=github["head_sha"],
+            name=github.get("check_name", "qa-framework/tests"),
+            status="completed",
+            conclusion="failure" if failed else "success",
+            output={
+                "title": f"{passed}/{total} tests passed",
+                "summary": f"{suite_name}: {passed} passed, {failed} failed",
+            },
+        ))
+
+    return messages
+
+
+# ==================== Dead Letters ====================
+
+async def list_dead_letters(
+    db: AsyncSession,
+    destination: Optional[str] = None,
+    limit: int = 100
+) -> List[OutboxMessage]:
+    """List dead-lettered messages, newest first"""
+    query = select(OutboxMessage).where(OutboxMessage.status == OutboxStatus.DEAD)
+    if destination:
+        query = query.where(OutboxMessage.destination == destination)
+    result = await db.execute(query.order_by(OutboxMessage.id.desc()).limit(limit))
+    return list(result.scalars().all())
+
+
+async def requeue_dead_letters(
+    db: AsyncSession,
+    message_ids: Optional[List[int]] = None,
+    destination: Optional[str] = None
+) -> int:
+    """
+    Move dead-lettered messages back to the queue with a fresh attempt budget.
+
+    Args:
+        db: Database session
+        message_ids: Messages to requeue (None = all matching destination)
+        destination: Restrict to one destination
+
+    Returns:
+        Number of requeued messages
+    """
+    query = update(OutboxMessage).where(OutboxMessage.status == OutboxStatus.DEAD)
+    if message_ids is not None:
+        query = query.where(OutboxMessage.id.in_(message_ids))
+    if destination:
+        query = query.where(OutboxMessage.destination == destination)
+
+    result = await db.execute(query.values(
+        status=OutboxStatus.PENDING,
+        attempts=0,
+        available_at=datetime.utcnow(),
+        locked_until=None,
+    ))
+    await db.commit()
+    return result.rowcount or 0
+
+
+# ==================== Dispatcher ====================
+
+class OutboxDispatcher:
+    """
+    Background worker draining the outbox table.
+
+    Features:
+    - Batched claims (FOR UPDATE SKIP LOCKED on PostgreSQL) with a lease, so
+      several workers can share the table and a crashed worker's messages
+      are picked up again once the lease expires; each message's lease is
+      renewed when its delivery starts, after waiting for its destination
+    - Several batches in flight; a per-destination semaphore bounds how hard
+      any single provider is hit
+    - Exponential backoff with jitter, dead-letter after max_attempts
+    - Prometheus gauges for queue depth and lag
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+        batch_size: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        default_concurrency: int = 4,
+        max_inflight_batches: int = 4,
+        lease_seconds: float = 300.0,
+        delivery_timeout: float = 120.0,
+        base_backoff: float = 2.0,
+        max_backoff: float = 900.0,
+        metrics_interval: float = 15.0,
+        retention: timedelta = timedelta(days=7)
+    ):
+        """
+        Initialize dispatcher.
+
+        Args:
+            session_factory: Factory for new sessions (defaults to AsyncSessionFactory)
+            batch_size: Messages claimed per query
+            poll_interval: Seconds to sleep when the queue is empty
+            default_concurrency: Concurrent deliveries per destination
+            max_inflight_batches: Claimed batches processed at the same time
+            lease_seconds: How long a claim is held before other workers may retry it
+            delivery_timeout: Seconds a single delivery may take
+            base_backoff: First retry delay in seconds
+            max_backoff: Cap for any retry delay
+            metrics_interval: Seconds between queue depth/lag refreshes
+            retention: How long delivered messages are kept
+        """
+        self._session_factory = session_factory
+        self.batch_size = batch_size or settings.OUTBOX_BATCH_SIZE
+        self.poll_interval = poll_interval if poll_interval is not None else settings.OUTBOX_POLL_INTERVAL
+        self.default_concurrency = default_concurrency
+        self.max_inflight_batches = max_inflight_batches
+        self.lease_seconds = lease_seconds
+        self.delivery_timeout = delivery_timeout
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.metrics_interval = metrics_interval
+        self.retention = retention
+
+        self.handlers: Dict[str, OutboxHandler] = {}
+        self._concurrency: Dict[str, int] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._stop_event: Optional[asyncio.Event] = None
+
+        # Statistics
+        self.delivered = 0
+        self.retried = 0
+        self.dead_lettered = 0
+
+    def _session(self) -> AsyncSession:
+        if self._session_factory is None:
+            from database import AsyncSessionFactory
+            self._session_factory = AsyncSessionFactory
+        return self._session_factory()
+
+    def register(self, destination: str, handler: OutboxHandler, concurrency: Optional[int] = None):
+        """
+        Register the delivery handler for a destination.
+
+        Args:
+            destination: Destination key used by producers
+            handler: Coroutine function receiving the message payload
+            concurrency: Concurrent deliveries for this destination
+        """
+        self.handlers[destination] = handler
+        self._concurrency[destination] = concurrency or self.default_concurrency
+        self._semaphores.pop(destination, None)
+
+    def _semaphore(self, destination: str) -> asyncio.Semaphore:
+        """Create semaphores lazily so they bind to the running loop"""
+        semaphore = self._semaphores.get(destination)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._concurrency.get(destination, self.default_concurrency))
+            self._semaphores[destination] = semaphore
+        return semaphore
+
+    def backoff_delay(self, attempts: int) -> float:
+        """Delay before retry number `attempts` (1-based), with +/-20% jitter"""
+        delay = self.base_backoff * (2 ** max(0, attempts - 1))
+        return min(self.max_backoff, delay * random.uniform(0.8, 1.2))
+
+    # ==================== Processing ====================
+
+    async def claim_batch(self, limit: Optional[int] = None) -> List[OutboxMessage]:
+        """
+        Claim due messages and mark them as processing.
+
+        Expired leases (a worker died mid-delivery) are claimed again. The
+        attempt counter is incremented on claim, so a message that keeps
+        crashing the worker still ends up in the dead-letter queue.
+
+        Args:
+            limit: Maximum messages to claim (defaults to batch_size)
+
+        Returns:
+            Claimed messages (detached from the session)
+        """
+        now = datetime.utcnow()
+        async with self._session() as session:
+            result = await session.execute(
+                select(OutboxMessage)
+                .where(or_(
+                    and_(OutboxMessage.status == OutboxStatus.PENDING,
+                         OutboxMessage.available_at <= now),
+                    and_(OutboxMessage.status == OutboxStatus.PROCESSING,
+                         OutboxMessage.locked_until < now),
+                ))
+                .order_by(OutboxMessage.available_at, OutboxMessage.id)
+                .limit(limit or self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            messages = list(result.scalars().all())
+            if not messages:
+                return []
+
+            lease = now + timedelta(seconds=self.lease_seconds)
+            for message in messages:
+                message.status = OutboxStatus.PROCESSING
+                message.locked_until = lease
+                message.attempts = (message.attempts or 0) + 1
+            await session.commit()
+            return messages
+
+    async def _renew_lease(self, message: OutboxMessage) -> bool:
+        """
+        Extend a claimed message's lease right before its delivery starts.
+
+        Messages of a batch wait for their destination's semaphore, so the
+        lease taken at claim time may have run out by then and another worker
+        may have claimed the message again. Claiming bumps ``attempts``, which
+        fences the renewal: it only succeeds while the claim is still ours.
+
+        Returns:
+            Whether the message is still held by this claim
+        """
+        lease = datetime.utcnow() + timedelta(seconds=max(self.lease_seconds, self.delivery_timeout))
+        async with self._session() as session:
+            result = await session.execute(
+                update(OutboxMessage)
+                .where(and_(
+                    OutboxMessage.id == message.id,
+                    OutboxMessage.status == OutboxStatus.PROCESSING,
+                    OutboxMessage.attempts == message.attempts,
+                ))
+                .values(locked_until=lease)
+            )
+            await session.commit()
+        return result.rowcount == 1
+
+    async def _deliver(self, message: OutboxMessage) -> Optional[Tuple[OutboxMessage, Optional[str], bool]]:
+        """
+        Deliver one message.
+
+        Returns:
+            (message, error or None, whether the error is permanent), or None
+            when the lease was lost to another worker before delivery started
+        """
+        handler = self.handlers.get(message.destination)
+        if handler is None:
+            return message, f"No handler registered for destination: {message.destination}", True
+
+        async with self._semaphore(message.destination):
+            if not await self._renew_lease(message):
+                logger.warning(
+                    "Outbox lease lost before delivery, skipping",
+                    message_id=message.id,
+                    destination=message.destination,
+                )
+                return None
+            start = time.perf_counter()
+            try:
+                await asyncio.wait_for(handler(message.payload or {}), timeout=self.delivery_timeout)
+                return message, None, False
+            except OutboxPermanentError as e:
+                return message, str(e) or "Permanent delivery failure", True
+            except asyncio.TimeoutError:
+                return message, f"Delivery timed out after {self.delivery_timeout}s", False
+            except Exception as e:
+                return message, f"{type(e).__name__}: {e}", False
+            finally:
+                outbox_delivery_seconds.labels(destination=message.destination).observe(
+                    time.perf_counter() - start
+                )
+
+    async def _complete(self, outcomes: List[Tuple[OutboxMessage, Optional[str], bool]]):
+        """Write delivery outcomes back in a single transaction"""
+        now = datetime.utcnow()
+        delivered_ids = []
+
+        async with self._session() as session:
+            for message, error, permanent in outcomes:
+                if error is None:
+                    delivered_ids.append(message.id)
+                    self.delivered += 1
+                    outbox_messages_total.labels(destination=message.destination, outcome="delivered").inc()
+                    continue
+
+                if permanent or message.attempts >= message.max_attempts:
+                    values = {"status": OutboxStatus.DEAD}
+                    self.dead_lettered += 1
+                    outcome = "dead"
+                    logger.error(
+                        "Outbox message dead-lettered",
+                        message_id=message.id,
+                        destination=message.destination,
+                        attempts=message.attempts,
+                        error=error,
+                    )
+                else:
+                    values = {
+                        "status": OutboxStatus.PENDING,
+                        "available_at": now + timedelta(seconds=self.backoff_delay(message.attempts)),
+                    }
+                    self.retried += 1
+                    outcome = "retried"
+                    logger.warning(
+                        "Outbox delivery failed, will retry",
+                        message_id=message.id,
+                        destination=message.destination,
+                        attempts=message.attempts,
+                        error=error,
+                    )
+
+                outbox_messages_total.labels(destination=message.destination, outcome=outcome).inc()
+                await session.execute(
+                    update(OutboxMessage)
+                    .where(OutboxMessage.id == message.id)
+                    .values(locked_until=None, last_error=error[:2000], **values)
+                )
+
+            if delivered_ids:
+                await session.execute(
+                    update(OutboxMessage)
+                    .where(OutboxMessage.id.in_(delivered_ids))
+                    .values(status=OutboxStatus.DELIVERED, delivered_at=now, locked_until=None)
+                )
+            await session.commit()
+
+    async def _process(self, message: OutboxMessage):
+        """Deliver one message and record its outcome while the lease still holds"""
+        outcome = await self._deliver(message)
+        if outcome is not None:
+            await self._complete([outcome])
+
+    async def process_batch(self, messages: List[OutboxMessage]) -> int:
+        """
+        Deliver a claimed batch concurrently.
+
+        Outcomes are written as each delivery finishes rather than once for
+        the batch, so a delivered message never sits in PROCESSING until the
+        slowest message of its batch is done and its lease runs out.
+        """
+        await asyncio.gather(*[self._process(message) for message in messages])
+        return len(messages)
+
+    async def run_once(self) -> int:
+        """
+        Claim and process a single batch.
+
+        Returns:
+            Number of messages processed
+        """
+        messages = await self.claim_batch()
+        if not messages:
+            return 0
+        return await self.process_batch(messages)
+
+    async def drain(self, max_batches: int = 1000) -> int:
+        """Process batches until nothing is due (used by tests and admin tooling)"""
+        total = 0
+        for _ in range(max_batches):
+            processed = await self.run_once()
+            if not processed:
+                break
+            total += processed
+        return total
+
+    # ==================== Metrics ====================
+
+    async def get_queue_stats(self) -> Dict[str, Any]:
+        """
+        Compute queue depth and lag per destination and export them as gauges.
+
+        Returns:
+            {"depth": {destination: {status: count}}, "lag_seconds": {destination: seconds}}
+        """
+        async with self._session() as session:
+            result = await session.execute(
+                select(
+                    OutboxMessage.destination,
+                    OutboxMessage.status,
+                    func.count(OutboxMessage.id),
+                    func.min(OutboxMessage.created_at),
+                )
+                .where(OutboxMessage.status != OutboxStatus.DELIVERED)
+                .group_by(OutboxMessage.destination, OutboxMessage.status)
+            )
+            rows = result.all()
+
+        now = datetime.utcnow()
+        depth: Dict[str, Dict[str, int]] = {}
+        oldest: Dict[str, datetime] = {}
+        for destination, status, count, first_created in rows:
+            depth.setdefault(destination, {})[status] = count
+            if status != OutboxStatus.DEAD and first_created is not None:
+                oldest[destination] = min(oldest.get(destination, first_created), first_created)
+
+        lag = {}
+        for destination in set(self.handlers) | set(depth):
+            counts = depth.setdefault(destination, {})
+            for status in (OutboxStatus.PENDING, OutboxStatus.PROCESSING, OutboxStatus.DEAD):
+                counts.setdefault(status, 0)
+                outbox_queue_depth_gauge.labels(destination=destination, status=status).set(counts[status])
+            lag[destination] = max(0.0, (now - oldest[destination]).total_seconds()) if destination in oldest else 0.0
+            outbox_lag_seconds_gauge.labels(destination=destination).set(lag[destination])
+
+        return {"depth": depth, "lag_seconds": lag}
+
+    async def purge_delivered(self) -> int:
+        """Delete delivered messages older than the retention period"""
+        cutoff = datetime.utcnow() - self.retention
+        async with self._session() as session:
+            result = await session.execute(
+                delete(OutboxMessage).where(and_(
+                    OutboxMessage.status == OutboxStatus.DELIVERED,
+                    OutboxMessage.delivered_at < cutoff,
+                ))
+            )
+            await session.commit()
+            return result.rowcount or 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get dispatcher statistics"""
+        return {
+            "running": self.is_running,
+            "delivered": self.delivered,
+            "retried": self.retried,
+            "dead_lettered": self.dead_lettered,
+            "destinations": sorted(self.handlers),
+        }
+
+    # ==================== Lifecycle ====================
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """Start the background dispatch loop"""
+        if self.is_running:
+            return
+        self._stop_event = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        logger.info("Outbox dispatcher started", batch_size=self.batch_size, destinations=sorted(self.handlers))
+
+    async def stop(self, timeout: float = 30.0):
+        """
+        Stop the loop and wait for in-flight batches.
+
+        Messages still in flight after the timeout keep their lease and are
+        redelivered once it expires.
+        """
+        if not self.is_running:
+            return
+        self._stop_event.set()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout=timeout)
+        except asyncio.TimeoutError:
+            self._task.cancel()
+        logger.info("Outbox dispatcher stopped", **self.get_stats())
+
+    async def _run(self):
+        batches: Set[asyncio.Task] = set()
+        last_maintenance = 0.0
+
+        while not self._stop_event.is_set():
+            try:
+                if time.monotonic() - last_maintenance >= self.metrics_interval:
+                    last_maintenance = time.monotonic()
+                    await self.get_queue_stats()
+                    await self.purge_delivered()
+
+                if len(batches) < self.max_inflight_batches:
+                    messages = await self.claim_batch()
+                    if messages:
+                        task = asyncio.create_task(self.process_batch(messages))
+                        batches.add(task)
+                        task.add_done_callback(batches.discard)
+                        continue
+            except Exception as e:
+                logger.error("Outbox dispatcher iteration failed", error=str(e), exc_info=True)
+
+            # Idle or saturated: wake up on stop, a finished batch or the poll interval
+            stop_waiter = asyncio.ensure_future(self._stop_event.wait())
+            await asyncio.wait({stop_waiter, *batches}, timeout=self.poll_interval,
+                               return_when=asyncio.FIRST_COMPLETED)
+            stop_waiter.cancel()
+
+        if batches:
+            await asyncio.gather(*batches, return_exceptions=True)
+
+
+# ==================== Default Handlers ====================
+
+async def deliver_integration_sync(payload: Dict[str, Any]):
+    """Sync results to one integration provider"""
+    from integrations.base import TestResult
+    from integrations.manager import integration_manager
+
+    provider = payload["provider"]
+    results = [TestResult(**result) for result in payload.get("results", [])]
+    sync = await integration_manager.sync_test_results(
+        results,
+        providers=[provider],
+        project_key=payload.get("project_key"),
+        bulk=payload.get("bulk", False),
+    )
+    result = sync[provider]
+    if result.success:
+        return
+    if result.synced_count:
+        # Retrying a partial sync would duplicate the issues already created
+        raise OutboxPermanentError(
+            f"Partial sync to {provider} ({result.synced_count} synced): {'; '.join(result.errors[:5])}"
+        )
+    raise RuntimeError(f"Sync to {provider} failed: {'; '.join(result.errors[:5])}")
+
+
+async def deliver_check_run(payload: Dict[str, Any]):
+    """Create a GitHub check run"""
+    import httpx
+    from services.github_sync_service import GitHubSyncService
+
+    if not settings.GITHUB_TOKEN:
+        raise OutboxPermanentError("GITHUB_TOKEN is not configured")
+
+    try:
+        await GitHubSyncService(settings.GITHUB_TOKEN).create_check_run(**payload)
+    except httpx.HTTPStatusError as e:
+        status_code = e.response.status_code
+        if 400 <= status_code < 500 and status_code not in (408, 429):
+            raise OutboxPermanentError(f"GitHub rejected check run: {status_code} {e.response.text[:200]}")
+        raise
+
+
+async def deliver_test_report(payload: Dict[str, Any]):
+    """Send a test report email"""
+    from services.email_service import email_service
+
+    if not await email_service.send_test_report(**payload):
+        raise RuntimeError(f"Failed to send test report to {payload.get('to_email')}")
+
+
+async def deliver_notification(payload: Dict[str, Any]):
+    """Create one in-app notification per user in a single transaction"""
+    from database import AsyncSessionFactory
+    from models.notification import Notification
+
+    async with AsyncSessionFactory() as session:
+        for user_id in payload.get("user_ids", []):
+            session.add(Notification(
+                user_id=user_id,
+                type=payload["type"],
+                title=payload["title"],
+                message=payload["message"],
+                data=payload.get("data") or {},
+            ))
+        await session.commit()
+
+
+def register_default_handlers(dispatcher: OutboxDispatcher) -> OutboxDispatcher:
+    """Register the built-in destinations on a dispatcher"""
+    dispatcher.register(INTEGRATION_SYNC, deliver_integration_sync, concurrency=2)
+    dispatcher.register(GITHUB_CHECK_RUN, deliver_check_run, concurrency=4)
+    dispatcher.register(EMAIL_TEST_REPORT, deliver_test_report, concurrency=4)
+    dispatcher.register(NOTIFICATION, deliver_notification, concurrency=8)
+    return dispatcher
+
+
+# Create singleton instance
+outbox_dispatcher = register_default_handlers(OutboxDispatcher())
@@ -11,7 +11,7 @@ from sqlalchemy import select, func
 
 from models import User
 from schemas import UserCreate, UserUpdate, UserResponse
-from services.auth_service import hash_password
+from services.auth_service import hash_password_async
 from core.logging_config import get_logger
 
 # Initialize logger
@@ -45,7 +45,7 @@ async def create_user_service(user_data: UserCreate, db: AsyncSession) -> User:
         )
 
     # Create user
-    hashed_password = hash_password(user_data.password)
+    hashed_password = await hash_password_async(user_data.password)
     db_user = User(
         username=user_data.username,
         email=user_data.email,
@@ -0,0 +1,4 @@
+"""HashingPool from the framework's src/infrastructure/auth."""
+from core.framework import load_framework_module
+
+load_framework_module(__name__, "src/infrastructure/auth/hashing_pool.py")
@@ -0,0 +1,4 @@
+"""FailureClassifier from the framework's src/infrastructure/classification."""
+from core.framework import load_framework_module
+
+load_framework_module(__name__, "src/infrastructure/classification/failure_classifier.py")
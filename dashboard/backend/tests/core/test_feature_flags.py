@@ -2,12 +2,15 @@
 Tests for feature flags system.
 """
 
+import asyncio
 import pytest
 from datetime import datetime, timedelta
 from core.feature_flags import (
     FeatureFlag,
     FeatureFlagStrategy,
     FeatureFlagManager,
+    bucket_for,
+    evaluation_scope,
     get_flag_manager,
     is_feature_enabled,
     register_feature_flag
@@ -740,3 +743,139 @@ class TestEdgeCases:
         long_id = "user" * 1000
         result = flag.is_enabled_for_user(long_id)
         assert isinstance(result, bool)
+
+
+class FakeRedis:
+    """In-memory stand-in for the async Redis client."""
+    
+    def __init__(self):
+        self.values = {}
+    
+    async def get(self, key):
+        return self.values.get(key)
+    
+    async def set(self, key, value):
+        self.values[key] = value.encode()
+
+
+class TestCompiledEvaluation:
+    """Tests for compiled flag evaluators."""
+    
+    def test_bucket_is_stable_and_in_range(self):
+        buckets = [bucket_for(123, f"user{i}") for i in range(1000)]
+        
+        assert buckets == [bucket_for(123, f"user{i}") for i in range(1000)]
+        assert min(buckets) >= 0 and max(buckets) < 100
+        assert 400 <= sum(1 for b in buckets if b < 50) <= 600
+    
+    def test_reassigning_config_recompiles(self):
+        flag = FeatureFlag(name="test", strategy=FeatureFlagStrategy.USER_LIST, config={"users": ["user1"]})
+        assert flag.is_enabled_for_user("user2") is False
+        
+        flag.config = {"users": ["user2"]}
+        
+        assert flag.is_enabled_for_user("user2") is True
+    
+    def test_in_place_config_change_needs_recompile(self):
+        flag = FeatureFlag(name="test", config={"percentage": 0})
+        assert flag.is_enabled_for_user("user1") is False
+        
+        flag.config["percentage"] = 100
+        flag.recompile()
+        
+        assert flag.is_enabled_for_user("user1") is True
+    
+    def test_ab_test_matches_weight_ranges(self):
+        flag = FeatureFlag(
+            name="test",
+            strategy=FeatureFlagStrategy.A_B_TEST,
+            config={"weights": [30, 70]}
+        )
+        seed_flag = FeatureFlag(name="test", config={"percentage": 30})
+        
+        for i in range(200):
+            user = f"user{i}"
+            assert flag.is_enabled_for_user(user) is (not seed_flag.is_enabled_for_user(user))
+
+
+class TestBulkEvaluation:
+    """Tests for evaluate_all and request-scoped memoization."""
+    
+    def make_manager(self):
+        manager = FeatureFlagManager()
+        manager.register_flag(FeatureFlag(name="all", config={"percentage": 100}))
+        manager.register_flag(FeatureFlag(name="none", config={"percentage": 0}))
+        manager.register_flag(FeatureFlag(
+            name="premium",
+            strategy=FeatureFlagStrategy.USER_SEGMENT,
+            config={"segments": ["premium"]}
+        ))
+        return manager
+    
+    def test_evaluate_all(self):
+        manager = self.make_manager()
+        
+        result = manager.evaluate_all("user1", {"segment": "premium"})
+        
+        assert result == {"all": True, "none": False, "premium": True}
+    
+    def test_scope_memoizes_evaluations(self):
+        manager = self.make_manager()
+        
+        with evaluation_scope() as memo:
+            manager.evaluate_all("user1")
+            manager.evaluate_all("user1")
+            assert len(memo) == 3
+        manager.is_enabled("all", "user1")
+        
+        assert manager.evaluation_count == {"all": 2, "none": 1, "premium": 1}
+    
+    def test_scope_keys_on_segment(self):
+        manager = self.make_manager()
+        
+        with evaluation_scope():
+            assert manager.is_enabled("premium", "user1", {"segment": "premium"}) is True
+            assert manager.is_enabled("premium", "user1", {"segment": "free"}) is False
+    
+    def test_registering_replaces_snapshot(self):
+        manager = self.make_manager()
+        snapshot = manager.flags
+        
+        manager.register_flag(FeatureFlag(name="new"))
+        
+        assert "new" not in snapshot
+        assert "new" in manager.flags
+
+
+@pytest.mark.asyncio
+class TestHotReload:
+    """Tests for reloading flags from Redis."""
+    
+    async def test_reload_swaps_flag_set(self):
+        redis = FakeRedis()
+        publisher = FeatureFlagManager()
+        publisher._redis_factory = lambda: redis
+        publisher.register_flag(FeatureFlag(name="beta", config={"percentage": 100}))
+        await publisher.publish_to_redis()
+        
+        worker = FeatureFlagManager()
+        worker._redis_factory = lambda: redis
+        worker.register_flag(FeatureFlag(name="stale"))
+        
+        assert await worker.reload_from_redis() is True
+        assert list(worker.flags) == ["beta"]
+        assert worker.is_enabled("beta", "user1") is True
+        assert await worker.reload_from_redis() is False
+    
+    async def test_background_reload_keeps_last_flags_on_error(self):
+        class BrokenRedis:
+            async def get(self, key):
+                raise ConnectionError("redis down")
+        
+        manager = FeatureFlagManager()
+        manager.register_flag(FeatureFlag(name="beta"))
+        manager.start_hot_reload(interval=0.01, redis_factory=BrokenRedis)
+        await asyncio.sleep(0.05)
+        await manager.stop_hot_reload()
+        
+        assert list(manager.flags) == ["beta"]
@@ -0,0 +1,30 @@
+"""
+Tests for loading shared QA-FRAMEWORK modules into the backend.
+"""
+
+import importlib
+import sys
+
+import pytest
+
+from core.framework import FRAMEWORK_ROOT, load_framework_module
+
+
+@pytest.mark.parametrize("name, attribute", [
+    ("src.infrastructure.classification.failure_classifier", "FailureClassifier"),
+    ("src.infrastructure.auth.hashing_pool", "HashingPool"),
+])
+def test_backend_modules_are_the_framework_files(name, attribute):
+    """Test shared modules run from the framework's single copy."""
+    module = importlib.import_module(name)
+
+    assert module.__file__ == str(FRAMEWORK_ROOT / (name.replace(".", "/") + ".py"))
+    assert sys.modules[name] is module
+    assert getattr(module, attribute).__module__ == name
+
+
+def test_missing_framework_module_raises():
+    """Test a missing framework file raises ImportError."""
+    with pytest.raises(ImportError):
+        load_framework_module("src.missing", "src/missing.py")
+    assert "src.missing" not in sys.modules
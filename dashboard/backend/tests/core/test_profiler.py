@@ -0,0 +1,196 @@
+"""
+Tests for the sampling profiler.
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from core.profiler import (
+    ProfilerBusyError,
+    ProfilerMiddleware,
+    ProfilerUnavailableError,
+    SamplingProfiler,
+    tag_request,
+)
+
+
+def burn_cpu(seconds: float) -> int:
+    """Spin for ``seconds`` of CPU time."""
+    total = 0
+    deadline = time.process_time() + seconds
+    while time.process_time() < deadline:
+        total += sum(range(200))
+    return total
+
+
+@pytest.fixture
+def profiler():
+    profiler = SamplingProfiler()
+    yield profiler
+    profiler.stop()
+
+
+class TestSamplingProfiler:
+    """Tests for SamplingProfiler."""
+
+    def test_samples_busy_function(self, profiler):
+        """Test the busy function shows up in collapsed stacks."""
+        profiler.start(duration=10, interval=0.002)
+        burn_cpu(0.3)
+        profiler.stop()
+
+        assert profiler.samples > 0
+        collapsed = profiler.collapsed(group_by=())
+        assert "burn_cpu (test_profiler.py:" in collapsed
+        for line in collapsed.splitlines():
+            stack, count = line.rsplit(" ", 1)
+            assert int(count) > 0
+            assert stack
+
+    def test_stops_after_duration(self, profiler):
+        """Test sampling ends once the duration has passed."""
+        profiler.start(duration=0.1, interval=0.002)
+        burn_cpu(0.3)
+
+        assert profiler.active is False
+        samples = profiler.samples
+        burn_cpu(0.05)
+        assert profiler.samples == samples
+
+    def test_start_while_running_raises(self, profiler):
+        """Test a second start is rejected."""
+        profiler.start(duration=10)
+        with pytest.raises(ProfilerBusyError):
+            profiler.start(duration=10)
+
+    def test_start_off_main_thread_raises(self, profiler):
+        """Test starting from another thread is rejected."""
+        errors = []
+
+        def start():
+            try:
+                profiler.start(duration=10)
+            except ProfilerUnavailableError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=start)
+        thread.start()
+        thread.join()
+        assert len(errors) == 1
+
+    def test_restart_clears_results(self, profiler):
+        """Test a new profile discards the previous samples."""
+        profiler.start(duration=10, interval=0.002)
+        burn_cpu(0.1)
+        profiler.stop()
+        profiler.start(duration=10, interval=0.002)
+        profiler.stop()
+
+        assert profiler.samples == 0
+        assert profiler.collapsed() == ""
+
+    def test_overhead_under_two_percent(self, profiler):
+        """Test the sampler stays under 2% of CPU time at the default rate."""
+        profiler.start(duration=10)
+        burn_cpu(1.0)
+        profiler.stop()
+
+        assert profiler.samples > 0
+        assert profiler.overhead() < 0.02
+
+    def test_overhead_guard_backs_off(self):
+        """Test the interval grows when the sampler exceeds its budget."""
+        profiler = SamplingProfiler(max_overhead=0.0)
+        try:
+            profiler.start(duration=10, interval=0.001)
+            burn_cpu(0.3)
+        finally:
+            profiler.stop()
+
+        assert profiler.status()["effective_interval_ms"] > 1.0
+
+    def test_unknown_group_by_raises(self, profiler):
+        """Test collapsed rejects unknown tags."""
+        with pytest.raises(ValueError):
+            profiler.collapsed(group_by=("host",))
+
+    def test_tag_request_outside_profile_is_noop(self):
+        """Test tagging without a profiled request does nothing."""
+        tag_request(tenant="acme")
+
+
+@pytest.mark.asyncio
+async def test_samples_tagged_by_route_and_tenant():
+    """Test samples carry the route template and tenant of the request."""
+    profiler = SamplingProfiler()
+    app = FastAPI()
+    app.add_middleware(ProfilerMiddleware, profiler=profiler)
+
+    @app.get("/work/{tenant}")
+    async def work(tenant: str):
+        tag_request(tenant=tenant)
+        return {"total": burn_cpu(0.2)}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        profiler.start(duration=10, interval=0.002)
+        try:
+            response = await client.get("/work/acme")
+        finally:
+            profiler.stop()
+    assert response.status_code == 200
+
+    collapsed = profiler.collapsed(group_by=("route", "tenant"))
+    assert "route /work/{tenant};tenant acme;" in collapsed
+    assert profiler.collapsed(tenant="other") == ""
+
+    summary = profiler.summary()
+    assert summary["by_route"][0]["name"] == "/work/{tenant}"
+    assert summary["by_tenant"][0]["name"] == "acme"
+    assert any(entry["name"].startswith("burn_cpu") for entry in summary["top_self"])
+
+
+class TestProfilerRoutes:
+    """Tests for the profiler admin endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_non_admin_forbidden(self):
+        """Test only superusers may start the profiler."""
+        from fastapi import HTTPException
+        from api.v1.profiler_routes import ProfileRequest, start_profiler
+
+        with pytest.raises(HTTPException) as exc:
+            await start_profiler(ProfileRequest(), current_user=Mock(is_superuser=False))
+        assert exc.value.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_start_while_running_conflicts(self):
+        """Test starting twice returns 409."""
+        from fastapi import HTTPException
+        from api.v1.profiler_routes import ProfileRequest, start_profiler, stop_profiler
+
+        admin = Mock(is_superuser=True)
+        status = await start_profiler(ProfileRequest(duration_seconds=5), current_user=admin)
+        try:
+            assert status["active"] is True
+            with pytest.raises(HTTPException) as exc:
+                await start_profiler(ProfileRequest(), current_user=admin)
+            assert exc.value.status_code == 409
+        finally:
+            status = await stop_profiler(current_user=admin)
+        assert status["active"] is False
+
+    @pytest.mark.asyncio
+    async def test_flamegraph_rejects_unknown_group_by(self):
+        """Test unknown group_by tags return 400."""
+        from fastapi import HTTPException
+        from api.v1.profiler_routes import get_flamegraph
+
+        with pytest.raises(HTTPException) as exc:
+            await get_flamegraph(group_by=["host"], current_user=Mock(is_superuser=True))
+        assert exc.value.status_code == 400
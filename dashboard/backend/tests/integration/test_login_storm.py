@@ -0,0 +1,77 @@
+"""
+Login storm benchmark
+
+Fires concurrent logins at an app while polling an unrelated endpoint and
+compares the endpoint's p99 latency with bcrypt run inline on the event
+loop versus on the password hashing pool.
+"""
+import asyncio
+import statistics
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from services.auth_service import hash_password, verify_password, verify_password_async
+
+LOGINS = 8
+INTERVAL = 0.01
+PASSWORD = "storm_pwd_123"
+
+
+def build_app(hashed: str, pooled: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/login")
+    async def login():
+        if pooled:
+            ok = await verify_password_async(PASSWORD, hashed)
+        else:
+            ok = verify_password(PASSWORD, hashed)
+        return {"ok": ok}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    return app
+
+
+def p99(samples):
+    return statistics.quantiles(samples, n=100)[98] if len(samples) > 1 else samples[0]
+
+
+async def run_storm(app: FastAPI) -> float:
+    """p99 latency in seconds of /health while logins are in flight
+
+    Health checks arrive on a fixed schedule; latency is measured from the
+    scheduled arrival, so time spent waiting for a blocked event loop counts.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        logins = [asyncio.ensure_future(client.post("/login")) for _ in range(LOGINS)]
+        latencies = []
+        arrival = time.perf_counter()
+        while not all(login.done() for login in logins):
+            arrival += INTERVAL
+            await asyncio.sleep(max(0.0, arrival - time.perf_counter()))
+            response = await client.get("/health")
+            latencies.append(time.perf_counter() - arrival)
+            assert response.status_code == 200
+        for response in await asyncio.gather(*logins):
+            assert response.json() == {"ok": True}
+    return p99(latencies)
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_login_storm_keeps_other_endpoints_responsive():
+    hashed = hash_password(PASSWORD)
+
+    inline_p99 = await run_storm(build_app(hashed, pooled=False))
+    pooled_p99 = await run_storm(build_app(hashed, pooled=True))
+
+    print(f"\n/health p99 during {LOGINS} logins: "
+          f"inline {inline_p99 * 1000:.1f} ms, pooled {pooled_p99 * 1000:.1f} ms")
+    assert pooled_p99 < inline_p99
@@ -0,0 +1,255 @@
+"""
+Tests for native bulk APIs in integration clients
+
+Jira /rest/api/3/issue/bulk, Azure DevOps $batch and Zephyr bulk execution
+updates are exercised against local mock HTTP servers (httpx.MockTransport).
+"""
+import json
+from collections import Counter
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+from integrations.base import TestResult, TestStatus
+from integrations.jira.client import JiraIntegration
+from integrations.zephyr.client import ZephyrIntegration
+from integrations.azure_devops.client import AzureDevOpsIntegration
+
+
+class RecordingServer:
+    """Mock HTTP server dispatching on (method, path) and recording calls"""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.calls = Counter()
+        self.bodies = []
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        key = (request.method, request.url.path)
+        self.calls[key] += 1
+        body = json.loads(request.content) if request.content else None
+        self.bodies.append((key, body))
+        for (method, prefix), route in self.routes.items():
+            if request.method == method and request.url.path.startswith(prefix):
+                return route(body)
+        return httpx.Response(404, json={"errorMessages": ["not found"]})
+
+    def client(self, base_url: str) -> httpx.AsyncClient:
+        return httpx.AsyncClient(base_url=base_url, transport=httpx.MockTransport(self.handler))
+
+
+def jira_bulk_route(fail_indexes=()):
+    def route(body):
+        issues, errors = [], []
+        for index, _ in enumerate(body["issueUpdates"]):
+            if index in fail_indexes:
+                errors.append({
+                    "failedElementNumber": index,
+                    "elementErrors": {"errors": {"summary": "Summary is required"}}
+                })
+            else:
+                issues.append({"id": str(1000 + index), "key": f"QA-{index}"})
+        return httpx.Response(201, json={"issues": issues, "errors": errors})
+    return route
+
+
+def make_bugs(count):
+    return [{"title": f"Bug {i}", "description": "desc"} for i in range(count)]
+
+
+def make_results(count, status=TestStatus.FAILED, **fields):
+    return [
+        TestResult(test_id=f"t{i}", test_name=f"Test {i}", status=status, **fields)
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def jira():
+    integration = JiraIntegration({
+        "base_url": "https://jira.local",
+        "email": "qa@example.com",
+        "api_token": "token",
+        "default_project": "QA",
+    })
+    integration.is_connected = True
+    return integration
+
+
+@pytest.fixture
+def zephyr():
+    integration = ZephyrIntegration({
+        "jira_base_url": "https://jira.local",
+        "jira_email": "qa@example.com",
+        "jira_api_token": "token",
+        "default_project": "QA",
+    })
+    integration.is_connected = True
+    integration._project_id_cache["QA"] = "10000"
+    return integration
+
+
+@pytest.fixture
+def azure():
+    integration = AzureDevOpsIntegration({
+        "organization_url": "https://dev.azure.com/org",
+        "project_name": "proj",
+        "personal_access_token": "pat",
+    })
+    integration.is_connected = True
+    return integration
+
+
+class TestJiraBulk:
+    """Tests for Jira bulk issue creation"""
+
+    @pytest.mark.asyncio
+    async def test_create_bugs_bulk_chunks_of_50(self, jira):
+        server = RecordingServer({("POST", "/rest/api/3/issue/bulk"): jira_bulk_route()})
+
+        with patch.object(jira, '_get_client', return_value=server.client("https://jira.local")):
+            created = await jira.create_bugs_bulk(make_bugs(120), project_key="QA")
+
+        assert len(created) == 120
+        assert all("key" in bug for bug in created)
+        assert server.calls[("POST", "/rest/api/3/issue/bulk")] == 3
+        assert ("POST", "/rest/api/3/issue") not in server.calls
+
+    @pytest.mark.asyncio
+    async def test_create_bugs_bulk_maps_partial_failures(self, jira):
+        server = RecordingServer({("POST", "/rest/api/3/issue/bulk"): jira_bulk_route(fail_indexes={1})})
+
+        with patch.object(jira, '_get_client', return_value=server.client("https://jira.local")):
+            created = await jira.create_bugs_bulk(make_bugs(3), project_key="QA")
+
+        assert created[0]["key"] == "QA-0"
+        assert "Summary is required" in created[1]["error"]
+        assert created[2]["key"] == "QA-2"
+
+    @pytest.mark.asyncio
+    async def test_create_bugs_bulk_falls_back_per_request(self, jira):
+        # Routes match by prefix in order: the bulk endpoint is "not available"
+        server = RecordingServer({
+            ("POST", "/rest/api/3/issue/bulk"): lambda body: httpx.Response(404),
+            ("POST", "/rest/api/3/issue"): lambda body: httpx.Response(201, json={"id": "1", "key": "QA-1"}),
+        })
+
+        with patch.object(jira, '_get_client', return_value=server.client("https://jira.local")):
+            created = await jira.create_bugs_bulk(make_bugs(4), project_key="QA")
+
+        assert [bug["key"] for bug in created] == ["QA-1"] * 4
+        assert server.calls[("POST", "/rest/api/3/issue/bulk")] == 1
+        assert server.calls[("POST", "/rest/api/3/issue")] == 4
+
+    @pytest.mark.asyncio
+    async def test_sync_test_results_bulk(self, jira):
+        server = RecordingServer({
+            ("POST", "/rest/api/3/issue/bulk"): jira_bulk_route(),
+            ("POST", "/rest/api/3/issue/QA-100/comment"): lambda body: httpx.Response(201, json={}),
+        })
+        results = make_results(60) + make_results(1, status=TestStatus.PASSED, issue_key="QA-100")
+
+        with patch.object(jira, '_get_client', return_value=server.client("https://jira.local")):
+            sync = await jira.sync_test_results_bulk(results)
+
+        assert sync.success is True
+        assert sync.synced_count == 61
+        assert sync.details["created_bugs"] == 60
+        assert server.calls[("POST", "/rest/api/3/issue/bulk")] == 2
+
+
+class TestAzureDevOpsBatch:
+    """Tests for Azure DevOps $batch"""
+
+    @staticmethod
+    def batch_route(fail_every=0):
+        def route(body):
+            values = []
+            for index, _ in enumerate(body):
+                if fail_every and index % fail_every == 0:
+                    values.append({"code": 400, "body": json.dumps({"message": "bad field"})})
+                else:
+                    values.append({"code": 200, "body": json.dumps({"id": index, "_links": {}})})
+            return httpx.Response(200, json={"count": len(values), "value": values})
+        return route
+
+    @pytest.mark.asyncio
+    async def test_create_bugs_bulk_uses_batch(self, azure):
+        server = RecordingServer({("POST", "/org/_apis/wit/$batch"): self.batch_route()})
+
+        with patch.object(azure, '_get_client', return_value=server.client("https://dev.azure.com/org")):
+            created = await azure.create_bugs_bulk(make_bugs(250))
+
+        assert len(created) == 250
+        assert all("id" in bug for bug in created)
+        assert server.calls[("POST", "/org/_apis/wit/$batch")] == 2
+        first_request = server.bodies[0][1][0]
+        assert first_request["method"] == "PATCH"
+        assert first_request["uri"].startswith("/proj/_apis/wit/workitems/$Bug")
+
+    @pytest.mark.asyncio
+    async def test_update_test_cases_bulk_reports_item_errors(self, azure):
+        server = RecordingServer({("POST", "/org/_apis/wit/$batch"): self.batch_route(fail_every=2)})
+
+        with patch.object(azure, '_get_client', return_value=server.client("https://dev.azure.com/org")):
+            updated = await azure.update_test_cases_bulk({
+                "1": {"name": "A"}, "2": {"name": "B"}, "3": {"name": "C"}
+            })
+
+        assert updated[0] == {"id": "1", "error": "Failed to update test case: bad field"}
+        assert updated[1] == {"id": "2", "updated": True}
+
+    @pytest.mark.asyncio
+    async def test_batch_rejected_falls_back_per_request(self, azure):
+        server = RecordingServer({
+            ("POST", "/org/_apis/wit/$batch"): lambda body: httpx.Response(404),
+            ("PATCH", "/org/proj/_apis/wit/workitems/"): lambda body: httpx.Response(200, json={"id": 7}),
+        })
+
+        with patch.object(azure, '_get_client', return_value=server.client("https://dev.azure.com/org")):
+            created = await azure.create_bugs_bulk(make_bugs(3))
+
+        assert [bug["id"] for bug in created] == [7, 7, 7]
+
+
+    @pytest.mark.asyncio
+    async def test_rejected_chunk_falls_back_without_duplicating_other_chunks(self, azure):
+        batch = self.batch_route()
+        server = RecordingServer({
+            # The second (shorter) chunk of 250 is rejected as a whole
+            ("POST", "/org/_apis/wit/$batch"): lambda body: batch(body) if len(body) == 200 else httpx.Response(400),
+            ("PATCH", "/org/proj/_apis/wit/workitems/"): lambda body: httpx.Response(200, json={"id": 7}),
+        })
+
+        with patch.object(azure, '_get_client', return_value=server.client("https://dev.azure.com/org")):
+            created = await azure.create_bugs_bulk(make_bugs(250))
+
+        individual = sum(count for (method, _), count in server.calls.items() if method == "PATCH")
+        assert server.calls[("POST", "/org/_apis/wit/$batch")] == 2
+        assert individual == 50
+        assert [bug["id"] for bug in created[:200]] == list(range(200))
+        assert [bug["id"] for bug in created[200:]] == [7] * 50
+
+class TestZephyrBulk:
+    """Tests for Zephyr bulk sync"""
+
+    @pytest.mark.asyncio
+    async def test_sync_test_results_bulk_uses_bulk_status(self, zephyr):
+        executions = iter(range(1000))
+        server = RecordingServer({
+            ("POST", "/rest/zapi/latest/cycle"): lambda body: httpx.Response(200, json={"id": "c1"}),
+            ("POST", "/rest/api/3/issue/bulk"): jira_bulk_route(),
+            ("POST", "/rest/zapi/latest/execution"): lambda body: httpx.Response(200, json={str(next(executions)): {}}),
+            ("PUT", "/rest/zapi/latest/execution/updateBulkStatus"): lambda body: httpx.Response(200, json={}),
+        })
+        results = make_results(10, status=TestStatus.PASSED) + make_results(5, status=TestStatus.SKIPPED)
+
+        with patch.object(zephyr, '_get_client', return_value=server.client("https://jira.local")):
+            sync = await zephyr.sync_test_results_bulk(results)
+
+        assert sync.success is True
+        assert sync.synced_count == 15
+        assert server.calls[("POST", "/rest/api/3/issue/bulk")] == 1
+        # One status update per distinct status instead of one per result
+        assert server.calls[("PUT", "/rest/zapi/latest/execution/updateBulkStatus")] == 2
@@ -0,0 +1,242 @@
+"""
+Tests for concurrent multi-provider sync and adaptive throttling
+
+Providers talk to local mock HTTP servers (httpx.MockTransport) that
+simulate latency and HTTP 429 responses.
+"""
+import asyncio
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+from integrations.base import TestResult, TestStatus
+from integrations.jira.client import JiraIntegration
+from integrations.azure_devops.client import AzureDevOpsIntegration
+from integrations.manager import IntegrationManager
+from integrations.throttle import AdaptiveThrottle, parse_retry_after
+
+
+class MockServer:
+    """Local mock HTTP server tracking concurrency and injecting throttling"""
+
+    def __init__(self, latency: float = 0.01, throttle_first: int = 0, retry_after: str = "0"):
+        self.latency = latency
+        self.throttle_first = throttle_first
+        self.retry_after = retry_after
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.throttled = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if self.throttled < self.throttle_first:
+                self.throttled += 1
+                return httpx.Response(429, headers={"Retry-After": self.retry_after})
+            if request.method == "PATCH":
+                return httpx.Response(200, json={"id": self.requests, "_links": {}})
+            return httpx.Response(201, json={"id": str(self.requests), "key": f"QA-{self.requests}"})
+        finally:
+            self.in_flight -= 1
+
+    def client(self, base_url: str) -> httpx.AsyncClient:
+        return httpx.AsyncClient(base_url=base_url, transport=httpx.MockTransport(self.handler))
+
+
+def make_results(count: int, status: TestStatus = TestStatus.FAILED):
+    return [
+        TestResult(test_id=f"t{i}", test_name=f"Test {i}", status=status, error="boom")
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def jira():
+    integration = JiraIntegration({
+        "base_url": "https://jira.local",
+        "email": "qa@example.com",
+        "api_token": "token",
+        "default_project": "QA",
+        "max_concurrency": 4,
+    })
+    integration.is_connected = True
+    return integration
+
+
+@pytest.fixture
+def azure():
+    integration = AzureDevOpsIntegration({
+        "organization_url": "https://dev.azure.com/org",
+        "project_name": "proj",
+        "personal_access_token": "pat",
+    })
+    integration.is_connected = True
+    return integration
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After parsing"""
+
+    def test_seconds(self):
+        assert parse_retry_after("3") == 3.0
+
+    def test_http_date(self):
+        future = datetime.now(timezone.utc) + timedelta(seconds=30)
+        delay = parse_retry_after(format_datetime(future, usegmt=True))
+        assert 25 <= delay <= 30
+
+    def test_missing_or_invalid(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestAdaptiveThrottle:
+    """Tests for AdaptiveThrottle"""
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrency(self):
+        server = MockServer(latency=0.02)
+        throttle = AdaptiveThrottle(max_concurrency=3)
+
+        async with server.client("https://api.local") as client:
+            await asyncio.gather(*[throttle.run(lambda: client.post("/x")) for _ in range(20)])
+
+        assert server.requests == 20
+        assert server.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_retries_after_429_and_decreases_limit(self):
+        server = MockServer(throttle_first=2)
+        throttle = AdaptiveThrottle(max_concurrency=8, base_backoff=0.01)
+
+        async with server.client("https://api.local") as client:
+            response = await throttle.run(lambda: client.post("/x"))
+
+        assert response.status_code == 201
+        assert throttle.retries == 2
+        assert throttle.limit == 2  # 8 -> 4 -> 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self):
+        server = MockServer(throttle_first=100)
+        throttle = AdaptiveThrottle(max_retries=2, base_backoff=0.001)
+
+        async with server.client("https://api.local") as client:
+            response = await throttle.run(lambda: client.post("/x"))
+
+        assert response.status_code == 429
+        assert server.requests == 3
+
+    def test_additive_increase(self):
+        throttle = AdaptiveThrottle(max_concurrency=4)
+        throttle.record_throttled(0, attempt=0)
+        assert throttle.limit == 2
+
+        for _ in range(2):
+            throttle.record_success()
+        assert throttle.limit == 3
+
+
+class TestConcurrentProviderSync:
+    """Tests for concurrent per-result sync in provider clients"""
+
+    @pytest.mark.asyncio
+    async def test_jira_sync_is_concurrent_and_bounded(self, jira):
+        server = MockServer(latency=0.02)
+
+        with patch.object(jira, '_get_client', return_value=server.client("https://jira.local")):
+            result = await jira.sync_test_results(make_results(40))
+
+        assert result.success is True
+        assert result.synced_count == 40
+        assert result.details["created_bugs"] == 40
+        assert 1 < server.max_in_flight <= 4
+
+    @pytest.mark.asyncio
+    async def test_jira_sync_recovers_from_rate_limiting(self, jira):
+        server = MockServer(throttle_first=5)
+
+        with patch.object(jira, '_get_client', return_value=server.client("https://jira.local")):
+            result = await jira.sync_test_results(make_results(10))
+
+        assert result.success is True
+        assert result.synced_count == 10
+        assert jira._throttle.throttled_responses == 5
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_outcome_per_result(self, jira):
+        server = MockServer()
+
+        with patch.object(jira, '_get_client', return_value=server.client("https://jira.local")):
+            outcomes = [o async for o in jira.stream_sync_results(make_results(5))]
+
+        assert sorted(o.test_id for o in outcomes) == [f"t{i}" for i in range(5)]
+        assert all(o.success and o.details["bug"]["key"] for o in outcomes)
+
+
+class TestIntegrationManagerFanOut:
+    """Tests for multi-provider fan-out in IntegrationManager"""
+
+    @pytest.mark.asyncio
+    async def test_providers_sync_in_parallel(self, jira, azure):
+        manager = IntegrationManager()
+        manager._instances = {"jira": jira, "azure_devops": azure}
+        manager._active_providers = ["jira", "azure_devops"]
+
+        jira_server = MockServer(latency=0.1)
+        azure_server = MockServer(latency=0.1)
+
+        with patch.object(jira, '_get_client', return_value=jira_server.client("https://jira.local")), \
+                patch.object(azure, '_get_client', return_value=azure_server.client("https://dev.azure.com/org")):
+            start = time.monotonic()
+            results = await manager.sync_test_results(make_results(4), project_key="QA")
+            elapsed = time.monotonic() - start
+
+        assert list(results) == ["jira", "azure_devops"]
+        assert results["jira"].synced_count == 4
+        assert results["azure_devops"].synced_count == 4
+        # Serial execution would take at least 8 * 0.1s
+        assert elapsed < 0.4
+
+    @pytest.mark.asyncio
+    async def test_stream_merges_provider_outcomes(self, jira):
+        manager = IntegrationManager()
+        manager._instances = {"jira": jira}
+        server = MockServer()
+
+        with patch.object(jira, '_get_client', return_value=server.client("https://jira.local")):
+            outcomes = [
+                o async for o in manager.stream_sync_results(
+                    make_results(3), providers=["jira", "zephyr"]
+                )
+            ]
+
+        jira_outcomes = [o for o in outcomes if o.provider == "jira"]
+        zephyr_outcomes = [o for o in outcomes if o.provider == "zephyr"]
+        assert len(jira_outcomes) == 3
+        assert len(zephyr_outcomes) == 1
+        assert zephyr_outcomes[0].success is False
+        assert "not configured" in zephyr_outcomes[0].error
+
+    @pytest.mark.asyncio
+    async def test_bulk_sync_runs_mappings_concurrently(self, jira, azure):
+        manager = IntegrationManager()
+        manager._instances = {"jira": jira, "azure_devops": azure}
+
+        with patch.object(jira, '_get_client', return_value=MockServer().client("https://jira.local")), \
+                patch.object(azure, '_get_client', return_value=MockServer().client("https://dev.azure.com/org")):
+            results = await manager.bulk_sync(
+                make_results(2),
+                {"jira": {"project_key": "QA"}, "azure_devops": {"project_key": "proj"}}
+            )
+
+        assert results["jira"]["jira"].synced_count == 2
+        assert results["azure_devops"]["azure_devops"].synced_count == 2
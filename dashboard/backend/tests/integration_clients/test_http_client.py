@@ -0,0 +1,207 @@
+"""
+Tests for the shared HTTP client registry and ETag cache
+
+Pools are replaced with local mock HTTP servers (httpx.MockTransport).
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from integrations.http_client import ETagCache, HTTPClientRegistry, credential_scope
+from integrations.jira.client import JiraIntegration
+
+
+class ETagServer:
+    """Mock HTTP server answering If-None-Match with 304"""
+
+    def __init__(self, body, etag='"v1"', latency: float = 0.0):
+        self.body = body
+        self.etag = etag
+        self.latency = latency
+        self.requests = []
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304, headers={"ETag": self.etag})
+        return httpx.Response(200, json=self.body, headers={"ETag": self.etag})
+
+
+def mock_registry(server: ETagServer, *base_urls: str) -> HTTPClientRegistry:
+    registry = HTTPClientRegistry()
+    for base_url in base_urls:
+        registry._pools[registry.origin(base_url)] = httpx.MockTransport(server.handler)
+    return registry
+
+
+class TestHTTPClientRegistry:
+    """Tests for HTTPClientRegistry"""
+
+    def test_pools_are_shared_per_origin(self):
+        registry = HTTPClientRegistry()
+
+        jira = registry.get_pool("https://acme.atlassian.net")
+        zephyr = registry.get_pool("https://acme.atlassian.net:443/rest/zapi")
+        azure = registry.get_pool("https://dev.azure.com/org")
+
+        assert jira is zephyr
+        assert jira is not azure
+        assert registry.get_stats()["pools"] == [
+            "https://acme.atlassian.net:443", "https://dev.azure.com:443"
+        ]
+
+    def test_clients_are_cached_per_scope(self):
+        registry = HTTPClientRegistry()
+        alice = credential_scope("alice", "token-a")
+        bob = credential_scope("bob", "token-b")
+
+        first = registry.get_client("https://acme.atlassian.net", scope=alice)
+
+        assert registry.get_client("https://acme.atlassian.net/", scope=alice) is first
+        assert registry.get_client("https://acme.atlassian.net", scope=bob) is not first
+
+    def test_configure_limits_and_http2(self):
+        registry = HTTPClientRegistry(max_connections=10, max_keepalive_connections=2, http2=False)
+        assert registry.limits.max_connections == 10
+        assert registry.http2 is False
+
+        registry.configure(max_connections=50)
+        assert registry.limits.max_connections == 50
+        assert registry.limits.max_keepalive_connections == 2
+
+    @pytest.mark.asyncio
+    async def test_closing_a_client_keeps_the_pool(self):
+        server = ETagServer({"ok": True})
+        registry = mock_registry(server, "https://api.local")
+
+        client = registry.get_client("https://api.local", scope="a")
+        await client.aclose()
+        other = registry.get_client("https://api.local", scope="b")
+        response = await other.get("/ping")
+
+        assert response.status_code == 200
+        assert registry.get_client("https://api.local", scope="a") is not client
+
+    @pytest.mark.asyncio
+    async def test_close_drains_in_flight_requests(self):
+        server = ETagServer({"ok": True}, latency=0.05)
+        registry = mock_registry(server, "https://api.local")
+        client = registry.get_client("https://api.local")
+
+        request = asyncio.create_task(client.get("/slow"))
+        await asyncio.sleep(0.01)
+        assert registry.in_flight == 1
+
+        await registry.close(timeout=1)
+
+        assert (await request).status_code == 200
+        assert registry.in_flight == 0
+        assert registry.get_stats()["pools"] == []
+
+
+class TestETagCache:
+    """Tests for conditional GETs"""
+
+    @pytest.mark.asyncio
+    async def test_revalidates_with_if_none_match(self):
+        server = ETagServer([{"key": "QA"}])
+        cache = ETagCache()
+
+        async with httpx.AsyncClient(base_url="https://api.local", transport=httpx.MockTransport(server.handler)) as client:
+            first = await cache.get(client, "/projects", scope="s")
+            second = await cache.get(client, "/projects", scope="s")
+
+        assert first.json() == second.json() == [{"key": "QA"}]
+        assert second.status_code == 200
+        assert "If-None-Match" not in server.requests[0].headers
+        assert server.requests[1].headers["If-None-Match"] == '"v1"'
+        assert cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_scopes_and_params_are_isolated(self):
+        server = ETagServer({"ok": True})
+        cache = ETagCache()
+
+        async with httpx.AsyncClient(base_url="https://api.local", transport=httpx.MockTransport(server.handler)) as client:
+            await cache.get(client, "/items", scope="alice", params={"page": 1})
+            await cache.get(client, "/items", scope="bob", params={"page": 1})
+            await cache.get(client, "/items", scope="alice", params={"page": 2})
+
+        assert all("If-None-Match" not in r.headers for r in server.requests)
+        assert cache.hits == 0
+
+    @pytest.mark.asyncio
+    async def test_changed_resource_replaces_entry(self):
+        server = ETagServer({"version": 1})
+        cache = ETagCache()
+
+        async with httpx.AsyncClient(base_url="https://api.local", transport=httpx.MockTransport(server.handler)) as client:
+            await cache.get(client, "/doc")
+            server.body, server.etag = {"version": 2}, '"v2"'
+            changed = await cache.get(client, "/doc")
+            cached = await cache.get(client, "/doc")
+
+        assert changed.json() == {"version": 2}
+        assert cached.json() == {"version": 2}
+        assert cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        server = ETagServer({"ok": True})
+        cache = ETagCache(max_entries=2)
+
+        async with httpx.AsyncClient(base_url="https://api.local", transport=httpx.MockTransport(server.handler)) as client:
+            for path in ("/a", "/b", "/c"):
+                await cache.get(client, path)
+
+        assert cache.get_stats()["entries"] == 2
+
+
+class TestPooledIntegrations:
+    """Tests for integrations and services using the registry"""
+
+    @pytest.mark.asyncio
+    async def test_jira_get_projects_uses_conditional_get(self, monkeypatch):
+        server = ETagServer([{"id": "1", "key": "QA", "name": "QA Project"}])
+        registry = mock_registry(server, "https://jira.local")
+        monkeypatch.setattr("integrations.base.client_registry", registry)
+        monkeypatch.setattr("integrations.base.etag_cache", ETagCache())
+
+        jira = JiraIntegration({
+            "base_url": "https://jira.local",
+            "email": "qa@example.com",
+            "api_token": "token",
+        })
+        jira.is_connected = True
+
+        first = await jira.get_projects()
+        second = await jira.get_projects()
+
+        assert first == second
+        assert second[0]["key"] == "QA"
+        assert server.requests[1].headers["If-None-Match"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_github_list_test_files_uses_conditional_get(self, monkeypatch):
+        from services import github_sync_service
+        from services.github_sync_service import GitHubSyncService
+
+        server = ETagServer({"tree": [
+            {"path": "tests/test_login.py", "type": "blob"},
+            {"path": "src/app.py", "type": "blob"},
+        ]})
+        registry = mock_registry(server, "https://api.github.com")
+        monkeypatch.setattr(github_sync_service, "client_registry", registry)
+        monkeypatch.setattr(github_sync_service, "etag_cache", ETagCache())
+
+        service = GitHubSyncService("gh-token")
+        first = await service.list_test_files("org", "app")
+        second = await service.list_test_files("org", "app")
+
+        assert first == second == ["tests/test_login.py"]
+        assert server.requests[0].url.path == "/repos/org/app/git/trees/main"
+        assert server.requests[0].headers["Authorization"] == "token gh-token"
+        assert server.requests[1].headers["If-None-Match"] == '"v1"'
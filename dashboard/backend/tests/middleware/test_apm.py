@@ -8,11 +8,13 @@ Covers:
 - Active requests gauge
 - Database query tracking
 - Cache hit/miss tracking
+- Exemplars
 """
 
+import asyncio
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.testclient import TestClient
 import time
 
@@ -25,8 +27,11 @@ from middleware.apm import (
     REQUEST_COUNT,
     REQUEST_LATENCY,
     ACTIVE_REQUESTS,
-    ERROR_RATE
+    ERROR_RATE,
+    SlidingWindowErrorRate,
+    UNMATCHED_ENDPOINT
 )
+from prometheus_client import REGISTRY
 
 
 @pytest.fixture
@@ -120,6 +125,125 @@ class TestAPMMiddleware:
         assert response.status_code == 200
 
 
+class TestPrometheusMetrics:
+    """Tests for the recorded metric values"""
+    
+    def _sample(self, name, **labels):
+        return REGISTRY.get_sample_value(name, labels) or 0
+    
+    def test_request_count_uses_route_template(self, client):
+        """Should label requests with the route template, not the raw path"""
+        labels = dict(method="GET", endpoint="/users/{user_id}", status_code="200")
+        before = self._sample("http_requests_total", **labels)
+        
+        client.get("/users/1")
+        client.get("/users/2")
+        
+        assert self._sample("http_requests_total", **labels) == before + 2
+    
+    def test_latency_observed(self, client):
+        """Should observe one latency sample per request"""
+        labels = dict(method="GET", endpoint="/test")
+        before = self._sample("http_request_duration_seconds_count", **labels)
+        
+        client.get("/test")
+        
+        assert self._sample("http_request_duration_seconds_count", **labels) == before + 1
+    
+    def test_active_requests_back_to_zero(self, client):
+        """Should decrement active requests after the response"""
+        client.get("/test")
+        
+        assert self._sample("http_requests_active", method="GET") == 0
+    
+    def test_unhandled_error_counted_as_500(self, client):
+        """Should record an unhandled exception as a 500"""
+        labels = dict(method="GET", endpoint="/error", status_code="500")
+        before = self._sample("http_requests_total", **labels)
+        
+        with pytest.raises(ValueError):
+            client.get("/error")
+        
+        assert self._sample("http_requests_total", **labels) == before + 1
+    
+    def test_unmatched_paths_share_one_label(self, client):
+        """Should not create a label per unknown path"""
+        labels = dict(method="GET", endpoint=UNMATCHED_ENDPOINT, status_code="404")
+        before = self._sample("http_requests_total", **labels)
+        
+        client.get("/nope/1")
+        client.get("/nope/2")
+        
+        assert self._sample("http_requests_total", **labels) == before + 2
+    
+    def test_sliding_window_error_rate(self):
+        """Should report the error percentage of the window"""
+        app = FastAPI()
+        app.add_middleware(APMMiddleware)
+        
+        @app.get("/flaky/{fail}")
+        async def flaky(fail: int):
+            if fail:
+                raise HTTPException(status_code=503)
+            return {"status": "ok"}
+        
+        client = TestClient(app)
+        for fail in (0, 0, 0, 1):
+            client.get(f"/flaky/{fail}")
+        
+        assert ERROR_RATE.rate("/flaky/{fail}") == 25.0
+        assert self._sample("http_error_rate", endpoint="/flaky/{fail}") == 25.0
+    
+    def test_error_rate_forgets_old_requests(self):
+        """Should drop requests older than the window"""
+        rate = SlidingWindowErrorRate("test_window_rate", "Test", window_seconds=10)
+        window = rate.window("/x")
+        window.record(100, True)
+        window.record(105, False)
+        
+        assert window.rate(105) == 50.0
+        assert window.rate(112) == 0.0
+        assert window.rate(120) is None
+    
+    def test_exemplars_carry_trace_id(self):
+        """Should attach the traceparent trace ID as an exemplar"""
+        from prometheus_client.openmetrics.exposition import generate_latest
+        
+        app = FastAPI()
+        app.add_middleware(APMMiddleware, exemplars=True)
+        
+        @app.get("/traced")
+        async def traced():
+            return {"status": "ok"}
+        
+        trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+        TestClient(app).get(
+            "/traced",
+            headers={"traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"}
+        )
+        
+        assert f'trace_id="{trace_id}"' in generate_latest(REGISTRY).decode()
+    
+    def test_malformed_traceparent_falls_back(self):
+        """Should ignore invalid trace IDs instead of failing the request"""
+        from middleware.apm import _trace_id
+        
+        app = FastAPI()
+        app.add_middleware(APMMiddleware, exemplars=True)
+        
+        @app.get("/traced")
+        async def traced():
+            return {"status": "ok"}
+        
+        client = TestClient(app)
+        for trace_id in ("f" * 200, "0" * 32, "4BF92F3577B34DA6A3CE929D0E0E4736", "xyz"):
+            headers = {"traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"}
+            assert client.get("/traced", headers=headers).status_code == 200
+            scope = {"headers": [(b"traceparent", headers["traceparent"].encode())]}
+            with patch("middleware.apm.get_request_id", return_value="req-1"):
+                assert _trace_id(scope) == "req-1"
+
+
 class TestDatabaseTracking:
     """Tests for database query tracking"""
     
@@ -10,6 +10,18 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 
+@pytest.fixture(autouse=True)
+def reset_api_key_cache():
+    """Start every test with an empty verified-key cache and no pending writes."""
+    from services.api_key_service import api_key_cache, last_used_recorder
+
+    api_key_cache.clear()
+    last_used_recorder._pending.clear()
+    yield
+    api_key_cache.clear()
+    last_used_recorder._pending.clear()
+
+
 class TestApiKeyServiceGenerate:
     """Tests for ApiKeyService static methods."""
 
@@ -141,7 +153,7 @@ class TestApiKeyServiceValidate:
         result = await ApiKeyService.validate_api_key(mock_db, "qaf_live_validkey123")
 
         assert result == mock_user
-        mock_db.commit.assert_called_once()  # last_used_at updated
+        mock_db.commit.assert_not_called()  # last_used_at is flushed in batches
 
     @pytest.mark.asyncio
     async def test_validate_invalid_prefix(self):
@@ -223,3 +235,179 @@ class TestApiKeyServiceValidate:
         result = await ApiKeyService.validate_api_key(mock_db, "qaf_live_validfuturekey")
 
         assert result == mock_user
+
+
+class TestApiKeyCaching:
+    """Tests for the verified-key cache and coalesced last_used_at writes."""
+
+    def _mock_db(self, key_id="key-1", expires_at=None, scopes=None):
+        mock_db = AsyncMock()
+        key_record = MagicMock()
+        key_record.id = key_id
+        key_record.expires_at = expires_at
+        key_record.scopes = scopes or ["read"]
+        key_record.hashed_key = "hash"
+        key_result = MagicMock()
+        key_result.scalar_one_or_none.return_value = key_record
+        user_result = MagicMock()
+        user_result.scalar_one_or_none.return_value = MagicMock(id=1)
+        mock_db.execute.side_effect = [key_result, user_result]
+        return mock_db
+
+    @pytest.mark.asyncio
+    async def test_repeat_requests_skip_the_database(self):
+        from services.api_key_service import ApiKeyService, api_key_cache, last_used_recorder
+
+        mock_db = self._mock_db(scopes=["read", "write"])
+        first = await ApiKeyService.verify_api_key(mock_db, "qaf_live_cached")
+        second = await ApiKeyService.verify_api_key(mock_db, "qaf_live_cached")
+
+        assert second is first
+        assert second.scopes == ["read", "write"]
+        assert mock_db.execute.call_count == 2
+        mock_db.commit.assert_not_called()
+        assert api_key_cache.get_stats()["entries"] == 1
+        assert last_used_recorder.pending == 1
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_with_ttl_and_key_expiry(self):
+        from services.api_key_service import ApiKeyCache, VerifiedApiKey
+
+        cache = ApiKeyCache(ttl=0)
+        cache.put("a", VerifiedApiKey(key_id="a", user=MagicMock()))
+        assert cache.get("a") is None
+
+        cache = ApiKeyCache(ttl=60)
+        cache.put("b", VerifiedApiKey(key_id="b", user=MagicMock(), expires_at=datetime.utcnow() - timedelta(seconds=1)))
+        assert cache.get("b") is None
+
+    def test_cache_is_bounded(self):
+        from services.api_key_service import ApiKeyCache, VerifiedApiKey
+
+        cache = ApiKeyCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, VerifiedApiKey(key_id=key, user=MagicMock()))
+
+        assert cache.get("a") is None
+        assert cache.get_stats()["entries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_revoke_deactivates_and_broadcasts(self):
+        from services.api_key_service import ApiKeyService, api_key_cache
+
+        redis = AsyncMock()
+        mock_db = self._mock_db()
+        await ApiKeyService.verify_api_key(mock_db, "qaf_live_revoked")
+        hashed = ApiKeyService.hash_api_key("qaf_live_revoked")
+
+        key_record = MagicMock(is_active=True, hashed_key=hashed)
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = key_record
+        revoke_db = AsyncMock()
+        revoke_db.execute.return_value = result
+
+        with patch.object(api_key_cache, "_redis_factory", lambda: redis):
+            assert await ApiKeyService.revoke_api_key(revoke_db, 1, "key-1") is True
+
+        assert key_record.is_active is False
+        revoke_db.commit.assert_called_once()
+        redis.publish.assert_awaited_once_with("api_keys:revoked", hashed)
+        assert api_key_cache.get(hashed) is None
+
+    @pytest.mark.asyncio
+    async def test_revoke_unknown_key(self):
+        from services.api_key_service import ApiKeyService
+
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = None
+        mock_db = AsyncMock()
+        mock_db.execute.return_value = result
+
+        assert await ApiKeyService.revoke_api_key(mock_db, 1, "missing") is False
+        mock_db.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_listener_evicts_revoked_keys(self):
+        import asyncio
+        from services.api_key_service import ApiKeyCache, VerifiedApiKey
+
+        class FakePubSub:
+            async def subscribe(self, channel):
+                self.channel = channel
+
+            async def listen(self):
+                yield {"type": "subscribe", "data": 1}
+                yield {"type": "message", "data": b"hash-1"}
+                await asyncio.Event().wait()
+
+            async def aclose(self):
+                pass
+
+        redis = MagicMock()
+        redis.pubsub.return_value = FakePubSub()
+        cache = ApiKeyCache(redis_factory=lambda: redis)
+        cache.put("hash-1", VerifiedApiKey(key_id="1", user=MagicMock()))
+        cache.put("hash-2", VerifiedApiKey(key_id="2", user=MagicMock()))
+
+        cache.start()
+        await asyncio.sleep(0.01)
+        await cache.stop()
+
+        assert cache.get("hash-1") is None
+        assert cache.get("hash-2") is not None
+
+
+class TestLastUsedRecorder:
+    """Tests for LastUsedRecorder."""
+
+    @pytest.fixture
+    def session_factory(self):
+        session = AsyncMock()
+        factory = MagicMock()
+        factory.return_value.__aenter__ = AsyncMock(return_value=session)
+        factory.return_value.__aexit__ = AsyncMock(return_value=False)
+        factory.session = session
+        return factory
+
+    @pytest.mark.asyncio
+    async def test_flush_coalesces_per_key(self, session_factory):
+        from services.api_key_service import LastUsedRecorder
+
+        recorder = LastUsedRecorder(session_factory=session_factory)
+        early, late = datetime(2026, 1, 1), datetime(2026, 1, 2)
+        for _ in range(100):
+            recorder.touch("key-1", early)
+        recorder.touch("key-1", late)
+        recorder.touch("key-2", early)
+
+        assert await recorder.flush() == 2
+
+        session = session_factory.session
+        session.execute.assert_awaited_once()
+        params = session.execute.await_args.args[1]
+        assert params == [{"key_id": "key-1", "used_at": late}, {"key_id": "key-2", "used_at": early}]
+        session.commit.assert_awaited_once()
+        assert await recorder.flush() == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_retried(self, session_factory):
+        from services.api_key_service import LastUsedRecorder
+
+        session_factory.session.execute.side_effect = RuntimeError("db down")
+        recorder = LastUsedRecorder(session_factory=session_factory)
+        recorder.touch("key-1", datetime(2026, 1, 1))
+
+        assert await recorder.flush() == 0
+        assert recorder.pending == 1
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_remaining(self, session_factory):
+        from services.api_key_service import LastUsedRecorder
+
+        recorder = LastUsedRecorder(flush_interval=60, session_factory=session_factory)
+        recorder.start()
+        recorder.touch("key-1")
+        await recorder.stop()
+
+        assert recorder.flushed == 1
+        assert not recorder.is_running
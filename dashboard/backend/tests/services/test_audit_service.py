@@ -0,0 +1,174 @@
+"""
+Unit tests for the batched audit log writer
+"""
+import asyncio
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from services.audit_service import AuditLog, AuditService, AuditWriter
+
+
+@pytest.fixture
+async def session_factory():
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(AuditLog.metadata.create_all)
+    yield sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def count_rows(session_factory):
+    async with session_factory() as session:
+        return (await session.execute(select(func.count(AuditLog.id)))).scalar()
+
+
+def make_row(action="user.login", **overrides):
+    row = {
+        "timestamp": datetime(2026, 1, 1, 12, 0),
+        "user_id": 1,
+        "action": action,
+        "resource_type": "user",
+        "resource_id": 1,
+        "ip_address": "10.0.0.1",
+        "user_agent": "pytest",
+        "details": {"source": "test"},
+        "status": "success",
+        "error_message": None,
+    }
+    row.update(overrides)
+    return row
+
+
+def failing_factory():
+    raise ConnectionError("database unavailable")
+
+
+class TestAuditWriter:
+    """Tests for AuditWriter"""
+
+    async def test_flush_writes_in_batches(self, session_factory):
+        writer = AuditWriter(batch_size=3, session_factory=session_factory)
+        for i in range(7):
+            assert await writer.submit(make_row(user_id=i))
+
+        assert await writer.flush() == 7
+        assert writer.batches == 3
+        assert await count_rows(session_factory) == 7
+
+    async def test_background_writer_flushes_on_interval(self, session_factory):
+        writer = AuditWriter(flush_interval=0.05, session_factory=session_factory)
+        writer.start()
+        try:
+            await writer.submit(make_row())
+            await writer.submit(make_row("user.logout"))
+            await asyncio.sleep(0.3)
+            assert await count_rows(session_factory) == 2
+        finally:
+            await writer.stop()
+
+        assert not writer.is_running
+
+    async def test_stop_flushes_pending_rows(self, session_factory):
+        writer = AuditWriter(flush_interval=60, batch_size=100, session_factory=session_factory)
+        writer.start()
+        for _ in range(5):
+            await writer.submit(make_row())
+
+        await writer.stop()
+
+        assert await count_rows(session_factory) == 5
+
+    async def test_full_queue_applies_backpressure_then_drops(self):
+        writer = AuditWriter(max_queue=1, put_timeout=0.01)
+        assert await writer.submit(make_row())
+
+        assert await writer.submit(make_row()) is False
+        assert writer.get_stats()["backpressure_waits"] == 1
+        assert writer.dropped == 1
+
+    async def test_failed_batches_spill_and_replay(self, session_factory, tmp_path):
+        spill_path = str(tmp_path / "audit.jsonl")
+        writer = AuditWriter(spill_path=spill_path, session_factory=failing_factory)
+        await writer.submit(make_row(details={"export_type": "csv"}))
+        await writer.flush()
+
+        with open(spill_path) as spill:
+            assert json.loads(spill.readline())["details"] == {"export_type": "csv"}
+        assert writer.spilled == 1
+
+        writer._session_factory = session_factory
+        assert await writer.replay_spill() == 1
+        assert await count_rows(session_factory) == 1
+
+    async def test_failed_batch_is_requeued_without_spill(self):
+        writer = AuditWriter(session_factory=failing_factory)
+        await writer.submit(make_row())
+
+        await writer._write_or_spill(writer._drain())
+
+        assert writer.queued == 1
+
+    async def test_flush_without_spill_returns_when_database_is_down(self):
+        writer = AuditWriter(batch_size=2, session_factory=failing_factory)
+        for _ in range(5):
+            await writer.submit(make_row())
+
+        assert await asyncio.wait_for(writer.flush(), timeout=1) == 0
+        assert writer.queued == 5
+
+    async def test_stop_without_spill_returns_when_database_is_down(self):
+        attempts = 0
+
+        def counting_factory():
+            nonlocal attempts
+            attempts += 1
+            return failing_factory()
+
+        writer = AuditWriter(flush_interval=0.01, session_factory=counting_factory)
+        writer.start()
+        await writer.submit(make_row())
+        await asyncio.sleep(0.2)
+
+        await asyncio.wait_for(writer.stop(), timeout=1)
+
+        assert not writer.is_running
+        assert writer.queued == 1
+        # Backing off from 10 ms, not retrying in a tight loop
+        assert attempts < 10
+
+
+class TestAuditService:
+    """Tests for AuditService.log_event"""
+
+    async def test_log_event_queues_without_committing(self, session_factory):
+        writer = AuditWriter(flush_interval=60, session_factory=session_factory)
+        db = AsyncMock()
+        writer.start()
+        try:
+            entry = await AuditService(db, writer=writer).log_event("user.login", "user", user_id=7)
+            assert entry.id is None
+            assert writer.queued == 1
+            db.commit.assert_not_called()
+        finally:
+            await writer.stop()
+
+        assert await count_rows(session_factory) == 1
+
+    async def test_log_event_writes_directly_when_writer_stopped(self):
+        db = AsyncMock()
+        db.add = lambda entry: None
+
+        await AuditService(db, writer=AuditWriter()).log_event("user.login", "user", user_id=7)
+
+        db.commit.assert_awaited_once()
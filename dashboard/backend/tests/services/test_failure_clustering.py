@@ -0,0 +1,133 @@
+"""
+Unit tests for failure clustering and batch root cause analysis
+"""
+import pytest
+
+from services.ai.failure_clustering import DrainClusterer, cluster_failures, normalize_error
+from services.ai.root_cause_analyzer import RootCauseAnalyzer
+
+
+PY_TRACE = '''Traceback (most recent call last):
+  File "/ci/tests/test_orders.py", line 12, in test_create_order
+    order = client.create_order(cart)
+  File "/ci/app/client.py", line 88, in create_order
+    raise TimeoutError("Timeout 30000ms exceeded")
+'''
+
+
+def make_failures():
+    failures = []
+    for i in range(300):
+        failures.append({
+            "test_name": f"test_checkout_{i % 5}",
+            "error_message": f"AssertionError: expected 200 got {500 + i % 4} for order {1000 + i}",
+        })
+    for i in range(150):
+        failures.append({
+            "test_name": "test_create_order",
+            "error_message": f"ConnectionRefusedError: connect to 10.0.0.{i % 9}:5432 refused",
+        })
+    failures.append({
+        "test_name": "test_profile",
+        "error_message": "TimeoutError: Timeout 30000ms exceeded",
+        "stack_trace": PY_TRACE,
+    })
+    return failures
+
+
+class TestNormalizeError:
+    """Tests for normalize_error"""
+
+    def test_masks_variable_parts(self):
+        signature = normalize_error(
+            "Request to https://api.local/users/42 failed for id "
+            "3f2a9c1e-1111-2222-3333-444455556666 reading /var/lib/app/data.json after 250ms at 0xdeadbeef"
+        )
+
+        assert signature == (
+            "Request to <URL> failed for id <UUID> reading <PATH> after <NUM> at <HEX>"
+        )
+
+    def test_keeps_first_line_and_innermost_frame(self):
+        message = "TimeoutError: Timeout 30000ms exceeded\nCall log:\n  - waiting for selector"
+
+        assert normalize_error(message, PY_TRACE) == "TimeoutError: Timeout <NUM> exceeded @ create_order"
+
+    def test_javascript_frames(self):
+        trace = "Error: boom\n    at async LoginPage.submit (/app/login.ts:10:5)\n    at run (/app/runner.ts:1:1)"
+
+        assert normalize_error("Error: boom", trace) == "Error: boom @ LoginPage.submit"
+
+
+class TestDrainClusterer:
+    """Tests for DrainClusterer"""
+
+    def test_groups_failures_into_templates(self):
+        clusters = cluster_failures(make_failures())
+
+        assert [c.count for c in clusters] == [300, 150, 1]
+        assert clusters[0].signature == "AssertionError: expected <NUM> got <NUM> for order <NUM>"
+        assert clusters[1].signature == "ConnectionRefusedError: connect to <IP> refused"
+        assert clusters[0].to_dict()["distinct_tests"] == 5
+
+    def test_similar_templates_are_generalized(self):
+        clusterer = DrainClusterer()
+        for user in ("alice", "bob", "carol"):
+            clusterer.add(f"PermissionError: user {user} may not delete project")
+
+        (cluster,) = clusterer.clusters
+        assert cluster.signature == "PermissionError: user <*> may not delete project"
+        assert cluster.count == 3
+
+    def test_different_errors_stay_apart(self):
+        clusterer = DrainClusterer()
+        clusterer.add("KeyError: missing field name")
+        clusterer.add("ValueError: invalid literal for int")
+
+        assert len(clusterer.clusters) == 2
+
+    def test_exemplars_are_bounded(self):
+        clusterer = DrainClusterer(max_exemplars=2)
+        for i in range(10):
+            clusterer.add(f"AssertionError: got {i}", test_name="test_a")
+
+        cluster = clusterer.clusters[0]
+        assert len(cluster.exemplars) == 2
+        assert cluster.test_names == {"test_a": 10}
+
+    def test_depth_is_validated(self):
+        with pytest.raises(ValueError):
+            DrainClusterer(depth=2)
+
+
+class TestBatchAnalyze:
+    """Tests for RootCauseAnalyzer.batch_analyze"""
+
+    @pytest.mark.asyncio
+    async def test_analyzes_once_per_cluster(self):
+        analyzer = RootCauseAnalyzer()
+
+        result = await analyzer.batch_analyze(iter(make_failures()))
+
+        assert result["total_failures"] == 451
+        assert result["total_clusters"] == 3
+        assert len(result["analyses"]) == 3
+        assert result["clusters"][0]["count"] == 300
+        assert result["clusters"][0]["analysis"]["occurrences"] == 300
+        assert result["common_causes"][0] == ("assertion", 300)
+
+    @pytest.mark.asyncio
+    async def test_max_clusters_limits_analysis(self):
+        analyzer = RootCauseAnalyzer()
+
+        result = await analyzer.batch_analyze(make_failures(), max_clusters=1)
+
+        assert result["total_clusters"] == 3
+        assert [c["count"] for c in result["clusters"]] == [300]
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self):
+        result = await RootCauseAnalyzer().batch_analyze([])
+
+        assert result["total_failures"] == 0
+        assert result["recommendation"] == "No failures to analyze."
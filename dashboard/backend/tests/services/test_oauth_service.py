@@ -420,7 +420,7 @@ class TestOAuthLogin:
         with patch.object(OAuthService, 'exchange_google_code', return_value=mock_tokens), \
              patch.object(OAuthService, 'get_google_user_info', return_value=mock_google_user_info), \
              patch('services.oauth_service.create_access_token', return_value="jwt_token"), \
-             patch('services.oauth_service.hash_password', return_value="hashed_pwd"):
+             patch('services.oauth_service.hash_password_async', return_value="hashed_pwd"):
             
             result = await OAuthService.oauth_login(mock_db, oauth_request, tenant_id="tenant_123")
             
@@ -488,7 +488,7 @@ class TestOAuthLogin:
         with patch.object(OAuthService, 'exchange_github_code', return_value=mock_tokens), \
              patch.object(OAuthService, 'get_github_user_info', return_value=mock_github_user_info), \
              patch('services.oauth_service.create_access_token', return_value="jwt_token"), \
-             patch('services.oauth_service.hash_password', return_value="hashed_pwd"):
+             patch('services.oauth_service.hash_password_async', return_value="hashed_pwd"):
             
             result = await OAuthService.oauth_login(mock_db, oauth_request)
             
@@ -560,7 +560,7 @@ class TestOAuthLogin:
         with patch.object(OAuthService, 'exchange_google_code', return_value=mock_tokens), \
              patch.object(OAuthService, 'get_google_user_info', return_value=mock_google_user_info), \
              patch('services.oauth_service.create_access_token', return_value="jwt_token"), \
-             patch('services.oauth_service.hash_password', return_value="hashed_pwd"):
+             patch('services.oauth_service.hash_password_async', return_value="hashed_pwd"):
             
             result = await OAuthService.oauth_login(mock_db, oauth_request, tenant_id="tenant_123")
             
@@ -0,0 +1,311 @@
+"""
+Unit Tests for Outbox Service
+
+Runs the outbox against an in-memory SQLite database (aiosqlite).
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from core.metrics import outbox_queue_depth_gauge, outbox_lag_seconds_gauge
+from models import TestExecution, TestSuite
+from models.outbox import OutboxMessage, OutboxStatus
+from services.outbox_service import (
+    OutboxDispatcher,
+    OutboxPermanentError,
+    enqueue,
+    enqueue_execution_events,
+    list_dead_letters,
+    requeue_dead_letters,
+)
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    """Session factory bound to a fresh in-memory database"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(OutboxMessage.__table__.create)
+    yield sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+def dispatcher(session_factory):
+    return OutboxDispatcher(session_factory=session_factory, batch_size=10, base_backoff=0.01, max_backoff=0.01)
+
+
+async def add_messages(session_factory, destination, count, **fields):
+    async with session_factory() as session:
+        for i in range(count):
+            enqueue(session, destination, {"n": i}, **fields)
+        await session.commit()
+
+
+async def all_messages(session_factory):
+    async with session_factory() as session:
+        result = await session.execute(select(OutboxMessage).order_by(OutboxMessage.id))
+        return list(result.scalars().all())
+
+
+class TestEnqueue:
+    """Tests for producers"""
+
+    @pytest.mark.asyncio
+    async def test_message_commits_with_caller_transaction(self, session_factory):
+        async with session_factory() as session:
+            enqueue(session, "email_test_report", {"to_email": "a@example.com"})
+            await session.rollback()
+
+        assert await all_messages(session_factory) == []
+
+        async with session_factory() as session:
+            enqueue(session, "email_test_report", {"to_email": "a@example.com"})
+            await session.commit()
+
+        messages = await all_messages(session_factory)
+        assert len(messages) == 1
+        assert messages[0].status == OutboxStatus.PENDING
+        assert messages[0].attempts == 0
+
+    @pytest.mark.asyncio
+    async def test_execution_events_follow_suite_config(self, session_factory):
+        suite = TestSuite(id=1, name="Checkout", config={
+            "report_emails": ["qa@example.com"],
+            "integrations": {"providers": ["jira", "zephyr"], "project_key": "QA"},
+            "github": {"owner": "org", "repo": "shop", "head_sha": "abc123"},
+        })
+        execution = TestExecution(
+            id=7, suite_id=1, executed_by=3, total_tests=2, passed_tests=1,
+            failed_tests=1, duration=4, ended_at=datetime.utcnow()
+        )
+        results = [
+            {"test_id": 1, "test_name": "test_pay", "status": "passed", "duration": 1, "error": None},
+            {"test_id": 2, "test_name": "test_refund", "status": "error", "duration": 3, "error": "boom"},
+        ]
+
+        async with session_factory() as session:
+            messages = enqueue_execution_events(session, execution, results, suite=suite)
+            await session.commit()
+
+        destinations = sorted(m.destination for m in messages)
+        assert destinations == [
+            "email_test_report", "github_check_run", "integration_sync", "integration_sync", "notification"
+        ]
+        by_destination = {m.destination: m.payload for m in messages}
+        assert by_destination["notification"]["type"] == "test_failed"
+        assert by_destination["github_check_run"]["conclusion"] == "failure"
+        assert by_destination["email_test_report"]["failed_tests"] == [{"name": "test_refund", "error": "boom"}]
+        assert by_destination["integration_sync"]["results"][1]["status"] == "failed"
+
+    def test_execution_events_without_suite_config(self):
+        added = []
+        session = type("Session", (), {"add": lambda self, obj: added.append(obj)})()
+        execution = TestExecution(id=1, suite_id=1, executed_by=2, total_tests=1, passed_tests=1, failed_tests=0)
+
+        messages = enqueue_execution_events(session, execution, [], suite=None)
+
+        assert [m.destination for m in messages] == ["notification"]
+        assert messages[0].payload["type"] == "test_completed"
+        assert added == messages
+
+
+class TestOutboxDispatcher:
+    """Tests for OutboxDispatcher"""
+
+    @pytest.mark.asyncio
+    async def test_delivers_in_batches(self, session_factory, dispatcher):
+        delivered = []
+
+        async def handler(payload):
+            delivered.append(payload["n"])
+
+        dispatcher.register("notification", handler)
+        await add_messages(session_factory, "notification", 25)
+
+        assert await dispatcher.run_once() == 10
+        assert await dispatcher.drain() == 15
+
+        assert sorted(delivered) == list(range(25))
+        messages = await all_messages(session_factory)
+        assert {m.status for m in messages} == {OutboxStatus.DELIVERED}
+        assert all(m.delivered_at is not None for m in messages)
+
+    @pytest.mark.asyncio
+    async def test_failed_delivery_is_retried_with_backoff(self, session_factory):
+        dispatcher = OutboxDispatcher(session_factory=session_factory, base_backoff=60, max_backoff=60)
+        calls = []
+
+        async def flaky(payload):
+            calls.append(payload)
+            raise ConnectionError("provider unavailable")
+
+        dispatcher.register("integration_sync", flaky)
+        await add_messages(session_factory, "integration_sync", 1)
+
+        await dispatcher.run_once()
+        # Not due again until the backoff has elapsed
+        assert await dispatcher.run_once() == 0
+
+        message = (await all_messages(session_factory))[0]
+        assert message.status == OutboxStatus.PENDING
+        assert message.attempts == 1
+        assert "provider unavailable" in message.last_error
+        assert message.available_at > datetime.utcnow() + timedelta(seconds=40)
+        assert dispatcher.retried == 1
+
+    @pytest.mark.asyncio
+    async def test_dead_letters_after_max_attempts(self, session_factory, dispatcher):
+        async def failing(payload):
+            raise RuntimeError("still down")
+
+        dispatcher.register("email_test_report", failing)
+        await add_messages(session_factory, "email_test_report", 1, max_attempts=3)
+
+        for _ in range(3):
+            await asyncio.sleep(0.02)
+            await dispatcher.run_once()
+
+        message = (await all_messages(session_factory))[0]
+        assert message.status == OutboxStatus.DEAD
+        assert message.attempts == 3
+        assert dispatcher.dead_lettered == 1
+
+    @pytest.mark.asyncio
+    async def test_permanent_errors_and_unknown_destinations_dead_letter_immediately(self, session_factory, dispatcher):
+        async def rejected(payload):
+            raise OutboxPermanentError("422 invalid head_sha")
+
+        dispatcher.register("github_check_run", rejected)
+        await add_messages(session_factory, "github_check_run", 1)
+        await add_messages(session_factory, "fax", 1)
+
+        await dispatcher.run_once()
+
+        messages = await all_messages(session_factory)
+        assert [m.status for m in messages] == [OutboxStatus.DEAD, OutboxStatus.DEAD]
+        assert messages[0].last_error == "422 invalid head_sha"
+        assert "No handler registered" in messages[1].last_error
+
+    @pytest.mark.asyncio
+    async def test_per_destination_concurrency(self, session_factory, dispatcher):
+        in_flight = {"slow": 0, "fast": 0}
+        peak = {"slow": 0, "fast": 0}
+
+        def make_handler(name):
+            async def handler(payload):
+                in_flight[name] += 1
+                peak[name] = max(peak[name], in_flight[name])
+                await asyncio.sleep(0.01)
+                in_flight[name] -= 1
+            return handler
+
+        dispatcher.register("slow", make_handler("slow"), concurrency=2)
+        dispatcher.register("fast", make_handler("fast"), concurrency=5)
+        await add_messages(session_factory, "slow", 5)
+        await add_messages(session_factory, "fast", 5)
+
+        await dispatcher.run_once()
+
+        assert peak == {"slow": 2, "fast": 5}
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_reclaimed(self, session_factory, dispatcher):
+        await add_messages(session_factory, "notification", 1)
+        claimed = await dispatcher.claim_batch()
+        assert len(claimed) == 1
+
+        # Lease still held: a second worker sees nothing
+        assert await dispatcher.claim_batch() == []
+
+        async with session_factory() as session:
+            message = await session.get(OutboxMessage, claimed[0].id)
+            message.locked_until = datetime.utcnow() - timedelta(seconds=1)
+            await session.commit()
+
+        reclaimed = await dispatcher.claim_batch()
+        assert [m.id for m in reclaimed] == [claimed[0].id]
+        assert reclaimed[0].attempts == 2
+
+    @pytest.mark.asyncio
+    async def test_message_queued_past_its_lease_is_delivered_once(self, session_factory):
+        deliveries = []
+
+        async def handler(payload):
+            deliveries.append(payload["n"])
+            await asyncio.sleep(0.2)
+
+        first = OutboxDispatcher(session_factory=session_factory, lease_seconds=0.3, delivery_timeout=0.3)
+        second = OutboxDispatcher(session_factory=session_factory, lease_seconds=0.3, delivery_timeout=0.3)
+        first.register("sync", handler, concurrency=1)
+        second.register("sync", handler, concurrency=1)
+        await add_messages(session_factory, "sync", 3)
+
+        batch = asyncio.create_task(first.process_batch(await first.claim_batch()))
+        # A second worker polls while the later messages wait behind the
+        # semaphore and their claim-time lease expires
+        while not batch.done():
+            await second.run_once()
+            await asyncio.sleep(0.02)
+        await batch
+
+        assert sorted(deliveries) == [0, 1, 2]
+        assert all(m.status == OutboxStatus.DELIVERED for m in await all_messages(session_factory))
+
+    @pytest.mark.asyncio
+    async def test_queue_stats_export_depth_and_lag(self, session_factory, dispatcher):
+        async with session_factory() as session:
+            message = enqueue(session, "notification", {})
+            message.created_at = datetime.utcnow() - timedelta(seconds=30)
+            enqueue(session, "notification", {})
+            dead = enqueue(session, "notification", {})
+            dead.status = OutboxStatus.DEAD
+            await session.commit()
+
+        stats = await dispatcher.get_queue_stats()
+
+        assert stats["depth"]["notification"] == {"pending": 2, "processing": 0, "dead": 1}
+        assert 29 <= stats["lag_seconds"]["notification"] < 40
+        assert outbox_queue_depth_gauge.labels(destination="notification", status="pending")._value.get() == 2
+        assert outbox_lag_seconds_gauge.labels(destination="notification")._value.get() >= 29
+
+    @pytest.mark.asyncio
+    async def test_requeue_dead_letters(self, session_factory, dispatcher):
+        await add_messages(session_factory, "fax", 2)
+        await dispatcher.run_once()
+
+        async with session_factory() as session:
+            dead = await list_dead_letters(session)
+            assert len(dead) == 2
+            assert await requeue_dead_letters(session, message_ids=[dead[0].id]) == 1
+
+        statuses = sorted(m.status for m in await all_messages(session_factory))
+        assert statuses == [OutboxStatus.DEAD, OutboxStatus.PENDING]
+
+    @pytest.mark.asyncio
+    async def test_background_loop_delivers_and_stops(self, session_factory):
+        dispatcher = OutboxDispatcher(session_factory=session_factory, poll_interval=0.01)
+        delivered = asyncio.Event()
+
+        async def handler(payload):
+            delivered.set()
+
+        dispatcher.register("notification", handler)
+        dispatcher.start()
+        await add_messages(session_factory, "notification", 1)
+
+        await asyncio.wait_for(delivered.wait(), timeout=2)
+        await dispatcher.stop()
+
+        assert not dispatcher.is_running
+        assert dispatcher.delivered == 1
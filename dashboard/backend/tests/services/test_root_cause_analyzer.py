@@ -0,0 +1,80 @@
+"""
+Unit tests for root cause failure classification
+
+Stored failures are classified against an in-memory SQLite database (aiosqlite).
+"""
+import json
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from models import TestExecutionDetail
+from services.ai.root_cause_analyzer import RootCauseAnalyzer, load_classifiers
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    """Session factory bound to a fresh in-memory database"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        # Foreign keys are not enforced by SQLite, so the detail table stands alone
+        await conn.run_sync(TestExecutionDetail.__table__.create)
+    yield sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+class TestClassification:
+    """Tests for the compiled pattern and error type classifiers"""
+
+    def test_identify_patterns_reports_matched_keywords(self):
+        analyzer = RootCauseAnalyzer()
+
+        patterns = analyzer._identify_patterns("AssertionError: expected 403 Forbidden", None)
+
+        assert [p["type"] for p in patterns] == ["assertion_failed", "permission_denied"]
+        assert patterns[0]["keywords"] == ["AssertionError", "assert", "expected"]
+        assert patterns[1]["keywords"] == ["403", "Forbidden"]
+
+    def test_cluster_error_first_declared_category_wins(self):
+        analyzer = RootCauseAnalyzer()
+
+        assert analyzer._cluster_error("Element not found after TIMEOUT")["type"] == "timeout"
+        assert analyzer._cluster_error("ECONNREFUSED 127.0.0.1")["type"] == "network"
+        assert analyzer._cluster_error("all good")["type"] == "unknown"
+
+    def test_classifiers_are_loaded_from_config(self, tmp_path):
+        config = tmp_path / "classifier.json"
+        config.write_text(json.dumps({"error_types": {"flaky_db": [{"regex": r"deadlock|lock wait"}]}}))
+
+        analyzer = RootCauseAnalyzer(classifier_config=str(config))
+
+        assert analyzer._cluster_error("Lock wait timeout exceeded")["type"] == "flaky_db"
+        assert analyzer.pattern_classifier.primary("timed out") == "timeout"
+        assert load_classifiers(str(config)) == (analyzer.pattern_classifier, analyzer.type_classifier)
+
+
+class TestClassifyStoredFailures:
+    """Tests for RootCauseAnalyzer.classify_stored_failures"""
+
+    @pytest.mark.asyncio
+    async def test_streams_all_failures(self, session_factory):
+        messages = ["timed out waiting"] * 7 + ["AssertionError: 1 != 2"] * 5 + ["kaboom", None]
+        async with session_factory() as session:
+            for i, message in enumerate(messages):
+                session.add(TestExecutionDetail(
+                    execution_id=1, test_case_id=i, status="failed", error_message=message
+                ))
+            await session.commit()
+
+        async with session_factory() as session:
+            result = await RootCauseAnalyzer().classify_stored_failures(session, batch_size=3)
+
+        assert result["total_failures"] == 13
+        assert result["error_types"] == {"timeout": 7, "assertion": 5, "unknown": 1}
@@ -0,0 +1,142 @@
+"""
+Unit tests for the AI test optimizer's redundant-test detection
+"""
+from datetime import datetime
+
+import pytest
+
+from services.ai.test_optimizer import LSHIndex, MinHasher, tokenize_code
+from services.ai.test_optimizer import TestOptimizer as Optimizer  # not a test class
+
+
+LOGIN_TEST = """
+def test_login(page):
+    page.goto("/login")
+    page.fill("#email", "qa@example.com")
+    page.fill("#password", "secret")
+    page.click("button[type=submit]")
+    assert page.url.endswith("/dashboard")
+    assert page.locator(".welcome").is_visible()
+"""
+
+CHECKOUT_TEST = """
+def test_checkout(api):
+    cart = api.post("/cart", json={"sku": "A-1", "qty": 2}).json()
+    order = api.post("/orders", json={"cart_id": cart["id"]})
+    assert order.status_code == 201
+    assert order.json()["total"] == 40
+"""
+
+
+def make_test(test_id, code, name=None, updated_at=datetime(2026, 1, 1)):
+    return {
+        "id": test_id,
+        "name": name or f"test_{test_id}",
+        "test_code": code,
+        "updated_at": updated_at,
+    }
+
+
+class TestTokenizer:
+    """Tests for tokenize_code"""
+
+    def test_comments_and_whitespace_are_ignored(self):
+        assert tokenize_code("x  =  1  # set x\n") == tokenize_code("x=1")
+
+    def test_string_literals_stay_whole(self):
+        assert tokenize_code('page.click("#login")') == [
+            "page", ".", "click", "(", '"#login"', ")"
+        ]
+
+
+class TestMinHash:
+    """Tests for MinHasher and LSHIndex"""
+
+    def test_similarity_estimates_jaccard(self):
+        hasher = MinHasher(num_perm=256, shingle_size=1)
+        first = " ".join(f"t{i}" for i in range(100))
+        second = " ".join(f"t{i}" for i in range(50, 150))  # Jaccard 1/3
+
+        estimate = MinHasher.similarity(hasher.signature(first), hasher.signature(second))
+
+        assert estimate == pytest.approx(1 / 3, abs=0.1)
+
+    def test_empty_code_has_no_signature(self):
+        assert MinHasher().signature("# only a comment") is None
+
+    def test_lsh_returns_only_colliding_keys(self):
+        hasher = MinHasher()
+        index = LSHIndex(num_perm=128, bands=16)
+        index.insert("login", hasher.signature(LOGIN_TEST))
+        index.insert("checkout", hasher.signature(CHECKOUT_TEST))
+
+        assert index.query(hasher.signature(LOGIN_TEST + "\n    page.close()")) == {"login"}
+
+    def test_bands_must_divide_signature(self):
+        with pytest.raises(ValueError):
+            LSHIndex(num_perm=128, bands=10)
+
+
+class TestRedundantTests:
+    """Tests for TestOptimizer._detect_redundant_tests"""
+
+    @pytest.mark.asyncio
+    async def test_near_duplicate_reports_estimated_similarity(self):
+        optimizer = Optimizer(similarity_threshold=0.7)
+        tests = [
+            make_test(1, LOGIN_TEST, "test_login"),
+            make_test(2, CHECKOUT_TEST, "test_checkout"),
+            make_test(3, LOGIN_TEST + '    assert page.title() == "Home"\n', "test_login_title"),
+        ]
+
+        redundant = await optimizer._detect_redundant_tests(tests)
+
+        assert len(redundant) == 1
+        assert redundant[0]["test_name"] == "test_login_title"
+        assert redundant[0]["duplicate_of"] == "test_login"
+        assert redundant[0]["duplicate_of_id"] == 1
+        assert 0.7 <= redundant[0]["similarity"] < 1.0
+
+    @pytest.mark.asyncio
+    async def test_exact_duplicates_point_at_first_occurrence(self):
+        optimizer = Optimizer()
+        reformatted = LOGIN_TEST.replace("    ", "        ") + "# copied\n"
+        tests = [make_test(i, code) for i, code in enumerate([LOGIN_TEST, reformatted, LOGIN_TEST])]
+
+        redundant = await optimizer._detect_redundant_tests(tests)
+
+        assert [r["test_id"] for r in redundant] == [1, 2]
+        assert {r["duplicate_of_id"] for r in redundant} == {0}
+        assert all(r["similarity"] == 1.0 for r in redundant)
+
+    @pytest.mark.asyncio
+    async def test_unrelated_tests_are_not_redundant(self):
+        optimizer = Optimizer()
+        tests = [make_test(1, LOGIN_TEST), make_test(2, CHECKOUT_TEST)]
+
+        assert await optimizer._detect_redundant_tests(tests) == []
+
+    @pytest.mark.asyncio
+    async def test_signatures_are_cached_per_updated_at(self):
+        optimizer = Optimizer()
+        tests = [make_test(1, LOGIN_TEST), make_test(2, CHECKOUT_TEST)]
+
+        await optimizer._detect_redundant_tests(tests)
+        await optimizer._detect_redundant_tests(tests)
+        assert (optimizer.signature_cache_hits, optimizer.signature_cache_misses) == (2, 2)
+
+        tests[1] = make_test(2, LOGIN_TEST, updated_at=datetime(2026, 2, 1))
+        redundant = await optimizer._detect_redundant_tests(tests)
+
+        assert optimizer.signature_cache_misses == 3
+        assert [r["test_id"] for r in redundant] == [2]
+
+    @pytest.mark.asyncio
+    async def test_analyze_suite_includes_redundant_tests(self):
+        optimizer = Optimizer()
+        tests = [make_test(1, LOGIN_TEST), make_test(2, LOGIN_TEST)]
+
+        result = await optimizer.analyze_suite(tests, [])
+
+        suggestion = next(s for s in result["suggestions"] if s["type"] == "redundant_tests")
+        assert suggestion["tests"][0]["test_id"] == 2
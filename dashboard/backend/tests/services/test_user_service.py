@@ -32,8 +32,8 @@ class TestCreateUserService:
         mock_result.scalar_one_or_none.return_value = None
         mock_db.execute.return_value = mock_result
 
-        # Mock hash_password
-        with patch("services.user_service.hash_password", return_value="hashed_pw"):
+        # Mock hash_password_async
+        with patch("services.user_service.hash_password_async", return_value="hashed_pw"):
             result = await create_user_service(mock_user_data, mock_db)
 
         mock_db.add.assert_called_once()
@@ -102,7 +102,7 @@ class TestCreateUserService:
         mock_result.scalar_one_or_none.return_value = None
         mock_db.execute.return_value = mock_result
 
-        with patch("services.user_service.hash_password", return_value="hashed"):
+        with patch("services.user_service.hash_password_async", return_value="hashed"):
             await create_user_service(mock_user_data, mock_db)
 
         mock_db.add.assert_called_once()
@@ -9,15 +9,28 @@ from datetime import datetime, timedelta
 from jose import jwt
 
 from config import settings
+from fastapi import HTTPException
 from services.auth_service import (
     hash_password,
     verify_password,
+    verify_password_async,
     create_access_token,
     authenticate_user,
-    get_current_user
+    get_current_user,
+    login_for_access_token,
+    TokenCache,
+    token_cache,
 )
 from models import User
 from schemas import UserCreate, LoginRequest
+from src.infrastructure.auth.hashing_pool import HashingPoolFullError
+
+
+@pytest.fixture(autouse=True)
+def reset_token_cache():
+    token_cache.clear()
+    yield
+    token_cache.clear()
 
 
 @pytest.mark.asyncio
@@ -215,6 +228,92 @@ class TestUserCreation:
         assert verify_password("plain_pwd", hashed) is True
 
 
+@pytest.mark.asyncio
+class TestPasswordPool:
+    """Test password hashing off the event loop"""
+
+    async def test_verify_password_async(self):
+        hashed = hash_password("test_pwd_123")
+
+        assert await verify_password_async("test_pwd_123", hashed) is True
+        assert await verify_password_async("wrong_pwd", hashed) is False
+
+    async def test_login_rejected_when_pool_saturated(self):
+        request = LoginRequest(username="testuser", password="test_pwd_123")
+
+        with patch(
+            "services.auth_service.authenticate_user",
+            AsyncMock(side_effect=HashingPoolFullError("full")),
+        ):
+            with pytest.raises(HTTPException) as exc_info:
+                await login_for_access_token(request, AsyncMock())
+
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.headers["Retry-After"] == "1"
+
+
+@pytest.mark.asyncio
+class TestTokenCache:
+    """Test the decoded token cache"""
+
+    def make_user(self):
+        return User(id=1, username="testuser", email="test@example.com",
+                    hashed_password="hashed", is_active=True)
+
+    def make_db(self, user):
+        mock_db = AsyncMock()
+        mock_result = AsyncMock()
+        mock_result.scalar_one_or_none = Mock(return_value=user)
+        mock_db.execute = AsyncMock(return_value=mock_result)
+        return mock_db
+
+    async def test_access_tokens_have_unique_jti(self):
+        first = jwt.get_unverified_claims(create_access_token({"sub": "testuser"}))
+        second = jwt.get_unverified_claims(create_access_token({"sub": "testuser"}))
+
+        assert first["jti"] != second["jti"]
+
+    async def test_repeat_requests_skip_user_lookup(self):
+        mock_db = self.make_db(self.make_user())
+        credentials = Mock(credentials=create_access_token({"sub": "testuser"}))
+
+        first = await get_current_user(credentials, mock_db)
+        second = await get_current_user(credentials, mock_db)
+
+        assert first is second
+        assert mock_db.execute.await_count == 1
+        assert token_cache.get_stats()["hits"] == 1
+
+    async def test_token_with_reused_jti_is_not_served_from_cache(self):
+        cache = TokenCache()
+        token = create_access_token({"sub": "testuser", "jti": "abc"})
+        forged = create_access_token({"sub": "admin", "jti": "abc"})
+        cache.put(token, jwt.get_unverified_claims(token), self.make_user())
+
+        assert cache.get(token) is not None
+        assert cache.get(forged) is None
+
+    async def test_entries_expire_with_token(self):
+        cache = TokenCache(ttl=60)
+        token = create_access_token({"sub": "testuser"}, timedelta(seconds=-1))
+        payload = jwt.get_unverified_claims(token)
+        cache.put(token, payload, self.make_user())
+
+        assert cache.get(token) is None
+        assert cache.get_stats()["entries"] == 0
+
+    async def test_bounded_and_invalidated(self):
+        cache = TokenCache(max_entries=2)
+        tokens = [create_access_token({"sub": f"user{i}"}) for i in range(3)]
+        for token in tokens:
+            cache.put(token, jwt.get_unverified_claims(token), self.make_user())
+
+        assert cache.get(tokens[0]) is None
+        assert cache.invalidate(tokens[2]) is True
+        assert cache.get(tokens[2]) is None
+        assert cache.get(tokens[1]) is not None
+
+
 # Run tests
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
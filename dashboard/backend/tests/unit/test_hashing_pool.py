@@ -0,0 +1,70 @@
+"""
+Unit Tests for the password hashing pool
+"""
+import asyncio
+import threading
+
+import bcrypt
+import pytest
+
+from src.infrastructure.auth.hashing_pool import HashingPool, HashingPoolFullError
+
+
+@pytest.mark.asyncio
+class TestHashingPool:
+    """Test suite for HashingPool"""
+
+    async def test_runs_callable_and_records_stats(self):
+        waits = []
+        pool = HashingPool(max_workers=1, on_wait=waits.append)
+        try:
+            assert await pool.run(pow, 2, 10) == 1024
+        finally:
+            pool.shutdown()
+
+        stats = pool.get_stats()
+        assert stats["completed"] == 1
+        assert stats["queued"] == 0 and stats["active"] == 0
+        assert len(waits) == 1 and waits[0] >= 0
+
+    async def test_rejects_calls_beyond_queue(self):
+        release = threading.Event()
+        pool = HashingPool(max_workers=1, max_queue=1)
+        try:
+            running = asyncio.ensure_future(pool.run(release.wait))
+            waiting = asyncio.ensure_future(pool.run(release.wait))
+            await asyncio.sleep(0.05)
+
+            with pytest.raises(HashingPoolFullError):
+                await pool.run(release.wait)
+
+            release.set()
+            assert await asyncio.gather(running, waiting) == [True, True]
+        finally:
+            release.set()
+            pool.shutdown()
+
+        stats = pool.get_stats()
+        assert stats["rejected"] == 1
+        assert stats["completed"] == 2
+
+    async def test_event_loop_stays_responsive_while_hashing(self):
+        pool = HashingPool(max_workers=1)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        task = asyncio.ensure_future(ticker())
+        try:
+            salt = bcrypt.gensalt(rounds=10)
+            hashed = await pool.run(bcrypt.hashpw, b"Secret123!", salt)
+            assert await pool.run(bcrypt.checkpw, b"Secret123!", hashed)
+        finally:
+            task.cancel()
+            pool.shutdown()
+
+        assert ticks > 3
@@ -16,11 +16,12 @@ SOLID Principles:
 """
 
 import json
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Pattern, Set, Tuple, Union
 
 import yaml
 
@@ -80,31 +81,64 @@ class ISchemaValidator(ABC):
 class JSONSchemaValidator(ISchemaValidator):
     """
     JSON Schema validator for OpenAPI schemas.
+
+    Validators are compiled once per schema and reused; ``jsonschema.validate``
+    would rebuild the validator (and re-check the schema) on every call.
     """
-    
+
+    MAX_CACHED_SCHEMAS = 256
+
+    def __init__(self) -> None:
+        # id(schema) -> (schema, compiled); the schema is kept so its id stays unique
+        self._compiled: Dict[int, Tuple[Dict[str, Any], Callable[[Any], ValidationResult]]] = {}
+
     def validate(self, data: Any, schema: Dict[str, Any]) -> ValidationResult:
         """Validate data against JSON schema."""
+        cached = self._compiled.get(id(schema))
+        if cached is None or cached[0] is not schema:
+            if len(self._compiled) >= self.MAX_CACHED_SCHEMAS:
+                self._compiled.clear()
+            cached = (schema, self.compile(schema))
+            self._compiled[id(schema)] = cached
+        return cached[1](data)
+
+    def compile(self, schema: Dict[str, Any]) -> Callable[[Any], ValidationResult]:
+        """
+        Compile a schema into a reusable validation function.
+
+        Args:
+            schema: JSON schema; ``#/...`` references resolve against it
+
+        Returns:
+            Function validating an instance and returning a ValidationResult
+        """
         try:
-            from jsonschema import validate, ValidationError
-            
-            validate(instance=data, schema=schema)
-            return ValidationResult(
-                passed=True,
-                message="Validation passed",
-                severity=ValidationSeverity.INFO
-            )
+            from jsonschema import exceptions
+            from jsonschema.validators import validator_for
         except ImportError:
             # Fallback to basic validation
-            return self._basic_validation(data, schema)
-        except ValidationError as e:
+            return lambda data: self._basic_validation(data, schema)
+
+        validator = validator_for(schema)(schema)
+
+        def check(data: Any) -> ValidationResult:
+            if validator.is_valid(data):
+                return ValidationResult(
+                    passed=True,
+                    message="Validation passed",
+                    severity=ValidationSeverity.INFO
+                )
+            error = exceptions.best_match(validator.iter_errors(data))
             return ValidationResult(
                 passed=False,
-                message=str(e.message),
+                message=str(error.message),
                 severity=ValidationSeverity.ERROR,
-                path=str(e.path),
-                expected=e.validator_value,
-                actual=e.instance
+                path=str(error.path),
+                expected=error.validator_value,
+                actual=error.instance
             )
+
+        return check
     
     def _basic_validation(self, data: Any, schema: Dict[str, Any]) -> ValidationResult:
         """Basic validation without jsonschema library."""
@@ -148,6 +182,9 @@ class OpenAPIParser:
         self.spec_path = Path(spec_path)
         self._spec: Optional[Dict[str, Any]] = None
         self._endpoints: List[EndpointContract] = []
+        self._endpoint_map: Dict[Tuple[str, str], EndpointContract] = {}
+        self._resolved_refs: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._inlined_refs: Dict[str, Any] = {}
     
     def parse(self) -> Dict[str, Any]:
         """Parse OpenAPI specification file."""
@@ -189,16 +226,14 @@ class OpenAPIParser:
                         deprecated=operation.get('deprecated', False)
                     )
                     self._endpoints.append(contract)
+                    self._endpoint_map[(path, contract.method)] = contract
         
         return self._endpoints
     
     def get_endpoint(self, path: str, method: str) -> Optional[EndpointContract]:
-        """Get contract for specific endpoint."""
-        endpoints = self.get_endpoints()
-        for endpoint in endpoints:
-            if endpoint.path == path and endpoint.method == method.upper():
-                return endpoint
-        return None
+        """Get contract for specific endpoint (path template and method)."""
+        self.get_endpoints()
+        return self._endpoint_map.get((path, method.upper()))
     
     def get_schemas(self) -> Dict[str, Any]:
         """Get all schemas defined in components."""
@@ -216,6 +251,9 @@ class OpenAPIParser:
     
     def resolve_schema(self, schema_ref: str) -> Optional[Dict[str, Any]]:
         """Resolve schema reference (e.g., #/components/schemas/User)."""
+        if schema_ref in self._resolved_refs:
+            return self._resolved_refs[schema_ref]
+
         if not schema_ref.startswith('#/'):
             return None
         
@@ -224,23 +262,270 @@ class OpenAPIParser:
         
         current = spec
         for part in parts:
+            part = part.replace('~1', '/').replace('~0', '~')
             if isinstance(current, dict) and part in current:
                 current = current[part]
             else:
-                return None
+                current = None
+                break
         
+        self._resolved_refs[schema_ref] = current
         return current
 
+    def inline_refs(self, node: Any) -> Any:
+        """
+        Return a copy of ``node`` with every local ``$ref`` replaced by its target.
+
+        Recursive references cannot be inlined and are left as ``$ref``;
+        they resolve against the spec's ``components`` (see ContractIndex).
+        """
+        return self._inline(node, ())[0]
+
+    def _inline(self, node: Any, stack: Tuple[str, ...]) -> Tuple[Any, bool]:
+        """Inline refs; returns (inlined node, whether a recursive ref was kept)."""
+        if isinstance(node, list):
+            items = [self._inline(item, stack) for item in node]
+            return [item for item, _ in items], any(cyclic for _, cyclic in items)
+
+        if not isinstance(node, dict):
+            return node, False
+
+        ref = node.get('$ref')
+        if isinstance(ref, str):
+            if ref in self._inlined_refs:
+                return self._inlined_refs[ref], False
+            target = self.resolve_schema(ref)
+            if target is None or ref in stack:
+                return node, target is not None
+            inlined, cyclic = self._inline(target, stack + (ref,))
+            if not cyclic:
+                self._inlined_refs[ref] = inlined
+            return inlined, cyclic
+
+        result: Dict[str, Any] = {}
+        cyclic = False
+        for key, value in node.items():
+            result[key], value_cyclic = self._inline(value, stack)
+            cyclic = cyclic or value_cyclic
+        return result, cyclic
+
+
+class PathTemplateRouter:
+    """
+    Radix tree routing concrete request paths to OpenAPI path templates.
+
+    Paths are split into segments; each node holds static children in a dict
+    and templated children (``{id}``, ``{name}.json``) as compiled patterns.
+    Static segments take precedence over templated ones, so ``/users/me``
+    wins over ``/users/{id}``, as the OpenAPI specification requires.
+
+    Example:
+        >>> router = PathTemplateRouter()
+        >>> router.add("/users/{id}")
+        >>> router.match("/users/42")
+        '/users/{id}'
+    """
+
+    _PARAM = re.compile(r'\{[^}/]+\}')
+
+    class _Node:
+        __slots__ = ('static', 'params', 'template')
+
+        def __init__(self) -> None:
+            self.static: Dict[str, "PathTemplateRouter._Node"] = {}
+            self.params: List[Tuple[Pattern[str], "PathTemplateRouter._Node"]] = []
+            self.template: Optional[str] = None
+
+    def __init__(self) -> None:
+        self._root = self._Node()
+        self._templates: Set[str] = set()
+
+    @staticmethod
+    def _segments(path: str) -> List[str]:
+        path = path.split('?', 1)[0].strip('/')
+        return path.split('/') if path else []
+
+    def add(self, template: str) -> None:
+        """Register a path template."""
+        node = self._root
+        for segment in self._segments(template):
+            if '{' not in segment:
+                node = node.static.setdefault(segment, self._Node())
+                continue
+
+            literals = self._PARAM.split(segment)
+            pattern = re.compile('[^/]+'.join(re.escape(literal) for literal in literals))
+            for existing, child in node.params:
+                if existing.pattern == pattern.pattern:
+                    node = child
+                    break
+            else:
+                child = self._Node()
+                node.params.append((pattern, child))
+                # Partially templated segments are more specific than bare {param}
+                node.params.sort(key=lambda entry: entry[0].pattern == '[^/]+')
+                node = child
+
+        node.template = template
+        self._templates.add(template)
+
+    def match(self, path: str) -> Optional[str]:
+        """
+        Find the template for a request path.
+
+        Args:
+            path: Concrete path (``/users/42``) or a registered template
+
+        Returns:
+            Matching path template, or None
+        """
+        if path in self._templates:
+            return path
+        return self._match(self._root, self._segments(path), 0)
+
+    def _match(self, node: "_Node", segments: List[str], index: int) -> Optional[str]:
+        if index == len(segments):
+            return node.template
+
+        segment = segments[index]
+        child = node.static.get(segment)
+        if child is not None:
+            template = self._match(child, segments, index + 1)
+            if template is not None:
+                return template
+
+        for pattern, child in node.params:
+            if pattern.fullmatch(segment):
+                template = self._match(child, segments, index + 1)
+                if template is not None:
+                    return template
+
+        return None
+
+
+@dataclass
+class CompiledResponse:
+    """Precompiled checks for one response status of an endpoint."""
+    has_content: bool
+    body_validator: Optional[Callable[[Any], ValidationResult]] = None
+    required_headers: List[str] = field(default_factory=list)
+
+
+@dataclass
+class CompiledEndpoint:
+    """Endpoint contract with validators compiled up front."""
+    contract: EndpointContract
+    responses: Dict[str, CompiledResponse] = field(default_factory=dict)
+    request_validator: Optional[Callable[[Any], ValidationResult]] = None
+    query_params: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def response_for(self, status_code: int, include_default: bool = True) -> Optional[CompiledResponse]:
+        """Find the response entry for a status (exact, then NXX, then default)."""
+        status_str = str(status_code)
+        response = self.responses.get(status_str) or self.responses.get(status_str[0] + 'XX')
+        if response is None and include_default:
+            response = self.responses.get('default')
+        return response
+
+
+class ContractIndex:
+    """
+    Precompiled contract index for fast response/request validation.
+
+    Built once per spec: a path-template router, ``$ref``s inlined, and one
+    compiled validator per (endpoint, status) and per request body.
+    """
+
+    def __init__(self, parser: OpenAPIParser, schema_validator: Optional[JSONSchemaValidator] = None):
+        self.parser = parser
+        self.schema_validator = schema_validator or JSONSchemaValidator()
+        self.router = PathTemplateRouter()
+        self._endpoints: Dict[Tuple[str, str], CompiledEndpoint] = {}
+        self._build()
+
+    def _build(self) -> None:
+        components = self.parser.parse().get('components', {})
+
+        for contract in self.parser.get_endpoints():
+            self.router.add(contract.path)
+            compiled = CompiledEndpoint(
+                contract=contract,
+                query_params={
+                    p['name']: p for p in self.parser.inline_refs(contract.parameters)
+                    if isinstance(p, dict) and p.get('in') == 'query' and 'name' in p
+                },
+            )
+
+            for status, response_spec in contract.responses.items():
+                response_spec = self.parser.inline_refs(response_spec) or {}
+                content = response_spec.get('content', {})
+                schema = content.get('application/json', {}).get('schema', {})
+                compiled.responses[str(status)] = CompiledResponse(
+                    has_content=bool(content),
+                    body_validator=self._compile(schema, components),
+                    required_headers=[
+                        name for name, spec in response_spec.get('headers', {}).items()
+                        if spec.get('required', False)
+                    ],
+                )
+
+            if contract.request_body:
+                request_body = self.parser.inline_refs(contract.request_body)
+                schema = request_body.get('content', {}).get('application/json', {}).get('schema', {})
+                compiled.request_validator = self._compile(schema, components)
+
+            self._endpoints[(contract.path, contract.method)] = compiled
+
+    def _compile(self, schema: Dict[str, Any],
+                 components: Dict[str, Any]) -> Optional[Callable[[Any], ValidationResult]]:
+        if not schema:
+            return None
+        if _contains_ref(schema) and components:
+            # Recursive refs stay as '#/components/...' and resolve against the schema root
+            schema = {**schema, 'components': components}
+        return self.schema_validator.compile(schema)
+
+    def match(self, path: str, method: str) -> Optional[CompiledEndpoint]:
+        """Find the compiled endpoint for a request path and method."""
+        template = self.router.match(path)
+        if template is None:
+            return None
+        return self._endpoints.get((template, method.upper()))
+
+
+def _contains_ref(node: Any) -> bool:
+    """Check whether a schema still contains a ``$ref``."""
+    if isinstance(node, dict):
+        return '$ref' in node or any(_contains_ref(value) for value in node.values())
+    if isinstance(node, list):
+        return any(_contains_ref(item) for item in node)
+    return False
+
 
 class ContractValidator:
     """
     Validates API responses against OpenAPI contracts.
+
+    The spec is compiled into a ContractIndex on first use, so each
+    validation is a router lookup plus a call to a prebuilt validator.
     """
     
     def __init__(self, spec_path: Union[str, Path]):
         self.parser = OpenAPIParser(spec_path)
         self.schema_validator = JSONSchemaValidator()
         self.violations: List[ContractViolation] = []
+        self._index: Optional[ContractIndex] = None
+
+    @property
+    def index(self) -> ContractIndex:
+        """Compiled contract index (built lazily)."""
+        if self._index is None:
+            self._index = ContractIndex(self.parser, self.schema_validator)
+        return self._index
+
+    def compile(self) -> ContractIndex:
+        """Build the compiled contract index now rather than on first use."""
+        return self.index
     
     def validate_response(
         self,
@@ -254,7 +539,8 @@ class ContractValidator:
         Validate an API response against the contract.
         
         Args:
-            endpoint_path: API endpoint path (e.g., "/users/{id}")
+            endpoint_path: API endpoint path, either a template ("/users/{id}")
+                or a concrete request path ("/users/42")
             method: HTTP method (GET, POST, etc.)
             status_code: HTTP status code
             response_body: Response body data
@@ -266,8 +552,8 @@ class ContractValidator:
         self.violations = []
         
         # Get endpoint contract
-        contract = self.parser.get_endpoint(endpoint_path, method)
-        if not contract:
+        endpoint = self.index.match(endpoint_path, method)
+        if not endpoint:
             self.violations.append(ContractViolation(
                 rule="endpoint_exists",
                 message=f"Endpoint {method} {endpoint_path} not found in contract",
@@ -277,37 +563,26 @@ class ContractValidator:
             return self.violations
         
         # Validate status code
-        self._validate_status_code(contract, status_code)
+        self._validate_status_code(endpoint, status_code)
         
         # Validate response body schema
         if response_body is not None:
-            self._validate_response_body(contract, status_code, response_body)
+            self._validate_response_body(endpoint, status_code, response_body)
         
         # Validate headers if provided
         if headers:
-            self._validate_headers(contract, status_code, headers)
+            self._validate_headers(endpoint, status_code, headers)
         
         return self.violations
     
-    def _validate_status_code(self, contract: EndpointContract, 
+    def _validate_status_code(self, endpoint: CompiledEndpoint,
                              status_code: int) -> None:
         """Validate that status code is defined in contract."""
-        status_str = str(status_code)
-        
-        # Check exact match
-        if status_str in contract.responses:
-            return
-        
-        # Check default
-        if 'default' in contract.responses:
-            return
-        
-        # Check wildcards (e.g., 2XX, 4XX)
-        status_prefix = status_str[0] + 'XX'
-        if status_prefix in contract.responses:
+        if endpoint.response_for(status_code) is not None:
             return
         
         # Not found - violation
+        contract = endpoint.contract
         allowed_codes = list(contract.responses.keys())
         self.violations.append(ContractViolation(
             rule="status_code",
@@ -318,24 +593,14 @@ class ContractValidator:
             actual=status_code
         ))
     
-    def _validate_response_body(self, contract: EndpointContract,
+    def _validate_response_body(self, endpoint: CompiledEndpoint,
                                status_code: int, response_body: Any) -> None:
         """Validate response body against schema."""
-        status_str = str(status_code)
-        response_spec = contract.responses.get(status_str)
-
-        if not response_spec:
-            # Try wildcard
-            status_prefix = status_str[0] + 'XX'
-            response_spec = contract.responses.get(status_prefix)
-        
-        if not response_spec:
-            response_spec = contract.responses.get('default', {})
-        
-        content = response_spec.get('content', {})
+        contract = endpoint.contract
+        response = endpoint.response_for(status_code)
         
         # Check if response should have body
-        if not content and response_body:
+        if (response is None or not response.has_content) and response_body:
             self.violations.append(ContractViolation(
                 rule="unexpected_body",
                 message=f"Response should not have a body for status {status_code}",
@@ -345,15 +610,8 @@ class ContractValidator:
             return
         
         # Validate against schema
-        json_content = content.get('application/json', {})
-        schema = json_content.get('schema', {})
-        
-        if schema:
-            # Resolve schema reference if needed
-            if '$ref' in schema:
-                schema = self.parser.resolve_schema(schema['$ref']) or schema
-            
-            result = self.schema_validator.validate(response_body, schema)
+        if response is not None and response.body_validator is not None:
+            result = response.body_validator(response_body)
             
             if not result.passed:
                 self.violations.append(ContractViolation(
@@ -365,29 +623,26 @@ class ContractValidator:
                     actual=result.actual
                 ))
     
-    def _validate_headers(self, contract: EndpointContract,
+    def _validate_headers(self, endpoint: CompiledEndpoint,
                          status_code: int, headers: Dict[str, str]) -> None:
         """Validate response headers."""
-        status_str = str(status_code)
-        response_spec = contract.responses.get(status_str, {})
+        response = endpoint.response_for(status_code, include_default=False)
+        if response is None or not response.required_headers:
+            return
 
-        if not response_spec:
-            status_prefix = status_str[0] + 'XX'
-            response_spec = contract.responses.get(status_prefix, {})
-        
-        expected_headers = response_spec.get('headers', {})
+        contract = endpoint.contract
+        present = {h.lower() for h in headers}
         
         # Check required headers
-        for header_name, header_spec in expected_headers.items():
-            if header_spec.get('required', False):
-                if header_name.lower() not in [h.lower() for h in headers.keys()]:
-                    self.violations.append(ContractViolation(
-                        rule="required_header",
-                        message=f"Required header '{header_name}' missing",
-                        path=f"{contract.method} {contract.path}",
-                        severity=ValidationSeverity.ERROR,
-                        expected=header_name
-                    ))
+        for header_name in response.required_headers:
+            if header_name.lower() not in present:
+                self.violations.append(ContractViolation(
+                    rule="required_header",
+                    message=f"Required header '{header_name}' missing",
+                    path=f"{contract.method} {contract.path}",
+                    severity=ValidationSeverity.ERROR,
+                    expected=header_name
+                ))
     
     def validate_request(
         self,
@@ -400,8 +655,8 @@ class ContractValidator:
         """Validate an API request against the contract."""
         self.violations = []
         
-        contract = self.parser.get_endpoint(endpoint_path, method)
-        if not contract:
+        endpoint = self.index.match(endpoint_path, method)
+        if not endpoint:
             self.violations.append(ContractViolation(
                 rule="endpoint_exists",
                 message=f"Endpoint {method} {endpoint_path} not found in contract",
@@ -411,46 +666,39 @@ class ContractValidator:
             return self.violations
         
         # Validate request body
-        if request_body and contract.request_body:
-            self._validate_request_body(contract, request_body)
+        if request_body and endpoint.contract.request_body:
+            self._validate_request_body(endpoint, request_body)
         
         # Validate query parameters
         if query_params:
-            self._validate_query_params(contract, query_params)
+            self._validate_query_params(endpoint, query_params)
         
         return self.violations
     
-    def _validate_request_body(self, contract: EndpointContract,
+    def _validate_request_body(self, endpoint: CompiledEndpoint,
                               request_body: Any) -> None:
         """Validate request body against schema."""
-        if not contract.request_body:
+        if endpoint.request_validator is None:
             return
 
-        content = contract.request_body.get('content', {})
-        json_content = content.get('application/json', {})
-        schema = json_content.get('schema', {})
+        result = endpoint.request_validator(request_body)
         
-        if schema:
-            if '$ref' in schema:
-                schema = self.parser.resolve_schema(schema['$ref']) or schema
-            
-            result = self.schema_validator.validate(request_body, schema)
-            
-            if not result.passed:
-                self.violations.append(ContractViolation(
-                    rule="request_body_validation",
-                    message=result.message,
-                    path=f"{contract.method} {contract.path}",
-                    severity=result.severity,
-                    expected=result.expected,
-                    actual=result.actual
-                ))
+        if not result.passed:
+            contract = endpoint.contract
+            self.violations.append(ContractViolation(
+                rule="request_body_validation",
+                message=result.message,
+                path=f"{contract.method} {contract.path}",
+                severity=result.severity,
+                expected=result.expected,
+                actual=result.actual
+            ))
     
-    def _validate_query_params(self, contract: EndpointContract,
+    def _validate_query_params(self, endpoint: CompiledEndpoint,
                               query_params: Dict[str, Any]) -> None:
         """Validate query parameters."""
-        param_specs = {p['name']: p for p in contract.parameters 
-                      if p.get('in') == 'query'}
+        contract = endpoint.contract
+        param_specs = endpoint.query_params
         
         # Check required params
         for name, spec in param_specs.items():
@@ -483,10 +731,27 @@ class ContractCoverageChecker:
     def __init__(self, spec_path: Union[str, Path]):
         self.parser = OpenAPIParser(spec_path)
         self.tested_endpoints: Set[Tuple[str, str]] = set()
+        self._router: Optional[PathTemplateRouter] = None
+
+    @property
+    def router(self) -> PathTemplateRouter:
+        """Router from request paths to the spec's path templates."""
+        if self._router is None:
+            self._router = PathTemplateRouter()
+            for endpoint in self.parser.get_endpoints():
+                self._router.add(endpoint.path)
+        return self._router
     
     def mark_tested(self, path: str, method: str) -> None:
-        """Mark an endpoint as tested."""
-        self.tested_endpoints.add((path, method.upper()))
+        """Mark an endpoint as tested (concrete paths map to their template)."""
+        template = self.router.match(path) or path
+        self.tested_endpoints.add((template, method.upper()))
+
+    def record_hits(self, hits: Dict[Tuple[str, str], int]) -> None:
+        """Mark endpoints as tested from aggregated (path, method) hit counts."""
+        for (path, method), count in hits.items():
+            if count:
+                self.mark_tested(path, method)
     
     def get_coverage(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,478 @@
+"""
+Batch contract validation of recorded API traffic.
+
+Streams a HAR file or a JSONL capture and validates every request/response
+exchange against an OpenAPI spec in a process pool, producing aggregated
+violations and endpoint coverage in a single pass.
+
+JSONL lines are objects with ``method``, ``url`` (or ``path``) and
+``status`` keys, plus optional ``response_body``, ``request_body``,
+``query`` and ``headers``.
+
+Memory stays bounded: exchanges are read lazily, at most
+``max_workers * 2`` chunks are in flight, and only a few sample
+violations are kept per (rule, endpoint).
+
+Clean Architecture: Adapter layer
+"""
+
+import base64
+import json
+import os
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlsplit
+
+from src.adapters.api_contract.contract_validator import (
+    ContractCoverageChecker,
+    ContractValidator,
+)
+
+
+@dataclass
+class TrafficExchange:
+    """A recorded request/response pair."""
+    method: str
+    path: str
+    status_code: int
+    response_body: Any = None
+    request_body: Any = None
+    query_params: Dict[str, Any] = field(default_factory=dict)
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class ViolationSummary:
+    """Aggregated occurrences of one violation rule on one endpoint."""
+    rule: str
+    endpoint: str
+    severity: str
+    count: int = 0
+    samples: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class TrafficAuditReport:
+    """Aggregated result of validating a traffic capture."""
+    total_exchanges: int = 0
+    unmatched_exchanges: int = 0
+    failed_exchanges: int = 0
+    endpoint_hits: Counter = field(default_factory=Counter)
+    unmatched_paths: Counter = field(default_factory=Counter)
+    violations: Dict[Tuple[str, str], ViolationSummary] = field(default_factory=dict)
+    coverage: Dict[str, Any] = field(default_factory=dict)
+
+    MAX_SAMPLES = 3
+    MAX_UNMATCHED_PATHS = 100
+
+    def add_violation(self, rule: str, endpoint: str, severity: str,
+                      sample: Dict[str, Any], count: int = 1) -> None:
+        """Record violation occurrences, keeping a few samples."""
+        summary = self.violations.get((rule, endpoint))
+        if summary is None:
+            summary = ViolationSummary(rule=rule, endpoint=endpoint, severity=severity)
+            self.violations[(rule, endpoint)] = summary
+        summary.count += count
+        if len(summary.samples) < self.MAX_SAMPLES:
+            summary.samples.append(sample)
+
+    def add_unmatched(self, method: str, path: str, count: int = 1) -> None:
+        """Record an exchange with no matching endpoint in the spec."""
+        self.unmatched_exchanges += count
+        key = f"{method} {path}"
+        if key in self.unmatched_paths or len(self.unmatched_paths) < self.MAX_UNMATCHED_PATHS:
+            self.unmatched_paths[key] += count
+
+    def merge(self, other: "TrafficAuditReport") -> None:
+        """Merge a partial report (e.g. from a worker) into this one."""
+        self.total_exchanges += other.total_exchanges
+        self.failed_exchanges += other.failed_exchanges
+        self.endpoint_hits.update(other.endpoint_hits)
+        for key, count in other.unmatched_paths.items():
+            method, path = key.split(" ", 1)
+            self.add_unmatched(method, path, count)
+        # Unmatched exchanges beyond the tracked paths
+        self.unmatched_exchanges += other.unmatched_exchanges - sum(other.unmatched_paths.values())
+        for summary in other.violations.values():
+            target = self.violations.get((summary.rule, summary.endpoint))
+            if target is None:
+                self.violations[(summary.rule, summary.endpoint)] = summary
+                continue
+            target.count += summary.count
+            target.samples.extend(summary.samples[:self.MAX_SAMPLES - len(target.samples)])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert report to a JSON-serializable dictionary."""
+        return {
+            'total_exchanges': self.total_exchanges,
+            'failed_exchanges': self.failed_exchanges,
+            'unmatched_exchanges': self.unmatched_exchanges,
+            'unmatched_paths': dict(self.unmatched_paths.most_common()),
+            'violations': [
+                {
+                    'rule': s.rule,
+                    'endpoint': s.endpoint,
+                    'severity': s.severity,
+                    'count': s.count,
+                    'samples': s.samples,
+                }
+                for s in sorted(self.violations.values(), key=lambda s: -s.count)
+            ],
+            'endpoint_hits': {f"{m} {p}": n for (p, m), n in self.endpoint_hits.most_common()},
+            'coverage': self.coverage,
+        }
+
+
+# ==================== Traffic readers ====================
+
+class _JSONStream:
+    """Minimal incremental JSON reader for walking large documents."""
+
+    def __init__(self, fp: IO[str], chunk_size: int = 1 << 16):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: Optional[int] = None) -> bool:
+        if self._eof:
+            return False
+        chunk = self._fp.read(size or self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume an expected structural character."""
+        actual = self.peek()
+        if actual != char:
+            raise ValueError(f"Malformed JSON: expected {char!r}, got {actual!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        size = self._chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                # Value is incomplete; read more, growing reads for huge values
+                if not self._fill(size):
+                    raise
+                size *= 2
+                continue
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self._buf) and not self._eof and self._buf[self._pos] not in '{["':
+                if self._fill():
+                    continue
+            self._pos = end
+            return value
+
+    def members(self) -> Iterator[str]:
+        """Iterate over object keys; the caller must consume each value."""
+        self.expect("{")
+        first = True
+        while self.peek() != "}":
+            if not first:
+                self.expect(",")
+            first = False
+            key = self.value()
+            self.expect(":")
+            yield key
+        self.expect("}")
+
+    def items(self) -> Iterator[Any]:
+        """Iterate over array elements."""
+        self.expect("[")
+        first = True
+        while self.peek() != "]":
+            if not first:
+                self.expect(",")
+            first = False
+            yield self.value()
+        self.expect("]")
+
+
+def _parse_body(text: Optional[str], mime_type: str = "", encoding: Optional[str] = None) -> Any:
+    """Decode a recorded body, parsing JSON when possible."""
+    if not text:
+        return None
+    if encoding == "base64":
+        try:
+            text = base64.b64decode(text).decode("utf-8")
+        except (ValueError, UnicodeDecodeError):
+            return None
+    if "json" in mime_type or not mime_type:
+        try:
+            return json.loads(text)
+        except ValueError:
+            return text
+    return text
+
+
+def _strip_base_path(path: str, base_path: str) -> str:
+    if base_path and path.startswith(base_path):
+        return path[len(base_path):] or "/"
+    return path
+
+
+def _har_exchange(entry: Dict[str, Any], base_path: str) -> TrafficExchange:
+    request = entry.get("request", {})
+    response = entry.get("response", {})
+    url = urlsplit(request.get("url", ""))
+    post_data = request.get("postData") or {}
+    content = response.get("content") or {}
+
+    return TrafficExchange(
+        method=request.get("method", "GET").upper(),
+        path=_strip_base_path(url.path or "/", base_path),
+        status_code=int(response.get("status", 0)),
+        response_body=_parse_body(content.get("text"), content.get("mimeType", ""), content.get("encoding")),
+        request_body=_parse_body(post_data.get("text"), post_data.get("mimeType", "")),
+        query_params={q["name"]: q.get("value") for q in request.get("queryString", []) if "name" in q},
+        headers={h["name"]: h.get("value", "") for h in response.get("headers", []) if "name" in h},
+    )
+
+
+def iter_har_exchanges(path: Union[str, Path], base_path: str = "") -> Iterator[TrafficExchange]:
+    """
+    Stream exchanges from a HAR file without loading the whole document.
+
+    Args:
+        path: HAR file path
+        base_path: Server base path to strip from request paths (e.g. "/api/v1")
+    """
+    with open(path, "r", encoding="utf-8") as fp:
+        stream = _JSONStream(fp)
+        for key in stream.members():
+            if key != "log":
+                stream.value()
+                continue
+            for log_key in stream.members():
+                if log_key != "entries":
+                    stream.value()
+                    continue
+                for entry in stream.items():
+                    yield _har_exchange(entry, base_path)
+
+
+def iter_jsonl_exchanges(path: Union[str, Path], base_path: str = "") -> Iterator[TrafficExchange]:
+    """
+    Stream exchanges from a JSON Lines capture.
+
+    Args:
+        path: JSONL file path
+        base_path: Server base path to strip from request paths
+    """
+    with open(path, "r", encoding="utf-8") as fp:
+        for line in fp:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            url = urlsplit(record.get("url") or record.get("path", "/"))
+            query = record.get("query")
+            if query is None:
+                query = dict(parse_qsl(url.query))
+            yield TrafficExchange(
+                method=str(record.get("method", "GET")).upper(),
+                path=_strip_base_path(url.path or "/", base_path),
+                status_code=int(record.get("status", record.get("status_code", 0))),
+                response_body=record.get("response_body"),
+                request_body=record.get("request_body"),
+                query_params=query,
+                headers=record.get("headers") or {},
+            )
+
+
+def iter_exchanges(path: Union[str, Path], base_path: str = "") -> Iterator[TrafficExchange]:
+    """Stream exchanges from a HAR (.har) or JSONL capture based on extension."""
+    if Path(path).suffix.lower() == ".har":
+        return iter_har_exchanges(path, base_path)
+    return iter_jsonl_exchanges(path, base_path)
+
+
+# ==================== Validation ====================
+
+_worker_validator: Optional[ContractValidator] = None
+_worker_validate_requests = False
+
+
+def _init_worker(spec_path: str, validate_requests: bool) -> None:
+    """Build the compiled contract once per worker process."""
+    global _worker_validator, _worker_validate_requests
+    _worker_validator = ContractValidator(spec_path)
+    _worker_validator.compile()  # before the first chunk arrives
+    _worker_validate_requests = validate_requests
+
+
+def _validate_chunk(exchanges: List[TrafficExchange]) -> TrafficAuditReport:
+    """Validate a chunk of exchanges in a worker and aggregate the results."""
+    return validate_exchanges(_worker_validator, exchanges, _worker_validate_requests)
+
+
+def validate_exchanges(
+    validator: ContractValidator,
+    exchanges: Iterable[TrafficExchange],
+    validate_requests: bool = False
+) -> TrafficAuditReport:
+    """
+    Validate exchanges in the current process.
+
+    Args:
+        validator: Contract validator for the spec
+        exchanges: Exchanges to validate
+        validate_requests: Also validate request bodies and query parameters
+
+    Returns:
+        Aggregated report (without coverage)
+    """
+    report = TrafficAuditReport()
+    index = validator.index
+
+    for exchange in exchanges:
+        report.total_exchanges += 1
+        endpoint = index.match(exchange.path, exchange.method)
+        if endpoint is None:
+            report.add_unmatched(exchange.method, exchange.path)
+            continue
+
+        template = endpoint.contract.path
+        report.endpoint_hits[(template, endpoint.contract.method)] += 1
+
+        violations = list(validator.validate_response(
+            template, exchange.method, exchange.status_code,
+            exchange.response_body, exchange.headers
+        ))
+        if validate_requests:
+            violations += validator.validate_request(
+                template, exchange.method, exchange.request_body, exchange.query_params
+            )
+
+        if violations:
+            report.failed_exchanges += 1
+        for violation in violations:
+            report.add_violation(
+                violation.rule,
+                violation.path,
+                violation.severity.value,
+                {
+                    'request': f"{exchange.method} {exchange.path}",
+                    'status': exchange.status_code,
+                    'message': violation.message,
+                },
+            )
+
+    return report
+
+
+class TrafficAuditor:
+    """
+    Validates recorded traffic against an OpenAPI contract in parallel.
+
+    Example:
+        >>> auditor = TrafficAuditor("openapi.yaml", base_path="/api/v1")
+        >>> report = auditor.audit("staging-2024-06-01.har")
+        >>> report.coverage['coverage_percentage']
+    """
+
+    def __init__(
+        self,
+        spec_path: Union[str, Path],
+        max_workers: Optional[int] = None,
+        chunk_size: int = 1000,
+        base_path: str = "",
+        validate_requests: bool = False
+    ):
+        """
+        Initialize auditor.
+
+        Args:
+            spec_path: OpenAPI specification path
+            max_workers: Worker processes (None = CPU count, 0 = validate in-process)
+            chunk_size: Exchanges sent to a worker per task
+            base_path: Server base path to strip from recorded paths
+            validate_requests: Also validate request bodies and query parameters
+        """
+        self.spec_path = str(spec_path)
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.base_path = base_path
+        self.validate_requests = validate_requests
+
+    def audit(self, traffic_path: Union[str, Path]) -> TrafficAuditReport:
+        """Validate a HAR or JSONL capture file."""
+        return self.audit_exchanges(iter_exchanges(traffic_path, self.base_path))
+
+    def audit_exchanges(self, exchanges: Iterable[TrafficExchange]) -> TrafficAuditReport:
+        """
+        Validate a stream of exchanges.
+
+        Args:
+            exchanges: Exchanges to validate (consumed lazily)
+
+        Returns:
+            Aggregated violations with endpoint coverage
+        """
+        report = TrafficAuditReport()
+
+        if self.max_workers == 0:
+            validator = ContractValidator(self.spec_path)
+            report.merge(validate_exchanges(validator, exchanges, self.validate_requests))
+        else:
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(self.spec_path, self.validate_requests),
+            ) as executor:
+                window = 2 * (self.max_workers or os.cpu_count() or 1)
+                pending: Deque[Future] = deque()
+                for chunk in self._chunks(exchanges):
+                    pending.append(executor.submit(_validate_chunk, chunk))
+                    if len(pending) >= window:
+                        report.merge(pending.popleft().result())
+                while pending:
+                    report.merge(pending.popleft().result())
+
+        checker = ContractCoverageChecker(self.spec_path)
+        checker.record_hits(report.endpoint_hits)
+        report.coverage = checker.get_coverage()
+        return report
+
+    def _chunks(self, exchanges: Iterable[TrafficExchange]) -> Iterator[List[TrafficExchange]]:
+        chunk: List[TrafficExchange] = []
+        for exchange in exchanges:
+            chunk.append(exchange)
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def audit_traffic(
+    spec_path: Union[str, Path],
+    traffic_path: Union[str, Path],
+    **kwargs: Any
+) -> TrafficAuditReport:
+    """Convenience function to validate a traffic capture against a contract."""
+    return TrafficAuditor(spec_path, **kwargs).audit(traffic_path)
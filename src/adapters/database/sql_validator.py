@@ -1,7 +1,8 @@
 """SQL query validation module"""
 
 import re
-from typing import Any, Dict, List
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 
@@ -58,6 +59,156 @@ class SQLValidationResult:
         return len(self.warnings) > 0
 
 
+class SQLToken(NamedTuple):
+    """
+    Lexical token of a SQL query.
+
+    Attributes:
+        kind: Token kind (word, string, ident, number, param, op, comment,
+            or open_string/open_ident/open_comment for unterminated ones)
+        text: Token text as written
+        upper: Uppercased text for words, otherwise the text
+        line: Line where the token starts
+    """
+
+    kind: str
+    text: str
+    upper: str
+    line: int
+
+
+_TOKEN_RE = re.compile(
+    r"""
+    \s*(?:
+      (?P<comment>--[^\n]*|/\*.*?\*/)
+    | (?P<open_comment>/\*.*)
+    | (?P<string>'(?:[^'\\]|\\.|'')*')
+    | (?P<open_string>'.*)
+    | (?P<ident>"(?:[^"\\]|\\.|"")*"|`[^`]*`)
+    | (?P<open_ident>".*)
+    | (?P<number>\d+(?:\.\d+)?)
+    | (?P<cast>::)
+    | (?P<param>\$\w+|%s|\?\?|\?|:\w+)
+    | (?P<word>[^\W\d]\w*)
+    | (?P<op><>|!=|<=|>=|\|\||.)
+    )
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+# Token kinds that may span lines
+_MULTILINE_KINDS = frozenset({"comment", "open_comment", "string", "open_string", "ident", "open_ident"})
+
+
+def tokenize_sql(query: str) -> List[SQLToken]:
+    """
+    Split a SQL query into tokens in a single pass.
+
+    String literals, quoted identifiers and comments are recognized across
+    lines, so their contents never trigger keyword or quote checks.
+
+    Args:
+        query: SQL query
+
+    Returns:
+        Tokens in order, without whitespace
+    """
+    tokens: List[SQLToken] = []
+    append = tokens.append
+    new_token = tuple.__new__
+    line = 1
+    position = 0
+    for match in _TOKEN_RE.finditer(query):
+        kind = match.lastgroup
+        if kind is None:
+            break  # trailing whitespace
+        start = match.start(kind)
+        line += query.count("\n", position, start)
+        position = start
+        text = match.group(kind)
+        if kind == "word":
+            append(new_token(SQLToken, (kind, text, text.upper(), line)))
+        else:
+            append(new_token(SQLToken, ("op" if kind == "cast" else kind, text, text, line)))
+    return tokens
+
+
+class WordPrefix(str):
+    """Rule pattern element matching words that start with a prefix."""
+
+
+# Rule pattern elements: a literal (matched against token.upper), a tuple of
+# alternative literals, a WordPrefix, or a frozenset of token kinds
+_PatternElement = Union[str, Tuple[str, ...], FrozenSet[str]]
+
+_STRING = frozenset({"string", "ident"})
+_VALUE = frozenset({"word", "number"})
+
+
+@dataclass(frozen=True)
+class SQLRule:
+    """
+    Token-sequence rule.
+
+    Attributes:
+        category: "performance" or "security"
+        bucket: Result list the issue goes to (issues, warnings, suggestions)
+        pattern: Consecutive token pattern
+        message: Issue message
+        suggestion: Suggested fix
+        anchor: Index of the pattern token whose line is reported
+        predicate: Extra check on the matched tokens
+        once: Report only the first match per query
+        key: Index of the pattern element the rule is looked up by; the most
+            selective element, so the rule is only tried where it can match
+    """
+
+    category: str
+    bucket: str
+    pattern: Tuple[_PatternElement, ...]
+    message: str
+    suggestion: str
+    anchor: int = 0
+    predicate: Optional[Callable[[List[SQLToken]], bool]] = None
+    once: bool = False
+    key: int = 0
+
+    def matches(self, tokens: List[SQLToken], start: int) -> bool:
+        """Check whether the rule matches the tokens beginning at start."""
+        end = start + len(self.pattern)
+        if start < 0 or end > len(tokens):
+            return False
+        for offset, element in enumerate(self.pattern):
+            token = tokens[start + offset]
+            if isinstance(element, WordPrefix):
+                if token.kind != "word" or not token.upper.startswith(element):
+                    return False
+            elif isinstance(element, str):
+                if token.upper != element:
+                    return False
+            elif isinstance(element, frozenset):
+                if token.kind not in element:
+                    return False
+            elif token.upper not in element:
+                return False
+        return self.predicate is None or self.predicate(tokens[start:end])
+
+
+@dataclass
+class _Analysis:
+    """Issues found for one query, per check."""
+
+    syntax: SQLValidationResult
+    performance: SQLValidationResult
+    security: SQLValidationResult
+
+
+def _copy_result(result: SQLValidationResult) -> SQLValidationResult:
+    return SQLValidationResult(
+        result.is_valid, list(result.issues), list(result.warnings), list(result.suggestions)
+    )
+
+
 class SQLValidator:
     """
     Validator for SQL queries.
@@ -65,6 +216,11 @@ class SQLValidator:
     This class provides comprehensive SQL validation including syntax checking,
     performance analysis, and security vulnerability detection.
 
+    Each query is tokenized once (see tokenize_sql) and every check runs
+    over that token stream using rule tables indexed by their first token.
+    Results are kept in an LRU cache keyed by the query text and by its
+    token fingerprint (keyword case and indentation normalized).
+
     Example:
         validator = SQLValidator()
 
@@ -90,28 +246,137 @@ class SQLValidator:
         "UPDATE",
     ]
 
+    STATEMENT_KEYWORDS = frozenset(
+        {"SELECT", "INSERT", "UPDATE", "DELETE", "CREATE", "ALTER", "DROP", "WITH"}
+    )
+
     # Performance anti-patterns
-    PERFORMANCE_PATTERNS = [
-        (r"SELECT\s+\*", "SELECT * can impact performance, specify columns explicitly"),
-        (r'LIKE\s+[\'"]%', "Leading wildcard in LIKE prevents index usage"),
-        (r"OR\s+\w+\s*=\s*\w+", "OR conditions can prevent index usage, consider UNION"),
-        (r"NOT\s+IN\s*\(", "NOT IN with subqueries can be slow, use NOT EXISTS"),
-        (r"HAVING\s+\w+\s*=", "HAVING with equality filter, use WHERE instead"),
+    PERFORMANCE_RULES = [
+        SQLRule(
+            "performance", "suggestions", ("SELECT", "*"),
+            "SELECT * can impact performance, specify columns explicitly",
+            "Specify only needed columns: SELECT col1, col2 FROM...",
+        ),
+        SQLRule(
+            "performance", "suggestions", ("LIKE", _STRING),
+            "Leading wildcard in LIKE prevents index usage",
+            "Remove leading wildcard or use full-text search",
+            predicate=lambda t: t[1].text[1:2] == "%",
+        ),
+        SQLRule(
+            "performance", "suggestions", ("OR", _VALUE, "=", _VALUE),
+            "OR conditions can prevent index usage, consider UNION",
+            "Use IN clause or UNION instead of multiple OR conditions",
+        ),
+        SQLRule(
+            "performance", "suggestions", ("NOT", "IN", "("),
+            "NOT IN with subqueries can be slow, use NOT EXISTS",
+            "Use NOT EXISTS or LEFT JOIN with IS NULL",
+        ),
+        SQLRule(
+            "performance", "suggestions", ("HAVING", _VALUE, "="),
+            "HAVING with equality filter, use WHERE instead",
+            "Move filter to WHERE clause when possible",
+        ),
+        SQLRule(
+            "performance", "warnings", ("SELECT", "DISTINCT"),
+            "DISTINCT can be expensive, consider if it's necessary",
+            "Review if DISTINCT is needed or if query can be rewritten",
+            anchor=1, once=True,
+        ),
+        SQLRule(
+            "performance", "warnings", ("WHERE", _VALUE, "=", _STRING),
+            "Implicit type conversion in WHERE clause",
+            "Match column and value types to avoid implicit conversion",
+            predicate=lambda t: t[3].text[1:-1].isdigit(), once=True,
+        ),
     ]
 
     # Security patterns
-    SECURITY_PATTERNS = [
-        (r"\$\w+|%s|\?\?", "Potential SQL injection - use parameterized queries"),
-        (r'EXEC\s*\(\s*["\']', "Dynamic SQL execution, verify input sanitization"),
-        (r"xp_", "Extended stored procedures, potential security risk"),
-        (r"--.*|\/\*.*\*\/", "Comments in SQL, potential SQL injection vector"),
+    SECURITY_RULES = [
+        SQLRule(
+            "security", "issues", (_STRING, "+", _VALUE),
+            "String concatenation detected - SQL injection risk!",
+            "Use parameterized queries or prepared statements",
+            anchor=1, once=True, key=1,
+        ),
+        SQLRule(
+            "security", "issues", (_VALUE, "+", _STRING),
+            "String concatenation detected - SQL injection risk!",
+            "Use parameterized queries or prepared statements",
+            anchor=1, once=True, key=1,
+        ),
+        SQLRule(
+            "security", "issues", (frozenset({"param"}),),
+            "Potential SQL injection - use parameterized queries",
+            "Use parameterized queries with bound variables",
+            predicate=lambda t: t[0].text[0] == "$" or t[0].text in ("%s", "??"),
+        ),
+        SQLRule(
+            "security", "issues", ("EXEC", "(", _STRING),
+            "Dynamic SQL execution, verify input sanitization",
+            "Use parameterized queries with bound variables",
+        ),
+        SQLRule(
+            "security", "issues", (WordPrefix("XP_"),),
+            "Extended stored procedures, potential security risk",
+            "Use parameterized queries with bound variables",
+        ),
+        SQLRule(
+            "security", "issues", (frozenset({"comment", "open_comment"}),),
+            "Comments in SQL, potential SQL injection vector",
+            "Use parameterized queries with bound variables",
+        ),
+        SQLRule(
+            "security", "issues", (("PASSWORD", "PWD", "PASSWD"), "=", _STRING),
+            "Hardcoded password detected in query!",
+            "Never hardcode passwords. Use secure credential storage",
+            predicate=lambda t: len(t[2].text) > 2, once=True,
+        ),
+    ] + [
+        SQLRule(
+            "security", "warnings", (keyword,),
+            f"Dangerous keyword '{keyword}' found",
+            f"Ensure {keyword} operation is properly authorized and logged",
+            once=True,
+        )
+        for keyword in DANGEROUS_KEYWORDS
     ]
 
-    def __init__(self) -> None:
-        """Initialize SQL validator."""
-        self._issues: List[SQLIssue] = []
-        self._warnings: List[SQLIssue] = []
-        self._suggestions: List[SQLIssue] = []
+    def __init__(self, cache_size: int = 4096) -> None:
+        """
+        Initialize SQL validator.
+
+        Args:
+            cache_size: Maximum cached query results (0 disables caching)
+        """
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, _Analysis]" = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._rules_by_literal, self._rules_by_kind, self._rules_by_prefix = self._compile_rules(
+            self.PERFORMANCE_RULES + self.SECURITY_RULES
+        )
+
+    @staticmethod
+    def _compile_rules(
+        rules: List[SQLRule],
+    ) -> Tuple[Dict[str, List[SQLRule]], Dict[str, List[SQLRule]], Dict[str, List[SQLRule]]]:
+        """Index rules by the literal, token kind or word prefix of their key element."""
+        by_literal: Dict[str, List[SQLRule]] = {}
+        by_kind: Dict[str, List[SQLRule]] = {}
+        by_prefix: Dict[str, List[SQLRule]] = {}
+        for rule in rules:
+            element = rule.pattern[rule.key]
+            if isinstance(element, WordPrefix):
+                by_prefix.setdefault(str(element), []).append(rule)
+            elif isinstance(element, frozenset):
+                for kind in element:
+                    by_kind.setdefault(kind, []).append(rule)
+            else:
+                for literal in (element,) if isinstance(element, str) else element:
+                    by_literal.setdefault(literal, []).append(rule)
+        return by_literal, by_kind, by_prefix
 
     def validate_syntax(self, query: str) -> SQLValidationResult:
         """
@@ -123,79 +388,7 @@ class SQLValidator:
         Returns:
             SQLValidationResult with validation details
         """
-        self._reset()
-
-        if not query or not query.strip():
-            self._issues.append(
-                SQLIssue(
-                    severity=ValidationSeverity.ERROR,
-                    message="Query is empty",
-                    line_number=0,
-                    suggestion="Provide a valid SQL query",
-                )
-            )
-            return SQLValidationResult(False, self._issues, self._warnings, self._suggestions)
-
-        # Basic syntax checks
-        lines = query.split("\n")
-
-        # Check for unclosed quotes
-        for i, line in enumerate(lines, 1):
-            single_quotes = line.count("'") - line.count("\\'")
-            double_quotes = line.count('"') - line.count('\\"')
-
-            if single_quotes % 2 != 0:
-                self._issues.append(
-                    SQLIssue(
-                        severity=ValidationSeverity.ERROR,
-                        message=f"Unclosed single quote on line {i}",
-                        line_number=i,
-                        suggestion="Close the string literal with a single quote",
-                    )
-                )
-
-            if double_quotes % 2 != 0:
-                self._warnings.append(
-                    SQLIssue(
-                        severity=ValidationSeverity.WARNING,
-                        message=f"Unclosed double quote on line {i}",
-                        line_number=i,
-                        suggestion="Close the identifier with a double quote or use single quotes for strings",
-                    )
-                )
-
-        # Check for unclosed parentheses
-        open_parens = query.count("(")
-        close_parens = query.count(")")
-        if open_parens != close_parens:
-            self._issues.append(
-                SQLIssue(
-                    severity=ValidationSeverity.ERROR,
-                    message=f"Unbalanced parentheses: {open_parens} open, {close_parens} close",
-                    line_number=0,
-                    suggestion="Ensure all opening parentheses have matching closing parentheses",
-                )
-            )
-
-        # Check basic query structure
-        query_upper = query.upper().strip()
-
-        if not any(
-            query_upper.startswith(kw)
-            for kw in ["SELECT", "INSERT", "UPDATE", "DELETE", "CREATE", "ALTER", "DROP", "WITH"]
-        ):
-            self._warnings.append(
-                SQLIssue(
-                    severity=ValidationSeverity.WARNING,
-                    message="Query doesn't start with a standard SQL keyword",
-                    line_number=1,
-                    suggestion="Ensure query starts with SELECT, INSERT, UPDATE, DELETE, etc.",
-                )
-            )
-
-        is_valid = not any(i.severity == ValidationSeverity.ERROR for i in self._issues)
-
-        return SQLValidationResult(is_valid, self._issues, self._warnings, self._suggestions)
+        return _copy_result(self._analyze(query).syntax)
 
     def check_performance_issues(self, query: str) -> SQLValidationResult:
         """
@@ -207,61 +400,7 @@ class SQLValidator:
         Returns:
             SQLValidationResult with performance issues found
         """
-        self._reset()
-
-        query_upper = query.upper()
-
-        # Check performance patterns
-        for pattern, message in self.PERFORMANCE_PATTERNS:
-            matches = re.finditer(pattern, query_upper, re.IGNORECASE)
-            for match in matches:
-                line_num = self._get_line_number(query, match.start())
-                self._suggestions.append(
-                    SQLIssue(
-                        severity=ValidationSeverity.WARNING,
-                        message=message,
-                        line_number=line_num,
-                        suggestion=self._get_performance_suggestion(pattern),
-                    )
-                )
-
-        # Check for missing WHERE clause in UPDATE/DELETE
-        if re.search(r"^\s*(UPDATE|DELETE)", query_upper):
-            if "WHERE" not in query_upper:
-                self._issues.append(
-                    SQLIssue(
-                        severity=ValidationSeverity.ERROR,
-                        message="UPDATE or DELETE without WHERE clause - will affect all rows!",
-                        line_number=1,
-                        suggestion="Add a WHERE clause to limit affected rows",
-                    )
-                )
-
-        # Check for DISTINCT overuse
-        if re.search(r"SELECT\s+DISTINCT", query_upper):
-            self._warnings.append(
-                SQLIssue(
-                    severity=ValidationSeverity.WARNING,
-                    message="DISTINCT can be expensive, consider if it's necessary",
-                    line_number=self._get_line_number(query_upper, query_upper.find("DISTINCT")),
-                    suggestion="Review if DISTINCT is needed or if query can be rewritten",
-                )
-            )
-
-        # Check for implicit conversions
-        if re.search(r'WHERE\s+\w+\s*=\s*["\']\d+["\']', query, re.IGNORECASE):
-            self._warnings.append(
-                SQLIssue(
-                    severity=ValidationSeverity.WARNING,
-                    message="Implicit type conversion in WHERE clause",
-                    line_number=1,
-                    suggestion="Match column and value types to avoid implicit conversion",
-                )
-            )
-
-        is_valid = not any(i.severity == ValidationSeverity.ERROR for i in self._issues)
-
-        return SQLValidationResult(is_valid, self._issues, self._warnings, self._suggestions)
+        return _copy_result(self._analyze(query).performance)
 
     def check_security_issues(self, query: str) -> SQLValidationResult:
         """
@@ -273,61 +412,7 @@ class SQLValidator:
         Returns:
             SQLValidationResult with security issues found
         """
-        self._reset()
-
-        query_upper = query.upper()
-
-        # Check for string concatenation (potential injection)
-        if re.search(r'["\']\s*\+\s*\w+', query) or re.search(r'\w+\s*\+\s*["\']', query):
-            self._issues.append(
-                SQLIssue(
-                    severity=ValidationSeverity.ERROR,
-                    message="String concatenation detected - SQL injection risk!",
-                    line_number=self._get_line_number(query, query.find("+")),
-                    suggestion="Use parameterized queries or prepared statements",
-                )
-            )
-
-        # Check for dangerous keywords without proper context
-        for keyword in self.DANGEROUS_KEYWORDS:
-            if keyword in query_upper:
-                self._warnings.append(
-                    SQLIssue(
-                        severity=ValidationSeverity.WARNING,
-                        message=f"Dangerous keyword '{keyword}' found",
-                        line_number=self._get_line_number(query_upper, query_upper.find(keyword)),
-                        suggestion=f"Ensure {keyword} operation is properly authorized and logged",
-                    )
-                )
-
-        # Check security patterns
-        for pattern, message in self.SECURITY_PATTERNS:
-            matches = re.finditer(pattern, query, re.IGNORECASE)
-            for match in matches:
-                line_num = self._get_line_number(query, match.start())
-                self._issues.append(
-                    SQLIssue(
-                        severity=ValidationSeverity.ERROR,
-                        message=message,
-                        line_number=line_num,
-                        suggestion="Use parameterized queries with bound variables",
-                    )
-                )
-
-        # Check for password in query (shouldn't happen!)
-        if re.search(r'(password|pwd|passwd)\s*=\s*["\'][^"\']+["\']', query, re.IGNORECASE):
-            self._issues.append(
-                SQLIssue(
-                    severity=ValidationSeverity.ERROR,
-                    message="Hardcoded password detected in query!",
-                    line_number=1,
-                    suggestion="Never hardcode passwords. Use secure credential storage",
-                )
-            )
-
-        is_valid = not any(i.severity == ValidationSeverity.ERROR for i in self._issues)
-
-        return SQLValidationResult(is_valid, self._issues, self._warnings, self._suggestions)
+        return _copy_result(self._analyze(query).security)
 
     def analyze_query_plan(self, query: str) -> Dict[str, Any]:
         """
@@ -421,41 +506,242 @@ class SQLValidator:
         Returns:
             SQLValidationResult with all validation issues
         """
-        # Run all validations
-        syntax_result = self.validate_syntax(query)
-        performance_result = self.check_performance_issues(query)
-        security_result = self.check_security_issues(query)
-
-        # Combine all issues
-        all_issues = syntax_result.issues + performance_result.issues + security_result.issues
-        all_warnings = (
-            syntax_result.warnings + performance_result.warnings + security_result.warnings
-        )
-        all_suggestions = (
-            syntax_result.suggestions + performance_result.suggestions + security_result.suggestions
-        )
+        analysis = self._analyze(query)
+        results = (analysis.syntax, analysis.performance, analysis.security)
+
+        all_issues = [issue for result in results for issue in result.issues]
+        all_warnings = [issue for result in results for issue in result.warnings]
+        all_suggestions = [issue for result in results for issue in result.suggestions]
 
         is_valid = not any(i.severity == ValidationSeverity.ERROR for i in all_issues)
 
         return SQLValidationResult(is_valid, all_issues, all_warnings, all_suggestions)
 
-    def _reset(self) -> None:
-        """Reset all issue lists."""
-        self._issues = []
-        self._warnings = []
-        self._suggestions = []
-
-    def _get_line_number(self, text: str, position: int) -> int:
-        """Get line number for a character position."""
-        return text[:position].count("\n") + 1
-
-    def _get_performance_suggestion(self, pattern: str) -> str:
-        """Get suggestion for performance issue."""
-        suggestions = {
-            r"SELECT\s+\*": "Specify only needed columns: SELECT col1, col2 FROM...",
-            r'LIKE\s+[\'"]%': "Remove leading wildcard or use full-text search",
-            r"OR\s+\w+\s*=\s*\w+": "Use IN clause or UNION instead of multiple OR conditions",
-            r"NOT\s+IN\s*\(": "Use NOT EXISTS or LEFT JOIN with IS NULL",
-            r"HAVING\s+\w+\s*=": "Move filter to WHERE clause when possible",
+    def cache_info(self) -> Dict[str, int]:
+        """Get result cache statistics."""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._cache),
+            "max_size": self.cache_size,
         }
-        return suggestions.get(pattern, "Review query for optimization opportunities")
+
+    def clear_cache(self) -> None:
+        """Drop all cached results."""
+        self._cache.clear()
+
+    @staticmethod
+    def fingerprint(tokens: List[SQLToken]) -> str:
+        """
+        Normalized query fingerprint.
+
+        Keyword case and whitespace within a line are normalized; literals
+        and line breaks are kept because rule results depend on them.
+        """
+        parts: List[str] = []
+        line = 1
+        for token in tokens:
+            if token.line != line:
+                parts.append("\n" * (token.line - line))
+                line = token.line
+            parts.append(token.upper)
+            if token.kind in _MULTILINE_KINDS:
+                line += token.text.count("\n")
+        return "\x1f".join(parts)
+
+    def _analyze(self, query: str) -> _Analysis:
+        """Run all checks over one token stream, using the result cache."""
+        if self.cache_size:
+            cached = self._cache.get(query)
+            if cached is not None:
+                self._cache_hits += 1
+                self._cache.move_to_end(query)
+                return cached
+
+        tokens = tokenize_sql(query) if query else []
+        key = self.fingerprint(tokens) if self.cache_size else ""
+
+        analysis = self._cache.get(key) if self.cache_size else None
+        if analysis is None:
+            self._cache_misses += 1
+            analysis = _Analysis(
+                syntax=self._check_syntax(query, tokens),
+                performance=self._new_result(),
+                security=self._new_result(),
+            )
+            self._apply_rules(tokens, analysis)
+            self._finalize(analysis.performance)
+            self._finalize(analysis.security)
+        else:
+            self._cache_hits += 1
+
+        if self.cache_size:
+            self._cache[key] = analysis
+            self._cache.move_to_end(key)
+            self._cache[query] = analysis
+            self._cache.move_to_end(query)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return analysis
+
+    @staticmethod
+    def _new_result() -> SQLValidationResult:
+        return SQLValidationResult(True, [], [], [])
+
+    @staticmethod
+    def _finalize(result: SQLValidationResult) -> None:
+        result.is_valid = not any(i.severity == ValidationSeverity.ERROR for i in result.issues)
+
+    def _check_syntax(self, query: str, tokens: List[SQLToken]) -> SQLValidationResult:
+        """Syntax checks over the token stream."""
+        result = self._new_result()
+
+        if not query or not query.strip():
+            result.issues.append(
+                SQLIssue(
+                    severity=ValidationSeverity.ERROR,
+                    message="Query is empty",
+                    line_number=0,
+                    suggestion="Provide a valid SQL query",
+                )
+            )
+            self._finalize(result)
+            return result
+
+        open_parens = close_parens = 0
+        first_keyword: Optional[str] = None
+
+        for token in tokens:
+            kind = token.kind
+            if kind == "op":
+                if token.text == "(":
+                    open_parens += 1
+                elif token.text == ")":
+                    close_parens += 1
+            elif kind == "open_string":
+                result.issues.append(
+                    SQLIssue(
+                        severity=ValidationSeverity.ERROR,
+                        message=f"Unclosed single quote on line {token.line}",
+                        line_number=token.line,
+                        suggestion="Close the string literal with a single quote",
+                    )
+                )
+            elif kind == "open_ident":
+                result.warnings.append(
+                    SQLIssue(
+                        severity=ValidationSeverity.WARNING,
+                        message=f"Unclosed double quote on line {token.line}",
+                        line_number=token.line,
+                        suggestion="Close the identifier with a double quote or use single quotes for strings",
+                    )
+                )
+            elif kind == "open_comment":
+                result.warnings.append(
+                    SQLIssue(
+                        severity=ValidationSeverity.WARNING,
+                        message=f"Unclosed block comment on line {token.line}",
+                        line_number=token.line,
+                        suggestion="Close the comment with */",
+                    )
+                )
+
+            if first_keyword is None and kind not in ("comment", "open_comment"):
+                first_keyword = token.upper
+
+        # Check for unclosed parentheses
+        if open_parens != close_parens:
+            result.issues.append(
+                SQLIssue(
+                    severity=ValidationSeverity.ERROR,
+                    message=f"Unbalanced parentheses: {open_parens} open, {close_parens} close",
+                    line_number=0,
+                    suggestion="Ensure all opening parentheses have matching closing parentheses",
+                )
+            )
+
+        # Check basic query structure
+        if first_keyword not in self.STATEMENT_KEYWORDS:
+            result.warnings.append(
+                SQLIssue(
+                    severity=ValidationSeverity.WARNING,
+                    message="Query doesn't start with a standard SQL keyword",
+                    line_number=1,
+                    suggestion="Ensure query starts with SELECT, INSERT, UPDATE, DELETE, etc.",
+                )
+            )
+
+        self._finalize(result)
+        return result
+
+    def _apply_rules(self, tokens: List[SQLToken], analysis: _Analysis) -> None:
+        """Run performance and security rules over the token stream."""
+        # Comments are matched on their own and never break up a sequence
+        code: List[SQLToken] = []
+        comments: List[SQLToken] = []
+        for token in tokens:
+            (comments if token.kind in ("comment", "open_comment") else code).append(token)
+        reported: Set[str] = set()
+
+        by_literal = self._rules_by_literal
+        by_kind = self._rules_by_kind
+        prefixes = tuple(self._rules_by_prefix)
+        for index, token in enumerate(code):
+            rules = by_literal.get(token.upper)
+            if rules:
+                for rule in rules:
+                    self._report(rule, code, index - rule.key, analysis, reported)
+            rules = by_kind.get(token.kind)
+            if rules:
+                for rule in rules:
+                    self._report(rule, code, index - rule.key, analysis, reported)
+            if prefixes and token.kind == "word" and token.upper.startswith(prefixes):
+                for prefix, rules in self._rules_by_prefix.items():
+                    if token.upper.startswith(prefix):
+                        for rule in rules:
+                            self._report(rule, code, index - rule.key, analysis, reported)
+
+        for index, token in enumerate(comments):
+            for rule in by_kind.get(token.kind, ()):
+                self._report(rule, comments, index, analysis, reported)
+
+        statement = code[0].upper if code else None
+        has_where = any(token.upper == "WHERE" for token in code)
+
+        # Check for missing WHERE clause in UPDATE/DELETE
+        if statement in ("UPDATE", "DELETE") and not has_where:
+            analysis.performance.issues.append(
+                SQLIssue(
+                    severity=ValidationSeverity.ERROR,
+                    message="UPDATE or DELETE without WHERE clause - will affect all rows!",
+                    line_number=1,
+                    suggestion="Add a WHERE clause to limit affected rows",
+                )
+            )
+
+    def _report(
+        self,
+        rule: SQLRule,
+        tokens: List[SQLToken],
+        index: int,
+        analysis: _Analysis,
+        reported: Set[str],
+    ) -> None:
+        """Record an issue if the rule matches starting at index."""
+        if rule.once and rule.message in reported:
+            return
+        if not rule.matches(tokens, index):
+            return
+        reported.add(rule.message)
+
+        result = analysis.performance if rule.category == "performance" else analysis.security
+        severity = ValidationSeverity.ERROR if rule.bucket == "issues" else ValidationSeverity.WARNING
+        getattr(result, rule.bucket).append(
+            SQLIssue(
+                severity=severity,
+                message=rule.message,
+                line_number=tokens[index + rule.anchor].line,
+                suggestion=rule.suggestion,
+            )
+        )
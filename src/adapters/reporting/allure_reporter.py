@@ -8,9 +8,13 @@ import json
 import os
 import shutil
 import subprocess
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, Iterator, List, Optional
+from xml.sax.saxutils import XMLGenerator
 
 import allure
 from allure_commons.types import AttachmentType
@@ -71,6 +75,7 @@ class AllureReporter(IReporter):
 
     Attributes:
         results_dir: Directory for Allure result files
+        parse_workers: Threads used to parse result files when generating reports
         screenshots_on_failure: Whether to auto-capture screenshots on failure
         current_test: Name of the currently executing test
     """
@@ -80,6 +85,7 @@ class AllureReporter(IReporter):
         results_dir: str = "allure-results",
         screenshots_on_failure: bool = True,
         clean_results: bool = True,
+        parse_workers: int = 4,
     ):
         """
         Initialize Allure reporter.
@@ -88,9 +94,11 @@ class AllureReporter(IReporter):
             results_dir: Directory to store Allure result files
             screenshots_on_failure: Enable automatic screenshot capture on failure
             clean_results: Clean results directory on initialization
+            parse_workers: Threads used to parse result files during report generation
         """
         self.results_dir = Path(results_dir)
         self.screenshots_on_failure = screenshots_on_failure
+        self.parse_workers = max(1, parse_workers)
         self.current_test: Optional[str] = None
         self._steps: List[Dict[str, Any]] = []
         self._tags: List[str] = []
@@ -393,10 +401,65 @@ class AllureReporter(IReporter):
             # Fallback: create a basic HTML report manually
             return self._generate_fallback_html(output_path)
 
+    def _iter_result_files(self) -> Iterator[str]:
+        """
+        Lazily iterate over Allure result files.
+
+        Plain ``os.scandir`` paths are used rather than ``Path.glob``, which
+        lists the whole directory up front and interns every file name.
+
+        Returns:
+            Iterator of result file paths
+        """
+        with os.scandir(self.results_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith("-result.json") and entry.is_file():
+                    yield entry.path
+
+    @staticmethod
+    def _load_result(result_file: str) -> Dict[str, Any]:
+        """
+        Parse a single Allure result file.
+
+        Args:
+            result_file: Path to the result file
+
+        Returns:
+            Parsed result dictionary
+        """
+        with open(result_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _iter_results(self) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily parse result files on a bounded thread pool.
+
+        At most ``parse_workers * 2`` files are read ahead, so memory stays
+        flat no matter how many results the directory holds. Results are
+        yielded in directory order.
+
+        Returns:
+            Iterator of parsed result dictionaries
+        """
+        files = self._iter_result_files()
+        window = max(1, self.parse_workers * 2)
+
+        with ThreadPoolExecutor(max_workers=self.parse_workers) as executor:
+            pending: Deque[Future] = deque()
+            for result_file in files:
+                pending.append(executor.submit(self._load_result, result_file))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
     def _generate_json_report(self, output_path: Path) -> str:
         """
         Generate JSON report from Allure results.
 
+        Results are encoded and written one at a time instead of building
+        the whole report in memory; the output matches ``json.dump(indent=2)``.
+
         Args:
             output_path: Directory to save the report
 
@@ -404,22 +467,18 @@ class AllureReporter(IReporter):
             Path to generated JSON report
         """
         report_file = output_path / "report.json"
-
-        # Collect all result files
-        results = []
-        for result_file in self.results_dir.glob("*-result.json"):
-            with open(result_file, "r", encoding="utf-8") as f:
-                results.append(json.load(f))
-
-        # Write combined JSON report
-        report_data = {
-            "report_name": "QA Framework Test Report",
-            "results": results,
-            "total_tests": len(results),
-        }
+        encoder = json.JSONEncoder(indent=2, default=str)
+        total = 0
 
         with open(report_file, "w", encoding="utf-8") as f:
-            json.dump(report_data, f, indent=2, default=str)
+            f.write('{\n  "report_name": "QA Framework Test Report",\n  "results": [')
+            for result in self._iter_results():
+                f.write(",\n    " if total else "\n    ")
+                # Raw newlines cannot appear inside JSON strings, so re-indenting is safe
+                f.write(encoder.encode(result).replace("\n", "\n    "))
+                total += 1
+            f.write("\n  ]" if total else "]")
+            f.write(f',\n  "total_tests": {total}\n}}')
 
         return str(report_file.absolute())
 
@@ -427,6 +486,10 @@ class AllureReporter(IReporter):
         """
         Generate JUnit-style XML report.
 
+        Test cases are written with an incremental XML writer to a spool
+        file while the totals are counted, then copied behind the
+        ``<testsuite>`` header once the counts are known.
+
         Args:
             output_path: Directory to save the report
 
@@ -434,69 +497,46 @@ class AllureReporter(IReporter):
             Path to generated XML report
         """
         report_file = output_path / "report.xml"
-
-        # Collect results and convert to JUnit XML format
-        import xml.etree.ElementTree as ET
-
-        testsuites = ET.Element("testsuites")
-
-        # Group by feature (simple approach)
-        testsuite = ET.SubElement(
-            testsuites,
-            "testsuite",
-            {
-                "name": "QA Framework Tests",
-                "tests": "0",
-                "failures": "0",
-                "errors": "0",
-                "skipped": "0",
-            },
-        )
-
-        test_count = 0
-        failure_count = 0
-        error_count = 0
-        skipped_count = 0
-
-        for result_file in self.results_dir.glob("*-result.json"):
-            with open(result_file, "r", encoding="utf-8") as f:
-                result = json.load(f)
-
-            testcase = ET.SubElement(testsuite, "testcase", {"name": result.get("name", "Unknown")})
-
-            status = result.get("status", "passed")
-            test_count += 1
-
-            if status == "failed":
-                failure = ET.SubElement(
-                    testcase,
-                    "failure",
-                    {"message": result.get("statusDetails", {}).get("message", "")},
+        counts = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0}
+
+        with tempfile.TemporaryFile("w+", encoding="utf-8") as spool:
+            writer = XMLGenerator(spool, encoding="utf-8", short_empty_elements=True)
+
+            for result in self._iter_results():
+                status = result.get("status", "passed")
+                counts["tests"] += 1
+
+                writer.ignorableWhitespace("\n    ")
+                writer.startElement("testcase", {"name": result.get("name", "Unknown")})
+
+                if status in ("failed", "broken"):
+                    tag = "failure" if status == "failed" else "error"
+                    counts["failures" if status == "failed" else "errors"] += 1
+                    details = result.get("statusDetails") or {}
+                    writer.ignorableWhitespace("\n      ")
+                    writer.startElement(tag, {"message": details.get("message") or ""})
+                    writer.characters(details.get("trace") or "")
+                    writer.endElement(tag)
+                    writer.ignorableWhitespace("\n    ")
+                elif status == "skipped":
+                    counts["skipped"] += 1
+                    writer.ignorableWhitespace("\n      ")
+                    writer.startElement("skipped", {})
+                    writer.endElement("skipped")
+                    writer.ignorableWhitespace("\n    ")
+
+                writer.endElement("testcase")
+
+            spool.seek(0)
+            with open(report_file, "w", encoding="utf-8") as f:
+                f.write("<?xml version='1.0' encoding='UTF-8'?>\n<testsuites>\n")
+                f.write(
+                    f'  <testsuite name="QA Framework Tests" tests="{counts["tests"]}" '
+                    f'failures="{counts["failures"]}" errors="{counts["errors"]}" '
+                    f'skipped="{counts["skipped"]}">'
                 )
-                failure.text = result.get("statusDetails", {}).get("trace", "")
-                failure_count += 1
-            elif status == "broken":
-                error = ET.SubElement(
-                    testcase,
-                    "error",
-                    {"message": result.get("statusDetails", {}).get("message", "")},
-                )
-                error.text = result.get("statusDetails", {}).get("trace", "")
-                error_count += 1
-            elif status == "skipped":
-                ET.SubElement(testcase, "skipped")
-                skipped_count += 1
-
-        # Update counts
-        testsuite.set("tests", str(test_count))
-        testsuite.set("failures", str(failure_count))
-        testsuite.set("errors", str(error_count))
-        testsuite.set("skipped", str(skipped_count))
-
-        # Write XML
-        tree = ET.ElementTree(testsuites)
-        ET.indent(tree, space="  ", level=0)
-        tree.write(report_file, encoding="unicode", xml_declaration=True)
+                shutil.copyfileobj(spool, f)
+                f.write("\n  </testsuite>\n</testsuites>" if counts["tests"] else "</testsuite>\n</testsuites>")
 
         return str(report_file.absolute())
 
@@ -511,15 +551,28 @@ class AllureReporter(IReporter):
             Path to generated HTML report
         """
         report_file = output_path / "fallback-report.html"
+        counts = {"passed": 0, "failed": 0, "broken": 0, "skipped": 0}
+        total = 0
+
+        with tempfile.TemporaryFile("w+", encoding="utf-8") as spool:
+            # Test entries are spooled so the summary can be written first
+            for result in self._iter_results():
+                status = result.get("status", "unknown")
+                name = result.get("name", "Unknown")
+                description = result.get("description", "")
+                total += 1
+                if status in counts:
+                    counts[status] += 1
+
+                spool.write(f"""
+    <div class="test {status}">
+        <span class="status">[{status.upper()}]</span> <strong>{name}</strong>
+        {f"<br><small>{description}</small>" if description else ""}
+    </div>
+""")
 
-        # Collect results
-        results = []
-        for result_file in self.results_dir.glob("*-result.json"):
-            with open(result_file, "r", encoding="utf-8") as f:
-                results.append(json.load(f))
-
-        # Generate basic HTML
-        html_content = f"""<!DOCTYPE html>
+            # Generate basic HTML
+            html_header = f"""<!DOCTYPE html>
 <html>
 <head>
     <title>QA Framework Test Report</title>
@@ -539,34 +592,25 @@ class AllureReporter(IReporter):
     <h1>QA Framework Test Report</h1>
     <div class="summary">
         <h2>Summary</h2>
-        <p>Total Tests: {len(results)}</p>
-        <p>Passed: {sum(1 for r in results if r.get("status") == "passed")}</p>
-        <p>Failed: {sum(1 for r in results if r.get("status") == "failed")}</p>
-        <p>Broken: {sum(1 for r in results if r.get("status") == "broken")}</p>
-        <p>Skipped: {sum(1 for r in results if r.get("status") == "skipped")}</p>
+        <p>Total Tests: {total}</p>
+        <p>Passed: {counts["passed"]}</p>
+        <p>Failed: {counts["failed"]}</p>
+        <p>Broken: {counts["broken"]}</p>
+        <p>Skipped: {counts["skipped"]}</p>
     </div>
     <h2>Test Results</h2>
 """
 
-        for result in results:
-            status = result.get("status", "unknown")
-            name = result.get("name", "Unknown")
-            description = result.get("description", "")
-
-            html_content += f"""
-    <div class="test {status}">
-        <span class="status">[{status.upper()}]</span> <strong>{name}</strong>
-        {f"<br><small>{description}</small>" if description else ""}
-    </div>
-"""
-
-        html_content += """
+            html_footer = """
 </body>
 </html>
 """
 
-        with open(report_file, "w", encoding="utf-8") as f:
-            f.write(html_content)
+            spool.seek(0)
+            with open(report_file, "w", encoding="utf-8") as f:
+                f.write(html_header)
+                shutil.copyfileobj(spool, f)
+                f.write(html_footer)
 
         return str(report_file.absolute())
 
@@ -5,6 +5,10 @@ This module provides:
 2. Decorator for protecting routes with permission checks
 3. Helper functions for permission validation
 4. Integration with tenant context and role system
+
+Permission checks run against the user's roles compiled into a bitmask
+(see CompiledPermissions), cached per tenant and role set, so each check
+is a bit test instead of a scan over every role and permission string.
 """
 
 from typing import Callable, List, Optional
@@ -14,7 +18,12 @@ from uuid import UUID
 from fastapi import Request, HTTPException, status
 import logging
 
+from src.domain.entities.permission import CompiledPermissions
 from src.domain.entities.role import Role
+from src.infrastructure.persistence.role_permission_cache import (
+    RolePermissionCache,
+    get_role_permission_cache
+)
 from src.infrastructure.persistence.role_repository import RoleRepositoryInterface
 from src.api.middleware.tenant_context import get_tenant_context
 
@@ -31,17 +40,29 @@ class RBACContext:
     - Effective permissions
     - Tenant context integration
     
-    For now, we'll implement permission checking based on roles
+    For now, we'll implement permission checking based on roles.
+    The union of the roles' permissions is compiled once and shared
+    through a RolePermissionCache.
     """
     
-    def __init__(self, roles: List[Role]):
+    def __init__(self, roles: List[Role], cache: Optional[RolePermissionCache] = None):
         """
         Initialize RBAC context.
         
         Args:
             roles: List of roles for the current user
+            cache: Compiled permission cache (shared cache by default)
         """
         self.roles = roles
+        self.cache = cache if cache is not None else get_role_permission_cache()
+        self._permissions: Optional[CompiledPermissions] = None
+    
+    @property
+    def permissions(self) -> CompiledPermissions:
+        """Compiled permissions of all roles"""
+        if self._permissions is None:
+            self._permissions = self.cache.get_permissions(self.roles)
+        return self._permissions
     
     def has_permission(self, permission: str) -> bool:
         """
@@ -53,7 +74,7 @@ class RBACContext:
         Returns:
             True if any role has the permission
         """
-        return any(role.has_permission(permission) for role in self.roles)
+        return self.permissions.allows(permission)
     
     def has_any_permission(self, permissions: List[str]) -> bool:
         """
@@ -65,7 +86,8 @@ class RBACContext:
         Returns:
             True if any role has at least one permission
         """
-        return any(self.has_permission(perm) for perm in permissions)
+        compiled = self.permissions
+        return compiled.allows_any(compiled.registry.mask(permissions))
     
     def has_all_permissions(self, permissions: List[str]) -> bool:
         """
@@ -77,7 +99,8 @@ class RBACContext:
         Returns:
             True if any role has all permissions
         """
-        return all(self.has_permission(perm) for perm in permissions)
+        compiled = self.permissions
+        return compiled.allows_all(compiled.registry.mask(permissions))
     
     @property
     def role_names(self) -> List[str]:
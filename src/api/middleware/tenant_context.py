@@ -5,15 +5,21 @@ This middleware:
 2. Resolves tenant from X-Tenant-ID header (for API clients)
 3. Injects tenant context into request state
 4. Validates tenant is active before allowing access
+
+Resolved (and unknown) tenants are served from a TenantCache, so most
+requests resolve their tenant without a database query.
 """
 
-from typing import Optional, Callable
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Callable, Tuple
+from uuid import UUID
 from fastapi import Request, HTTPException, status
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
 import logging
+import time
 
 from src.domain.entities.tenant import Tenant, TenantStatus
+from src.infrastructure.persistence.tenant_cache import MISSING, TenantCache, get_tenant_cache
 from src.infrastructure.persistence.tenant_repository import TenantRepositoryInterface
 
 
@@ -54,6 +60,43 @@ class TenantContext:
         return self.tenant.slug if self.tenant else None
 
 
+DEFAULT_PUBLIC_PATHS = (
+    "/",
+    "/health",
+    "/api/v1/health",
+    "/api/v1/docs",
+    "/api/v1/openapi.json",
+    "/docs",
+    "/openapi.json"
+)
+
+# Subdomains that never name a tenant
+RESERVED_SUBDOMAINS = frozenset({"www", "api", "app"})
+
+
+def compile_public_paths(paths: Iterable[str]) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """
+    Split public path patterns into exact paths and path prefixes.
+    
+    Patterns ending in ``/*`` match the prefix and everything below it
+    (``/docs/*`` matches ``/docs`` and ``/docs/oauth2-redirect``); other
+    patterns match exactly.
+    
+    Args:
+        paths: Public path patterns
+        
+    Returns:
+        Tuple of (exact paths, prefixes)
+    """
+    exact, prefixes = set(), set()
+    for path in paths:
+        if path.endswith("/*"):
+            prefixes.add(path[:-2] or "/")
+        else:
+            exact.add(path)
+    return frozenset(exact), frozenset(prefixes)
+
+
 class TenantContextMiddleware(BaseHTTPMiddleware):
     """
     FastAPI/Starlette middleware for multi-tenant context resolution.
@@ -70,7 +113,8 @@ class TenantContextMiddleware(BaseHTTPMiddleware):
         app,
         tenant_repository: TenantRepositoryInterface,
         require_tenant: bool = False,
-        public_paths: Optional[list] = None
+        public_paths: Optional[list] = None,
+        cache: Optional[TenantCache] = None
     ):
         """
         Initialize middleware.
@@ -79,63 +123,138 @@ class TenantContextMiddleware(BaseHTTPMiddleware):
             app: FastAPI/Starlette application
             tenant_repository: Repository to fetch tenant data
             require_tenant: If True, reject requests without valid tenant
-            public_paths: List of paths that don't require tenant context
+            public_paths: Paths that don't require tenant context
+                (``/prefix/*`` patterns match whole subtrees)
+            cache: Tenant resolution cache (shared cache by default)
         """
         super().__init__(app)
         self.tenant_repository = tenant_repository
         self.require_tenant = require_tenant
-        self.public_paths = public_paths or [
-            "/",
-            "/health",
-            "/api/v1/health",
-            "/api/v1/docs",
-            "/api/v1/openapi.json",
-            "/docs",
-            "/openapi.json"
-        ]
+        self.public_paths = list(public_paths or DEFAULT_PUBLIC_PATHS)
+        self._public_exact, self._public_prefixes = compile_public_paths(self.public_paths)
+        self.cache = cache if cache is not None else get_tenant_cache()
+        self.requests_resolved = 0
+        self.resolution_seconds = 0.0
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def is_public_path(self, path: str) -> bool:
         """
-        Process request and resolve tenant context.
+        Check if a path skips tenant resolution.
         
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/route handler
+            path: Request path
             
         Returns:
-            HTTP response
+            True if the path is public
         """
-        # Skip tenant resolution for public paths
-        if request.url.path in self.public_paths:
-            request.state.tenant_context = TenantContext(None, "none")
-            return await call_next(request)
-        
-        # Try to resolve tenant
-        tenant = None
-        resolved_from = "none"
+        if path in self._public_exact:
+            return True
+        prefixes = self._public_prefixes
+        if not prefixes:
+            return False
+        if "/" in prefixes or path in prefixes:
+            return True
+        # Check each ancestor: /a/b/c -> /a/b, /a
+        index = path.rfind("/")
+        while index > 0:
+            path = path[:index]
+            if path in prefixes:
+                return True
+            index = path.rfind("/")
+        return False
+    
+    async def resolve_tenant(self, request: Request) -> Tuple[Optional[Tenant], str]:
+        """
+        Resolve the request's tenant from header or subdomain.
         
+        Args:
+            request: Incoming HTTP request
+            
+        Returns:
+            Tuple of (tenant or None, how it was resolved)
+        """
+        started = time.perf_counter()
+        try:
+            return await self._resolve(request)
+        finally:
+            self.resolution_seconds += time.perf_counter() - started
+            self.requests_resolved += 1
+    
+    async def _resolve(self, request: Request) -> Tuple[Optional[Tenant], str]:
         # Method 1: Try X-Tenant-ID header
         tenant_id = request.headers.get("X-Tenant-ID")
         if tenant_id:
             try:
-                from uuid import UUID
-                tenant = await self.tenant_repository.get_by_id(UUID(tenant_id))
+                tenant = await self._get_by_id(UUID(tenant_id))
                 if tenant:
-                    resolved_from = "header"
                     logger.debug(f"Resolved tenant {tenant.slug} from header")
+                    return tenant, "header"
             except Exception as e:
                 logger.warning(f"Invalid tenant ID in header: {tenant_id}, error: {e}")
         
         # Method 2: Try subdomain from host
-        if not tenant:
-            host = request.headers.get("host", "")
-            subdomain = self._extract_subdomain(host)
+        host = request.headers.get("host", "")
+        subdomain = self._extract_subdomain(host)
+        
+        if subdomain and subdomain not in RESERVED_SUBDOMAINS:
+            tenant = await self._get_by_slug(subdomain)
+            if tenant:
+                logger.debug(f"Resolved tenant {tenant.slug} from subdomain")
+                return tenant, "subdomain"
+        
+        return None, "none"
+    
+    async def _get_by_id(self, tenant_id: UUID) -> Optional[Tenant]:
+        tenant = self.cache.get_by_id(tenant_id)
+        if tenant is MISSING:
+            tenant = await self.tenant_repository.get_by_id(tenant_id)
+            if tenant:
+                self.cache.put(tenant)
+            else:
+                self.cache.put_missing_id(tenant_id)
+        return tenant
+    
+    async def _get_by_slug(self, slug: str) -> Optional[Tenant]:
+        tenant = self.cache.get_by_slug(slug)
+        if tenant is MISSING:
+            tenant = await self.tenant_repository.get_by_slug(slug)
+            if tenant:
+                self.cache.put(tenant)
+            else:
+                self.cache.put_missing_slug(slug)
+        return tenant
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get tenant resolution statistics.
+        
+        Returns:
+            Cache statistics plus average resolution overhead per request
+        """
+        resolved = self.requests_resolved
+        return {
+            **self.cache.get_stats(),
+            "requests_resolved": resolved,
+            "avg_resolution_us": (self.resolution_seconds / resolved * 1e6) if resolved else 0.0,
+        }
+    
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        """
+        Process request and resolve tenant context.
+        
+        Args:
+            request: Incoming HTTP request
+            call_next: Next middleware/route handler
             
-            if subdomain and subdomain not in ["www", "api", "app"]:
-                tenant = await self.tenant_repository.get_by_slug(subdomain)
-                if tenant:
-                    resolved_from = "subdomain"
-                    logger.debug(f"Resolved tenant {tenant.slug} from subdomain")
+        Returns:
+            HTTP response
+        """
+        # Skip tenant resolution for public paths
+        if self.is_public_path(request.url.path):
+            request.state.tenant_context = TenantContext(None, "none")
+            return await call_next(request)
+        
+        # Try to resolve tenant
+        tenant, resolved_from = await self.resolve_tenant(request)
         
         # Create tenant context
         tenant_context = TenantContext(tenant, resolved_from)
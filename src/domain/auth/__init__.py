@@ -1,11 +1,12 @@
 """Domain layer for authentication and OAuth."""
-from .entities import OAuthUser, Token
+from .entities import OAuthUser, Token, Session
 from .value_objects import AuthProvider
 from .interfaces import OAuthProvider
 
 __all__ = [
     "OAuthUser",
     "Token",
+    "Session",
     "AuthProvider",
     "OAuthProvider",
 ]
\ No newline at end of file
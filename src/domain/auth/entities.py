@@ -1,7 +1,8 @@
 """OAuth Domain Entities."""
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Optional
+from datetime import datetime, timezone, timedelta
+from typing import Any, Dict, Optional
+from uuid import UUID, uuid4
 
 
 @dataclass(frozen=True)
@@ -48,4 +49,89 @@ class Token:
         if self.expires_at is None:
             return None
         delta = self.expires_at - datetime.now(timezone.utc)
-        return max(0, int(delta.total_seconds()))
\ No newline at end of file
+        return max(0, int(delta.total_seconds()))
+
+
+@dataclass
+class Session:
+    """Entity representing an authenticated user session."""
+    user_id: UUID
+    token: str
+    expires_at: datetime
+    id: UUID = field(default_factory=uuid4)
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    last_activity_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    user_agent: Optional[str] = None
+    ip_address: Optional[str] = None
+    device_info: Optional[str] = None
+    is_active: bool = True
+    
+    @classmethod
+    def create(
+        cls,
+        user_id: UUID,
+        token: str,
+        expires_in_seconds: int = 604800,
+        user_agent: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        device_info: Optional[str] = None
+    ) -> "Session":
+        """Create a session expiring ``expires_in_seconds`` from now."""
+        now = datetime.now(timezone.utc)
+        return cls(
+            user_id=user_id,
+            token=token,
+            expires_at=now + timedelta(seconds=expires_in_seconds),
+            created_at=now,
+            last_activity_at=now,
+            user_agent=user_agent,
+            ip_address=ip_address,
+            device_info=device_info
+        )
+    
+    def is_expired(self) -> bool:
+        """Check if session is past its expiry."""
+        return datetime.now(timezone.utc) >= self.expires_at
+    
+    def is_valid(self) -> bool:
+        """Check if session is active and not expired."""
+        return self.is_active and not self.is_expired()
+    
+    def refresh_activity(self) -> None:
+        """Record activity now."""
+        self.last_activity_at = datetime.now(timezone.utc)
+    
+    def terminate(self) -> None:
+        """End the session."""
+        self.is_active = False
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for storage."""
+        return {
+            "id": str(self.id),
+            "user_id": str(self.user_id),
+            "token": self.token,
+            "expires_at": self.expires_at.isoformat(),
+            "created_at": self.created_at.isoformat(),
+            "last_activity_at": self.last_activity_at.isoformat(),
+            "user_agent": self.user_agent,
+            "ip_address": self.ip_address,
+            "device_info": self.device_info,
+            "is_active": self.is_active,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Session":
+        """Deserialize from storage."""
+        return cls(
+            id=UUID(data["id"]),
+            user_id=UUID(data["user_id"]),
+            token=data["token"],
+            expires_at=datetime.fromisoformat(data["expires_at"]),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            last_activity_at=datetime.fromisoformat(data["last_activity_at"]),
+            user_agent=data.get("user_agent"),
+            ip_address=data.get("ip_address"),
+            device_info=data.get("device_info"),
+            is_active=data.get("is_active", True),
+        )
@@ -1,7 +1,8 @@
 """Permission entity - Domain model for RBAC permissions"""
 
+import threading
 from dataclasses import dataclass
-from typing import Set
+from typing import Dict, Iterable, List, Set
 
 
 @dataclass(frozen=True)
@@ -141,3 +142,160 @@ def validate_permission(permission_str: str) -> bool:
         return permission_str in PERMISSIONS
     except Exception:
         return False
+
+
+class PermissionRegistry:
+    """
+    Interns permission strings to bit positions.
+
+    Every distinct permission gets a stable bit the first time it is seen,
+    so a set of permissions is a single int and membership is a bit test.
+    Bits are only ever added, never reused.
+    """
+
+    def __init__(self, permissions: Iterable[str] = ()):
+        """
+        Initialize registry.
+
+        Args:
+            permissions: Permissions to intern up front
+        """
+        self._bits: Dict[str, int] = {}
+        self._resources: List[str] = []
+        self._lock = threading.Lock()
+        for permission in permissions:
+            self.bit(permission)
+
+    def bit(self, permission: str) -> int:
+        """
+        Bit position of a permission, interning it if new.
+
+        Args:
+            permission: Permission string (e.g., "tests:read")
+
+        Returns:
+            Bit position
+        """
+        bit = self._bits.get(permission)
+        if bit is None:
+            with self._lock:
+                bit = self._bits.get(permission)
+                if bit is None:
+                    bit = len(self._resources)
+                    self._resources.append(permission.split(":")[0])
+                    self._bits[permission] = bit
+        return bit
+
+    def resource(self, bit: int) -> str:
+        """Resource of the permission interned at a bit"""
+        return self._resources[bit]
+
+    def mask(self, permissions: Iterable[str]) -> int:
+        """Bitmask with the bit of every given permission set"""
+        mask = 0
+        for permission in permissions:
+            mask |= 1 << self.bit(permission)
+        return mask
+
+    def resource_mask(self, resource: str) -> int:
+        """Bitmask of every interned permission on a resource"""
+        mask = 0
+        for bit, owner in enumerate(list(self._resources)):
+            if owner == resource:
+                mask |= 1 << bit
+        return mask
+
+    def __len__(self) -> int:
+        return len(self._resources)
+
+
+# Process-wide registry; predefined permissions get the low bits
+PERMISSION_REGISTRY = PermissionRegistry(sorted(PERMISSIONS))
+
+
+class CompiledPermissions:
+    """
+    Immutable, precompiled permission set.
+
+    Grants are compiled once into a bitmask over a PermissionRegistry with
+    resource wildcards ("tests:*") expanded to every permission the
+    registry knows on that resource, so checks are bit operations with no
+    string parsing. Permissions interned after compilation fall back to a
+    lookup of their resource among the wildcard grants. "admin:*" grants
+    everything.
+    """
+
+    __slots__ = ("mask", "wildcards", "grants_all", "registry")
+
+    def __init__(self, grants: Iterable[str], registry: PermissionRegistry = PERMISSION_REGISTRY):
+        """
+        Compile a set of granted permission strings.
+
+        Args:
+            grants: Granted permissions, wildcards allowed
+            registry: Registry assigning permission bits
+        """
+        grants = set(grants)
+        wildcards = frozenset(
+            grant.split(":")[0] for grant in grants if ":*" in grant
+        )
+        mask = registry.mask(grants)
+        for resource in wildcards:
+            mask |= registry.resource_mask(resource)
+        object.__setattr__(self, "registry", registry)
+        object.__setattr__(self, "wildcards", wildcards)
+        object.__setattr__(self, "grants_all", "admin:*" in grants)
+        object.__setattr__(self, "mask", mask)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError("CompiledPermissions is immutable")
+
+    def _covers(self, missing: int) -> bool:
+        """Check wildcard grants for bits interned after compilation"""
+        if self.grants_all:
+            return True
+        if not self.wildcards:
+            return False
+        resource = self.registry.resource
+        while missing:
+            low = missing & -missing
+            if resource(low.bit_length() - 1) not in self.wildcards:
+                return False
+            missing ^= low
+        return True
+
+    def allows(self, permission: str) -> bool:
+        """
+        Check a single permission.
+
+        Args:
+            permission: Permission to check (e.g., "tests:read")
+
+        Returns:
+            True if granted
+        """
+        bit = 1 << self.registry.bit(permission)
+        return bool(self.mask & bit) or self._covers(bit)
+
+    def allows_all(self, required_mask: int) -> bool:
+        """Check that every permission in a registry mask is granted"""
+        missing = required_mask & ~self.mask
+        return not missing or self._covers(missing)
+
+    def allows_any(self, required_mask: int) -> bool:
+        """Check that at least one permission in a registry mask is granted"""
+        if self.mask & required_mask:
+            return True
+        missing = required_mask
+        while missing:
+            low = missing & -missing
+            if self._covers(low):
+                return True
+            missing ^= low
+        return False
+
+    def __repr__(self) -> str:
+        return (
+            f"CompiledPermissions(bits={bin(self.mask).count('1')}, "
+            f"wildcards={sorted(self.wildcards)}, grants_all={self.grants_all})"
+        )
@@ -1,16 +1,27 @@
 """Authentication infrastructure components."""
+from .hashing_pool import HashingPool, HashingPoolFullError
 from .password_hasher import PasswordHasher, BCryptPasswordHasher
 from .token_generator import TokenGenerator, JWTokenGenerator
-from .api_key_generator import APIKeyGenerator
 from .session_store import SessionStore, InMemorySessionStore, RedisSessionStore
 
 __all__ = [
     "PasswordHasher",
     "BCryptPasswordHasher",
+    "HashingPool",
+    "HashingPoolFullError",
     "TokenGenerator",
     "JWTokenGenerator",
     "APIKeyGenerator",
     "SessionStore",
     "InMemorySessionStore",
     "RedisSessionStore",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # api_key_generator needs the APIKey entity; load it on first use so the
+    # rest of the package imports without it
+    if name == "APIKeyGenerator":
+        from .api_key_generator import APIKeyGenerator
+        return APIKeyGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
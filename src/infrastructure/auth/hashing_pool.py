@@ -0,0 +1,165 @@
+"""Bounded executor for CPU-bound credential hashing.
+
+bcrypt at 12 rounds costs about 250 ms of CPU per call. Run inline on an
+event loop, every login stalls all other requests for that long. The
+pool moves hashing onto a small dedicated set of worker threads (bcrypt
+releases the GIL while hashing) or processes, caps how many calls may
+wait for a worker, and records queueing statistics.
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class HashingPoolFullError(RuntimeError):
+    """Raised when more calls are waiting than the pool's queue allows."""
+
+
+class HashingPool:
+    """Dedicated, bounded pool for password hashing and verification.
+
+    At most ``max_workers`` calls hash concurrently and at most
+    ``max_queue`` more wait for a worker; beyond that ``run`` raises
+    ``HashingPoolFullError`` so a login storm is shed instead of piling
+    up unbounded work.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_queue: int = 64,
+        use_processes: bool = False,
+        on_wait: Optional[Callable[[float], None]] = None,
+    ):
+        """Initialize the pool.
+
+        Args:
+            max_workers: Concurrent hashing calls
+            max_queue: Calls allowed to wait for a worker
+            use_processes: Use worker processes instead of threads
+            on_wait: Callback receiving each call's queue wait in seconds
+        """
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.use_processes = use_processes
+        self._on_wait = on_wait
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._run_total = 0.0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.use_processes:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="hashing"
+                )
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run ``func(*args)`` on a pool worker.
+
+        Args:
+            func: CPU-bound callable (picklable when using processes)
+            *args: Positional arguments for ``func``
+
+        Returns:
+            The callable's result
+
+        Raises:
+            HashingPoolFullError: If the wait queue is full
+        """
+        with self._lock:
+            if self._queued + self._active >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise HashingPoolFullError(
+                    f"Hashing pool saturated ({self.max_workers} workers, "
+                    f"{self.max_queue} queued)"
+                )
+            self._queued += 1
+
+        submitted = time.perf_counter()
+        executor = self._get_executor()
+        if self.use_processes:
+            # Queue time cannot be observed inside another process
+            self._started()
+            future = executor.submit(func, *args)
+            future.add_done_callback(lambda f: self._finished(submitted, submitted))
+        else:
+            def call(*call_args: Any) -> T:
+                started = time.perf_counter()
+                self._started()
+                try:
+                    return func(*call_args)
+                finally:
+                    self._finished(submitted, started)
+
+            future = executor.submit(call, *args)
+            future.add_done_callback(self._discard_cancelled)
+        return await asyncio.wrap_future(future)
+
+    def _started(self) -> None:
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+
+    def _discard_cancelled(self, future) -> None:
+        # A call cancelled before a worker picked it up never ran
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+
+    def _finished(self, submitted: float, started: float) -> None:
+        now = time.perf_counter()
+        wait = started - submitted
+        with self._lock:
+            self._active -= 1
+            self._completed += 1
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+            self._run_total += now - started
+        if self._on_wait is not None:
+            self._on_wait(wait)
+
+    @property
+    def queued(self) -> int:
+        """Calls waiting for a worker."""
+        return self._queued
+
+    @property
+    def active(self) -> int:
+        """Calls currently hashing."""
+        return self._active
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queueing statistics since the pool was created."""
+        with self._lock:
+            completed = self._completed
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "queued": self._queued,
+                "active": self._active,
+                "completed": completed,
+                "rejected": self._rejected,
+                "avg_wait_ms": (self._wait_total / completed * 1000) if completed else 0.0,
+                "max_wait_ms": self._wait_max * 1000,
+                "avg_run_ms": (self._run_total / completed * 1000) if completed else 0.0,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers; the pool restarts lazily on next use."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
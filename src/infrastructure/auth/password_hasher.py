@@ -3,6 +3,7 @@ from abc import ABC, abstractmethod
 from typing import Optional
 import bcrypt
 from src.domain.auth.value_objects import Password
+from src.infrastructure.auth.hashing_pool import HashingPool
 
 
 class PasswordHasher(ABC):
@@ -53,13 +54,15 @@ class BCryptPasswordHasher(PasswordHasher):
     Default rounds: 12 (adjustable based on security/performance needs)
     """
 
-    def __init__(self, rounds: int = 12):
+    def __init__(self, rounds: int = 12, pool: Optional[HashingPool] = None):
         """Initialize bcrypt hasher.
 
         Args:
             rounds: Number of bcrypt rounds (4-31, higher = slower)
+            pool: Pool for the async variants (defaults to the shared pool)
         """
         self._rounds = rounds
+        self._pool = pool
 
     def hash(self, password: str) -> str:
         """Hash password using bcrypt.
@@ -94,6 +97,36 @@ class BCryptPasswordHasher(PasswordHasher):
         except Exception:
             return False
 
+    @property
+    def pool(self) -> HashingPool:
+        """Pool running the async variants."""
+        if self._pool is None:
+            self._pool = get_hashing_pool()
+        return self._pool
+
+    async def hash_async(self, password: str) -> str:
+        """Hash password on the hashing pool, keeping the event loop free.
+
+        Args:
+            password: Plain text password
+
+        Returns:
+            BCrypt hash string (includes salt)
+        """
+        return await self.pool.run(self.hash, password)
+
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify password on the hashing pool, keeping the event loop free.
+
+        Args:
+            plain_password: Plain text password
+            hashed_password: BCrypt hash
+
+        Returns:
+            True if passwords match
+        """
+        return await self.pool.run(self.verify, plain_password, hashed_password)
+
     def needs_rehash(self, hashed_password: str) -> bool:
         """Check if password needs rehashing.
 
@@ -131,6 +164,15 @@ class BCryptPasswordHasher(PasswordHasher):
 
 # Global hasher instance (use this for all password operations)
 _default_hasher: Optional[BCryptPasswordHasher] = None
+_default_pool: Optional[HashingPool] = None
+
+
+def get_hashing_pool() -> HashingPool:
+    """Get the shared pool for CPU-bound password hashing."""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = HashingPool()
+    return _default_pool
 
 
 def get_password_hasher() -> BCryptPasswordHasher:
@@ -151,6 +193,16 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return get_password_hasher().verify(plain_password, hashed_password)
 
 
+async def hash_password_async(password: str) -> str:
+    """Convenience function to hash a password off the event loop."""
+    return await get_password_hasher().hash_async(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Convenience function to verify a password off the event loop."""
+    return await get_password_hasher().verify_async(plain_password, hashed_password)
+
+
 def check_password_strength(password: str) -> tuple[bool, list[str]]:
     """Convenience function to check password strength."""
     return Password.validate_strength(password)
\ No newline at end of file
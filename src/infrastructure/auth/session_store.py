@@ -1,9 +1,13 @@
 """Session storage backends for session management."""
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Dict, List
-from uuid import UUID, uuid4
+from typing import Any, Optional, Dict, List, Set, Tuple
+from uuid import UUID
+import hashlib
+import heapq
 import json
+import time
 
 from src.domain.auth.entities import Session
 
@@ -149,11 +153,18 @@ class InMemorySessionStore(SessionStore):
     """In-memory session store for development and testing.
 
     NOT FOR PRODUCTION USE - Sessions are lost on restart.
+
+    Sessions are indexed by token and by user, and expiries are kept in a
+    heap, so lookups, per-user operations and cleanup never scan every
+    session.
     """
 
     def __init__(self):
         """Initialize in-memory session store."""
         self._sessions: Dict[UUID, Session] = {}
+        self._by_token: Dict[str, UUID] = {}
+        self._by_user: Dict[UUID, Set[UUID]] = {}
+        self._expiry_heap: List[Tuple[datetime, UUID]] = []
 
     async def create_session(
         self,
@@ -174,8 +185,24 @@ class InMemorySessionStore(SessionStore):
             device_info=device_info
         )
         self._sessions[session.id] = session
+        self._by_token[token] = session.id
+        self._by_user.setdefault(user_id, set()).add(session.id)
+        heapq.heappush(self._expiry_heap, (session.expires_at, session.id))
         return session
 
+    def _user_sessions(self, user_id: UUID) -> List[Session]:
+        return [self._sessions[sid] for sid in self._by_user.get(user_id, ())]
+
+    def _remove(self, session: Session) -> None:
+        del self._sessions[session.id]
+        if self._by_token.get(session.token) == session.id:
+            del self._by_token[session.token]
+        user_sessions = self._by_user.get(session.user_id)
+        if user_sessions is not None:
+            user_sessions.discard(session.id)
+            if not user_sessions:
+                del self._by_user[session.user_id]
+
     async def get_session(self, session_id: UUID) -> Optional[Session]:
         """Get session from memory."""
         session = self._sessions.get(session_id)
@@ -185,10 +212,10 @@ class InMemorySessionStore(SessionStore):
 
     async def get_session_by_token(self, token: str) -> Optional[Session]:
         """Get session by token."""
-        for session in self._sessions.values():
-            if session.token == token and session.is_valid():
-                return session
-        return None
+        session_id = self._by_token.get(token)
+        if session_id is None:
+            return None
+        return await self.get_session(session_id)
 
     async def update_session_activity(self, session_id: UUID) -> bool:
         """Update session activity."""
@@ -213,12 +240,11 @@ class InMemorySessionStore(SessionStore):
     ) -> int:
         """Revoke all sessions for user."""
         revoked_count = 0
-        for session in self._sessions.values():
-            if session.user_id == user_id:
-                if except_session_id and session.id == except_session_id:
-                    continue
-                session.terminate()
-                revoked_count += 1
+        for session in self._user_sessions(user_id):
+            if not session.is_active or session.id == except_session_id:
+                continue
+            session.terminate()
+            revoked_count += 1
         return revoked_count
 
     async def list_user_sessions(
@@ -228,21 +254,24 @@ class InMemorySessionStore(SessionStore):
     ) -> List[Session]:
         """List user sessions."""
         sessions = [
-            s for s in self._sessions.values()
-            if s.user_id == user_id and (not active_only or s.is_valid())
+            s for s in self._user_sessions(user_id)
+            if not active_only or s.is_valid()
         ]
         # Sort by last activity (most recent first)
         return sorted(sessions, key=lambda s: s.last_activity_at, reverse=True)
 
     async def clean_expired_sessions(self) -> int:
         """Clean expired sessions."""
-        expired_ids = [
-            sid for sid, s in self._sessions.items()
-            if s.is_expired()
-        ]
-        for sid in expired_ids:
-            del self._sessions[sid]
-        return len(expired_ids)
+        now = datetime.now(timezone.utc)
+        heap = self._expiry_heap
+        cleaned = 0
+        while heap and heap[0][0] <= now:
+            _, sid = heapq.heappop(heap)
+            session = self._sessions.get(sid)
+            if session is not None:
+                self._remove(session)
+                cleaned += 1
+        return cleaned
 
     async def terminate_inactive_sessions(
         self,
@@ -252,17 +281,66 @@ class InMemorySessionStore(SessionStore):
         """Terminate inactive sessions."""
         cutoff = datetime.now(timezone.utc) - timedelta(days=inactive_days)
         terminated = 0
-        for session in self._sessions.values():
-            if session.user_id == user_id and session.last_activity_at < cutoff:
+        for session in self._user_sessions(user_id):
+            if session.is_active and session.last_activity_at < cutoff:
                 session.terminate()
                 terminated += 1
         return terminated
 
 
+# Deletes sessions with their token keys and index entries atomically.
+# KEYS[1]: the user's session set, KEYS[2]: global expiry index
+# ARGV[1]: key prefix, ARGV[2]: user id, ARGV[3]: session id to keep ("" for none)
+# ARGV[4...]: session ids to revoke; every session in KEYS[1] when absent
+# Returns the ids of the sessions deleted
+REVOKE_SESSIONS_LUA = """
+local ids
+if #ARGV > 3 then
+    ids = {}
+    for i = 4, #ARGV do
+        ids[#ids + 1] = ARGV[i]
+    end
+else
+    ids = redis.call('ZRANGE', KEYS[1], 0, -1)
+end
+local revoked = {}
+for _, id in ipairs(ids) do
+    if id ~= ARGV[3] then
+        local session_key = ARGV[1] .. id
+        local data = redis.call('GET', session_key)
+        if data then
+            local session = cjson.decode(data)
+            redis.call('DEL', session_key, ARGV[1] .. 'token:' .. session['token_hash'])
+            revoked[#revoked + 1] = id
+        end
+        redis.call('ZREM', KEYS[1], id)
+        redis.call('ZREM', KEYS[2], ARGV[2] .. ':' .. id)
+    end
+end
+return revoked
+"""
+
+
 class RedisSessionStore(SessionStore):
     """Redis-backed session store for production.
 
     Requires redis-py package: pip install redis redis[hiredis]
+
+    Layout (``key_prefix`` defaults to ``session:``):
+
+    - ``session:<id>``: session JSON, expiring with the session
+    - ``session:token:<sha256(token)>``: session id, expiring with the session
+    - ``session:user:<user_id>``: sorted set of the user's session ids
+      scored by expiry time
+    - ``session:expiry``: sorted set of ``<user_id>:<id>`` scored by expiry
+      time, swept incrementally by ``clean_expired_sessions``
+
+    Revoked sessions are deleted; revoking all of a user's sessions is a
+    single Lua call. Activity updates are coalesced: a session's
+    ``last_activity_at`` is only rewritten once per
+    ``activity_write_interval`` seconds per worker, so it may lag by up
+    to that long, and an update within that window reports success
+    without checking that the session still exists.
     """
 
     def __init__(
@@ -271,7 +349,256 @@ class RedisSessionStore(SessionStore):
         redis_port: int = 6379,
         redis_db: int = 0,
         redis_password: Optional[str] = None,
-        key_prefix: str = "session:"
+        key_prefix: str = "session:",
+        redis_client: Any = None,
+        activity_write_interval: float = 60.0,
+        sweep_batch_size: int = 500,
+        max_tracked_activity: int = 100_000
     ):
         """Initialize Redis session store.
 
+        Args:
+            redis_host: Redis host
+            redis_port: Redis port
+            redis_db: Redis database number
+            redis_password: Redis password
+            key_prefix: Prefix of every key written by the store
+            redis_client: Existing async Redis client (built from the
+                connection settings when omitted)
+            activity_write_interval: Minimum seconds between persisted
+                activity updates of a session
+            sweep_batch_size: Expired sessions removed per sweep batch
+            max_tracked_activity: Sessions whose last activity write is
+                remembered for coalescing
+        """
+        self.redis_host = redis_host
+        self.redis_port = redis_port
+        self.redis_db = redis_db
+        self.redis_password = redis_password
+        self.key_prefix = key_prefix
+        self.activity_write_interval = activity_write_interval
+        self.sweep_batch_size = sweep_batch_size
+        self.max_tracked_activity = max_tracked_activity
+        self._client = redis_client
+        self._revoke_script = None
+        self._activity_written: "OrderedDict[UUID, float]" = OrderedDict()
+
+    def _get_client(self):
+        if self._client is None:
+            import redis.asyncio as redis
+
+            self._client = redis.Redis(
+                host=self.redis_host,
+                port=self.redis_port,
+                db=self.redis_db,
+                password=self.redis_password,
+                decode_responses=True,
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the Redis connection."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._revoke_script = None
+
+    @staticmethod
+    def _token_hash(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    @staticmethod
+    def _text(value: Any) -> str:
+        return value.decode() if isinstance(value, bytes) else value
+
+    def _session_key(self, session_id: Any) -> str:
+        return f"{self.key_prefix}{session_id}"
+
+    def _token_key(self, token_hash: str) -> str:
+        return f"{self.key_prefix}token:{token_hash}"
+
+    def _user_key(self, user_id: Any) -> str:
+        return f"{self.key_prefix}user:{user_id}"
+
+    @property
+    def _expiry_key(self) -> str:
+        return f"{self.key_prefix}expiry"
+
+    def _dump(self, session: Session) -> str:
+        data = session.to_dict()
+        data["token_hash"] = self._token_hash(session.token)
+        return json.dumps(data)
+
+    def _load(self, data: Any) -> Session:
+        return Session.from_dict(json.loads(self._text(data)))
+
+    async def _revoke(
+        self,
+        user_id: UUID,
+        except_session_id: Optional[UUID] = None,
+        session_ids: Tuple[UUID, ...] = ()
+    ) -> int:
+        if self._revoke_script is None:
+            self._revoke_script = self._get_client().register_script(REVOKE_SESSIONS_LUA)
+        revoked = await self._revoke_script(
+            keys=[self._user_key(user_id), self._expiry_key],
+            args=[
+                self.key_prefix,
+                str(user_id),
+                str(except_session_id) if except_session_id else "",
+                *(str(sid) for sid in session_ids),
+            ],
+        )
+        for sid in revoked:
+            self._activity_written.pop(UUID(self._text(sid)), None)
+        return len(revoked)
+
+    async def create_session(
+        self,
+        user_id: UUID,
+        token: str,
+        expires_in_seconds: int = 604800,
+        user_agent: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        device_info: Optional[str] = None
+    ) -> Session:
+        """Create a session with its token and index entries."""
+        session = Session.create(
+            user_id=user_id,
+            token=token,
+            expires_in_seconds=expires_in_seconds,
+            user_agent=user_agent,
+            ip_address=ip_address,
+            device_info=device_info
+        )
+        ttl = max(1, int(expires_in_seconds))
+        expires_at = session.expires_at.timestamp()
+        pipe = self._get_client().pipeline(transaction=True)
+        pipe.set(self._session_key(session.id), self._dump(session), ex=ttl)
+        pipe.set(self._token_key(self._token_hash(token)), str(session.id), ex=ttl)
+        pipe.zadd(self._user_key(user_id), {str(session.id): expires_at})
+        pipe.zadd(self._expiry_key, {f"{user_id}:{session.id}": expires_at})
+        await pipe.execute()
+        return session
+
+    async def get_session(self, session_id: UUID) -> Optional[Session]:
+        """Get session by ID."""
+        data = await self._get_client().get(self._session_key(session_id))
+        if data is None:
+            return None
+        session = self._load(data)
+        return session if session.is_valid() else None
+
+    async def get_session_by_token(self, token: str) -> Optional[Session]:
+        """Get session through the token index."""
+        session_id = await self._get_client().get(self._token_key(self._token_hash(token)))
+        if session_id is None:
+            return None
+        session = await self.get_session(self._text(session_id))
+        if session is None or session.token != token:
+            return None
+        return session
+
+    async def update_session_activity(self, session_id: UUID) -> bool:
+        """Update last activity, persisting at most once per write interval."""
+        now = time.monotonic()
+        written = self._activity_written.get(session_id)
+        if written is not None and now - written < self.activity_write_interval:
+            return True
+
+        client = self._get_client()
+        key = self._session_key(session_id)
+        data = await client.get(key)
+        if data is None:
+            self._activity_written.pop(session_id, None)
+            return False
+        session = self._load(data)
+        session.refresh_activity()
+        if not await client.set(key, self._dump(session), keepttl=True, xx=True):
+            # Expired or revoked since the read
+            self._activity_written.pop(session_id, None)
+            return False
+
+        self._activity_written[session_id] = now
+        self._activity_written.move_to_end(session_id)
+        while len(self._activity_written) > self.max_tracked_activity:
+            self._activity_written.popitem(last=False)
+        return True
+
+    async def revoke_session(self, session_id: UUID) -> bool:
+        """Revoke (delete) a session."""
+        data = await self._get_client().get(self._session_key(session_id))
+        if data is None:
+            return False
+        session = self._load(data)
+        return await self._revoke(session.user_id, session_ids=(session.id,)) > 0
+
+    async def revoke_all_sessions(
+        self,
+        user_id: UUID,
+        except_session_id: Optional[UUID] = None
+    ) -> int:
+        """Revoke all sessions for a user in one Lua call."""
+        return await self._revoke(user_id, except_session_id=except_session_id)
+
+    async def list_user_sessions(
+        self,
+        user_id: UUID,
+        active_only: bool = True
+    ) -> List[Session]:
+        """List a user's sessions from their session set."""
+        client = self._get_client()
+        user_key = self._user_key(user_id)
+        if active_only:
+            ids = await client.zrangebyscore(user_key, f"({time.time()}", "+inf")
+        else:
+            ids = await client.zrange(user_key, 0, -1)
+        if not ids:
+            return []
+        values = await client.mget([self._session_key(self._text(sid)) for sid in ids])
+        sessions = [self._load(value) for value in values if value is not None]
+        if active_only:
+            sessions = [s for s in sessions if s.is_valid()]
+        # Sort by last activity (most recent first)
+        return sorted(sessions, key=lambda s: s.last_activity_at, reverse=True)
+
+    async def clean_expired_sessions(self) -> int:
+        """Sweep the expiry index in batches of ``sweep_batch_size``.
+
+        Session and token keys expire on their own; the sweep removes the
+        expired sessions' index entries.
+        """
+        client = self._get_client()
+        now = time.time()
+        cleaned = 0
+        while True:
+            members = await client.zrangebyscore(
+                self._expiry_key, "-inf", now, start=0, num=self.sweep_batch_size
+            )
+            if not members:
+                break
+            members = [self._text(member) for member in members]
+            pipe = client.pipeline(transaction=False)
+            for member in members:
+                user_id, session_id = member.split(":", 1)
+                pipe.zrem(self._user_key(user_id), session_id)
+                pipe.delete(self._session_key(session_id))
+            pipe.zrem(self._expiry_key, *members)
+            await pipe.execute()
+            cleaned += len(members)
+            if len(members) < self.sweep_batch_size:
+                break
+        return cleaned
+
+    async def terminate_inactive_sessions(
+        self,
+        user_id: UUID,
+        inactive_days: int
+    ) -> int:
+        """Revoke a user's sessions inactive for the given number of days."""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=inactive_days)
+        sessions = await self.list_user_sessions(user_id, active_only=False)
+        inactive = tuple(s.id for s in sessions if s.last_activity_at < cutoff)
+        if not inactive:
+            return 0
+        return await self._revoke(user_id, session_ids=inactive)
@@ -0,0 +1,9 @@
+"""
+Failure Classification Infrastructure Module
+"""
+
+from .failure_classifier import FailureClassifier
+
+__all__ = [
+    "FailureClassifier",
+]
@@ -0,0 +1,272 @@
+"""
+Failure Classifier Implementation
+
+Classifies error messages into categories with one compiled pattern.
+
+All literal keywords are merged into one trie-shaped regex, so a message
+is classified in one scan instead of one substring search per keyword.
+Each search resumes just after the previous match's start, which finds
+the longest keyword at every position where one starts: overlapping
+keywords (``"connection timeout"`` and ``"timeout error"``) are all
+found, and keywords contained in a longer match (``"assert"`` inside
+``"assertionerror"``) are credited as well. That is the result of testing
+each keyword, as Aho-Corasick dictionary matching gives. Configured
+regexes are searched one by one.
+
+Category definitions can be loaded from a JSON or YAML file::
+
+    {
+        "timeout": ["timeout", "timed out", {"regex": "exceeded \\\\d+ ?ms"}],
+        "network": ["connection refused", "ECONNREFUSED"]
+    }
+"""
+
+import json
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+PatternSpec = Union[str, Mapping[str, str], "re.Pattern[str]"]
+
+
+class FailureClassifier:
+    """
+    Compiled multi-pattern classifier for failure messages.
+
+    Categories keep their declaration order: ``classify`` lists matched
+    categories in that order and ``primary`` returns the first of them.
+    Plain strings are matched literally; ``{"regex": ...}`` entries and
+    compiled patterns are matched as regular expressions.
+    """
+
+    def __init__(
+        self,
+        categories: Mapping[str, Sequence[PatternSpec]],
+        case_sensitive: bool = False,
+    ):
+        self.case_sensitive = case_sensitive
+        self._categories: List[str] = list(categories)
+        # Keyword ids per category, in declaration order
+        self._keywords: List[str] = []
+        self._category_keywords: List[List[int]] = []
+        # Regex specs with the keyword ids they report
+        alternatives: List[Tuple[str, int]] = []
+        literals: Dict[str, List[int]] = {}
+
+        for category in self._categories:
+            ids = []
+            for spec in categories[category]:
+                keyword_id = len(self._keywords)
+                if isinstance(spec, str):
+                    self._keywords.append(spec)
+                    literals.setdefault(self._fold(spec), []).append(keyword_id)
+                else:
+                    source = spec.pattern if isinstance(spec, re.Pattern) else spec["regex"]
+                    self._keywords.append(source)
+                    alternatives.append((source, keyword_id))
+                ids.append(keyword_id)
+            self._category_keywords.append(ids)
+        # Declaration rank of each keyword's category, for ``primary``
+        self._keyword_rank: List[int] = [
+            rank
+            for rank, ids in enumerate(self._category_keywords)
+            for _ in ids
+        ]
+
+        # Keywords credited by each literal: itself and every literal it contains
+        self._literal_implied: Dict[str, Tuple[int, ...]] = {
+            literal: tuple(
+                keyword_id
+                for other, keyword_ids in literals.items()
+                if other in literal
+                for keyword_id in keyword_ids
+            )
+            for literal in literals
+        }
+
+        # Literals are matched against folded text, regexes ignore case instead
+        flags = 0 if case_sensitive else re.IGNORECASE
+        self._regexes: List[Tuple["re.Pattern[str]", int]] = [
+            (re.compile(source, flags), keyword_id) for source, keyword_id in alternatives
+        ]
+        self._literal_pattern: Optional["re.Pattern[str]"] = None
+        if literals:
+            trie: Dict[str, Any] = {}
+            for literal in literals:
+                node = trie
+                for char in literal:
+                    node = node.setdefault(char, {})
+                node[""] = {}
+            # Greedy branches make every match the longest keyword at its start
+            self._literal_pattern = re.compile(_trie_pattern(trie))
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Mapping[str, Any],
+        section: Optional[str] = None,
+        case_sensitive: bool = False,
+    ) -> "FailureClassifier":
+        """
+        Build a classifier from a category mapping.
+
+        Args:
+            config: ``{category: [keyword | {"regex": pattern}, ...]}``
+            section: Optional top-level key holding the category mapping
+            case_sensitive: Match keywords case-sensitively
+
+        Returns:
+            Compiled classifier
+        """
+        categories = config[section] if section else config
+        if not isinstance(categories, Mapping):
+            raise ValueError("Failure classification config must map categories to patterns")
+        for category, specs in categories.items():
+            if isinstance(specs, (str, bytes)) or not isinstance(specs, Sequence):
+                raise ValueError(f"Patterns for category '{category}' must be a list")
+        return cls(categories, case_sensitive=case_sensitive)
+
+    @staticmethod
+    def load_config(path: Union[str, Path]) -> Dict[str, Any]:
+        """
+        Read a JSON or YAML classifier config file.
+
+        Args:
+            path: Config file (``.json``, ``.yaml`` or ``.yml``)
+
+        Returns:
+            Parsed config mapping
+        """
+        path = Path(path)
+        text = path.read_text(encoding="utf-8")
+        if path.suffix in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError as exc:
+                raise ImportError("PyYAML is required for YAML classifier configs") from exc
+            return yaml.safe_load(text) or {}
+        return json.loads(text)
+
+    @classmethod
+    def from_file(
+        cls,
+        path: Union[str, Path],
+        section: Optional[str] = None,
+        case_sensitive: bool = False,
+    ) -> "FailureClassifier":
+        """
+        Load categories from a JSON or YAML file.
+
+        Args:
+            path: Config file (``.json``, ``.yaml`` or ``.yml``)
+            section: Optional top-level key holding the category mapping
+            case_sensitive: Match keywords case-sensitively
+
+        Returns:
+            Compiled classifier
+        """
+        return cls.from_config(cls.load_config(path), section=section, case_sensitive=case_sensitive)
+
+    @property
+    def categories(self) -> List[str]:
+        """Category names in declaration order."""
+        return list(self._categories)
+
+    def _fold(self, text: str) -> str:
+        return text if self.case_sensitive else text.lower()
+
+    def _matched_keywords(self, text: Optional[str]) -> set:
+        if not text:
+            return set()
+        matched = set()
+        if self._literal_pattern is not None:
+            # Resume one character after each match start rather than after
+            # its end, so keywords overlapping a match are found as well
+            search = self._literal_pattern.search
+            literal_implied = self._literal_implied
+            folded = self._fold(text)
+            match = search(folded)
+            while match is not None:
+                matched.update(literal_implied[match.group()])
+                match = search(folded, match.start() + 1)
+        for regex, keyword_id in self._regexes:
+            if regex.search(text):
+                matched.add(keyword_id)
+        return matched
+
+    def classify(self, text: Optional[str]) -> Dict[str, List[str]]:
+        """
+        Classify one message.
+
+        Args:
+            text: Error message
+
+        Returns:
+            Matched keywords per category, categories in declaration order
+        """
+        matched = self._matched_keywords(text)
+        if not matched:
+            return {}
+        keywords = self._keywords
+        result = {}
+        for category, ids in zip(self._categories, self._category_keywords):
+            hits = [keywords[i] for i in ids if i in matched]
+            if hits:
+                result[category] = hits
+        return result
+
+    def primary(self, text: Optional[str], default: Optional[str] = None) -> Optional[str]:
+        """
+        First declared category matching the message.
+
+        Args:
+            text: Error message
+            default: Returned when nothing matches
+
+        Returns:
+            Category name or ``default``
+        """
+        matched = self._matched_keywords(text)
+        if not matched:
+            return default
+        rank = self._keyword_rank
+        return self._categories[min(rank[i] for i in matched)]
+
+    def classify_many(self, texts: Iterable[Optional[str]]) -> Iterator[Dict[str, List[str]]]:
+        """Classify messages lazily, one result per message."""
+        for text in texts:
+            yield self.classify(text)
+
+    def count(self, texts: Iterable[Optional[str]], default: str = "unknown") -> Counter:
+        """
+        Count messages by primary category in one streaming pass.
+
+        Args:
+            texts: Error messages
+            default: Bucket for messages matching no category
+
+        Returns:
+            Counter of primary categories
+        """
+        counts: Counter = Counter()
+        primary = self.primary
+        for text in texts:
+            counts[primary(text, default)] += 1
+        return counts
+
+
+def _trie_pattern(node: Dict[str, Any]) -> str:
+    """Regex matching the longest keyword of a character trie at a position."""
+    branches = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ""
+    is_end = "" in node
+    if len(branches) == 1 and not is_end:
+        return branches[0]
+    pattern = "(?:" + "|".join(branches) + ")"
+    return pattern + "?" if is_end else pattern
@@ -6,13 +6,13 @@ Analyzes root causes of test flakiness and provides recommendations.
 
 from typing import List, Dict, Any, Optional
 from collections import Counter
-import re
 
 from src.domain.flaky_detection.entities import TestRun
 from src.domain.flaky_detection.value_objects import (
     TestIdentifier,
     QuarantineReason,
 )
+from src.infrastructure.classification import FailureClassifier
 
 
 class RootCauseAnalyzer:
@@ -68,6 +68,22 @@ class RootCauseAnalyzer:
         ],
     }
     
+    _default_classifier: Optional[FailureClassifier] = None
+    
+    def __init__(self, classifier: Optional[FailureClassifier] = None):
+        """
+        Initialize the analyzer.
+        
+        Args:
+            classifier: Classifier keyed by QuarantineReason; defaults to
+                one compiled from PATTERNS and shared by all instances
+        """
+        if classifier is None:
+            if RootCauseAnalyzer._default_classifier is None:
+                RootCauseAnalyzer._default_classifier = FailureClassifier(self.PATTERNS)
+            classifier = RootCauseAnalyzer._default_classifier
+        self.classifier = classifier
+    
     def analyze(
         self,
         test_identifier: TestIdentifier,
@@ -144,25 +160,20 @@ class RootCauseAnalyzer:
         for run in runs:
             if not run.passed:
                 if run.error_message:
-                    errors.append(run.error_message.lower())
+                    errors.append(run.error_message)
                 if run.error_type:
-                    errors.append(run.error_type.lower())
+                    errors.append(run.error_type)
         
         if not errors:
             return {"race_condition_likelihood": 0, "external_dependency_likelihood": 0}
         
-        # Count pattern matches
+        # Count pattern matches, one classifier pass per error
         race_matches = []
         external_matches = []
         
-        for error in errors:
-            for pattern in self.PATTERNS.get(QuarantineReason.RACE_CONDITION, []):
-                if re.search(pattern, error, re.IGNORECASE):
-                    race_matches.append(pattern)
-            
-            for pattern in self.PATTERNS.get(QuarantineReason.EXTERNAL_DEPENDENCY, []):
-                if re.search(pattern, error, re.IGNORECASE):
-                    external_matches.append(pattern)
+        for matches in self.classifier.classify_many(errors):
+            race_matches.extend(matches.get(QuarantineReason.RACE_CONDITION, []))
+            external_matches.extend(matches.get(QuarantineReason.EXTERNAL_DEPENDENCY, []))
         
         race_likelihood = len(race_matches) / len(errors) if errors else 0
         external_likelihood = len(external_matches) / len(errors) if errors else 0
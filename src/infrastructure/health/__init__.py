@@ -4,6 +4,7 @@ Health Check Module for QA-FRAMEWORK
 This module provides comprehensive health checking capabilities for:
 - Database connectivity (PostgreSQL, MySQL, SQLite)
 - Redis cache connectivity
+- Pool saturation and checkout wait of the app's own engine and Redis pools
 - External API availability
 - Internal service status
 
@@ -12,6 +13,7 @@ Features:
 - Parallel or sequential health checks
 - Result caching
 - Detailed error reporting
+- Background scheduling with per-check intervals and O(1) probes
 - Kubernetes-compatible health probes
 - FastAPI integration
 
@@ -80,11 +82,16 @@ from src.infrastructure.health.models import (
     RedisHealthCheckConfig,
     ExternalAPIHealthCheckConfig,
     InternalServiceHealthCheckConfig,
+    PoolHealthThresholds,
+    EnginePoolHealthCheckConfig,
+    RedisPoolHealthCheckConfig,
 )
 from src.infrastructure.health.checks import (
     # Individual check functions
     check_database_health,
     check_redis_health,
+    check_engine_pool_health,
+    check_redis_pool_health,
     check_external_api_health,
     check_internal_service_health,
 )
@@ -95,6 +102,11 @@ from src.infrastructure.health.health_checker import (
     get_health_checker,
     set_health_checker,
 )
+from src.infrastructure.health.scheduler import (
+    # Background scheduling
+    CheckSchedule,
+    HealthScheduler,
+)
 from src.infrastructure.health.endpoint import (
     # FastAPI integration
     create_health_router,
@@ -113,15 +125,23 @@ __all__ = [
     "RedisHealthCheckConfig",
     "ExternalAPIHealthCheckConfig",
     "InternalServiceHealthCheckConfig",
+    "PoolHealthThresholds",
+    "EnginePoolHealthCheckConfig",
+    "RedisPoolHealthCheckConfig",
     # Check functions
     "check_database_health",
     "check_redis_health",
+    "check_engine_pool_health",
+    "check_redis_pool_health",
     "check_external_api_health",
     "check_internal_service_health",
     # Health checker
     "HealthChecker",
     "get_health_checker",
     "set_health_checker",
+    # Background scheduling
+    "CheckSchedule",
+    "HealthScheduler",
     # FastAPI integration
     "create_health_router",
     "HealthEndpointManager",
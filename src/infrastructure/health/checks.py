@@ -3,7 +3,7 @@
 import asyncio
 import time
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from src.infrastructure.health.models import (
     HealthCheckResult,
@@ -11,6 +11,9 @@ from src.infrastructure.health.models import (
     ServiceType,
     DatabaseHealthCheckConfig,
     RedisHealthCheckConfig,
+    EnginePoolHealthCheckConfig,
+    RedisPoolHealthCheckConfig,
+    PoolHealthThresholds,
     ExternalAPIHealthCheckConfig,
     InternalServiceHealthCheckConfig,
 )
@@ -380,6 +383,230 @@ async def check_redis_health(
     )
 
 
+def _pool_status(
+    metadata: Dict[str, Any],
+    checkout_wait_ms: Optional[float],
+    thresholds: PoolHealthThresholds,
+) -> Tuple[HealthStatus, Optional[str]]:
+    """Status of a pool from its saturation and the probe's checkout wait."""
+    saturation = metadata.get("saturation")
+    if saturation is not None and saturation >= thresholds.saturation_unhealthy:
+        return HealthStatus.UNHEALTHY, "pool_saturated"
+    if checkout_wait_ms is not None and checkout_wait_ms >= thresholds.checkout_wait_unhealthy_ms:
+        return HealthStatus.UNHEALTHY, "slow_checkout"
+    if saturation is not None and saturation >= thresholds.saturation_degraded:
+        return HealthStatus.DEGRADED, "pool_saturated"
+    if checkout_wait_ms is not None and checkout_wait_ms >= thresholds.checkout_wait_degraded_ms:
+        return HealthStatus.DEGRADED, "slow_checkout"
+    return HealthStatus.HEALTHY, None
+
+
+def _engine_pool_stats(pool: Any) -> Dict[str, Any]:
+    """Usage of an SQLAlchemy pool (only QueuePool-style pools have a capacity)."""
+    stats: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if not callable(getattr(pool, "checkedout", None)):
+        return stats
+    
+    pool_size = pool.size()
+    checked_out = pool.checkedout()
+    max_overflow = getattr(pool, "_max_overflow", 0)
+    stats.update({
+        "pool_size": pool_size,
+        "checked_out": checked_out,
+        "idle": pool.checkedin(),
+        # overflow() counts from -pool_size until the pool is full
+        "overflow_in_use": max(0, pool.overflow()),
+        "max_overflow": max_overflow,
+    })
+    if max_overflow >= 0 and pool_size + max_overflow > 0:
+        capacity = pool_size + max_overflow
+        stats["capacity"] = capacity
+        stats["saturation"] = round(checked_out / capacity, 3)
+    return stats
+
+
+def _redis_pool_stats(pool: Any) -> Dict[str, Any]:
+    """Usage of a redis-py connection pool (unbounded pools have no saturation)."""
+    in_use = len(getattr(pool, "_in_use_connections", ()))
+    max_connections = getattr(pool, "max_connections", None)
+    stats: Dict[str, Any] = {
+        "pool_class": type(pool).__name__,
+        "in_use": in_use,
+        "idle": len(getattr(pool, "_available_connections", ())),
+        "max_connections": max_connections,
+    }
+    # redis-py uses 2**31 as "no limit"
+    if max_connections and max_connections < 2 ** 31:
+        stats["saturation"] = round(in_use / max_connections, 3)
+    return stats
+
+
+def _borrow_sync_engine_connection(engine: Any, test_query: str) -> float:
+    """Check out a connection from a sync engine; returns the wait in ms."""
+    from sqlalchemy import text
+    
+    started = time.perf_counter()
+    with engine.connect() as conn:
+        checkout_wait_ms = (time.perf_counter() - started) * 1000
+        conn.execute(text(test_query))
+    return checkout_wait_ms
+
+
+async def _borrow_engine_connection(engine: Any, test_query: str) -> float:
+    """Check out a connection from an engine and run the test query; returns the wait in ms."""
+    if not hasattr(engine, "sync_engine"):
+        return await asyncio.to_thread(_borrow_sync_engine_connection, engine, test_query)
+    
+    from sqlalchemy import text
+    
+    started = time.perf_counter()
+    conn = await engine.connect().start()
+    checkout_wait_ms = (time.perf_counter() - started) * 1000
+    try:
+        await conn.execute(text(test_query))
+    finally:
+        await conn.close()
+    return checkout_wait_ms
+
+
+async def check_engine_pool_health(
+    config: EnginePoolHealthCheckConfig,
+    timeout_seconds: float = 5.0,
+) -> HealthCheckResult:
+    """
+    Check a database through the application's own SQLAlchemy engine.
+    
+    Borrows a connection from the engine's pool instead of opening a new
+    one, so the result reflects the pool requests actually use. Reports
+    saturation (connections checked out over pool capacity), overflow in
+    use and the probe's checkout wait, and degrades or fails on the
+    configured thresholds so the service goes unready before requests
+    start timing out on checkout. A pool already past the unhealthy
+    saturation threshold is not borrowed from.
+    
+    Args:
+        config: Engine pool health check configuration
+        timeout_seconds: Timeout for checkout and test query
+        
+    Returns:
+        HealthCheckResult with database pool status
+    """
+    start_time = time.time()
+    engine = config.engine
+    try:
+        service_type = ServiceType(engine.dialect.name)
+    except ValueError:
+        service_type = ServiceType.INTERNAL_SERVICE
+    metadata = _engine_pool_stats(engine.pool)
+    checkout_wait_ms: Optional[float] = None
+    error_details: Optional[str] = None
+    
+    status, error_type = _pool_status(metadata, None, config.thresholds)
+    if status == HealthStatus.UNHEALTHY:
+        error_details = (
+            f"{metadata['checked_out']} of {metadata['capacity']} connections checked out"
+        )
+    else:
+        try:
+            checkout_wait_ms = await asyncio.wait_for(
+                _borrow_engine_connection(engine, config.test_query),
+                timeout=timeout_seconds
+            )
+            metadata["checkout_wait_ms"] = round(checkout_wait_ms, 2)
+            status, error_type = _pool_status(metadata, checkout_wait_ms, config.thresholds)
+            if status == HealthStatus.UNHEALTHY:
+                error_details = f"Pooled connection checkout took {checkout_wait_ms:.0f} ms"
+            elif error_type:
+                metadata["degraded_reason"] = error_type
+        except asyncio.TimeoutError:
+            status = HealthStatus.UNHEALTHY
+            error_type = "checkout_timeout"
+            error_details = f"No pooled connection within {timeout_seconds}s"
+        except Exception as e:
+            status = HealthStatus.UNHEALTHY
+            error_type = type(e).__name__.lower()
+            error_details = str(e)
+    
+    return HealthCheckResult(
+        service_name=f"{config.name}_pool",
+        service_type=service_type,
+        status=status,
+        response_time_ms=round((time.time() - start_time) * 1000, 2),
+        error_details=error_details,
+        error_type=error_type if status == HealthStatus.UNHEALTHY else None,
+        metadata=metadata,
+    )
+
+
+async def check_redis_pool_health(
+    config: RedisPoolHealthCheckConfig,
+    timeout_seconds: float = 5.0,
+) -> HealthCheckResult:
+    """
+    Check Redis through the application's own connection pool.
+    
+    Borrows a pooled connection for a PING instead of opening a new
+    client. Reports connections in use, saturation for bounded pools and
+    the probe's checkout wait, with the same thresholds as
+    ``check_engine_pool_health``.
+    
+    Args:
+        config: Redis pool health check configuration
+        timeout_seconds: Timeout for checkout and PING
+        
+    Returns:
+        HealthCheckResult with Redis pool status
+    """
+    start_time = time.time()
+    pool = getattr(config.client, "connection_pool", config.client)
+    metadata = _redis_pool_stats(pool)
+    error_details: Optional[str] = None
+    
+    status, error_type = _pool_status(metadata, None, config.thresholds)
+    if status == HealthStatus.UNHEALTHY:
+        error_details = (
+            f"{metadata['in_use']} of {metadata['max_connections']} connections in use"
+        )
+    else:
+        async def ping() -> float:
+            started = time.perf_counter()
+            connection = await pool.get_connection("PING")
+            checkout_wait_ms = (time.perf_counter() - started) * 1000
+            try:
+                await connection.send_command("PING")
+                await connection.read_response()
+            finally:
+                await pool.release(connection)
+            return checkout_wait_ms
+        
+        try:
+            checkout_wait_ms = await asyncio.wait_for(ping(), timeout=timeout_seconds)
+            metadata["checkout_wait_ms"] = round(checkout_wait_ms, 2)
+            status, error_type = _pool_status(metadata, checkout_wait_ms, config.thresholds)
+            if status == HealthStatus.UNHEALTHY:
+                error_details = f"Pooled connection checkout took {checkout_wait_ms:.0f} ms"
+            elif error_type:
+                metadata["degraded_reason"] = error_type
+        except asyncio.TimeoutError:
+            status = HealthStatus.UNHEALTHY
+            error_type = "checkout_timeout"
+            error_details = f"No pooled connection within {timeout_seconds}s"
+        except Exception as e:
+            status = HealthStatus.UNHEALTHY
+            error_type = type(e).__name__.lower()
+            error_details = str(e)
+    
+    return HealthCheckResult(
+        service_name=f"{config.name}_pool",
+        service_type=ServiceType.REDIS,
+        status=status,
+        response_time_ms=round((time.time() - start_time) * 1000, 2),
+        error_details=error_details,
+        error_type=error_type if status == HealthStatus.UNHEALTHY else None,
+        metadata=metadata,
+    )
+
+
 async def check_external_api_health(
     config: ExternalAPIHealthCheckConfig,
 ) -> HealthCheckResult:
@@ -12,6 +12,7 @@ from src.infrastructure.health.models import (
     HealthCheckConfig,
     HealthStatus,
 )
+from src.infrastructure.health.scheduler import HealthScheduler
 
 
 def create_health_router(
@@ -21,6 +22,7 @@ def create_health_router(
     include_liveness: bool = True,
     include_readiness: bool = True,
     include_startup: bool = True,
+    scheduler: Optional[HealthScheduler] = None,
 ) -> APIRouter:
     """
     Create a FastAPI router with health check endpoints.
@@ -34,6 +36,8 @@ def create_health_router(
         include_liveness: Include /live endpoint
         include_readiness: Include /ready endpoint
         include_startup: Include /startup endpoint
+        scheduler: Background scheduler; when given, /ready and /status
+            serve its latest snapshot instead of running checks per request
         
     Returns:
         FastAPI router with health endpoints
@@ -62,6 +66,11 @@ def create_health_router(
         nonlocal startup_time
         startup_time = datetime.now(timezone.utc)
     
+    async def current_status() -> AggregatedHealthStatus:
+        if scheduler is not None:
+            return scheduler.snapshot()
+        return await checker.run_health_checks()
+    
     @router.get("/live", status_code=status.HTTP_200_OK)
     async def liveness_probe():
         """
@@ -88,7 +97,7 @@ def create_health_router(
         Checks all registered health services.
         If this fails, Kubernetes will remove the pod from the service.
         """
-        health_status = await checker.run_health_checks()
+        health_status = await current_status()
         
         if health_status.overall_status == HealthStatus.UNHEALTHY:
             raise HTTPException(
@@ -136,7 +145,7 @@ def create_health_router(
         
         Provides comprehensive health information about all components.
         """
-        health_status = await checker.run_health_checks()
+        health_status = await current_status()
         
         # Add system information
         system_info = _get_system_info()
@@ -160,7 +169,7 @@ def create_health_router(
         
         Returns information about what health checks are configured.
         """
-        return {
+        response = {
             "registered_checks": checker.get_registered_checks(),
             "config": {
                 "timeout_seconds": checker.config.timeout_seconds,
@@ -169,15 +178,21 @@ def create_health_router(
                 "parallel_checks": checker.config.parallel_checks,
             }
         }
+        if scheduler is not None:
+            response["scheduled"] = scheduler.get_check_stats()
+        return response
     
     @router.post("/invalidate-cache", status_code=status.HTTP_200_OK)
     async def invalidate_cache():
         """
         Invalidate health check cache.
         
-        Forces the next health check to run all checks.
+        Forces the next health check to run all checks. With a scheduler,
+        runs every check now.
         """
         checker.invalidate_cache()
+        if scheduler is not None:
+            await scheduler.refresh()
         return {"message": "Cache invalidated", "timestamp": datetime.now(timezone.utc).isoformat()}
     
     # Store startup function reference
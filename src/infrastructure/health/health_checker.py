@@ -3,7 +3,8 @@
 import asyncio
 import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Dict, List, Optional, Union
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 
 from src.infrastructure.health.models import (
     AggregatedHealthStatus,
@@ -15,10 +16,15 @@ from src.infrastructure.health.models import (
     RedisHealthCheckConfig,
     ExternalAPIHealthCheckConfig,
     InternalServiceHealthCheckConfig,
+    EnginePoolHealthCheckConfig,
+    RedisPoolHealthCheckConfig,
+    PoolHealthThresholds,
 )
 from src.infrastructure.health.checks import (
     check_database_health,
     check_redis_health,
+    check_engine_pool_health,
+    check_redis_pool_health,
     check_external_api_health,
     check_internal_service_health,
 )
@@ -76,6 +82,8 @@ class HealthChecker:
         # Registered health checks
         self._database_checks: Dict[str, DatabaseHealthCheckConfig] = {}
         self._redis_checks: Dict[str, RedisHealthCheckConfig] = {}
+        self._engine_pool_checks: Dict[str, EnginePoolHealthCheckConfig] = {}
+        self._redis_pool_checks: Dict[str, RedisPoolHealthCheckConfig] = {}
         self._external_api_checks: Dict[str, ExternalAPIHealthCheckConfig] = {}
         self._internal_service_checks: Dict[str, InternalServiceHealthCheckConfig] = {}
         self._custom_checks: Dict[str, Callable[[], HealthCheckResult]] = {}
@@ -141,6 +149,59 @@ class HealthChecker:
         self.logger.info(f"Added Redis health check: {name}")
         return self
     
+    def add_engine_pool_check(
+        self,
+        name: str,
+        engine: Any,
+        test_query: str = "SELECT 1",
+        thresholds: Optional[PoolHealthThresholds] = None,
+    ) -> "HealthChecker":
+        """
+        Add a database health check that borrows from the app's engine pool.
+        
+        Args:
+            name: Unique name for this check
+            engine: SQLAlchemy Engine or AsyncEngine used by the application
+            test_query: Query to test connectivity
+            thresholds: Saturation and checkout wait limits
+            
+        Returns:
+            Self for chaining
+        """
+        self._engine_pool_checks[name] = EnginePoolHealthCheckConfig(
+            name=name,
+            engine=engine,
+            test_query=test_query,
+            thresholds=thresholds or PoolHealthThresholds(),
+        )
+        self.logger.info(f"Added engine pool health check: {name}")
+        return self
+    
+    def add_redis_pool_check(
+        self,
+        name: str,
+        client: Any,
+        thresholds: Optional[PoolHealthThresholds] = None,
+    ) -> "HealthChecker":
+        """
+        Add a Redis health check that borrows from the app's connection pool.
+        
+        Args:
+            name: Unique name for this check
+            client: Async Redis client or ConnectionPool used by the application
+            thresholds: Saturation and checkout wait limits
+            
+        Returns:
+            Self for chaining
+        """
+        self._redis_pool_checks[name] = RedisPoolHealthCheckConfig(
+            name=name,
+            client=client,
+            thresholds=thresholds or PoolHealthThresholds(),
+        )
+        self.logger.info(f"Added Redis pool health check: {name}")
+        return self
+    
     def add_external_api_check(
         self,
         name: str,
@@ -239,6 +300,8 @@ class HealthChecker:
         for check_dict in [
             self._database_checks,
             self._redis_checks,
+            self._engine_pool_checks,
+            self._redis_pool_checks,
             self._external_api_checks,
             self._internal_service_checks,
             self._custom_checks,
@@ -264,6 +327,8 @@ class HealthChecker:
         """
         self._database_checks.clear()
         self._redis_checks.clear()
+        self._engine_pool_checks.clear()
+        self._redis_pool_checks.clear()
         self._external_api_checks.clear()
         self._internal_service_checks.clear()
         self._custom_checks.clear()
@@ -294,41 +359,9 @@ class HealthChecker:
         self.logger.info("Starting health checks...")
         
         # Prepare all check coroutines
-        check_tasks = []
-        check_names = []
-        
-        # Database checks
-        for name, config in self._database_checks.items():
-            check_tasks.append(self._run_with_retry(
-                check_database_health, config, self.config.timeout_seconds
-            ))
-            check_names.append(f"db:{name}")
-        
-        # Redis checks
-        for name, config in self._redis_checks.items():
-            check_tasks.append(self._run_with_retry(
-                check_redis_health, config, self.config.timeout_seconds
-            ))
-            check_names.append(f"redis:{name}")
-        
-        # External API checks
-        for name, config in self._external_api_checks.items():
-            check_tasks.append(self._run_with_retry(
-                check_external_api_health, config
-            ))
-            check_names.append(f"api:{name}")
-        
-        # Internal service checks
-        for name, config in self._internal_service_checks.items():
-            check_tasks.append(self._run_with_retry(
-                check_internal_service_health, config
-            ))
-            check_names.append(f"service:{name}")
-        
-        # Custom checks
-        for name, check_func in self._custom_checks.items():
-            check_tasks.append(self._run_custom_check(check_func))
-            check_names.append(f"custom:{name}")
+        runners = self.get_check_runners()
+        check_names = list(runners)
+        check_tasks = [runner() for runner in runners.values()]
         
         # Run checks
         if self.config.parallel_checks and check_tasks:
@@ -357,19 +390,9 @@ class HealthChecker:
             else:
                 health_results.append(result)
         
-        # Calculate overall status
-        overall_status = self._calculate_overall_status(health_results)
-        
-        # Build summary
-        summary = self._build_summary(health_results, time.time() - start_time)
-        
-        # Create aggregated status
-        aggregated = AggregatedHealthStatus(
-            overall_status=overall_status,
-            timestamp=datetime.now(timezone.utc),
-            checks=health_results,
-            summary=summary,
-        )
+        aggregated = self.aggregate(health_results, time.time() - start_time)
+        overall_status = aggregated.overall_status
+        summary = aggregated.summary
         
         # Cache results
         self._cached_results = aggregated
@@ -382,6 +405,65 @@ class HealthChecker:
         
         return aggregated
     
+    def get_check_runners(self) -> Dict[str, Callable[[], Awaitable[HealthCheckResult]]]:
+        """
+        Get a coroutine factory for every registered check.
+        
+        Returns:
+            Mapping of qualified check name (e.g. ``db:main_db``) to a
+            callable running that check with retries
+        """
+        runners: Dict[str, Callable[[], Awaitable[HealthCheckResult]]] = {}
+        for name, config in self._database_checks.items():
+            runners[f"db:{name}"] = partial(
+                self._run_with_retry, check_database_health, config, self.config.timeout_seconds
+            )
+        for name, config in self._redis_checks.items():
+            runners[f"redis:{name}"] = partial(
+                self._run_with_retry, check_redis_health, config, self.config.timeout_seconds
+            )
+        for name, config in self._engine_pool_checks.items():
+            runners[f"db_pool:{name}"] = partial(
+                check_engine_pool_health, config, self.config.timeout_seconds
+            )
+        for name, config in self._redis_pool_checks.items():
+            runners[f"redis_pool:{name}"] = partial(
+                check_redis_pool_health, config, self.config.timeout_seconds
+            )
+        for name, config in self._external_api_checks.items():
+            runners[f"api:{name}"] = partial(
+                self._run_with_retry, check_external_api_health, config
+            )
+        for name, config in self._internal_service_checks.items():
+            runners[f"service:{name}"] = partial(
+                self._run_with_retry, check_internal_service_health, config
+            )
+        for name, check_func in self._custom_checks.items():
+            runners[f"custom:{name}"] = partial(self._run_custom_check, check_func)
+        return runners
+    
+    def aggregate(
+        self,
+        results: List[HealthCheckResult],
+        total_time: float = 0.0,
+    ) -> AggregatedHealthStatus:
+        """
+        Combine individual results into an aggregated status.
+        
+        Args:
+            results: Individual check results
+            total_time: Seconds spent running the checks
+            
+        Returns:
+            AggregatedHealthStatus with overall status and summary
+        """
+        return AggregatedHealthStatus(
+            overall_status=self._calculate_overall_status(results),
+            timestamp=datetime.now(timezone.utc),
+            checks=results,
+            summary=self._build_summary(results, total_time),
+        )
+    
     async def _run_with_retry(
         self,
         check_func: Callable,
@@ -510,6 +592,8 @@ class HealthChecker:
         return {
             "database": list(self._database_checks.keys()),
             "redis": list(self._redis_checks.keys()),
+            "database_pool": list(self._engine_pool_checks.keys()),
+            "redis_pool": list(self._redis_pool_checks.keys()),
             "external_api": list(self._external_api_checks.keys()),
             "internal_service": list(self._internal_service_checks.keys()),
             "custom": list(self._custom_checks.keys()),
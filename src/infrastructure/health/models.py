@@ -117,6 +117,44 @@ class RedisHealthCheckConfig(BaseModel):
     socket_connect_timeout: float = Field(5.0, description="Connection timeout in seconds")
 
 
+class PoolHealthThresholds(BaseModel):
+    """Pool usage limits at which a pooled check degrades or fails"""
+    saturation_degraded: float = Field(
+        0.8,
+        description="Fraction of pool capacity checked out for degraded status"
+    )
+    saturation_unhealthy: float = Field(
+        0.95,
+        description="Fraction of pool capacity checked out for unhealthy status"
+    )
+    checkout_wait_degraded_ms: float = Field(
+        100.0,
+        description="Checkout wait for degraded status"
+    )
+    checkout_wait_unhealthy_ms: float = Field(
+        1000.0,
+        description="Checkout wait for unhealthy status"
+    )
+
+
+class EnginePoolHealthCheckConfig(BaseModel):
+    """Configuration for health checks borrowing from an SQLAlchemy engine"""
+    name: str = Field("database", description="Name of the engine")
+    engine: Any = Field(..., description="Application's Engine or AsyncEngine")
+    test_query: str = Field(
+        "SELECT 1",
+        description="Query to test database connectivity"
+    )
+    thresholds: PoolHealthThresholds = Field(default_factory=PoolHealthThresholds)
+
+
+class RedisPoolHealthCheckConfig(BaseModel):
+    """Configuration for health checks borrowing from a Redis connection pool"""
+    name: str = Field("redis", description="Name of the pool")
+    client: Any = Field(..., description="Application's async Redis client or ConnectionPool")
+    thresholds: PoolHealthThresholds = Field(default_factory=PoolHealthThresholds)
+
+
 class ExternalAPIHealthCheckConfig(BaseModel):
     """Configuration for external API health checks"""
     name: str = Field(..., description="Name of the external API")
@@ -0,0 +1,309 @@
+"""Background health check scheduler with per-check intervals"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from src.infrastructure.health.health_checker import HealthChecker
+from src.infrastructure.health.models import (
+    AggregatedHealthStatus,
+    HealthCheckResult,
+    HealthStatus,
+    ServiceType,
+)
+from src.infrastructure.logger.logger import QALogger
+
+
+class CheckSchedule(BaseModel):
+    """Schedule of one background health check"""
+    interval_seconds: float = Field(15.0, description="Seconds between runs")
+    timeout_seconds: float = Field(5.0, description="Timeout for one run, retries included")
+    stale_after_seconds: Optional[float] = Field(
+        None,
+        description="Age after which the last result is reported unhealthy "
+                    "(default: three intervals plus the timeout)"
+    )
+
+    @property
+    def staleness_budget(self) -> float:
+        """Seconds a result may be served before it counts as stale"""
+        if self.stale_after_seconds is not None:
+            return self.stale_after_seconds
+        return 3 * self.interval_seconds + self.timeout_seconds
+
+
+class _CheckState:
+    """Latest result and latency history of one check"""
+
+    __slots__ = ("result", "completed_at", "latencies", "runs", "failures", "consecutive_failures")
+
+    def __init__(self, history_size: int):
+        self.result: Optional[HealthCheckResult] = None
+        self.completed_at: Optional[float] = None
+        self.latencies: Deque[float] = deque(maxlen=history_size)
+        self.runs = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+
+
+class HealthScheduler:
+    """
+    Runs a HealthChecker's checks in the background, each on its own interval.
+
+    Probes read ``snapshot()``, which returns the aggregated status built
+    from the latest result of every check without running anything. The
+    snapshot is rebuilt when a check completes or when a result crosses its
+    staleness budget, so a probe costs a lookup and a timestamp comparison.
+    A slow check only delays its own next result; at most
+    ``max_concurrency`` checks run at once.
+
+    Checks that have not completed yet are reported as unknown; await
+    ``refresh()`` once at startup to run every check before serving probes.
+
+    Example:
+        checker = HealthChecker()
+        checker.add_database_check("main_db", "postgresql://...", ServiceType.DATABASE_POSTGRESQL)
+        checker.add_external_api_check("payments", "https://api.example.com/health")
+
+        scheduler = HealthScheduler(checker)
+        scheduler.configure_check("api:payments", interval_seconds=60, timeout_seconds=10)
+        await scheduler.refresh()
+        scheduler.start()
+
+        app.include_router(create_health_router(checker, scheduler=scheduler))
+    """
+
+    def __init__(
+        self,
+        checker: HealthChecker,
+        default_schedule: Optional[CheckSchedule] = None,
+        max_concurrency: int = 4,
+        history_size: int = 100,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            checker: Health checker whose registered checks are run
+            default_schedule: Schedule for checks without their own
+            max_concurrency: Maximum checks running at the same time
+            history_size: Latencies kept per check
+        """
+        self.checker = checker
+        self.default_schedule = default_schedule or CheckSchedule(
+            timeout_seconds=checker.config.timeout_seconds
+        )
+        self.max_concurrency = max_concurrency
+        self.history_size = history_size
+        self.logger = QALogger.get_logger("health-scheduler")
+
+        self._schedules: Dict[str, CheckSchedule] = {}
+        self._states: Dict[str, _CheckState] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._snapshot: Optional[AggregatedHealthStatus] = None
+        # Monotonic time at which some served result becomes stale
+        self._snapshot_valid_until = 0.0
+
+    def configure_check(
+        self,
+        name: str,
+        interval_seconds: Optional[float] = None,
+        timeout_seconds: Optional[float] = None,
+        stale_after_seconds: Optional[float] = None,
+    ) -> "HealthScheduler":
+        """
+        Set the schedule of one check.
+
+        Args:
+            name: Qualified check name (e.g. ``db:main_db``, ``api:payments``)
+            interval_seconds: Seconds between runs
+            timeout_seconds: Timeout for one run
+            stale_after_seconds: Staleness budget of its result
+
+        Returns:
+            Self for chaining
+        """
+        default = self.default_schedule
+        self._schedules[name] = CheckSchedule(
+            interval_seconds=interval_seconds if interval_seconds is not None else default.interval_seconds,
+            timeout_seconds=timeout_seconds if timeout_seconds is not None else default.timeout_seconds,
+            stale_after_seconds=stale_after_seconds,
+        )
+        return self
+
+    def get_schedule(self, name: str) -> CheckSchedule:
+        """Get the schedule of a check (default schedule if not configured)."""
+        return self._schedules.get(name, self.default_schedule)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def run_check(self, name: str) -> Optional[HealthCheckResult]:
+        """
+        Run one check now and record its result.
+
+        Args:
+            name: Qualified check name
+
+        Returns:
+            The result, or None if no such check is registered
+        """
+        runner = self.checker.get_check_runners().get(name)
+        if runner is None:
+            self._forget(name)
+            return None
+
+        schedule = self.get_schedule(name)
+        async with self._get_semaphore():
+            started = time.perf_counter()
+            try:
+                result = await asyncio.wait_for(runner(), timeout=schedule.timeout_seconds)
+            except asyncio.TimeoutError:
+                result = self._failure(
+                    name, f"Check timed out after {schedule.timeout_seconds}s", "timeout", started
+                )
+            except Exception as e:
+                result = self._failure(name, str(e), type(e).__name__.lower(), started)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+
+        state = self._states.get(name)
+        if state is None:
+            state = self._states[name] = _CheckState(self.history_size)
+        state.result = result
+        state.completed_at = time.monotonic()
+        state.latencies.append(elapsed_ms)
+        state.runs += 1
+        if result.status == HealthStatus.UNHEALTHY:
+            state.failures += 1
+            state.consecutive_failures += 1
+        else:
+            state.consecutive_failures = 0
+        self._snapshot = None
+        return result
+
+    @staticmethod
+    def _failure(name: str, message: str, error_type: str, started: float) -> HealthCheckResult:
+        return HealthCheckResult(
+            service_name=name,
+            service_type=ServiceType.INTERNAL_SERVICE,
+            status=HealthStatus.UNHEALTHY,
+            response_time_ms=(time.perf_counter() - started) * 1000,
+            error_details=message,
+            error_type=error_type,
+        )
+
+    def _forget(self, name: str) -> None:
+        if self._states.pop(name, None) is not None:
+            self._snapshot = None
+
+    async def refresh(self) -> AggregatedHealthStatus:
+        """Run every registered check now and return the new snapshot."""
+        names = list(self.checker.get_check_runners())
+        for name in list(self._states):
+            if name not in names:
+                self._forget(name)
+        await asyncio.gather(*(self.run_check(name) for name in names))
+        return self.snapshot()
+
+    def snapshot(self) -> AggregatedHealthStatus:
+        """
+        Latest aggregated status, without running any check.
+
+        Results older than their staleness budget are reported unhealthy
+        with ``error_type="stale"``; checks with no result yet are unknown.
+        """
+        now = time.monotonic()
+        if self._snapshot is None or now >= self._snapshot_valid_until:
+            self._snapshot = self._build_snapshot(now)
+        return self._snapshot
+
+    def _build_snapshot(self, now: float) -> AggregatedHealthStatus:
+        results: List[HealthCheckResult] = []
+        valid_until = float("inf")
+        for name in self.checker.get_check_runners():
+            state = self._states.get(name)
+            if state is None or state.result is None:
+                results.append(HealthCheckResult(
+                    service_name=name,
+                    service_type=ServiceType.INTERNAL_SERVICE,
+                    status=HealthStatus.UNKNOWN,
+                    response_time_ms=0,
+                    error_details="Check has not completed yet",
+                    error_type="pending",
+                ))
+                continue
+            stale_at = state.completed_at + self.get_schedule(name).staleness_budget
+            if now >= stale_at:
+                results.append(state.result.model_copy(update={
+                    "status": HealthStatus.UNHEALTHY,
+                    "error_details": f"Last result is {now - state.completed_at:.1f}s old",
+                    "error_type": "stale",
+                }))
+            else:
+                results.append(state.result)
+                valid_until = min(valid_until, stale_at)
+        self._snapshot_valid_until = valid_until
+        snapshot = self.checker.aggregate(results)
+        snapshot.summary["scheduled"] = True
+        return snapshot
+
+    @property
+    def is_running(self) -> bool:
+        """Check if any background check loop is running"""
+        return any(not task.done() for task in self._tasks.values())
+
+    def start(self) -> None:
+        """Start a background loop for every registered check."""
+        for name in self.checker.get_check_runners():
+            task = self._tasks.get(name)
+            if task is None or task.done():
+                self._tasks[name] = asyncio.create_task(self._run_loop(name))
+        self.logger.info(f"Health scheduler started ({len(self._tasks)} checks)")
+
+    async def stop(self) -> None:
+        """Stop all background check loops."""
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run_loop(self, name: str) -> None:
+        while True:
+            result = await self.run_check(name)
+            if result is None:
+                # Check was removed from the checker
+                self._tasks.pop(name, None)
+                return
+            await asyncio.sleep(self.get_schedule(name).interval_seconds)
+
+    def get_check_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Run counts and latency statistics per check"""
+        now = time.monotonic()
+        stats: Dict[str, Dict[str, Any]] = {}
+        for name, state in self._states.items():
+            latencies = sorted(state.latencies)
+            count = len(latencies)
+            schedule = self.get_schedule(name)
+            stats[name] = {
+                "interval_seconds": schedule.interval_seconds,
+                "timeout_seconds": schedule.timeout_seconds,
+                "stale_after_seconds": schedule.staleness_budget,
+                "status": state.result.status if state.result else HealthStatus.UNKNOWN,
+                "age_seconds": round(now - state.completed_at, 3) if state.completed_at else None,
+                "runs": state.runs,
+                "failures": state.failures,
+                "consecutive_failures": state.consecutive_failures,
+                "last_ms": round(state.latencies[-1], 2) if count else None,
+                "avg_ms": round(sum(latencies) / count, 2) if count else None,
+                "p50_ms": round(latencies[count // 2], 2) if count else None,
+                "p95_ms": round(latencies[min(count - 1, int(count * 0.95))], 2) if count else None,
+                "max_ms": round(latencies[-1], 2) if count else None,
+            }
+        return stats
@@ -5,6 +5,9 @@ from .tenant_repository import (
     SQLAlchemyTenantRepository,
     InMemoryTenantRepository
 )
+from .invalidating_cache import InvalidatingCache
+from .tenant_cache import TenantCache, get_tenant_cache
+from .role_permission_cache import RolePermissionCache, get_role_permission_cache
 from .role_repository import (
     RoleRepositoryInterface,
     SQLAlchemyRoleRepository,
@@ -15,6 +18,11 @@ __all__ = [
     "TenantRepositoryInterface",
     "SQLAlchemyTenantRepository",
     "InMemoryTenantRepository",
+    "InvalidatingCache",
+    "TenantCache",
+    "get_tenant_cache",
+    "RolePermissionCache",
+    "get_role_permission_cache",
     "RoleRepositoryInterface",
     "SQLAlchemyRoleRepository",
     "InMemoryRoleRepository"
@@ -0,0 +1,175 @@
+"""Invalidating Cache - Base for in-process caches kept coherent over Redis
+
+This module provides:
+1. LRU cache with a TTL per entry
+2. Invalidation broadcast to other workers over Redis pub/sub
+3. A listener that resubscribes after a lost connection, clearing the
+   cache since invalidations may have been missed meanwhile
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Returned by lookups that found nothing cached
+MISSING = object()
+
+
+class InvalidatingCache:
+    """
+    LRU cache whose entries expire after a TTL, invalidated across workers.
+
+    Subclasses publish invalidations with ``broadcast`` and apply the ones
+    received from other workers in ``on_invalidation``. Eviction, expiry and
+    invalidation all remove entries through ``_drop``, and subclasses that
+    index entries override ``_dropped`` and ``clear``.
+    """
+
+    name = "Cache"
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        redis_client: Any = None,
+        channel: str = "",
+        reconnect_delay: float = 5.0
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum cached keys (least recently used evicted)
+            redis_client: Async Redis client for invalidation broadcast
+            channel: Pub/sub channel for invalidations
+            reconnect_delay: Seconds before the listener resubscribes
+        """
+        self.max_entries = max_entries
+        self.redis_client = redis_client
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._listener: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def _lookup(self, key: Hashable) -> Any:
+        """Cached value for a key, or MISSING if absent or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return MISSING
+        deadline, value = entry
+        if deadline < time.monotonic():
+            self._drop(key)
+            self.misses += 1
+            return MISSING
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def _store(self, key: Hashable, value: Any, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._dropped(evicted)
+
+    def _drop(self, key: Hashable) -> None:
+        if self._entries.pop(key, None) is not None:
+            self._dropped(key)
+
+    def _dropped(self, key: Hashable) -> None:
+        """Called after an entry left the cache"""
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    async def broadcast(self, payload: Dict[str, Any]) -> None:
+        """Publish an invalidation to every subscribed worker."""
+        if self.redis_client is None:
+            return
+        try:
+            await self.redis_client.publish(self.channel, json.dumps(payload))
+        except Exception as e:
+            # Other workers drop the entries when their TTL runs out
+            logger.warning(f"{self.name} invalidation broadcast failed: {e}")
+
+    def on_invalidation(self, payload: Dict[str, Any]) -> None:
+        """Apply an invalidation received from another worker."""
+        raise NotImplementedError
+
+    @property
+    def is_listening(self) -> bool:
+        """Check if the invalidation listener is running"""
+        return self._listener is not None and not self._listener.done()
+
+    def start(self) -> None:
+        """Subscribe to invalidations from other workers."""
+        if self.redis_client is None or self.is_listening:
+            return
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop listening for invalidations."""
+        if self._listener is None:
+            return
+        self._listener.cancel()
+        try:
+            await self._listener
+        except (asyncio.CancelledError, Exception):
+            pass
+        self._listener = None
+
+    async def _listen(self) -> None:
+        reconnecting = False
+        while True:
+            pubsub = self.redis_client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                if reconnecting:
+                    # Invalidations published while disconnected were missed
+                    self.clear()
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    data = message["data"]
+                    if isinstance(data, bytes):
+                        data = data.decode()
+                    try:
+                        payload = json.loads(data)
+                    except ValueError:
+                        continue
+                    self.on_invalidation(payload)
+                logger.warning(f"{self.name} invalidation subscription ended")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"{self.name} invalidation listener failed: {e}")
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+            # Entries may be stale until the listener is back
+            self.clear()
+            reconnecting = True
+            await asyncio.sleep(self.reconnect_delay)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,146 @@
+"""Role Permission Cache - Compiled permission sets per role combination
+
+This module provides:
+1. LRU cache of CompiledPermissions keyed by (tenant, roles and their permissions)
+2. Invalidation by role or tenant when roles change
+3. Invalidation broadcast to other workers over Redis pub/sub
+"""
+
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Set, Tuple, Union
+from uuid import UUID
+
+from src.domain.entities.permission import (
+    CompiledPermissions,
+    PermissionRegistry,
+    PERMISSION_REGISTRY
+)
+from src.domain.entities.role import Role
+from src.infrastructure.persistence.invalidating_cache import MISSING, InvalidatingCache
+
+
+INVALIDATION_CHANNEL = "roles:invalidated"
+
+CacheKey = Tuple[Optional[UUID], FrozenSet[Tuple[UUID, Tuple[str, ...]]]]
+
+
+class RolePermissionCache(InvalidatingCache):
+    """
+    LRU cache mapping a user's role combination to its compiled permissions.
+
+    Entries are keyed by tenant and each role's ID together with its
+    permissions, so a role whose permissions changed compiles a new entry
+    instead of being served the old set. Repository updates invalidate
+    every combination containing the role, which frees the superseded
+    entries here and on other workers; the TTL bounds how long those live
+    when an invalidation is missed.
+    """
+
+    name = "Role"
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        max_entries: int = 10_000,
+        registry: PermissionRegistry = PERMISSION_REGISTRY,
+        redis_client: Any = None,
+        channel: str = INVALIDATION_CHANNEL
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            ttl: Seconds a compiled permission set is served from cache
+            max_entries: Maximum cached role combinations (least recently used evicted)
+            registry: Registry assigning permission bits
+            redis_client: Async Redis client for invalidation broadcast
+            channel: Pub/sub channel for invalidations
+        """
+        super().__init__(max_entries, redis_client, channel)
+        self.ttl = ttl
+        self.registry = registry
+        self._by_role: Dict[UUID, Set[CacheKey]] = {}
+
+    @staticmethod
+    def _key(roles: Iterable[Role]) -> CacheKey:
+        # UUIDs hash far faster than they format, so keys keep them as is
+        tenant_id = next((role.tenant_id for role in roles if role.tenant_id), None)
+        return (tenant_id, frozenset([(role.id, tuple(role.permissions)) for role in roles]))
+
+    def get_permissions(self, roles: Iterable[Role]) -> CompiledPermissions:
+        """
+        Compiled union of the permissions of a set of roles.
+
+        Args:
+            roles: Roles of the current user
+
+        Returns:
+            Compiled permission set
+        """
+        roles = list(roles)
+        key = self._key(roles)
+        compiled = self._lookup(key)
+        if compiled is not MISSING:
+            return compiled
+
+        compiled = CompiledPermissions(
+            (grant for role in roles for grant in role.permissions),
+            self.registry
+        )
+        for role_id, _ in key[1]:
+            self._by_role.setdefault(role_id, set()).add(key)
+        self._store(key, compiled, self.ttl)
+        return compiled
+
+    def _dropped(self, key: CacheKey) -> None:
+        for role_id, _ in key[1]:
+            keys = self._by_role.get(role_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_role[role_id]
+
+    def invalidate_role(self, role_id: Union[UUID, str]) -> None:
+        """Drop every cached combination containing a role."""
+        if isinstance(role_id, str):
+            role_id = UUID(role_id)
+        for key in list(self._by_role.get(role_id, ())):
+            self._drop(key)
+        self.invalidations += 1
+
+    def invalidate_tenant(self, tenant_id: Union[UUID, str]) -> None:
+        """Drop every cached combination of a tenant."""
+        if isinstance(tenant_id, str):
+            tenant_id = UUID(tenant_id)
+        for key in [key for key in self._entries if key[0] == tenant_id]:
+            self._drop(key)
+        self.invalidations += 1
+
+    async def broadcast_invalidation(self, role_id: Union[UUID, str]) -> None:
+        """Invalidate a role here and on every subscribed worker."""
+        self.invalidate_role(role_id)
+        await self.broadcast({"role_id": str(role_id)})
+
+    def on_invalidation(self, payload: Dict[str, Any]) -> None:
+        """Apply an invalidation received from another worker."""
+        if payload.get("role_id"):
+            self.invalidate_role(payload["role_id"])
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        super().clear()
+        self._by_role.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        return {**super().get_stats(), "registered_permissions": len(self.registry)}
+
+
+_default_cache: Optional[RolePermissionCache] = None
+
+
+def get_role_permission_cache() -> RolePermissionCache:
+    """Get the process-wide role permission cache shared by RBAC checks and repository."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = RolePermissionCache()
+    return _default_cache
@@ -12,6 +12,10 @@ from typing import Optional, List
 from uuid import UUID
 
 from src.domain.entities.role import Role
+from src.infrastructure.persistence.role_permission_cache import (
+    RolePermissionCache,
+    get_role_permission_cache
+)
 
 
 class RoleRepositoryInterface(ABC):
@@ -135,16 +139,19 @@ class SQLAlchemyRoleRepository(RoleRepositoryInterface):
     SQLAlchemy implementation of RoleRepositoryInterface.
     
     This implementation uses async SQLAlchemy sessions for database operations.
+    Updates and deletes invalidate the role's compiled permission sets.
     """
     
-    def __init__(self, session):
+    def __init__(self, session, cache: Optional[RolePermissionCache] = None):
         """
         Initialize repository with database session.
         
         Args:
             session: AsyncSession instance from SQLAlchemy
+            cache: Compiled permission cache to invalidate (shared cache by default)
         """
         self.session = session
+        self.cache = cache if cache is not None else get_role_permission_cache()
     
     async def create(self, role: Role) -> Role:
         """Create a new role in the database"""
@@ -247,6 +254,7 @@ class SQLAlchemyRoleRepository(RoleRepositoryInterface):
         
         await self.session.commit()
         await self.session.refresh(db_role)
+        await self.cache.broadcast_invalidation(role.id)
         
         return self._map_to_entity(db_role)
     
@@ -264,6 +272,7 @@ class SQLAlchemyRoleRepository(RoleRepositoryInterface):
         
         await self.session.delete(db_role)
         await self.session.commit()
+        await self.cache.broadcast_invalidation(role_id)
         
         return True
     
@@ -307,11 +316,18 @@ class InMemoryRoleRepository(RoleRepositoryInterface):
     In-memory implementation of RoleRepositoryInterface for testing.
     
     This implementation stores roles in memory and is useful for unit tests.
+    Updates and deletes invalidate the role's compiled permission sets.
     """
     
-    def __init__(self):
-        """Initialize in-memory storage"""
+    def __init__(self, cache: Optional[RolePermissionCache] = None):
+        """
+        Initialize in-memory storage.
+        
+        Args:
+            cache: Compiled permission cache to invalidate (shared cache by default)
+        """
         self._roles: dict = {}
+        self.cache = cache if cache is not None else get_role_permission_cache()
     
     async def create(self, role: Role) -> Role:
         """Create role in memory"""
@@ -346,6 +362,7 @@ class InMemoryRoleRepository(RoleRepositoryInterface):
         if role.id not in self._roles:
             raise ValueError(f"Role with id {role.id} not found")
         self._roles[role.id] = role
+        await self.cache.broadcast_invalidation(role.id)
         return role
     
     async def delete(self, role_id: UUID) -> bool:
@@ -353,6 +370,7 @@ class InMemoryRoleRepository(RoleRepositoryInterface):
         if role_id not in self._roles:
             return False
         del self._roles[role_id]
+        await self.cache.broadcast_invalidation(role_id)
         return True
     
     async def create_default_roles(self, tenant_id: UUID) -> List[Role]:
@@ -0,0 +1,152 @@
+"""Tenant Cache - Bounded in-process cache for tenant resolution
+
+This module provides:
+1. LRU cache of tenants by ID and slug with a TTL
+2. Negative caching of unknown IDs/slugs (shorter TTL)
+3. Invalidation broadcast to other workers over Redis pub/sub
+"""
+
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+from uuid import UUID
+
+from src.domain.entities.tenant import Tenant
+from src.infrastructure.persistence.invalidating_cache import MISSING, InvalidatingCache
+
+
+INVALIDATION_CHANNEL = "tenants:invalidated"
+
+class TenantCache(InvalidatingCache):
+    """
+    LRU cache mapping tenant IDs and slugs to tenants.
+
+    Found tenants are kept for ``ttl`` seconds and unknown IDs/slugs for
+    ``negative_ttl`` seconds; a cached unknown is returned as None. Repository
+    writes invalidate entries locally and, when a Redis client is
+    configured, on every worker subscribed through ``start()``; the TTL
+    bounds staleness if a message is missed.
+    """
+
+    name = "Tenant"
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        negative_ttl: float = 10.0,
+        max_entries: int = 10_000,
+        redis_client: Any = None,
+        channel: str = INVALIDATION_CHANNEL
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            ttl: Seconds a resolved tenant is served from cache
+            negative_ttl: Seconds an unknown ID/slug is remembered
+            max_entries: Maximum cached keys (least recently used evicted)
+            redis_client: Async Redis client for invalidation broadcast
+            channel: Pub/sub channel for invalidations
+        """
+        super().__init__(max_entries, redis_client, channel)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.negative_hits = 0
+
+    @staticmethod
+    def _id_key(tenant_id: Union[UUID, str]) -> Tuple[str, str]:
+        return ("id", str(tenant_id))
+
+    @staticmethod
+    def _slug_key(slug: str) -> Tuple[str, str]:
+        return ("slug", slug)
+
+    def _lookup(self, key: Tuple[str, str]) -> Any:
+        tenant = super()._lookup(key)
+        if tenant is None:
+            self.negative_hits += 1
+        return tenant
+
+    def get_by_id(self, tenant_id: Union[UUID, str]) -> Any:
+        """
+        Cached tenant for an ID.
+
+        Returns:
+            Tenant, None for a cached unknown ID, or MISSING
+        """
+        return self._lookup(self._id_key(tenant_id))
+
+    def get_by_slug(self, slug: str) -> Any:
+        """
+        Cached tenant for a slug.
+
+        Returns:
+            Tenant, None for a cached unknown slug, or MISSING
+        """
+        return self._lookup(self._slug_key(slug))
+
+    def put(self, tenant: Tenant) -> None:
+        """Cache a tenant under both its ID and slug."""
+        self._store(self._id_key(tenant.id), tenant, self.ttl)
+        self._store(self._slug_key(tenant.slug), tenant, self.ttl)
+
+    def put_missing_id(self, tenant_id: Union[UUID, str]) -> None:
+        """Remember that no tenant has this ID."""
+        self._store(self._id_key(tenant_id), None, self.negative_ttl)
+
+    def put_missing_slug(self, slug: str) -> None:
+        """Remember that no tenant has this slug."""
+        self._store(self._slug_key(slug), None, self.negative_ttl)
+
+    def invalidate(
+        self,
+        tenant_id: Optional[Union[UUID, str]] = None,
+        slugs: Iterable[Optional[str]] = ()
+    ) -> None:
+        """
+        Drop a tenant's entries from this worker's cache.
+
+        Args:
+            tenant_id: Tenant ID
+            slugs: Slugs the tenant was (or is now) known by
+        """
+        keys = [self._slug_key(slug) for slug in slugs if slug]
+        if tenant_id is not None:
+            id_key = self._id_key(tenant_id)
+            entry = self._entries.get(id_key)
+            if entry is not None and entry[1] is not None:
+                keys.append(self._slug_key(entry[1].slug))
+            keys.append(id_key)
+        for key in keys:
+            self._drop(key)
+        self.invalidations += 1
+
+    async def broadcast_invalidation(
+        self,
+        tenant_id: Optional[Union[UUID, str]] = None,
+        slugs: Iterable[Optional[str]] = ()
+    ) -> None:
+        """Invalidate here and on every subscribed worker."""
+        slugs = list(slugs)
+        self.invalidate(tenant_id, slugs)
+        await self.broadcast({
+            "tenant_id": str(tenant_id) if tenant_id is not None else None,
+            "slugs": [slug for slug in slugs if slug],
+        })
+
+    def on_invalidation(self, payload: Dict[str, Any]) -> None:
+        """Apply an invalidation received from another worker."""
+        self.invalidate(payload.get("tenant_id"), payload.get("slugs", []))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        return {**super().get_stats(), "negative_hits": self.negative_hits}
+
+
+_default_cache: Optional[TenantCache] = None
+
+
+def get_tenant_cache() -> TenantCache:
+    """Get the process-wide tenant cache shared by middleware and repository."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = TenantCache()
+    return _default_cache
@@ -11,6 +11,7 @@ from typing import Optional, List
 from uuid import UUID
 
 from src.domain.entities.tenant import Tenant, TenantPlan, TenantStatus
+from src.infrastructure.persistence.tenant_cache import TenantCache, get_tenant_cache
 
 
 class TenantRepositoryInterface(ABC):
@@ -119,16 +120,19 @@ class SQLAlchemyTenantRepository(TenantRepositoryInterface):
     SQLAlchemy implementation of TenantRepositoryInterface.
     
     This implementation uses async SQLAlchemy sessions for database operations.
+    Creates, updates and deletes invalidate the tenant in the resolution cache.
     """
     
-    def __init__(self, session):
+    def __init__(self, session, cache: Optional[TenantCache] = None):
         """
         Initialize repository with database session.
         
         Args:
             session: AsyncSession instance from SQLAlchemy
+            cache: Tenant resolution cache to invalidate (shared cache by default)
         """
         self.session = session
+        self.cache = cache if cache is not None else get_tenant_cache()
     
     async def create(self, tenant: Tenant) -> Tenant:
         """Create a new tenant in the database"""
@@ -149,6 +153,8 @@ class SQLAlchemyTenantRepository(TenantRepositoryInterface):
         self.session.add(db_tenant)
         await self.session.commit()
         await self.session.refresh(db_tenant)
+        # Drop negative slug entries cached before the tenant existed
+        await self.cache.broadcast_invalidation(tenant.id, [tenant.slug])
         
         return self._map_to_entity(db_tenant)
     
@@ -192,6 +198,8 @@ class SQLAlchemyTenantRepository(TenantRepositoryInterface):
         if db_tenant is None:
             raise ValueError(f"Tenant with id {tenant.id} not found")
         
+        previous_slug = db_tenant.slug
+        
         # Update fields
         db_tenant.name = tenant.name
         db_tenant.slug = tenant.slug
@@ -202,6 +210,7 @@ class SQLAlchemyTenantRepository(TenantRepositoryInterface):
         
         await self.session.commit()
         await self.session.refresh(db_tenant)
+        await self.cache.broadcast_invalidation(tenant.id, [previous_slug, tenant.slug])
         
         return self._map_to_entity(db_tenant)
     
@@ -217,8 +226,10 @@ class SQLAlchemyTenantRepository(TenantRepositoryInterface):
         if db_tenant is None:
             return False
         
+        slug = db_tenant.slug
         await self.session.delete(db_tenant)
         await self.session.commit()
+        await self.cache.broadcast_invalidation(tenant_id, [slug])
         
         return True
     
@@ -3,10 +3,13 @@ Connection tracking and draining functionality
 """
 
 import asyncio
-import uuid
-from collections import defaultdict
+import itertools
+import math
+import time
+from bisect import bisect_right
+from collections import deque
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional
 
 from src.infrastructure.shutdown.models import (
     ConnectionInfo,
@@ -19,6 +22,30 @@ from src.infrastructure.logger.logger import QALogger
 logger = QALogger.get_logger(__name__)
 
 
+class _TrackedConnection:
+    """Minimal per-connection state kept on the request path"""
+    
+    __slots__ = ("connection_id", "resource_type", "created_at", "request_starts", "info")
+    
+    def __init__(self, connection_id: str, resource_type: ResourceType, info: Optional[ConnectionInfo]):
+        self.connection_id = connection_id
+        self.resource_type = resource_type
+        self.created_at = time.time()
+        # Monotonic start times of in-flight requests, oldest first
+        self.request_starts: List[float] = []
+        self.info = info
+    
+    def to_info(self) -> ConnectionInfo:
+        """ConnectionInfo view (metadata only when details are tracked)"""
+        info = self.info or ConnectionInfo(
+            connection_id=self.connection_id,
+            resource_type=self.resource_type,
+            created_at=datetime.fromtimestamp(self.created_at),
+        )
+        info.request_count = len(self.request_starts)
+        return info
+
+
 class ConnectionTracker:
     """
     Tracks active connections and requests.
@@ -28,16 +55,71 @@ class ConnectionTracker:
     - Request tracking per connection
     - Connection draining with timeout
     - Connection statistics
+    
+    Counts are kept per resource type and updated without awaiting, so on
+    the event loop every update is atomic and no lock is taken on the
+    request path. ConnectionInfo objects and connection metadata are only
+    stored with ``config.track_connection_details``.
+    
+    Completed request durations are sampled so ``estimate_drain_time()``
+    can predict how long in-flight requests still need, which adaptive
+    draining uses to size the drain timeout.
     """
     
     def __init__(self, config: Optional[ShutdownConfig] = None):
         self.config = config or ShutdownConfig()
-        self._connections: Dict[str, ConnectionInfo] = {}
-        self._connections_by_type: Dict[ResourceType, List[str]] = defaultdict(list)
-        self._request_counter: Dict[str, int] = defaultdict(int)
-        self._lock = asyncio.Lock()
+        self.track_details = self.config.track_connection_details
+        self._connections: Dict[str, _TrackedConnection] = {}
+        self._active_by_type: Dict[ResourceType, int] = {rt: 0 for rt in ResourceType}
+        self._in_flight_by_type: Dict[ResourceType, int] = {rt: 0 for rt in ResourceType}
+        self._in_flight = 0
+        self._durations: Deque[float] = deque(maxlen=self.config.duration_sample_size)
+        self._ids = itertools.count(1)
+        self._drained: Optional[asyncio.Event] = None
         self._is_accepting_new = True
+    
+    def begin_request(
+        self,
+        resource_type: ResourceType,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Register a connection and start one request on it.
+        
+        Synchronous equivalent of ``register_connection`` followed by
+        ``start_request``, for per-request middleware.
+        
+        Args:
+            resource_type: Type of resource
+            metadata: Optional metadata (kept only when tracking details)
+        
+        Returns:
+            Connection ID
+        
+        Raises:
+            RuntimeError: If not accepting new connections
+        """
+        conn_id = self._register(resource_type, None, metadata)
+        self._start(self._connections[conn_id])
+        return conn_id
+    
+    def finish_request(self, connection_id: str) -> bool:
+        """
+        End the request started by ``begin_request`` and deregister its connection.
+        
+        Args:
+            connection_id: Connection ID
         
+        Returns:
+            True if the connection was tracked
+        """
+        conn = self._connections.get(connection_id)
+        if conn is None:
+            return False
+        self._end(conn)
+        self._deregister(conn)
+        return True
+    
     async def register_connection(
         self,
         resource_type: ResourceType,
@@ -50,21 +132,30 @@ class ConnectionTracker:
         Args:
             resource_type: Type of resource (DATABASE, REDIS, HTTP_CLIENT, etc.)
             connection_id: Optional custom connection ID (auto-generated if not provided)
-            metadata: Optional metadata about the connection
-            
+            metadata: Optional metadata about the connection (kept only when tracking details)
+        
         Returns:
             Connection ID
-            
+        
         Raises:
             RuntimeError: If not accepting new connections
         """
-        async with self._lock:
-            if not self._is_accepting_new:
-                raise RuntimeError("Not accepting new connections - shutdown in progress")
-            
-            conn_id = connection_id or f"{resource_type.value}_{uuid.uuid4().hex[:8]}"
-            
-            conn_info = ConnectionInfo(
+        return self._register(resource_type, connection_id, metadata)
+    
+    def _register(
+        self,
+        resource_type: ResourceType,
+        connection_id: Optional[str],
+        metadata: Optional[Dict[str, Any]]
+    ) -> str:
+        if not self._is_accepting_new:
+            raise RuntimeError("Not accepting new connections - shutdown in progress")
+        
+        conn_id = connection_id or f"{resource_type.value}_{next(self._ids):08x}"
+        
+        info = None
+        if self.track_details:
+            info = ConnectionInfo(
                 connection_id=conn_id,
                 resource_type=resource_type,
                 created_at=datetime.now(),
@@ -72,47 +163,52 @@ class ConnectionTracker:
                 request_count=0,
                 is_active=True
             )
-            
-            self._connections[conn_id] = conn_info
-            self._connections_by_type[resource_type].append(conn_id)
-            
             logger.debug(f"Connection registered: connection_id={conn_id}, resource_type={resource_type.value}")
-            
-            return conn_id
+        
+        previous = self._connections.get(conn_id)
+        if previous is not None:
+            self._deregister(previous)
+        self._connections[conn_id] = _TrackedConnection(conn_id, resource_type, info)
+        self._active_by_type[resource_type] += 1
+        
+        return conn_id
     
     async def deregister_connection(self, connection_id: str) -> bool:
         """
         Deregister a connection.
         
+        Requests still in flight on it are no longer counted.
+        
         Args:
             connection_id: ID of connection to deregister
-            
+        
         Returns:
             True if connection was deregistered, False if not found
         """
-        async with self._lock:
-            conn_info = self._connections.get(connection_id)
-            if not conn_info:
-                logger.warning(f"Attempted to deregister unknown connection: connection_id={connection_id}")
-                return False
-            
-            conn_info.is_active = False
-            
-            # Remove from type index
-            type_list = self._connections_by_type[conn_info.resource_type]
-            if connection_id in type_list:
-                type_list.remove(connection_id)
-            
-            # Remove from main dict
-            del self._connections[connection_id]
-            
-            # Clean up request counter
-            if connection_id in self._request_counter:
-                del self._request_counter[connection_id]
-            
-            logger.debug(f"Connection deregistered: connection_id={connection_id}, resource_type={conn_info.resource_type.value}")
-            
-            return True
+        conn = self._connections.get(connection_id)
+        if conn is None:
+            logger.warning(f"Attempted to deregister unknown connection: connection_id={connection_id}")
+            return False
+        
+        self._deregister(conn)
+        
+        if self.track_details:
+            logger.debug(f"Connection deregistered: connection_id={connection_id}, resource_type={conn.resource_type.value}")
+        
+        return True
+    
+    def _deregister(self, conn: _TrackedConnection) -> None:
+        del self._connections[conn.connection_id]
+        self._active_by_type[conn.resource_type] -= 1
+        abandoned = len(conn.request_starts)
+        if abandoned:
+            conn.request_starts.clear()
+            self._in_flight_by_type[conn.resource_type] -= abandoned
+            self._in_flight -= abandoned
+            self._notify_if_drained()
+        if conn.info is not None:
+            conn.info.is_active = False
+            conn.info.request_count = 0
     
     async def start_request(self, connection_id: str) -> bool:
         """
@@ -120,19 +216,22 @@ class ConnectionTracker:
         
         Args:
             connection_id: Connection ID
-            
+        
         Returns:
             True if request was tracked, False if connection not found
         """
-        async with self._lock:
-            conn_info = self._connections.get(connection_id)
-            if not conn_info or not conn_info.is_active:
-                return False
-            
-            self._request_counter[connection_id] += 1
-            conn_info.request_count = self._request_counter[connection_id]
-            
-            return True
+        conn = self._connections.get(connection_id)
+        if conn is None:
+            return False
+        self._start(conn)
+        return True
+    
+    def _start(self, conn: _TrackedConnection) -> None:
+        conn.request_starts.append(time.monotonic())
+        self._in_flight_by_type[conn.resource_type] += 1
+        self._in_flight += 1
+        if conn.info is not None:
+            conn.info.request_count = len(conn.request_starts)
     
     async def end_request(self, connection_id: str) -> bool:
         """
@@ -140,20 +239,29 @@ class ConnectionTracker:
         
         Args:
             connection_id: Connection ID
-            
+        
         Returns:
             True if request was tracked, False if connection not found
         """
-        async with self._lock:
-            conn_info = self._connections.get(connection_id)
-            if not conn_info:
-                return False
-            
-            if self._request_counter[connection_id] > 0:
-                self._request_counter[connection_id] -= 1
-                conn_info.request_count = self._request_counter[connection_id]
-            
-            return True
+        conn = self._connections.get(connection_id)
+        if conn is None:
+            return False
+        self._end(conn)
+        return True
+    
+    def _end(self, conn: _TrackedConnection) -> None:
+        if not conn.request_starts:
+            return
+        self._durations.append(time.monotonic() - conn.request_starts.pop(0))
+        self._in_flight_by_type[conn.resource_type] -= 1
+        self._in_flight -= 1
+        if conn.info is not None:
+            conn.info.request_count = len(conn.request_starts)
+        self._notify_if_drained()
+    
+    def _notify_if_drained(self) -> None:
+        if self._in_flight == 0 and self._drained is not None:
+            self._drained.set()
     
     def stop_accepting_new(self):
         """
@@ -168,48 +276,93 @@ class ConnectionTracker:
         """Check if accepting new connections"""
         return self._is_accepting_new
     
+    @property
+    def in_flight(self) -> int:
+        """Requests currently in flight"""
+        return self._in_flight
+    
     async def get_active_connections_count(self) -> int:
         """Get count of active connections"""
-        async with self._lock:
-            return len([c for c in self._connections.values() if c.is_active])
+        return len(self._connections)
     
     async def get_in_flight_requests_count(self) -> int:
         """Get total count of in-flight requests"""
-        async with self._lock:
-            return sum(self._request_counter.values())
+        return self._in_flight
     
     async def get_connections_by_type(self, resource_type: ResourceType) -> List[ConnectionInfo]:
         """Get all connections of a specific type"""
-        async with self._lock:
-            conn_ids = self._connections_by_type.get(resource_type, [])
-            return [
-                self._connections[cid]
-                for cid in conn_ids
-                if cid in self._connections and self._connections[cid].is_active
-            ]
+        return [
+            conn.to_info()
+            for conn in self._connections.values()
+            if conn.resource_type == resource_type
+        ]
     
     async def get_all_active_connections(self) -> List[ConnectionInfo]:
         """Get all active connections"""
-        async with self._lock:
-            return [c for c in self._connections.values() if c.is_active]
+        return [conn.to_info() for conn in self._connections.values()]
+    
+    def estimate_drain_time(self, percentile: Optional[float] = None) -> Optional[float]:
+        """
+        Estimate seconds until in-flight requests complete.
+        
+        For each in-flight request, the remaining time is taken from the
+        observed durations of requests that ran at least as long as it has
+        so far, at the given percentile. A request older than every observed
+        duration cannot be predicted; it may just be slow, so the estimate
+        is then unbounded and draining waits for its full timeout.
+        
+        Args:
+            percentile: Percentile of the remaining time (default: config.drain_percentile)
+        
+        Returns:
+            Estimated seconds (0 when nothing is in flight, ``math.inf`` when
+            some in-flight request has no prediction), or None when no
+            request durations have been observed yet
+        """
+        if self._in_flight == 0:
+            return 0.0
+        if not self._durations:
+            return None
+        
+        percentile = self.config.drain_percentile if percentile is None else percentile
+        durations = sorted(self._durations)
+        now = time.monotonic()
+        estimate = 0.0
+        for conn in self._connections.values():
+            for started in conn.request_starts:
+                age = now - started
+                longer = bisect_right(durations, age)
+                tail = len(durations) - longer
+                if tail == 0:
+                    return math.inf
+                index = longer + min(tail - 1, int(tail * percentile))
+                estimate = max(estimate, durations[index] - age)
+        return estimate
     
     async def drain_connections(
         self,
         timeout: Optional[float] = None,
         check_interval: Optional[float] = None
-    ) -> Dict[str, int]:
+    ) -> Dict[str, Any]:
         """
         Drain all active connections by waiting for in-flight requests.
         
+        Returns as soon as the last request completes, or once ``timeout``
+        has passed. The drain estimate is reported, not acted on: any
+        request may outlive its prediction, and cutting it short would drop
+        it (``ShutdownManager`` uses the estimate to size ``timeout``).
+        
         Args:
             timeout: Maximum time to wait for draining
-            check_interval: How often to check for completion
-            
+            check_interval: How often to log progress
+        
         Returns:
             Dict with drain statistics:
             - active_connections: connections that were active
             - remaining_requests: requests still in flight (if timeout)
             - drained_connections: connections that completed
+            - estimated_seconds: initial drain estimate (None without samples)
+            - duration_seconds: time spent draining
         """
         timeout = timeout or self.config.drain_timeout
         check_interval = check_interval or self.config.drain_check_interval
@@ -217,40 +370,46 @@ class ConnectionTracker:
         # Stop accepting new connections
         self.stop_accepting_new()
         
-        start_time = datetime.now()
+        start_time = time.monotonic()
+        self._drained = asyncio.Event()
         
         # Get initial counts
-        active_conns = await self.get_active_connections_count()
-        initial_requests = await self.get_in_flight_requests_count()
-        
-        logger.info(f"Starting connection drain: active_connections={active_conns}, in_flight_requests={initial_requests}")
-        
-        # Wait for requests to complete
-        elapsed = 0.0
-        while elapsed < timeout:
-            in_flight = await self.get_in_flight_requests_count()
-            
-            if in_flight == 0:
-                logger.info(f"All connections drained successfully: duration_seconds={elapsed}")
-                return {
-                    "active_connections": active_conns,
-                    "remaining_requests": 0,
-                    "drained_connections": active_conns
-                }
-            
-            logger.debug(f"Waiting for requests to complete: in_flight_requests={in_flight}, elapsed_seconds={elapsed}")
-            
-            await asyncio.sleep(check_interval)
-            elapsed = (datetime.now() - start_time).total_seconds()
-        
-        # Timeout reached
-        remaining = await self.get_in_flight_requests_count()
-        logger.warning(f"Connection drain timeout reached: remaining_requests={remaining}, timeout_seconds={timeout}")
+        active_conns = len(self._connections)
+        initial_estimate = self.estimate_drain_time()
+        
+        logger.info(f"Starting connection drain: active_connections={active_conns}, in_flight_requests={self._in_flight}, estimated_seconds={initial_estimate}")
+        
+        try:
+            elapsed = 0.0
+            while self._in_flight > 0 and elapsed < timeout:
+                logger.debug(f"Waiting for requests to complete: in_flight_requests={self._in_flight}, elapsed_seconds={elapsed}")
+                
+                try:
+                    await asyncio.wait_for(
+                        self._drained.wait(),
+                        timeout=min(check_interval, timeout - elapsed)
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                elapsed = time.monotonic() - start_time
+        finally:
+            self._drained = None
+        
+        duration = time.monotonic() - start_time
+        remaining = self._in_flight
+        if remaining == 0:
+            logger.info(f"All connections drained successfully: duration_seconds={duration}")
+            drained = active_conns
+        else:
+            logger.warning(f"Connection drain timeout reached: remaining_requests={remaining}, timeout_seconds={timeout}")
+            drained = active_conns - remaining if remaining < active_conns else 0
         
         return {
             "active_connections": active_conns,
             "remaining_requests": remaining,
-            "drained_connections": active_conns - remaining if remaining < active_conns else 0
+            "drained_connections": drained,
+            "estimated_seconds": initial_estimate,
+            "duration_seconds": duration,
         }
     
     async def force_close_all(self) -> int:
@@ -260,30 +419,39 @@ class ConnectionTracker:
         Returns:
             Number of connections closed
         """
-        async with self._lock:
-            count = 0
-            for conn_info in list(self._connections.values()):
-                if conn_info.is_active:
-                    conn_info.is_active = False
-                    count += 1
-            
-            self._connections.clear()
-            self._connections_by_type.clear()
-            self._request_counter.clear()
-            
-            logger.warning(f"Force closed all connections: count={count}")
-            
-            return count
+        count = len(self._connections)
+        for conn in self._connections.values():
+            if conn.info is not None:
+                conn.info.is_active = False
+        
+        self._connections.clear()
+        self._active_by_type = {rt: 0 for rt in ResourceType}
+        self._in_flight_by_type = {rt: 0 for rt in ResourceType}
+        self._in_flight = 0
+        self._notify_if_drained()
+        
+        logger.warning(f"Force closed all connections: count={count}")
+        
+        return count
     
     def get_stats(self) -> Dict[str, Any]:
         """Get connection statistics"""
+        durations = sorted(self._durations)
         return {
             "total_connections": len(self._connections),
-            "active_connections": len([c for c in self._connections.values() if c.is_active]),
+            "active_connections": len(self._connections),
             "accepting_new": self._is_accepting_new,
             "by_type": {
-                rt.value: len(conns)
-                for rt, conns in self._connections_by_type.items()
+                rt.value: count
+                for rt, count in self._active_by_type.items()
+                if count
+            },
+            "in_flight_by_type": {
+                rt.value: count
+                for rt, count in self._in_flight_by_type.items()
+                if count
             },
-            "total_in_flight_requests": sum(self._request_counter.values())
+            "total_in_flight_requests": self._in_flight,
+            "request_duration_p50_seconds": durations[len(durations) // 2] if durations else None,
+            "request_duration_p99_seconds": durations[int(len(durations) * 0.99)] if durations else None,
         }
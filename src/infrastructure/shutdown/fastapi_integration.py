@@ -59,32 +59,21 @@ try:
                 )
             
             # Register connection and track request
-            connection_id = None
+            tracker = self.manager.connection_tracker
+            metadata = None
+            if tracker.track_details:
+                metadata = {
+                    "path": request.url.path,
+                    "method": request.method,
+                    "client": request.client.host if request.client else None
+                }
+            connection_id = tracker.begin_request(ResourceType.HTTP_CLIENT, metadata)
             try:
-                # Register HTTP connection
-                connection_id = await self.manager.connection_tracker.register_connection(
-                    resource_type=ResourceType.HTTP_CLIENT,
-                    metadata={
-                        "path": request.url.path,
-                        "method": request.method,
-                        "client": request.client.host if request.client else None
-                    }
-                )
-                
-                # Track the request
-                await self.manager.connection_tracker.start_request(connection_id)
-                
                 # Process request
-                response = await call_next(request)
-                
-                return response
-                
+                return await call_next(request)
             finally:
-                # End request tracking
-                if connection_id:
-                    await self.manager.connection_tracker.end_request(connection_id)
-                    # Deregister connection
-                    await self.manager.connection_tracker.deregister_connection(connection_id)
+                # End request tracking and deregister connection
+                tracker.finish_request(connection_id)
 
 
     def setup_fastapi_shutdown(
@@ -259,17 +248,15 @@ try:
         async def __aenter__(self):
             """Enter context - register and start tracking"""
             if not self.manager.is_shutting_down():
-                self.connection_id = await self.manager.connection_tracker.register_connection(
-                    resource_type=ResourceType.HTTP_CLIENT
+                self.connection_id = self.manager.connection_tracker.begin_request(
+                    ResourceType.HTTP_CLIENT
                 )
-                await self.manager.connection_tracker.start_request(self.connection_id)
             return self
         
         async def __aexit__(self, exc_type, exc_val, exc_tb):
             """Exit context - end tracking and deregister"""
             if self.connection_id:
-                await self.manager.connection_tracker.end_request(self.connection_id)
-                await self.manager.connection_tracker.deregister_connection(self.connection_id)
+                self.manager.connection_tracker.finish_request(self.connection_id)
             return False
 
 
@@ -102,6 +102,12 @@ class ShutdownConfig:
     # Connection draining
     drain_check_interval: float = 0.5  # How often to check connections
     max_in_flight_requests: int = 1000  # Max requests to track
+    track_connection_details: bool = False  # Keep per-connection metadata (debugging)
+    
+    # Adaptive draining
+    adaptive_drain: bool = True  # Size drain timeout from observed request durations
+    duration_sample_size: int = 1000  # Recent request durations kept for estimates
+    drain_percentile: float = 0.99  # Percentile of remaining time waited for
     
     # Behavior
     force_after_timeout: bool = True  # Force shutdown after timeout
@@ -356,7 +356,7 @@ class ShutdownManager:
         logger.info("Phase: Draining connections")
         
         drain_result = await self.connection_tracker.drain_connections(
-            timeout=self.config.drain_timeout,
+            timeout=self._drain_timeout(),
             check_interval=self.config.drain_check_interval
         )
         
@@ -369,6 +369,33 @@ class ShutdownManager:
         
         return drain_result["drained_connections"]
     
+    def _drain_timeout(self) -> float:
+        """
+        Pick the drain timeout.
+        
+        Once request durations have been observed, the timeout is the
+        estimated time for in-flight requests to finish, at least
+        ``drain_timeout`` and at most the graceful budget left after
+        reserving time to close resources. A request the estimate cannot
+        predict (``math.inf``) gets the whole budget. Draining still returns
+        as soon as the last request finishes. Without observations (or with
+        adaptive draining off) ``drain_timeout`` is used as configured.
+        """
+        timeout = self.config.drain_timeout
+        if not self.config.adaptive_drain:
+            return timeout
+        
+        estimate = self.connection_tracker.estimate_drain_time()
+        if estimate is None:
+            return timeout
+        
+        elapsed = self._progress.duration_seconds or 0.0
+        reserved = self.config.resource_close_timeout * len(self._resources)
+        budget = max(timeout, self.config.graceful_timeout - elapsed - reserved)
+        timeout = min(max(timeout, estimate), budget)
+        logger.info(f"Adaptive drain: estimated_seconds={estimate:.3f}, timeout_seconds={timeout:.3f}")
+        return timeout
+    
     async def _phase_close_resources(self) -> int:
         """Phase 3: Close all resources"""
         self._progress.phase = ShutdownPhase.CLOSING_RESOURCES
@@ -9,8 +9,20 @@ from src.infrastructure.usage.usage_tracker import (
     UsageTracker,
     get_usage_tracker,
 )
+from src.infrastructure.usage.usage_store import (
+    Granularity,
+    UsageBackend,
+    RedisUsageBackend,
+    UsageStore,
+    bucket_start,
+)
 
 __all__ = [
     "UsageTracker",
     "get_usage_tracker",
+    "Granularity",
+    "UsageBackend",
+    "RedisUsageBackend",
+    "UsageStore",
+    "bucket_start",
 ]
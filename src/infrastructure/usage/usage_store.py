@@ -0,0 +1,372 @@
+"""
+Usage Store
+===========
+
+Pre-aggregated usage counters per (user, resource type, time bucket).
+
+Every tracked quantity is added to its hour, day and month bucket, so a
+period total is a sum over the few coarsest buckets that tile the period
+(one bucket for a month, seven for a week) and the current month's usage
+is a single lookup, however much has been tracked.
+
+Counters can be persisted to a durable backend: increments accumulate as
+pending deltas and ``flush()`` writes them in one batch.
+"""
+
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, Dict, Iterable, Optional, Tuple
+import logging
+
+from src.domain.usage.entities import ResourceType
+
+
+logger = logging.getLogger(__name__)
+
+
+class Granularity(str, Enum):
+    """Bucket sizes counters are aggregated into."""
+    HOUR = "hour"
+    DAY = "day"
+    MONTH = "month"
+
+
+BucketKey = Tuple[str, ResourceType, Granularity, datetime]
+
+
+def bucket_start(timestamp: datetime, granularity: Granularity) -> datetime:
+    """Start of the bucket containing a timestamp."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    elif timestamp.utcoffset():
+        timestamp = timestamp.astimezone(timezone.utc)
+    start = timestamp.replace(minute=0, second=0, microsecond=0)
+    if granularity is Granularity.HOUR:
+        return start
+    start = start.replace(hour=0)
+    if granularity is Granularity.DAY:
+        return start
+    return start.replace(day=1)
+
+
+def _next_month(start: datetime) -> datetime:
+    if start.month == 12:
+        return start.replace(year=start.year + 1, month=1)
+    return start.replace(month=start.month + 1)
+
+
+class UsageBackend(ABC):
+    """Durable storage for bucketed usage counters."""
+
+    @abstractmethod
+    async def write(self, deltas: Dict[BucketKey, float]) -> None:
+        """
+        Add counter deltas in one batch.
+
+        Args:
+            deltas: Quantity to add per bucket
+        """
+        pass
+
+    @abstractmethod
+    async def read(
+        self,
+        user_id: str,
+        granularity: Granularity,
+        start: datetime,
+    ) -> Dict[ResourceType, float]:
+        """
+        Read one bucket's counters.
+
+        Args:
+            user_id: User ID
+            granularity: Bucket size
+            start: Bucket start
+
+        Returns:
+            Quantity per resource type
+        """
+        pass
+
+
+class RedisUsageBackend(UsageBackend):
+    """
+    Usage counters in Redis hashes.
+
+    Each bucket is a hash ``{prefix}:{user_id}:{granularity}:{bucket}``
+    with one field per resource type. A flush is one non-transactional
+    pipeline of ``HINCRBYFLOAT`` calls, which Redis applies atomically per
+    field, so concurrent workers can flush into the same buckets. Hour and
+    day buckets expire after their retention; month buckets are kept.
+    """
+
+    _BUCKET_FORMAT = {
+        Granularity.HOUR: "%Y%m%d%H",
+        Granularity.DAY: "%Y%m%d",
+        Granularity.MONTH: "%Y%m",
+    }
+
+    def __init__(
+        self,
+        redis_client: Any,
+        prefix: str = "usage",
+        retention: Optional[Dict[Granularity, timedelta]] = None,
+    ):
+        """
+        Initialize backend.
+
+        Args:
+            redis_client: Async Redis client
+            prefix: Key prefix
+            retention: Expiry per granularity (no expiry when missing)
+        """
+        self.redis_client = redis_client
+        self.prefix = prefix
+        self.retention = retention if retention is not None else {
+            Granularity.HOUR: timedelta(days=7),
+            Granularity.DAY: timedelta(days=400),
+        }
+
+    def key(self, user_id: str, granularity: Granularity, start: datetime) -> str:
+        """Redis key of a bucket hash."""
+        bucket = start.strftime(self._BUCKET_FORMAT[granularity])
+        return f"{self.prefix}:{user_id}:{granularity.value}:{bucket}"
+
+    async def write(self, deltas: Dict[BucketKey, float]) -> None:
+        """Add counter deltas in one pipeline."""
+        pipe = self.redis_client.pipeline(transaction=False)
+        expiring = {}
+        for (user_id, resource_type, granularity, start), quantity in deltas.items():
+            key = self.key(user_id, granularity, start)
+            pipe.hincrbyfloat(key, resource_type.value, quantity)
+            ttl = self.retention.get(granularity)
+            if ttl is not None:
+                expiring[key] = ttl
+        for key, ttl in expiring.items():
+            pipe.expire(key, int(ttl.total_seconds()))
+        await pipe.execute()
+
+    async def read(
+        self,
+        user_id: str,
+        granularity: Granularity,
+        start: datetime,
+    ) -> Dict[ResourceType, float]:
+        """Read one bucket hash."""
+        values = await self.redis_client.hgetall(self.key(user_id, granularity, start))
+        counters = {}
+        for field_name, value in values.items():
+            if isinstance(field_name, bytes):
+                field_name = field_name.decode()
+            try:
+                counters[ResourceType(field_name)] = float(value)
+            except ValueError:
+                continue
+        return counters
+
+
+class UsageStore:
+    """
+    In-memory bucketed usage counters with optional write-behind.
+
+    Hour buckets give totals a resolution of one hour. Old hour and day
+    buckets are dropped by ``prune()``; month buckets are kept.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[UsageBackend] = None,
+        hour_retention: timedelta = timedelta(days=2),
+        day_retention: timedelta = timedelta(days=400),
+    ):
+        """
+        Initialize store.
+
+        Args:
+            backend: Durable backend receiving flushed deltas
+            hour_retention: How long hour buckets are kept in memory
+            day_retention: How long day buckets are kept in memory
+        """
+        self.backend = backend
+        self.hour_retention = hour_retention
+        self.day_retention = day_retention
+        self._counters: Dict[BucketKey, float] = defaultdict(float)
+        self._pending: Dict[BucketKey, float] = defaultdict(float)
+        # Deltas of the write in progress
+        self._inflight: Dict[BucketKey, float] = {}
+
+    def add(
+        self,
+        user_id: str,
+        resource_type: ResourceType,
+        quantity: float,
+        timestamp: datetime,
+    ) -> None:
+        """
+        Add a quantity to the hour, day and month buckets of a timestamp.
+
+        Args:
+            user_id: User ID
+            resource_type: Resource type
+            quantity: Amount consumed
+            timestamp: When it was consumed
+        """
+        hour = bucket_start(timestamp, Granularity.HOUR)
+        day = hour.replace(hour=0)
+        month = day.replace(day=1)
+        counters = self._counters
+        for key in (
+            (user_id, resource_type, Granularity.HOUR, hour),
+            (user_id, resource_type, Granularity.DAY, day),
+            (user_id, resource_type, Granularity.MONTH, month),
+        ):
+            counters[key] += quantity
+            if self.backend is not None:
+                self._pending[key] += quantity
+
+    def get(
+        self,
+        user_id: str,
+        resource_type: ResourceType,
+        granularity: Granularity,
+        start: datetime,
+    ) -> float:
+        """Counter of one bucket (0 when nothing was tracked)."""
+        return self._counters.get((user_id, resource_type, granularity, start), 0.0)
+
+    def total(
+        self,
+        user_id: str,
+        resource_type: ResourceType,
+        start: datetime,
+        end: datetime,
+    ) -> float:
+        """
+        Usage in ``[start, end)``, summed over the coarsest buckets tiling it.
+
+        Args:
+            user_id: User ID
+            resource_type: Resource type
+            start: Range start (rounded down to the hour)
+            end: Range end
+
+        Returns:
+            Total quantity
+        """
+        counters = self._counters
+        cursor = bucket_start(start, Granularity.HOUR)
+        total = 0.0
+        while cursor < end:
+            if cursor.hour == 0 and cursor.day == 1 and _next_month(cursor) <= end:
+                granularity, following = Granularity.MONTH, _next_month(cursor)
+            elif cursor.hour == 0 and cursor + timedelta(days=1) <= end:
+                granularity, following = Granularity.DAY, cursor + timedelta(days=1)
+            else:
+                granularity, following = Granularity.HOUR, cursor + timedelta(hours=1)
+            total += counters.get((user_id, resource_type, granularity, cursor), 0.0)
+            cursor = following
+        return total
+
+    def totals(
+        self,
+        user_id: str,
+        start: datetime,
+        end: datetime,
+        resource_types: Iterable[ResourceType] = ResourceType,
+    ) -> Dict[ResourceType, float]:
+        """Usage in ``[start, end)`` per resource type."""
+        return {
+            resource_type: self.total(user_id, resource_type, start, end)
+            for resource_type in resource_types
+        }
+
+    def pending_quantity(
+        self,
+        user_id: str,
+        resource_type: ResourceType,
+        granularity: Granularity,
+        start: datetime,
+    ) -> float:
+        """Quantity of one bucket not yet confirmed written to the backend."""
+        key = (user_id, resource_type, granularity, start)
+        return self._pending.get(key, 0.0) + self._inflight.get(key, 0.0)
+
+    @property
+    def pending(self) -> int:
+        """Buckets with deltas not yet flushed."""
+        return len(self._pending)
+
+    async def flush(self) -> int:
+        """
+        Write pending deltas to the backend in one batch.
+
+        Deltas are re-queued if the write fails, so nothing is lost or
+        counted twice by a later flush.
+
+        Returns:
+            Number of buckets written
+        """
+        if self.backend is None or not self._pending:
+            return 0
+        deltas, self._pending = self._pending, defaultdict(float)
+        self._inflight = deltas
+        try:
+            await self.backend.write(deltas)
+        except Exception as e:
+            for key, quantity in deltas.items():
+                self._pending[key] += quantity
+            logger.warning(f"Usage flush failed, {len(deltas)} buckets re-queued: {e}")
+            raise
+        finally:
+            self._inflight = {}
+        return len(deltas)
+
+    async def hydrate(
+        self,
+        user_id: str,
+        granularity: Granularity,
+        start: datetime,
+    ) -> None:
+        """
+        Load a bucket from the backend, e.g. after a restart.
+
+        Local counters become the durable value plus deltas not yet flushed.
+        """
+        if self.backend is None:
+            return
+        durable = await self.backend.read(user_id, granularity, start)
+        for resource_type, quantity in durable.items():
+            key = (user_id, resource_type, granularity, start)
+            self._counters[key] = quantity + self._pending.get(key, 0.0)
+
+    def prune(self, now: Optional[datetime] = None) -> int:
+        """
+        Drop hour and day buckets past their retention.
+
+        Returns:
+            Number of buckets dropped
+        """
+        now = now or datetime.now(timezone.utc)
+        cutoffs = {
+            Granularity.HOUR: now - self.hour_retention,
+            Granularity.DAY: now - self.day_retention,
+        }
+        expired = [
+            key for key in self._counters
+            if key[2] in cutoffs and key[3] < cutoffs[key[2]]
+        ]
+        for key in expired:
+            del self._counters[key]
+        return len(expired)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics"""
+        buckets: Dict[str, int] = {granularity.value: 0 for granularity in Granularity}
+        for key in self._counters:
+            buckets[key[2].value] += 1
+        return {
+            "buckets": buckets,
+            "pending": len(self._pending),
+        }
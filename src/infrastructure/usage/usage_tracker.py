@@ -3,12 +3,26 @@ Usage Tracking Service
 ======================
 
 Service for tracking, aggregating, and reporting resource usage.
+
+Quantities are aggregated on write into hour/day/month buckets (see
+UsageStore), so summaries and limit checks never rescan raw records.
+
+For per-request metering, ``meter()`` only bumps a per-worker counter;
+counters are folded into the buckets and flushed to the shared backend
+every ``flush_interval`` seconds by a background task. With a backend,
+limit checks read a locally cached budget: the shared month total as of
+the last flush cycle plus this worker's usage since. Usage from other
+workers therefore shows up in a worker's checks within two flush
+intervals (their flush, then our refresh).
 """
 
+import asyncio
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta, timezone
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from collections import defaultdict
 import logging
+import time
 
 from src.domain.usage.entities import (
     UsageRecord,
@@ -18,18 +32,67 @@ from src.domain.usage.entities import (
     BillingPeriod,
     get_plan_limits,
 )
+from src.infrastructure.usage.usage_store import Granularity, UsageStore
 
 
 logger = logging.getLogger(__name__)
 
+# Resource types whose summary fields are integer counts
+_COUNTED_RESOURCES = frozenset({
+    ResourceType.API_CALLS,
+    ResourceType.TEST_EXECUTIONS,
+    ResourceType.AI_GENERATIONS,
+})
+
+UsageKey = Tuple[str, ResourceType]
+
+
+class _Budget:
+    """Shared month total of one (user, resource type) as of a refresh"""
+    
+    __slots__ = ("month_start", "shared", "used_at")
+    
+    def __init__(self, month_start: Optional[datetime] = None, shared: float = 0.0):
+        self.month_start = month_start
+        self.shared = shared
+        self.used_at = time.monotonic()
+
 
 class UsageTracker:
     """Service for tracking and managing resource usage."""
     
-    def __init__(self):
-        # In-memory storage (replace with database in production)
+    def __init__(
+        self,
+        store: Optional[UsageStore] = None,
+        retain_records: bool = True,
+        flush_interval: float = 5.0,
+        budget_idle_timeout: float = 300.0,
+    ):
+        """
+        Initialize tracker.
+        
+        Args:
+            store: Bucketed usage counters (in-memory store by default)
+            retain_records: Keep raw records for ``get_usage``
+            flush_interval: Seconds between background flush cycles
+            budget_idle_timeout: Seconds a cached budget is refreshed after its last check
+        """
+        self.store = store if store is not None else UsageStore()
+        self.retain_records = retain_records
+        self.flush_interval = flush_interval
+        self.budget_idle_timeout = budget_idle_timeout
+        # Metered quantities of the current hour, not yet in the store
+        self._local: Dict[UsageKey, float] = {}
+        self._window_start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        self._window_end = (self._window_start + timedelta(hours=1)).timestamp()
+        self._budgets: Dict[UsageKey, _Budget] = {}
+        self._flusher: Optional[asyncio.Task] = None
+        # Raw records per user and per (user, resource type), in timestamp
+        # order, with parallel timestamp lists for range lookups
         self._records: Dict[str, List[UsageRecord]] = defaultdict(list)
-        self._summaries: Dict[str, UsageSummary] = {}
+        self._timestamps: Dict[str, List[datetime]] = defaultdict(list)
+        self._typed_records: Dict[Tuple[str, ResourceType], List[UsageRecord]] = defaultdict(list)
+        self._typed_timestamps: Dict[Tuple[str, ResourceType], List[datetime]] = defaultdict(list)
         
     def track_usage(
         self,
@@ -38,6 +101,7 @@ class UsageTracker:
         quantity: float = 1.0,
         organization_id: Optional[str] = None,
         metadata: Optional[dict] = None,
+        timestamp: Optional[datetime] = None,
     ) -> UsageRecord:
         """
         Track a usage event.
@@ -48,6 +112,7 @@ class UsageTracker:
             quantity: Amount of resource consumed
             organization_id: Optional organization ID
             metadata: Additional metadata about the usage
+            timestamp: When the usage happened (now by default)
             
         Returns:
             UsageRecord: The created usage record
@@ -60,12 +125,67 @@ class UsageTracker:
             unit=self._get_unit(resource_type),
             metadata=metadata or {},
         )
+        if timestamp is not None:
+            record.timestamp = timestamp
         
-        self._records[user_id].append(record)
-        logger.info(f"Tracked usage: {user_id} - {resource_type.value} - {quantity}")
+        self.store.add(user_id, resource_type, quantity, record.timestamp)
+        if self.retain_records:
+            self._index(record)
+        logger.debug(f"Tracked usage: {user_id} - {resource_type.value} - {quantity}")
         
         return record
     
+    def meter(
+        self,
+        user_id: str,
+        resource_type: ResourceType,
+        quantity: float = 1.0,
+    ) -> None:
+        """
+        Count usage on the hot path.
+        
+        Unlike ``track_usage`` no record is created or logged: the quantity
+        is added to a per-worker counter that the next flush cycle folds into
+        the usage buckets. Counters are plain dict updates without locks, so
+        call this from the event loop thread.
+        
+        Args:
+            user_id: User ID
+            resource_type: Type of resource being used
+            quantity: Amount of resource consumed
+        """
+        if time.time() >= self._window_end:
+            self._fold()
+        key = (user_id, resource_type)
+        local = self._local
+        local[key] = local.get(key, 0.0) + quantity
+    
+    def _fold(self) -> None:
+        """Move metered counters into the store and start a new hour window."""
+        local, self._local = self._local, {}
+        window_start = self._window_start
+        for (user_id, resource_type), quantity in local.items():
+            self.store.add(user_id, resource_type, quantity, window_start)
+        now = datetime.now(timezone.utc)
+        if now.timestamp() >= self._window_end:
+            self._window_start = now.replace(minute=0, second=0, microsecond=0)
+            self._window_end = (self._window_start + timedelta(hours=1)).timestamp()
+    
+    def _index(self, record: UsageRecord) -> None:
+        """Insert a record into the per-user and per-type indexes."""
+        typed_key = (record.user_id, record.resource_type)
+        for records, timestamps in (
+            (self._records[record.user_id], self._timestamps[record.user_id]),
+            (self._typed_records[typed_key], self._typed_timestamps[typed_key]),
+        ):
+            if not timestamps or timestamps[-1] <= record.timestamp:
+                records.append(record)
+                timestamps.append(record.timestamp)
+            else:
+                position = bisect_right(timestamps, record.timestamp)
+                records.insert(position, record)
+                timestamps.insert(position, record.timestamp)
+    
     def get_usage(
         self,
         user_id: str,
@@ -74,7 +194,7 @@ class UsageTracker:
         resource_type: Optional[ResourceType] = None,
     ) -> List[UsageRecord]:
         """
-        Get usage records for a user.
+        Get usage records for a user, in timestamp order.
         
         Args:
             user_id: User ID
@@ -85,17 +205,17 @@ class UsageTracker:
         Returns:
             List of usage records
         """
-        records = self._records.get(user_id, [])
-        
-        # Apply filters
-        if start_date:
-            records = [r for r in records if r.timestamp >= start_date]
-        if end_date:
-            records = [r for r in records if r.timestamp <= end_date]
         if resource_type:
-            records = [r for r in records if r.resource_type == resource_type]
+            key = (user_id, resource_type)
+            records = self._typed_records.get(key, [])
+            timestamps = self._typed_timestamps.get(key, [])
+        else:
+            records = self._records.get(user_id, [])
+            timestamps = self._timestamps.get(user_id, [])
         
-        return records
+        low = bisect_left(timestamps, start_date) if start_date else 0
+        high = bisect_right(timestamps, end_date) if end_date else len(timestamps)
+        return records[low:high]
     
     def get_usage_summary(
         self,
@@ -114,15 +234,10 @@ class UsageTracker:
         Returns:
             UsageSummary: Aggregated usage summary
         """
+        self._fold()
         period_start, period_end = self._get_period_dates(period)
+        totals = self.store.totals(user_id, period_start, period_end)
         
-        records = self.get_usage(
-            user_id=user_id,
-            start_date=period_start,
-            end_date=period_end,
-        )
-        
-        # Aggregate by resource type
         summary = UsageSummary(
             user_id=user_id,
             organization_id=organization_id,
@@ -131,17 +246,11 @@ class UsageTracker:
             billing_period=period,
         )
         
-        for record in records:
-            if record.resource_type == ResourceType.API_CALLS:
-                summary.api_calls += int(record.quantity)
-            elif record.resource_type == ResourceType.TEST_EXECUTIONS:
-                summary.test_executions += int(record.quantity)
-            elif record.resource_type == ResourceType.AI_GENERATIONS:
-                summary.ai_generations += int(record.quantity)
-            elif record.resource_type == ResourceType.STORAGE_MB:
-                summary.storage_mb += record.quantity
-            elif record.resource_type == ResourceType.BANDWIDTH_MB:
-                summary.bandwidth_mb += record.quantity
+        summary.api_calls = int(totals[ResourceType.API_CALLS])
+        summary.test_executions = int(totals[ResourceType.TEST_EXECUTIONS])
+        summary.ai_generations = int(totals[ResourceType.AI_GENERATIONS])
+        summary.storage_mb = totals[ResourceType.STORAGE_MB]
+        summary.bandwidth_mb = totals[ResourceType.BANDWIDTH_MB]
         
         return summary
     
@@ -202,9 +311,7 @@ class UsageTracker:
             Dict with limit status information
         """
         limits = get_plan_limits(plan_name)
-        summary = self.get_usage_summary(user_id)
-        
-        current_usage = self._get_current_usage(summary, resource_type)
+        current_usage = self.get_current_usage(user_id, resource_type)
         limit = limits.get_limit(resource_type)
         
         # -1 means unlimited
@@ -224,6 +331,124 @@ class UsageTracker:
             "plan_name": plan_name,
         }
     
+    def get_current_usage(self, user_id: str, resource_type: ResourceType) -> float:
+        """
+        Usage of a resource type in the current monthly billing period.
+        
+        Reads the current month's bucket plus unfolded metered usage, so
+        the cost does not depend on how much has been tracked. With a
+        backend, the cached shared budget replaces the local bucket once
+        a flush cycle has refreshed it; until then only this worker's
+        usage is counted.
+        
+        Args:
+            user_id: User ID
+            resource_type: Type of resource
+            
+        Returns:
+            Current usage (an int for counted resources)
+        """
+        if time.time() >= self._window_end:
+            self._fold()
+        month_start, _ = self._get_period_dates(BillingPeriod.MONTHLY)
+        key = (user_id, resource_type)
+        usage = self._local.get(key, 0.0)
+        
+        budget = self._budgets.get(key) if self.store.backend is not None else None
+        if budget is not None and budget.month_start == month_start:
+            budget.used_at = time.monotonic()
+            usage += budget.shared + self.store.pending_quantity(
+                user_id, resource_type, Granularity.MONTH, month_start
+            )
+        else:
+            usage += self.store.get(user_id, resource_type, Granularity.MONTH, month_start)
+            if self.store.backend is not None:
+                # Fetched by the next flush cycle
+                self._budgets[key] = _Budget()
+        return int(usage) if resource_type in _COUNTED_RESOURCES else usage
+    
+    async def flush(self) -> int:
+        """
+        Run one flush cycle.
+        
+        Folds metered counters into the store, writes pending counters to
+        the store's backend, refreshes cached budgets from it and prunes
+        old buckets.
+        
+        Returns:
+            Number of buckets written
+        """
+        self._fold()
+        month_start, _ = self._get_period_dates(BillingPeriod.MONTHLY)
+        flushing = {
+            key: self.store.pending_quantity(key[0], key[1], Granularity.MONTH, month_start)
+            for key, budget in self._budgets.items()
+            if budget.month_start == month_start
+        }
+        written = await self.store.flush()
+        # Written deltas are now part of the shared totals
+        for key, quantity in flushing.items():
+            budget = self._budgets.get(key)
+            if budget is not None and budget.month_start == month_start:
+                budget.shared += quantity
+        await self._refresh_budgets()
+        self.store.prune()
+        return written
+    
+    async def _refresh_budgets(self) -> None:
+        """Re-read the shared month totals of recently checked budgets."""
+        if self.store.backend is None or not self._budgets:
+            return
+        idle_before = time.monotonic() - self.budget_idle_timeout
+        for key in [key for key, budget in self._budgets.items() if budget.used_at < idle_before]:
+            del self._budgets[key]
+        
+        month_start, _ = self._get_period_dates(BillingPeriod.MONTHLY)
+        users: Dict[str, List[ResourceType]] = defaultdict(list)
+        for user_id, resource_type in self._budgets:
+            users[user_id].append(resource_type)
+        for user_id, resource_types in users.items():
+            shared = await self.store.backend.read(user_id, Granularity.MONTH, month_start)
+            for resource_type in resource_types:
+                budget = self._budgets.get((user_id, resource_type))
+                if budget is not None:
+                    budget.month_start = month_start
+                    budget.shared = shared.get(resource_type, 0.0)
+    
+    @property
+    def is_running(self) -> bool:
+        """Check if the background flush task is running"""
+        return self._flusher is not None and not self._flusher.done()
+    
+    def start(self) -> None:
+        """Start flushing every ``flush_interval`` seconds."""
+        if self.is_running:
+            return
+        self._flusher = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Stop the background task and run a final flush cycle."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._flusher = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.warning(f"Final usage flush failed: {e}")
+    
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                # Deltas stay pending and go out with the next cycle
+                logger.warning(f"Usage flush cycle failed: {e}")
+    
     def get_usage_report(
         self,
         user_id: str,
@@ -313,17 +538,6 @@ class UsageTracker:
             return 0
         overage = max(0, usage - limit)
         return int(overage * price_per_unit)
-    
-    def _get_current_usage(self, summary: UsageSummary, resource_type: ResourceType) -> float:
-        """Get current usage for a resource type from summary."""
-        usage_map = {
-            ResourceType.API_CALLS: summary.api_calls,
-            ResourceType.TEST_EXECUTIONS: summary.test_executions,
-            ResourceType.AI_GENERATIONS: summary.ai_generations,
-            ResourceType.STORAGE_MB: summary.storage_mb,
-            ResourceType.BANDWIDTH_MB: summary.bandwidth_mb,
-        }
-        return usage_map.get(resource_type, 0)
 
 
 # Singleton instance
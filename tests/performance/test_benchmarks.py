@@ -144,6 +144,271 @@ class TestReportPerformance:
         result = benchmark(lambda: reporter.generate(results))
         assert result is not None
 
+    @pytest.mark.performance
+    def test_allure_report_memory_100k_results(self, tmp_path):
+        """Peak memory of streamed Allure reports stays flat at 100k results."""
+        import json
+        import tracemalloc
+
+        from src.adapters.reporting.allure_reporter import AllureReporter
+
+        def make_reporter(count):
+            reporter = AllureReporter(results_dir=str(tmp_path / f"results-{count}"))
+            for i in range(count):
+                status = ("passed", "failed", "broken", "skipped")[i % 4]
+                (reporter.results_dir / f"{i:06d}-result.json").write_text(json.dumps({
+                    "name": f"test_{i}",
+                    "status": status,
+                    "statusDetails": {"message": "assertion failed", "trace": "Traceback ..." * 20},
+                    "steps": [{"name": f"step {n}", "status": status} for n in range(5)],
+                }))
+            return reporter
+
+        def peak_mb(reporter, report_format):
+            tracemalloc.start()
+            reporter.generate_report(str(tmp_path / "out"), report_format)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return peak / (1024 * 1024)
+
+        small, large = make_reporter(1_000), make_reporter(100_000)
+
+        for report_format in ("json", "xml"):
+            small_peak = peak_mb(small, report_format)
+            large_peak = peak_mb(large, report_format)
+            print(f"\n{report_format}: peak {small_peak:.2f} MB @1k, {large_peak:.2f} MB @100k")
+            assert large_peak < 5
+            # 100x the results must not add more than a couple of MB
+            assert large_peak - small_peak < 2
+
+
+class TestContractValidationPerformance:
+    """Performance tests for API contract validation."""
+
+    @pytest.mark.performance
+    def test_contract_validations_per_second(self, benchmark, tmp_path):
+        """Benchmark response validation throughput across a 200-path spec."""
+        import json
+
+        from src.adapters.api_contract.contract_validator import ContractValidator
+
+        paths = {}
+        for i in range(200):
+            paths[f"/resource{i}/{{id}}/items/{{item_id}}"] = {
+                "get": {"responses": {"200": {"description": "ok", "content": {"application/json": {
+                    "schema": {"$ref": "#/components/schemas/Item"},
+                }}}}},
+            }
+        spec = {
+            "openapi": "3.0.0",
+            "info": {"title": "Bench", "version": "1"},
+            "paths": paths,
+            "components": {"schemas": {
+                "Item": {
+                    "type": "object",
+                    "required": ["id", "owner"],
+                    "properties": {"id": {"type": "integer"}, "owner": {"$ref": "#/components/schemas/Owner"}},
+                },
+                "Owner": {"type": "object", "properties": {"name": {"type": "string"}}},
+            }},
+        }
+        spec_path = tmp_path / "openapi.json"
+        spec_path.write_text(json.dumps(spec))
+
+        validator = ContractValidator(spec_path)
+        body = {"id": 1, "owner": {"name": "qa"}}
+        requests = [(f"/resource{i % 200}/{i}/items/{i * 7}", body) for i in range(1_000)]
+
+        def validate_all():
+            for path, response_body in requests:
+                assert not validator.validate_response(path, "GET", 200, response_body)
+            return len(requests)
+
+        result = benchmark(validate_all)
+        assert result == 1_000
+        if benchmark.stats:
+            print(f"\n{1_000 / benchmark.stats['mean']:.0f} validations/s")
+
+
+class TestSQLValidatorPerformance:
+    """Performance tests for SQL validation."""
+
+    @pytest.mark.performance
+    def test_sql_validation_throughput_100k(self, benchmark):
+        """Benchmark validate_query over a 100k-query corpus."""
+        from src.adapters.database.sql_validator import SQLValidator
+
+        templates = [
+            "SELECT id, name FROM users WHERE id = {i}",
+            "SELECT * FROM orders o JOIN users u ON u.id = o.user_id WHERE o.total > {i}",
+            "UPDATE accounts SET balance = balance - {i} WHERE id = {i}",
+            "SELECT note FROM notes\nWHERE note = 'multi\nline {i}' AND name LIKE '%x'",
+            "DELETE FROM sessions WHERE expires_at < {i} OR user_id = owner_id",
+        ]
+        # 100k queries with ~10k distinct texts, like queries extracted from test code
+        corpus = [templates[i % len(templates)].format(i=i % 2000) for i in range(100_000)]
+
+        def validate_corpus():
+            validator = SQLValidator()
+            return sum(1 for query in corpus if validator.validate_query(query).is_valid)
+
+        result = benchmark.pedantic(validate_corpus, rounds=1, iterations=1)
+        assert result == 100_000
+        if benchmark.stats:
+            print(f"\n{100_000 / benchmark.stats['mean']:.0f} queries/s")
+
+
+class TestTenantResolutionPerformance:
+    """Performance tests for tenant resolution in TenantContextMiddleware."""
+
+    @pytest.mark.performance
+    def test_tenant_resolution_overhead(self, benchmark):
+        """Benchmark resolving 10k requests across 100 tenants through the cache."""
+        import asyncio
+
+        from starlette.requests import Request
+
+        from src.api.middleware.tenant_context import TenantContextMiddleware
+        from src.domain.entities.tenant import Tenant
+        from src.infrastructure.persistence.tenant_cache import TenantCache
+        from src.infrastructure.persistence.tenant_repository import InMemoryTenantRepository
+
+        repository = InMemoryTenantRepository()
+        for i in range(100):
+            asyncio.run(repository.create(Tenant(name=f"Tenant {i}", slug=f"tenant{i}")))
+        requests = [
+            Request({
+                "type": "http",
+                "method": "GET",
+                "path": "/api/v1/tests",
+                "headers": [(b"host", f"tenant{i % 100}.app.com".encode())],
+            })
+            for i in range(10_000)
+        ]
+        middleware = TenantContextMiddleware(None, repository, cache=TenantCache())
+
+        async def resolve_all():
+            resolved = 0
+            for request in requests:
+                tenant, _ = await middleware.resolve_tenant(request)
+                resolved += tenant is not None
+            return resolved
+
+        result = benchmark.pedantic(lambda: asyncio.run(resolve_all()), rounds=3, iterations=1)
+        assert result == 10_000
+        stats = middleware.get_stats()
+        print(f"\nhit rate {stats['hit_rate']:.1%}, "
+              f"{stats['avg_resolution_us']:.1f} us/request")
+
+
+class TestRBACPermissionPerformance:
+    """Performance tests for RBAC permission checks."""
+
+    @pytest.mark.performance
+    def test_permission_checks_with_20_roles(self, benchmark):
+        """Benchmark 10k requests checking 4 permissions for a user with 20 roles."""
+        from uuid import uuid4
+
+        from src.api.middleware.rbac_middleware import RBACContext
+        from src.domain.entities.role import Role
+        from src.infrastructure.persistence.role_permission_cache import RolePermissionCache
+
+        tenant_id = uuid4()
+        roles = [
+            Role(
+                tenant_id=tenant_id,
+                name=f"role{i}",
+                permissions=[f"resource{i}:read", f"resource{i}:write", f"reports{i}:*"],
+            )
+            for i in range(19)
+        ]
+        roles.append(Role(tenant_id=tenant_id, name="member", permissions=["tests:*", "projects:read"]))
+        required = ["tests:run", "projects:read", "projects:write", "users:read"]
+        cache = RolePermissionCache()
+
+        def check_requests():
+            granted = 0
+            for _ in range(10_000):
+                rbac = RBACContext(roles, cache=cache)
+                for permission in required:
+                    granted += rbac.has_permission(permission)
+            return granted
+
+        result = benchmark.pedantic(check_requests, rounds=3, iterations=1)
+        assert result == 20_000
+        if benchmark.stats:
+            print(f"\n{40_000 / benchmark.stats['mean']:.0f} checks/s")
+
+
+class TestUsageMeteringPerformance:
+    """Performance tests for per-request usage metering."""
+
+    @pytest.mark.performance
+    def test_meter_vs_track_usage(self, benchmark):
+        """Benchmark metering 100k API calls and compare with track_usage."""
+        import time
+
+        from src.domain.usage.entities import ResourceType
+        from src.infrastructure.usage.usage_tracker import UsageTracker
+
+        calls = 100_000
+
+        def meter_calls():
+            tracker = UsageTracker()
+            for i in range(calls):
+                tracker.meter(f"user{i % 100}", ResourceType.API_CALLS)
+            return tracker
+
+        tracker = benchmark.pedantic(meter_calls, rounds=3, iterations=1)
+        assert tracker.get_current_usage("user0", ResourceType.API_CALLS) == calls // 100
+
+        tracked = UsageTracker(retain_records=False)
+        start = time.perf_counter()
+        for i in range(calls // 10):
+            tracked.track_usage(f"user{i % 100}", ResourceType.API_CALLS)
+        track_us = (time.perf_counter() - start) / (calls // 10) * 1e6
+        if benchmark.stats:
+            meter_us = benchmark.stats["mean"] / calls * 1e6
+            print(f"\nmeter {meter_us:.2f} us/call, track_usage {track_us:.2f} us/call")
+
+
+class TestConnectionTrackerPerformance:
+    """Performance tests for shutdown request tracking."""
+
+    @pytest.mark.performance
+    def test_request_tracking(self, benchmark):
+        """Benchmark tracking 100k requests through the middleware path."""
+        import asyncio
+
+        from src.infrastructure.shutdown.connection_tracker import ConnectionTracker
+        from src.infrastructure.shutdown.models import ResourceType
+
+        requests = 100_000
+
+        def track_requests():
+            tracker = ConnectionTracker()
+            for _ in range(requests):
+                tracker.finish_request(tracker.begin_request(ResourceType.HTTP_CLIENT))
+            return tracker
+
+        tracker = benchmark.pedantic(track_requests, rounds=3, iterations=1)
+        assert tracker.get_stats()["total_in_flight_requests"] == 0
+
+        async def track_async():
+            tracker = ConnectionTracker()
+            start = time.perf_counter()
+            for _ in range(requests // 10):
+                conn_id = await tracker.register_connection(ResourceType.HTTP_CLIENT)
+                await tracker.start_request(conn_id)
+                await tracker.end_request(conn_id)
+                await tracker.deregister_connection(conn_id)
+            return (time.perf_counter() - start) / (requests // 10) * 1e6
+
+        async_us = asyncio.run(track_async())
+        if benchmark.stats:
+            sync_us = benchmark.stats["mean"] / requests * 1e6
+            print(f"\nbegin/finish {sync_us:.2f} us/request, async API {async_us:.2f} us/request")
+
 
 class TestConcurrencyPerformance:
     """Performance tests for concurrent operations."""
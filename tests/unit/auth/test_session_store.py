@@ -0,0 +1,193 @@
+"""
+Tests for the session store backends.
+
+RedisSessionStore runs against fakeredis, which executes the revoke Lua
+script through lupa.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from fakeredis import aioredis
+
+from src.infrastructure.auth import InMemorySessionStore, RedisSessionStore
+
+
+@pytest.fixture(params=["memory", "redis"])
+def store(request):
+    """Each session store backend."""
+    if request.param == "memory":
+        return InMemorySessionStore()
+    return RedisSessionStore(redis_client=aioredis.FakeRedis(decode_responses=True))
+
+
+@pytest.fixture
+def redis_store():
+    """Redis session store on a fake server."""
+    return RedisSessionStore(
+        redis_client=aioredis.FakeRedis(decode_responses=True),
+        sweep_batch_size=2,
+    )
+
+
+async def set_last_activity(store, session, when):
+    """Backdate a stored session's last activity."""
+    if isinstance(store, InMemorySessionStore):
+        store._sessions[session.id].last_activity_at = when
+        return
+    client = store._get_client()
+    key = store._session_key(session.id)
+    data = json.loads(await client.get(key))
+    data["last_activity_at"] = when.isoformat()
+    await client.set(key, json.dumps(data), keepttl=True)
+
+
+async def stored_last_activity(store, session):
+    """Last activity of a session as currently stored."""
+    if isinstance(store, InMemorySessionStore):
+        return store._sessions[session.id].last_activity_at
+    data = json.loads(await store._get_client().get(store._session_key(session.id)))
+    return datetime.fromisoformat(data["last_activity_at"])
+
+
+class TestSessionStores:
+    """Behaviour shared by every backend."""
+
+    @pytest.mark.asyncio
+    async def test_get_session_by_token(self, store):
+        """Test sessions are found by their token only."""
+        user_id = uuid4()
+        session = await store.create_session(user_id, "token-a")
+        await store.create_session(user_id, "token-b")
+
+        found = await store.get_session_by_token("token-a")
+        assert found.id == session.id
+        assert found.user_id == user_id
+        assert await store.get_session_by_token("token-c") is None
+
+    @pytest.mark.asyncio
+    async def test_revoke_all_sessions_keeps_excepted(self, store):
+        """Test revoke-all spares the excepted session and other users."""
+        user_id = uuid4()
+        kept = await store.create_session(user_id, "kept")
+        revoked = [await store.create_session(user_id, f"revoked-{i}") for i in range(3)]
+        other = await store.create_session(uuid4(), "other")
+
+        assert await store.revoke_all_sessions(user_id, except_session_id=kept.id) == 3
+
+        assert (await store.get_session_by_token("kept")).id == kept.id
+        for session in revoked:
+            assert await store.get_session(session.id) is None
+            assert await store.get_session_by_token(session.token) is None
+        assert (await store.get_session(other.id)).id == other.id
+        assert [s.id for s in await store.list_user_sessions(user_id)] == [kept.id]
+
+    @pytest.mark.asyncio
+    async def test_terminate_inactive_sessions(self, store):
+        """Test only sessions idle past the cutoff are terminated."""
+        user_id = uuid4()
+        idle = await store.create_session(user_id, "idle")
+        recent = await store.create_session(user_id, "recent")
+        await set_last_activity(store, idle, datetime.now(timezone.utc) - timedelta(days=31))
+        await set_last_activity(store, recent, datetime.now(timezone.utc) - timedelta(days=29))
+
+        assert await store.terminate_inactive_sessions(user_id, inactive_days=30) == 1
+
+        assert await store.get_session(idle.id) is None
+        assert (await store.get_session(recent.id)).id == recent.id
+        assert await store.terminate_inactive_sessions(user_id, inactive_days=30) == 0
+
+    @pytest.mark.asyncio
+    async def test_clean_expired_sessions(self, store):
+        """Test cleanup removes expired sessions only."""
+        user_id = uuid4()
+        for i in range(5):
+            await store.create_session(user_id, f"expired-{i}", expires_in_seconds=0)
+        live = await store.create_session(user_id, "live")
+
+        assert await store.clean_expired_sessions() == 5
+
+        sessions = await store.list_user_sessions(user_id, active_only=False)
+        assert [s.id for s in sessions] == [live.id]
+        assert await store.clean_expired_sessions() == 0
+
+
+class TestRedisSessionStore:
+    """Redis-specific indexing and activity coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_sweep_clears_expiry_and_user_indexes(self, redis_store):
+        """Test the expiry sweep runs in batches and empties both indexes."""
+        client = redis_store._get_client()
+        user_id = uuid4()
+        expired = [
+            await redis_store.create_session(user_id, f"expired-{i}", expires_in_seconds=0)
+            for i in range(5)
+        ]
+        live = await redis_store.create_session(user_id, "live")
+
+        assert await redis_store.clean_expired_sessions() == 5
+
+        assert await client.zrange(redis_store._expiry_key, 0, -1) == [f"{user_id}:{live.id}"]
+        assert await client.zrange(redis_store._user_key(user_id), 0, -1) == [str(live.id)]
+        for session in expired:
+            assert await client.get(redis_store._session_key(session.id)) is None
+
+    @pytest.mark.asyncio
+    async def test_revoke_all_removes_token_and_index_entries(self, redis_store):
+        """Test revoke-all deletes token keys and index entries in one call."""
+        client = redis_store._get_client()
+        user_id = uuid4()
+        kept = await redis_store.create_session(user_id, "kept")
+        revoked = await redis_store.create_session(user_id, "revoked")
+
+        assert await redis_store.revoke_all_sessions(user_id, except_session_id=kept.id) == 1
+
+        assert await client.get(redis_store._token_key(redis_store._token_hash("revoked"))) is None
+        assert await client.zrange(redis_store._user_key(user_id), 0, -1) == [str(kept.id)]
+        assert await client.zrange(redis_store._expiry_key, 0, -1) == [f"{user_id}:{kept.id}"]
+        assert await redis_store.get_session(revoked.id) is None
+
+    @pytest.mark.asyncio
+    async def test_activity_writes_are_coalesced(self, redis_store):
+        """Test activity is persisted at most once per write interval."""
+        session = await redis_store.create_session(uuid4(), "token")
+        old = datetime.now(timezone.utc) - timedelta(hours=1)
+        await set_last_activity(redis_store, session, old)
+
+        assert await redis_store.update_session_activity(session.id) is True
+        written = await stored_last_activity(redis_store, session)
+        assert written > old
+
+        await set_last_activity(redis_store, session, old)
+        assert await redis_store.update_session_activity(session.id) is True
+        assert await stored_last_activity(redis_store, session) == old
+
+        redis_store.activity_write_interval = 0
+        assert await redis_store.update_session_activity(session.id) is True
+        assert await stored_last_activity(redis_store, session) > old
+
+    @pytest.mark.asyncio
+    async def test_activity_update_fails_after_revoke_all(self, redis_store):
+        """Test revoke-all drops coalesced activity so updates report failure."""
+        user_id = uuid4()
+        sessions = [await redis_store.create_session(user_id, f"token-{i}") for i in range(2)]
+        for session in sessions:
+            assert await redis_store.update_session_activity(session.id) is True
+
+        assert await redis_store.revoke_all_sessions(user_id) == 2
+
+        for session in sessions:
+            assert await redis_store.update_session_activity(session.id) is False
+
+    @pytest.mark.asyncio
+    async def test_activity_update_fails_after_revoke(self, redis_store):
+        """Test revoking one session drops its coalesced activity."""
+        session = await redis_store.create_session(uuid4(), "token")
+        assert await redis_store.update_session_activity(session.id) is True
+
+        assert await redis_store.revoke_session(session.id) is True
+
+        assert await redis_store.update_session_activity(session.id) is False
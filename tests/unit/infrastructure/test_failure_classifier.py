@@ -0,0 +1,115 @@
+"""
+Unit Tests for Failure Classifier
+"""
+
+import json
+import re
+
+import pytest
+
+from src.infrastructure.classification import FailureClassifier
+
+
+CATEGORIES = {
+    "assertion": ["AssertionError", "assert", "expected"],
+    "timeout": ["TimeoutError", "timed out", "timeout"],
+    "network": ["connection refused", {"regex": r"E(?:CONN|HOST)\w+"}],
+    "resource": ["not found", "404"],
+}
+
+
+class TestFailureClassifier:
+    """Tests for FailureClassifier."""
+
+    @pytest.fixture
+    def classifier(self):
+        """Create a classifier instance."""
+        return FailureClassifier(CATEGORIES)
+
+    def test_classify_reports_keywords_per_category(self, classifier):
+        """Test matched keywords are grouped in declaration order."""
+        result = classifier.classify("TimeoutError: connection refused (ECONNRESET), 404")
+
+        assert list(result) == ["timeout", "network", "resource"]
+        assert result["timeout"] == ["TimeoutError", "timeout"]
+        assert result["network"] == ["connection refused", r"E(?:CONN|HOST)\w+"]
+
+    def test_overlapping_keywords_are_all_found(self):
+        """Test keywords overlapping another match are not lost."""
+        classifier = FailureClassifier({
+            "network": ["connection timeout"],
+            "timeout": ["timeout error"],
+            "generic": ["error"],
+        })
+
+        result = classifier.classify("Connection timeout error")
+
+        assert result == {
+            "network": ["connection timeout"],
+            "timeout": ["timeout error"],
+            "generic": ["error"],
+        }
+
+    def test_regex_and_literal_at_same_position(self):
+        """Test a regex does not hide a literal starting where it matches."""
+        classifier = FailureClassifier({
+            "network": [{"regex": r"econn\w+"}],
+            "reset": ["econnreset"],
+        })
+
+        assert classifier.classify("ECONNRESET") == {
+            "network": [r"econn\w+"],
+            "reset": ["econnreset"],
+        }
+
+    def test_contained_keywords_are_credited(self, classifier):
+        """Test keywords inside a longer match are reported too."""
+        assert classifier.classify("assertionerror")["assertion"] == ["AssertionError", "assert"]
+
+    def test_case_sensitive_matching(self):
+        """Test case-sensitive classifiers ignore other casings."""
+        classifier = FailureClassifier(CATEGORIES, case_sensitive=True)
+
+        assert classifier.classify("ASSERT failed") == {}
+        assert classifier.primary("assert failed") == "assertion"
+
+    def test_primary_and_default(self, classifier):
+        """Test the first declared category wins."""
+        assert classifier.primary("expected element, got Not Found") == "assertion"
+        assert classifier.primary("segfault", default="unknown") == "unknown"
+        assert classifier.primary(None) is None
+
+    def test_count_streams_messages(self, classifier):
+        """Test bulk counting by primary category."""
+        messages = (m for m in ["timed out"] * 3 + ["404"] + ["?"] * 2)
+
+        assert classifier.count(messages) == {"timeout": 3, "resource": 1, "unknown": 2}
+
+    def test_classify_many_is_lazy(self, classifier):
+        """Test classify_many yields one result per message."""
+        results = classifier.classify_many(iter(["timeout", "", "EHOSTUNREACH"]))
+
+        assert next(results) == {"timeout": ["timeout"]}
+        assert list(results) == [{}, {"network": [r"E(?:CONN|HOST)\w+"]}]
+
+    def test_compiled_patterns_and_empty_config(self):
+        """Test compiled regexes and classifiers without categories."""
+        classifier = FailureClassifier({"oom": [re.compile(r"out of memory|OOM")]})
+
+        assert classifier.primary("Killed: OOM") == "oom"
+        assert FailureClassifier({}).classify("anything") == {}
+
+    def test_from_file(self, tmp_path):
+        """Test loading a config section from JSON."""
+        path = tmp_path / "classifier.json"
+        path.write_text(json.dumps({"failures": {"flaky": ["stale element"]}}))
+
+        classifier = FailureClassifier.from_file(path, section="failures")
+
+        assert classifier.categories == ["flaky"]
+        assert classifier.primary("StaleElement: stale element reference") == "flaky"
+
+    def test_invalid_config(self):
+        """Test categories must map to pattern lists."""
+        with pytest.raises(ValueError):
+            FailureClassifier.from_config({"timeout": "timed out"})
@@ -1,5 +1,6 @@
 """Unit tests for health module"""
 
+import asyncio
 import pytest
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -19,6 +20,13 @@ from src.infrastructure.health import (
     RedisHealthCheckConfig,
     ExternalAPIHealthCheckConfig,
     InternalServiceHealthCheckConfig,
+    HealthScheduler,
+    create_health_router,
+    PoolHealthThresholds,
+    EnginePoolHealthCheckConfig,
+    RedisPoolHealthCheckConfig,
+    check_engine_pool_health,
+    check_redis_pool_health,
 )
 
 
@@ -468,3 +476,311 @@ class TestHealthCheckConfig:
         assert config.timeout_seconds == 10.0
         assert config.retry_count == 5
         assert config.parallel_checks is False
+
+
+def _healthy(name="custom"):
+    return HealthCheckResult(
+        service_name=name,
+        service_type=ServiceType.INTERNAL_SERVICE,
+        status=HealthStatus.HEALTHY,
+        response_time_ms=1.0
+    )
+
+
+class TestHealthScheduler:
+    """Tests for background health check scheduling."""
+    
+    @pytest.fixture
+    def health_checker(self):
+        """Create health checker without retries."""
+        return HealthChecker(HealthCheckConfig(retry_count=1))
+    
+    @pytest.mark.asyncio
+    async def test_snapshot_does_not_run_checks(self, health_checker):
+        """Test probes read the latest results without running checks."""
+        call_count = 0
+        
+        async def custom_check():
+            nonlocal call_count
+            call_count += 1
+            return _healthy()
+        
+        health_checker.add_custom_check("custom", custom_check)
+        scheduler = HealthScheduler(health_checker)
+        
+        pending = scheduler.snapshot()
+        assert pending.overall_status == HealthStatus.UNKNOWN
+        assert pending.checks[0].error_type == "pending"
+        
+        await scheduler.refresh()
+        assert call_count == 1
+        
+        first = scheduler.snapshot()
+        assert first.overall_status == HealthStatus.HEALTHY
+        assert scheduler.snapshot() is first
+        assert call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_timeout_reported_unhealthy(self, health_checker):
+        """Test a check exceeding its timeout is recorded as unhealthy."""
+        async def slow_check():
+            await asyncio.sleep(1)
+            return _healthy("slow")
+        
+        health_checker.add_custom_check("slow", slow_check)
+        scheduler = HealthScheduler(health_checker)
+        scheduler.configure_check("custom:slow", timeout_seconds=0.01)
+        
+        result = await scheduler.run_check("custom:slow")
+        
+        assert result.status == HealthStatus.UNHEALTHY
+        assert result.error_type == "timeout"
+        assert scheduler.get_check_stats()["custom:slow"]["consecutive_failures"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_stale_result_reported_unhealthy(self, health_checker):
+        """Test results older than their staleness budget fail readiness."""
+        async def custom_check():
+            return _healthy()
+        
+        health_checker.add_custom_check("custom", custom_check)
+        scheduler = HealthScheduler(health_checker)
+        scheduler.configure_check("custom:custom", stale_after_seconds=0.05)
+        
+        await scheduler.refresh()
+        assert scheduler.snapshot().overall_status == HealthStatus.HEALTHY
+        
+        await asyncio.sleep(0.06)
+        snapshot = scheduler.snapshot()
+        
+        assert snapshot.overall_status == HealthStatus.UNHEALTHY
+        assert snapshot.checks[0].error_type == "stale"
+    
+    @pytest.mark.asyncio
+    async def test_per_check_intervals(self, health_checker):
+        """Test each check runs on its own interval."""
+        counts = {"fast": 0, "slow": 0}
+        
+        def counting(name):
+            async def check():
+                counts[name] += 1
+                return _healthy(name)
+            return check
+        
+        health_checker.add_custom_check("fast", counting("fast"))
+        health_checker.add_custom_check("slow", counting("slow"))
+        scheduler = HealthScheduler(health_checker)
+        scheduler.configure_check("custom:fast", interval_seconds=0.01)
+        scheduler.configure_check("custom:slow", interval_seconds=10)
+        
+        scheduler.start()
+        assert scheduler.is_running
+        await asyncio.sleep(0.1)
+        await scheduler.stop()
+        
+        assert not scheduler.is_running
+        assert counts["slow"] == 1
+        assert counts["fast"] > 3
+        stats = scheduler.get_check_stats()
+        assert stats["custom:fast"]["runs"] == counts["fast"]
+        assert stats["custom:fast"]["p95_ms"] is not None
+    
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self, health_checker):
+        """Test no more than max_concurrency checks run at once."""
+        running = 0
+        peak = 0
+        
+        async def check():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return _healthy()
+        
+        for i in range(6):
+            health_checker.add_custom_check(f"check{i}", check)
+        scheduler = HealthScheduler(health_checker, max_concurrency=2)
+        
+        await scheduler.refresh()
+        
+        assert peak == 2
+        assert len(scheduler.snapshot().checks) == 6
+    
+    @pytest.mark.asyncio
+    async def test_removed_check_dropped(self, health_checker):
+        """Test removed checks disappear from the snapshot."""
+        async def custom_check():
+            return _healthy()
+        
+        health_checker.add_custom_check("custom", custom_check)
+        scheduler = HealthScheduler(health_checker)
+        await scheduler.refresh()
+        
+        health_checker.remove_check("custom")
+        
+        assert await scheduler.run_check("custom:custom") is None
+        assert scheduler.snapshot().checks == []
+    
+    def test_router_serves_snapshot(self, health_checker):
+        """Test readiness probe reads the scheduler's snapshot."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        
+        call_count = 0
+        
+        async def custom_check():
+            nonlocal call_count
+            call_count += 1
+            return _healthy()
+        
+        health_checker.add_custom_check("custom", custom_check)
+        scheduler = HealthScheduler(health_checker)
+        app = FastAPI()
+        app.include_router(create_health_router(health_checker, scheduler=scheduler))
+        client = TestClient(app)
+        
+        client.post("/health/invalidate-cache")
+        assert call_count == 1
+        
+        for _ in range(3):
+            response = client.get("/health/ready")
+            assert response.status_code == 200
+            assert response.json()["overall_status"] == "healthy"
+        assert call_count == 1
+        
+        checks = client.get("/health/checks").json()
+        assert checks["scheduled"]["custom:custom"]["runs"] == 1
+
+
+class _FakeRedisConnection:
+    async def send_command(self, *args):
+        pass
+    
+    async def read_response(self):
+        return "PONG"
+
+
+class _FakeRedisPool:
+    """Bounded pool exposing the redis-py pool attributes the check reads."""
+    
+    def __init__(self, max_connections=10, checkout_delay=0.0):
+        self.max_connections = max_connections
+        self.checkout_delay = checkout_delay
+        self._available_connections = []
+        self._in_use_connections = set()
+    
+    async def get_connection(self, command_name, *keys, **options):
+        await asyncio.sleep(self.checkout_delay)
+        connection = _FakeRedisConnection()
+        self._in_use_connections.add(connection)
+        return connection
+    
+    async def release(self, connection):
+        self._in_use_connections.discard(connection)
+        self._available_connections.append(connection)
+
+
+class TestPoolHealthChecks:
+    """Tests for health checks borrowing from application pools."""
+    
+    @pytest.fixture
+    def engine(self, tmp_path):
+        """Create a small async SQLite engine with a bounded queue pool."""
+        from sqlalchemy.ext.asyncio import create_async_engine
+        from sqlalchemy.pool import AsyncAdaptedQueuePool
+        
+        return create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'health.db'}",
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=2,
+            max_overflow=3,
+        )
+    
+    @pytest.mark.asyncio
+    async def test_engine_pool_healthy(self, engine):
+        """Test a check borrows from the engine and reports pool usage."""
+        result = await check_engine_pool_health(EnginePoolHealthCheckConfig(name="main", engine=engine))
+        
+        assert result.status == HealthStatus.HEALTHY
+        assert result.service_name == "main_pool"
+        assert result.metadata["capacity"] == 5
+        assert result.metadata["checked_out"] == 0
+        assert "checkout_wait_ms" in result.metadata
+        # The borrowed connection went back to the pool
+        assert engine.pool.checkedout() == 0
+        await engine.dispose()
+    
+    @pytest.mark.asyncio
+    async def test_engine_pool_saturation(self, engine):
+        """Test saturation and overflow degrade and then fail readiness."""
+        config = EnginePoolHealthCheckConfig(engine=engine)
+        connections = [await engine.connect().start() for _ in range(4)]
+        try:
+            degraded = await check_engine_pool_health(config)
+            assert degraded.status == HealthStatus.DEGRADED
+            assert degraded.metadata["saturation"] == 0.8
+            assert degraded.metadata["overflow_in_use"] == 2
+            assert degraded.metadata["degraded_reason"] == "pool_saturated"
+            
+            connections.append(await engine.connect().start())
+            unhealthy = await check_engine_pool_health(config)
+            assert unhealthy.status == HealthStatus.UNHEALTHY
+            assert unhealthy.error_type == "pool_saturated"
+            # A saturated pool is not borrowed from
+            assert "checkout_wait_ms" not in unhealthy.metadata
+        finally:
+            for connection in connections:
+                await connection.close()
+            await engine.dispose()
+    
+    @pytest.mark.asyncio
+    async def test_redis_pool_checkout_wait(self):
+        """Test slow checkouts from the Redis pool degrade or fail the check."""
+        thresholds = PoolHealthThresholds(checkout_wait_degraded_ms=10, checkout_wait_unhealthy_ms=1000)
+        pool = _FakeRedisPool(checkout_delay=0.02)
+        
+        result = await check_redis_pool_health(RedisPoolHealthCheckConfig(client=pool, thresholds=thresholds))
+        
+        assert result.status == HealthStatus.DEGRADED
+        assert result.metadata["degraded_reason"] == "slow_checkout"
+        assert result.metadata["checkout_wait_ms"] >= 10
+        assert not pool._in_use_connections
+        
+        timed_out = await check_redis_pool_health(
+            RedisPoolHealthCheckConfig(client=_FakeRedisPool(checkout_delay=1)),
+            timeout_seconds=0.01,
+        )
+        assert timed_out.status == HealthStatus.UNHEALTHY
+        assert timed_out.error_type == "checkout_timeout"
+    
+    @pytest.mark.asyncio
+    async def test_redis_pool_saturation(self):
+        """Test a bounded Redis pool reports saturation."""
+        pool = _FakeRedisPool(max_connections=2)
+        pool._in_use_connections.update({object(), object()})
+        
+        result = await check_redis_pool_health(RedisPoolHealthCheckConfig(client=pool))
+        
+        assert result.status == HealthStatus.UNHEALTHY
+        assert result.metadata["saturation"] == 1.0
+    
+    @pytest.mark.asyncio
+    async def test_pool_checks_registered(self, engine):
+        """Test pool checks feed the aggregated readiness status."""
+        checker = HealthChecker()
+        checker.add_engine_pool_check("main", engine)
+        checker.add_redis_pool_check("cache", _FakeRedisPool(max_connections=1))
+        
+        checks = checker.get_registered_checks()
+        assert checks["database_pool"] == ["main"]
+        assert checks["redis_pool"] == ["cache"]
+        
+        status = await checker.run_health_checks(use_cache=False)
+        assert status.overall_status == HealthStatus.HEALTHY
+        assert {check.service_name for check in status.checks} == {"main_pool", "cache_pool"}
+        
+        checker.remove_check("cache")
+        assert checker.get_registered_checks()["redis_pool"] == []
+        await engine.dispose()
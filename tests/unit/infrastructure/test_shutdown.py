@@ -3,6 +3,7 @@ Unit tests for graceful shutdown functionality
 """
 
 import asyncio
+import math
 import signal
 import pytest
 from datetime import datetime, timezone, timedelta
@@ -282,6 +283,161 @@ class TestConnectionTracker:
         assert stats["total_connections"] == 0
 
 
+class TestConnectionTrackerCounters:
+    """Tests for per-type counters and adaptive draining"""
+    
+    @pytest.mark.asyncio
+    async def test_metadata_only_with_details(self, config):
+        """Test connection metadata is kept only when details are tracked"""
+        tracker = ConnectionTracker(config)
+        await tracker.register_connection(ResourceType.DATABASE, metadata={"host": "db"})
+        
+        [info] = await tracker.get_connections_by_type(ResourceType.DATABASE)
+        assert info.metadata == {}
+        
+        config.track_connection_details = True
+        detailed = ConnectionTracker(config)
+        await detailed.register_connection(ResourceType.DATABASE, metadata={"host": "db"})
+        
+        [info] = await detailed.get_connections_by_type(ResourceType.DATABASE)
+        assert info.metadata == {"host": "db"}
+    
+    def test_begin_finish_request(self, connection_tracker):
+        """Test the synchronous request path keeps per-type counts"""
+        first = connection_tracker.begin_request(ResourceType.HTTP_CLIENT)
+        second = connection_tracker.begin_request(ResourceType.HTTP_CLIENT)
+        connection_tracker.begin_request(ResourceType.DATABASE)
+        
+        stats = connection_tracker.get_stats()
+        assert stats["by_type"] == {"http_client": 2, "database": 1}
+        assert stats["in_flight_by_type"] == {"http_client": 2, "database": 1}
+        assert stats["total_in_flight_requests"] == 3
+        
+        assert connection_tracker.finish_request(first) is True
+        assert connection_tracker.finish_request(first) is False
+        connection_tracker.finish_request(second)
+        
+        stats = connection_tracker.get_stats()
+        assert stats["by_type"] == {"database": 1}
+        assert stats["total_in_flight_requests"] == 1
+        assert stats["request_duration_p50_seconds"] is not None
+    
+    @pytest.mark.asyncio
+    async def test_deregister_drops_in_flight(self, connection_tracker):
+        """Test deregistering a busy connection stops counting its requests"""
+        conn_id = await connection_tracker.register_connection(ResourceType.HTTP_CLIENT)
+        await connection_tracker.start_request(conn_id)
+        await connection_tracker.start_request(conn_id)
+        
+        await connection_tracker.deregister_connection(conn_id)
+        
+        assert await connection_tracker.get_in_flight_requests_count() == 0
+    
+    def test_estimate_drain_time(self, connection_tracker):
+        """Test the drain estimate uses durations of longer requests"""
+        assert connection_tracker.estimate_drain_time() == 0.0
+        
+        conn_id = connection_tracker.begin_request(ResourceType.HTTP_CLIENT)
+        assert connection_tracker.estimate_drain_time() is None
+        
+        connection_tracker._durations.extend([0.1] * 50 + [2.0] * 50)
+        estimate = connection_tracker.estimate_drain_time(percentile=0.5)
+        assert 1.9 < estimate <= 2.0
+        
+        # Older than every observed request: no prediction, wait the full timeout
+        connection_tracker._connections[conn_id].request_starts[0] -= 5
+        assert connection_tracker.estimate_drain_time() == math.inf
+    
+    @pytest.mark.asyncio
+    async def test_drain_returns_when_last_request_ends(self, connection_tracker):
+        """Test draining wakes up as soon as in-flight requests complete"""
+        conn_id = connection_tracker.begin_request(ResourceType.HTTP_CLIENT)
+        
+        async def finish():
+            await asyncio.sleep(0.05)
+            connection_tracker.finish_request(conn_id)
+        
+        task = asyncio.create_task(finish())
+        result = await connection_tracker.drain_connections(timeout=2.0, check_interval=1.0)
+        await task
+        
+        assert result["remaining_requests"] == 0
+        assert result["duration_seconds"] < 0.5
+    
+    @pytest.mark.asyncio
+    async def test_drain_waits_for_request_slower_than_every_sample(self):
+        """Test a request slower than every sample is waited for, not dropped"""
+        tracker = ConnectionTracker(ShutdownConfig())
+        tracker._durations.extend([0.01] * 200)
+        conn_id = tracker.begin_request(ResourceType.HTTP_CLIENT)
+        tracker._connections[conn_id].request_starts[0] -= 1
+        
+        async def finish():
+            await asyncio.sleep(1.5)
+            tracker.finish_request(conn_id)
+        
+        task = asyncio.create_task(finish())
+        result = await tracker.drain_connections(timeout=3.0)
+        await task
+        
+        assert result["estimated_seconds"] == math.inf
+        assert result["remaining_requests"] == 0
+        assert result["duration_seconds"] >= 1.4
+    
+    @pytest.mark.asyncio
+    async def test_manager_extends_drain_for_long_requests(self, config):
+        """Test shutdown drains past drain_timeout when requests are expected to finish"""
+        config.graceful_timeout = 2.0
+        config.drain_timeout = 0.1
+        ShutdownManager.reset()
+        manager = ShutdownManager(config)
+        tracker = manager.connection_tracker
+        tracker._durations.extend([0.3] * 5 + [0.6] * 5)
+        conn_id = tracker.begin_request(ResourceType.HTTP_CLIENT)
+        
+        async def finish():
+            await asyncio.sleep(0.3)
+            tracker.finish_request(conn_id)
+        
+        task = asyncio.create_task(finish())
+        result = await manager.shutdown(reason="Rolling deploy")
+        await task
+        ShutdownManager.reset()
+        
+        assert result.status == ShutdownStatus.SUCCESSFUL
+        assert not result.progress.warnings
+    
+    def test_drain_timeout_sized_by_estimate(self, config):
+        """Test the drain timeout follows the estimate within drain_timeout and the budget"""
+        config.graceful_timeout = 5.0
+        config.drain_timeout = 0.5
+        ShutdownManager.reset()
+        manager = ShutdownManager(config)
+        tracker = manager.connection_tracker
+        try:
+            assert manager._drain_timeout() == 0.5
+            
+            conn_id = tracker.begin_request(ResourceType.HTTP_CLIENT)
+            assert manager._drain_timeout() == 0.5  # no samples yet
+            
+            tracker._durations.extend([2.0] * 10)
+            assert 1.9 < manager._drain_timeout() <= 2.0
+            
+            tracker._durations.clear()
+            tracker._durations.extend([0.1] * 10 + [20.0])
+            assert manager._drain_timeout() == 5.0
+            
+            tracker._durations.clear()
+            tracker._durations.extend([0.1] * 10)
+            assert manager._drain_timeout() == 0.5
+            
+            # Older than every sample: unpredictable, so the whole budget
+            tracker._connections[conn_id].request_starts[0] -= 1
+            assert manager._drain_timeout() == 5.0
+        finally:
+            ShutdownManager.reset()
+
+
 # ShutdownManager Tests
 
 class TestShutdownManager:
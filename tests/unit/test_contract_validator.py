@@ -0,0 +1,227 @@
+"""
+Unit tests for compiled API contract validation
+"""
+
+import json
+
+import pytest
+
+from src.adapters.api_contract.contract_validator import (
+    ContractValidator,
+    JSONSchemaValidator,
+    OpenAPIParser,
+    PathTemplateRouter,
+)
+
+
+SPEC = {
+    "openapi": "3.0.0",
+    "info": {"title": "Test API", "version": "1.0.0"},
+    "paths": {
+        "/users": {
+            "get": {
+                "parameters": [
+                    {"name": "limit", "in": "query", "required": True},
+                    {"$ref": "#/components/parameters/Page"},
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Users",
+                        "headers": {"X-Total-Count": {"required": True}},
+                        "content": {"application/json": {"schema": {
+                            "type": "array", "items": {"$ref": "#/components/schemas/User"},
+                        }}},
+                    },
+                },
+            },
+            "post": {
+                "requestBody": {"content": {"application/json": {"schema": {
+                    "$ref": "#/components/schemas/NewUser",
+                }}}},
+                "responses": {"201": {"description": "Created"}},
+            },
+        },
+        "/users/me": {
+            "get": {"responses": {"200": {"description": "Current user", "content": {
+                "application/json": {"schema": {"$ref": "#/components/schemas/User"}},
+            }}}},
+        },
+        "/users/{id}": {
+            "get": {"responses": {
+                "200": {"description": "User", "content": {
+                    "application/json": {"schema": {"$ref": "#/components/schemas/User"}},
+                }},
+                "4XX": {"$ref": "#/components/responses/Error"},
+            }},
+        },
+        "/files/{name}.json": {
+            "get": {"responses": {"200": {"description": "File"}}},
+        },
+        "/trees/{id}": {
+            "get": {"responses": {"200": {"description": "Tree", "content": {
+                "application/json": {"schema": {"$ref": "#/components/schemas/TreeNode"}},
+            }}}},
+        },
+    },
+    "components": {
+        "parameters": {"Page": {"name": "page", "in": "query"}},
+        "responses": {"Error": {"description": "Error", "content": {"application/json": {"schema": {
+            "type": "object", "required": ["error"], "properties": {"error": {"type": "string"}},
+        }}}}},
+        "schemas": {
+            "User": {
+                "type": "object",
+                "required": ["id", "profile"],
+                "properties": {"id": {"type": "integer"}, "profile": {"$ref": "#/components/schemas/Profile"}},
+            },
+            "Profile": {"type": "object", "required": ["email"], "properties": {"email": {"type": "string"}}},
+            "NewUser": {"type": "object", "required": ["username"], "properties": {"username": {"type": "string"}}},
+            "TreeNode": {
+                "type": "object",
+                "properties": {
+                    "value": {"type": "integer"},
+                    "children": {"type": "array", "items": {"$ref": "#/components/schemas/TreeNode"}},
+                },
+            },
+        },
+    },
+}
+
+
+@pytest.fixture
+def spec_path(tmp_path):
+    path = tmp_path / "openapi.json"
+    path.write_text(json.dumps(SPEC))
+    return path
+
+
+@pytest.fixture
+def validator(spec_path):
+    return ContractValidator(spec_path)
+
+
+USER = {"id": 1, "profile": {"email": "a@example.com"}}
+
+
+class TestPathTemplateRouter:
+    """Tests for PathTemplateRouter"""
+
+    @pytest.fixture
+    def router(self):
+        router = PathTemplateRouter()
+        for template in SPEC["paths"]:
+            router.add(template)
+        return router
+
+    def test_routes_concrete_paths(self, router):
+        assert router.match("/users/42") == "/users/{id}"
+        assert router.match("/users/42/") == "/users/{id}"
+        assert router.match("/users?limit=1") == "/users"
+        assert router.match("/files/report.json") == "/files/{name}.json"
+
+    def test_static_segments_win(self, router):
+        assert router.match("/users/me") == "/users/me"
+
+    def test_templates_match_themselves(self, router):
+        assert router.match("/users/{id}") == "/users/{id}"
+
+    def test_unknown_paths(self, router):
+        assert router.match("/users/42/posts") is None
+        assert router.match("/files/report.xml") is None
+        assert router.match("/") is None
+
+
+class TestOpenAPIParser:
+    """Tests for parser ref handling"""
+
+    def test_inline_nested_refs(self, spec_path):
+        parser = OpenAPIParser(spec_path)
+        user = parser.inline_refs({"$ref": "#/components/schemas/User"})
+
+        assert user["properties"]["profile"]["required"] == ["email"]
+        assert "$ref" not in json.dumps(user)
+
+    def test_recursive_refs_are_kept(self, spec_path):
+        parser = OpenAPIParser(spec_path)
+        tree = parser.inline_refs({"$ref": "#/components/schemas/TreeNode"})
+
+        assert tree["properties"]["children"]["items"] == {"$ref": "#/components/schemas/TreeNode"}
+
+    def test_get_endpoint(self, spec_path):
+        parser = OpenAPIParser(spec_path)
+
+        assert parser.get_endpoint("/users/{id}", "get").path == "/users/{id}"
+        assert parser.get_endpoint("/users/{id}", "DELETE") is None
+
+
+class TestJSONSchemaValidator:
+    """Tests for compiled schema validation"""
+
+    def test_compiled_validator_is_reused(self):
+        validator = JSONSchemaValidator()
+        schema = {"type": "object", "required": ["id"]}
+
+        assert validator.validate({"id": 1}, schema).passed
+        result = validator.validate({}, schema)
+
+        assert not result.passed
+        assert "'id' is a required property" in result.message
+        assert len(validator._compiled) == 1
+
+
+class TestContractValidator:
+    """Tests for ContractValidator with the compiled index"""
+
+    def test_compile_builds_index_once(self, validator):
+        assert validator._index is None
+
+        index = validator.compile()
+
+        assert validator._index is index
+        assert validator.compile() is index
+
+    def test_concrete_path_response(self, validator):
+        assert validator.validate_response("/users/42", "GET", 200, USER) == []
+
+    def test_nested_ref_violation(self, validator):
+        violations = validator.validate_response("/users/42", "GET", 200, {"id": 1, "profile": {}})
+
+        assert [v.rule for v in violations] == ["schema_validation"]
+        assert "email" in violations[0].message
+        assert violations[0].path == "GET /users/{id}"
+
+    def test_response_ref_and_wildcard_status(self, validator):
+        assert validator.validate_response("/users/42", "GET", 404, {"error": "missing"}) == []
+        violations = validator.validate_response("/users/42", "GET", 404, {})
+        assert [v.rule for v in violations] == ["schema_validation"]
+
+    def test_recursive_schema(self, validator):
+        tree = {"value": 1, "children": [{"value": 2, "children": [{"value": "bad"}]}]}
+
+        assert validator.validate_response("/trees/1", "GET", 200, {"value": 1, "children": []}) == []
+        assert [v.rule for v in validator.validate_response("/trees/1", "GET", 200, tree)] == [
+            "schema_validation"
+        ]
+
+    def test_status_body_and_header_rules(self, validator):
+        violations = validator.validate_response("/users", "GET", 500, None)
+        assert [v.rule for v in violations] == ["status_code"]
+
+        violations = validator.validate_response("/files/a.json", "GET", 200, {"unexpected": True})
+        assert [v.rule for v in violations] == ["unexpected_body"]
+
+        violations = validator.validate_response("/users", "GET", 200, [USER], headers={"Content-Type": "x"})
+        assert [v.rule for v in violations] == ["required_header"]
+        assert validator.validate_response("/users", "GET", 200, [USER], headers={"x-total-count": "1"}) == []
+
+    def test_unknown_endpoint(self, validator):
+        violations = validator.validate_response("/orders/1", "GET", 200, {})
+        assert [v.rule for v in violations] == ["endpoint_exists"]
+
+    def test_validate_request(self, validator):
+        assert validator.validate_request("/users", "POST", request_body={"username": "x"}) == []
+        violations = validator.validate_request("/users", "POST", request_body={"name": "x"})
+        assert [v.rule for v in violations] == ["request_body_validation"]
+
+        violations = validator.validate_request("/users", "GET", query_params={"page": 1, "sort": "id"})
+        assert sorted(v.rule for v in violations) == ["required_parameter", "unknown_parameter"]
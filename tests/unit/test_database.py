@@ -29,7 +29,12 @@ from src.adapters.database import (
     MigrationResult,
     MigrationStatus,
 )
-from src.adapters.database.sql_validator import SQLIssue, SQLValidationResult, ValidationSeverity
+from src.adapters.database.sql_validator import (
+    SQLIssue,
+    SQLValidationResult,
+    ValidationSeverity,
+    tokenize_sql,
+)
 from src.adapters.database.data_integrity_tester import ConstraintType
 
 
@@ -148,6 +153,65 @@ class TestSQLValidator:
         assert hasattr(result, "warnings")
         assert hasattr(result, "suggestions")
 
+    def test_multiline_string_literals(self):
+        """Test that string contents spanning lines are not scanned as SQL."""
+        validator = SQLValidator()
+
+        query = "SELECT note FROM notes\nWHERE note = 'first line\nit''s -- not a comment\nDROP'"
+        result = validator.validate_query(query)
+
+        assert result.is_valid is True
+        assert result.warnings == []
+
+    def test_unclosed_multiline_string_reports_start_line(self):
+        """Test that an unterminated literal is reported where it starts."""
+        validator = SQLValidator()
+
+        result = validator.validate_syntax("SELECT id\nFROM users\nWHERE name = 'john\nAND id = 1")
+
+        assert [issue.line_number for issue in result.issues] == [3]
+
+    def test_keywords_inside_identifiers_are_ignored(self):
+        """Test that UPDATE in updated_at is not a dangerous keyword."""
+        validator = SQLValidator()
+
+        result = validator.check_security_issues("SELECT updated_at, exp_date FROM users WHERE id = 1")
+
+        assert result.warnings == []
+        assert result.issues == []
+
+    def test_result_cache_uses_fingerprint(self):
+        """Test that keyword case and spacing share cached results."""
+        validator = SQLValidator(cache_size=16)
+
+        first = validator.validate_query("SELECT * FROM users WHERE id = 1")
+        second = validator.validate_query("select *   from users where id = 1")
+
+        assert validator.cache_info()["hits"] == 1
+        assert [i.message for i in first.suggestions] == [i.message for i in second.suggestions]
+
+    def test_cached_results_are_not_shared_lists(self):
+        """Test that mutating a returned result does not corrupt the cache."""
+        validator = SQLValidator()
+
+        validator.validate_query("UPDATE users SET active = 0").issues.clear()
+
+        assert validator.validate_query("UPDATE users SET active = 0").has_errors() is True
+
+
+class TestSQLTokenizer:
+    """Test suite for tokenize_sql."""
+
+    def test_token_kinds_and_lines(self):
+        """Test token kinds and line tracking."""
+        tokens = tokenize_sql("SELECT a::int, 'x\ny' -- c\nFROM t WHERE b = :b")
+
+        assert [t.kind for t in tokens] == [
+            "word", "word", "op", "word", "op", "string", "comment", "word", "word", "word", "word", "op", "param",
+        ]
+        assert tokens[5].line == 1
+        assert tokens[7].line == 3
+
 
 class TestDataIntegrityTester:
     """Test suite for DataIntegrityTester."""
@@ -0,0 +1,138 @@
+"""
+Unit tests for the shared invalidating cache base and its listener
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.domain.entities.role import Role
+from src.domain.entities.tenant import Tenant
+from src.infrastructure.persistence.invalidating_cache import MISSING
+from src.infrastructure.persistence.role_permission_cache import RolePermissionCache
+from src.infrastructure.persistence.tenant_cache import TenantCache
+
+
+class FakePubSub:
+    """Delivers queued messages, or fails like a dropped connection"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.closed = False
+
+    async def subscribe(self, channel):
+        self.redis.subscriptions += 1
+        if self.redis.fail_subscriptions:
+            self.redis.fail_subscriptions -= 1
+            raise ConnectionError("connection refused")
+
+    async def listen(self):
+        while True:
+            message = await self.redis.messages.get()
+            if isinstance(message, Exception):
+                raise message
+            yield {"type": "message", "data": message.encode()}
+
+    async def aclose(self):
+        self.closed = True
+
+
+class FakeRedis:
+    """Pub/sub client whose connection can be made to drop"""
+
+    def __init__(self, fail_subscriptions=0):
+        self.fail_subscriptions = fail_subscriptions
+        self.subscriptions = 0
+        self.messages = asyncio.Queue()
+        self.published = []
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+
+    def deliver(self, payload):
+        self.messages.put_nowait(json.dumps(payload))
+
+    def drop(self):
+        self.messages.put_nowait(ConnectionError("connection lost"))
+
+
+async def wait_for(condition, timeout=1.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        assert loop.time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.005)
+
+
+class TestInvalidatingCacheListener:
+    """Listener behaviour shared by TenantCache and RolePermissionCache"""
+
+    @pytest.mark.asyncio
+    async def test_applies_invalidations_from_other_workers(self):
+        redis = FakeRedis()
+        cache = TenantCache(redis_client=redis)
+        tenant = Tenant(name="Acme", slug="acme")
+        cache.put(tenant)
+        cache.start()
+        try:
+            await wait_for(lambda: redis.subscriptions == 1)
+            redis.deliver({"tenant_id": str(tenant.id), "slugs": []})
+            await wait_for(lambda: cache.get_by_slug("acme") is MISSING)
+        finally:
+            await cache.stop()
+        assert not cache.is_listening
+
+    @pytest.mark.asyncio
+    async def test_reconnects_and_clears_after_connection_drops(self):
+        redis = FakeRedis()
+        cache = RolePermissionCache(redis_client=redis)
+        cache.reconnect_delay = 0.01
+        role = Role(name="viewer", permissions=["tests:read"])
+        cache.start()
+        try:
+            await wait_for(lambda: redis.subscriptions == 1)
+            cache.get_permissions([role])
+            redis.drop()
+            await wait_for(lambda: redis.subscriptions == 2)
+
+            assert cache.is_listening
+            assert cache.get_stats()["entries"] == 0
+            assert cache._by_role == {}
+
+            cache.get_permissions([role])
+            redis.deliver({"role_id": str(role.id)})
+            await wait_for(lambda: cache.get_stats()["entries"] == 0)
+        finally:
+            await cache.stop()
+
+    @pytest.mark.asyncio
+    async def test_retries_failed_subscription(self):
+        redis = FakeRedis(fail_subscriptions=2)
+        cache = TenantCache(redis_client=redis)
+        cache.reconnect_delay = 0.01
+        cache.start()
+        try:
+            await wait_for(lambda: redis.subscriptions == 3)
+            cache.put(Tenant(name="Acme", slug="acme"))
+            redis.deliver({"tenant_id": None, "slugs": ["acme"]})
+            await wait_for(lambda: cache.get_by_slug("acme") is MISSING)
+        finally:
+            await cache.stop()
+
+    @pytest.mark.asyncio
+    async def test_broadcast_failure_is_not_raised(self):
+        class BrokenRedis(FakeRedis):
+            async def publish(self, channel, message):
+                raise ConnectionError("connection lost")
+
+        cache = RolePermissionCache(redis_client=BrokenRedis())
+        role = Role(name="viewer", permissions=["tests:read"])
+        cache.get_permissions([role])
+
+        await cache.broadcast_invalidation(role.id)
+
+        assert cache.get_stats()["entries"] == 0
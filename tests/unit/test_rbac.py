@@ -6,6 +6,7 @@ Tests cover:
 2. Role entity with permission checking
 3. RBACContext permission utilities
 4. InMemoryRoleRepository operations
+5. Compiled permission sets and their cache
 """
 
 import pytest
@@ -13,8 +14,15 @@ from datetime import datetime, timezone
 from uuid import uuid4, UUID
 
 from src.domain.entities.role import Role, ROLE_PERMISSIONS
-from src.domain.entities.permission import Permission, validate_permission, PERMISSIONS
+from src.domain.entities.permission import (
+    CompiledPermissions,
+    Permission,
+    PermissionRegistry,
+    validate_permission,
+    PERMISSIONS
+)
 from src.api.middleware.rbac_middleware import RBACContext
+from src.infrastructure.persistence.role_permission_cache import RolePermissionCache
 from src.infrastructure.persistence.role_repository import InMemoryRoleRepository
 
 
@@ -404,3 +412,159 @@ class TestInMemoryRoleRepository:
         
         assert deleted is True
         assert await repository.get_by_id(sample_role.id) is None
+
+
+class FakeRedis:
+    """Records published messages"""
+    
+    def __init__(self):
+        self.published = []
+    
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+
+
+class TestCompiledPermissions:
+    """Unit tests for CompiledPermissions"""
+    
+    GRANT_SETS = [
+        [],
+        ["tests:read"],
+        ["tests:*", "users:read"],
+        ["projects:read", "projects:write", "settings:*"],
+        ["admin:*"],
+        ROLE_PERMISSIONS["member"],
+    ]
+    
+    REQUIRED = sorted(PERMISSIONS) + ["tests:*", "billing:read", "reports:export"]
+    
+    @pytest.mark.parametrize("grants", GRANT_SETS)
+    def test_matches_role_has_permission(self, grants):
+        """Compiled checks agree with Role.has_permission"""
+        role = Role(name="custom", permissions=list(grants))
+        compiled = CompiledPermissions(grants, PermissionRegistry(PERMISSIONS))
+        
+        for permission in self.REQUIRED:
+            assert compiled.allows(permission) == role.has_permission(permission), permission
+    
+    def test_wildcard_covers_permissions_interned_later(self):
+        """Permissions unknown at compile time still match resource wildcards"""
+        registry = PermissionRegistry(["tests:read"])
+        compiled = CompiledPermissions(["tests:*"], registry)
+        
+        assert compiled.allows("tests:export") is True
+        assert compiled.allows("projects:export") is False
+        assert compiled.allows_all(registry.mask(["tests:read", "tests:export"])) is True
+        assert compiled.allows_any(registry.mask(["projects:read", "tests:export"])) is True
+    
+    def test_masks(self):
+        """Set operations over registry masks"""
+        registry = PermissionRegistry(PERMISSIONS)
+        compiled = CompiledPermissions(["tests:read", "projects:read"], registry)
+        
+        assert compiled.allows_all(registry.mask(["tests:read", "projects:read"])) is True
+        assert compiled.allows_all(registry.mask(["tests:read", "tests:write"])) is False
+        assert compiled.allows_any(registry.mask(["users:read", "projects:read"])) is True
+        assert compiled.allows_any(0) is False
+        assert compiled.allows_all(0) is True
+    
+    def test_immutable(self):
+        """Compiled sets cannot be modified"""
+        compiled = CompiledPermissions(["tests:read"])
+        
+        with pytest.raises(AttributeError):
+            compiled.mask = 0
+
+
+class TestRolePermissionCache:
+    """Unit tests for RolePermissionCache"""
+    
+    def test_role_sets_compiled_once(self):
+        """Repeat lookups of a role set hit the cache"""
+        cache = RolePermissionCache()
+        tenant_id = uuid4()
+        roles = [Role(tenant_id=tenant_id, name=f"r{i}", permissions=["tests:read"]) for i in range(3)]
+        
+        first = cache.get_permissions(roles)
+        assert cache.get_permissions(list(reversed(roles))) is first
+        assert cache.get_stats()["hits"] == 1
+    
+    def test_invalidate_role_drops_every_combination(self):
+        """Invalidating a role recompiles each combination containing it"""
+        cache = RolePermissionCache()
+        shared = Role(name="shared", permissions=["tests:read"])
+        other = Role(name="other", permissions=["projects:read"])
+        cache.get_permissions([shared])
+        cache.get_permissions([shared, other])
+        cache.get_permissions([other])
+        
+        shared.permissions = ["tests:write"]
+        cache.invalidate_role(shared.id)
+        
+        assert cache.get_stats()["entries"] == 1
+        assert cache.get_permissions([shared, other]).allows("tests:write") is True
+    
+    def test_changed_permissions_not_served_from_cache(self):
+        """A role's revoked permission is denied without any invalidation"""
+        cache = RolePermissionCache()
+        role = Role(name="member", permissions=["tests:read", "tests:write"])
+        assert RBACContext([role], cache=cache).has_permission("tests:read") is True
+        
+        role.remove_permission("tests:read")
+        
+        assert RBACContext([role], cache=cache).has_permission("tests:read") is False
+    
+    @pytest.mark.asyncio
+    async def test_repository_update_revokes_cached_permission(self):
+        """Updating a role through the repository invalidates its combinations"""
+        cache = RolePermissionCache()
+        repo = InMemoryRoleRepository(cache=cache)
+        tenant_id = uuid4()
+        role = await repo.create(Role(tenant_id=tenant_id, name="member", permissions=["tests:read"]))
+        assert RBACContext([role], cache=cache).has_permission("tests:read") is True
+        
+        revoked = Role(id=role.id, tenant_id=tenant_id, name="member", permissions=[])
+        await repo.update(revoked)
+        
+        assert cache.get_stats()["entries"] == 0
+        assert RBACContext([revoked], cache=cache).has_permission("tests:read") is False
+        
+        await repo.delete(role.id)
+        assert cache.get_stats()["invalidations"] == 2
+    
+    def test_lru_bound(self):
+        """Oldest combinations are evicted"""
+        cache = RolePermissionCache(max_entries=2)
+        roles = [Role(name=f"r{i}") for i in range(3)]
+        for role in roles:
+            cache.get_permissions([role])
+        
+        cache.invalidate_role(roles[0].id)
+        assert cache.get_stats()["entries"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_publishes_invalidation(self):
+        """Invalidations are published for other workers"""
+        redis = FakeRedis()
+        cache = RolePermissionCache(redis_client=redis)
+        role = Role(name="member", permissions=["tests:read"])
+        cache.get_permissions([role])
+        
+        await cache.broadcast_invalidation(role.id)
+        
+        assert cache.get_stats()["entries"] == 0
+        channel, message = redis.published[0]
+        assert channel == "roles:invalidated"
+        assert str(role.id) in message
+    
+    def test_rbac_context_uses_cache(self):
+        """RBACContext checks share compiled sets across requests"""
+        cache = RolePermissionCache()
+        roles = [Role(name="member", permissions=["tests:*"]), Role(name="viewer", permissions=["projects:read"])]
+        
+        for _ in range(3):
+            rbac = RBACContext(roles, cache=cache)
+            assert rbac.has_all_permissions(["tests:run", "projects:read"]) is True
+            assert rbac.has_any_permission(["users:read", "projects:write"]) is False
+        
+        assert cache.get_stats()["misses"] == 1
@@ -33,6 +33,87 @@ class TestAllureReporter:
         assert hasattr(reporter, 'end_test')
         assert hasattr(reporter, 'generate_report')
 
+    def _write_results(self, results_dir, statuses):
+        """Write Allure result files with the given statuses"""
+        import json
+
+        for i, status in enumerate(statuses):
+            result = {
+                "name": f"test_{i}",
+                "status": status,
+                "statusDetails": {"message": f"boom <{i}>", "trace": "Traceback\n  line"},
+            }
+            (Path(results_dir) / f"{i:05d}-result.json").write_text(json.dumps(result))
+
+    def test_streaming_json_report(self):
+        """Test that the streamed JSON report contains every result"""
+        import json
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reporter = AllureReporter(results_dir=f"{tmpdir}/results", parse_workers=2)
+            self._write_results(reporter.results_dir, ["passed", "failed", "skipped"] * 5)
+
+            report_path = reporter.generate_report(f"{tmpdir}/out", "json")
+            report = json.loads(Path(report_path).read_text())
+
+            assert report["report_name"] == "QA Framework Test Report"
+            assert report["total_tests"] == 15
+            assert sorted(r["name"] for r in report["results"]) == sorted(f"test_{i}" for i in range(15))
+
+    def test_streaming_xml_report_counts(self):
+        """Test that the streamed JUnit XML report has correct totals"""
+        import xml.etree.ElementTree as ET
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reporter = AllureReporter(results_dir=f"{tmpdir}/results")
+            self._write_results(reporter.results_dir, ["passed", "failed", "broken", "skipped", "failed"])
+
+            report_path = reporter.generate_report(f"{tmpdir}/out", "xml")
+            suite = ET.parse(report_path).getroot().find("testsuite")
+
+            assert suite.attrib["tests"] == "5"
+            assert suite.attrib["failures"] == "2"
+            assert suite.attrib["errors"] == "1"
+            assert suite.attrib["skipped"] == "1"
+            failures = suite.findall("testcase/failure")
+            assert failures[0].attrib["message"].startswith("boom <")
+            assert failures[0].text == "Traceback\n  line"
+
+    def test_xml_report_with_null_status_details(self):
+        """Test that null messages and traces are written as empty"""
+        import json
+        import xml.etree.ElementTree as ET
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reporter = AllureReporter(results_dir=f"{tmpdir}/results")
+            results = [
+                {"name": "test_0", "status": "failed", "statusDetails": {"message": None, "trace": None}},
+                {"name": "test_1", "status": "broken", "statusDetails": None},
+            ]
+            for i, result in enumerate(results):
+                (reporter.results_dir / f"{i:05d}-result.json").write_text(json.dumps(result))
+
+            suite = ET.parse(reporter.generate_report(tmpdir, "xml")).getroot().find("testsuite")
+
+            failure = suite.find("testcase/failure")
+            assert failure.attrib["message"] == ""
+            assert not failure.text
+            assert suite.find("testcase/error").attrib["message"] == ""
+
+    def test_streaming_reports_with_no_results(self):
+        """Test that reports are valid when there are no results"""
+        import json
+        import xml.etree.ElementTree as ET
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reporter = AllureReporter(results_dir=f"{tmpdir}/results")
+
+            report = json.loads(Path(reporter.generate_report(tmpdir, "json")).read_text())
+            suite = ET.parse(reporter.generate_report(tmpdir, "xml")).getroot().find("testsuite")
+
+            assert report["results"] == [] and report["total_tests"] == 0
+            assert suite.attrib["tests"] == "0"
+
 
 class TestHTMLReporter:
     """Unit tests for HTMLReporter"""
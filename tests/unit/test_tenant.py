@@ -13,7 +13,12 @@ from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
 from src.domain.entities.tenant import Tenant, TenantPlan, TenantStatus
-from src.infrastructure.persistence.tenant_repository import InMemoryTenantRepository
+from src.infrastructure.persistence.tenant_repository import (
+    InMemoryTenantRepository,
+    SQLAlchemyTenantRepository,
+)
+from src.infrastructure.persistence.tenant_cache import MISSING, TenantCache
+from src.api.middleware.tenant_context import TenantContextMiddleware, compile_public_paths
 
 
 class TestTenantEntity:
@@ -472,3 +477,182 @@ class TestInMemoryTenantRepository:
         
         assert len(suspended_tenants) == 1
         assert suspended_tenants[0].slug == "suspended"
+
+
+class CountingTenantRepository(InMemoryTenantRepository):
+    """In-memory repository counting lookups"""
+    
+    def __init__(self):
+        super().__init__()
+        self.lookups = 0
+    
+    async def get_by_id(self, tenant_id):
+        self.lookups += 1
+        return await super().get_by_id(tenant_id)
+    
+    async def get_by_slug(self, slug):
+        self.lookups += 1
+        return await super().get_by_slug(slug)
+
+
+def make_request(host="acme.app.com", tenant_id=None, path="/api/v1/tests"):
+    """Build a Starlette request with the given host and tenant header"""
+    from starlette.requests import Request
+    headers = [(b"host", host.encode())]
+    if tenant_id:
+        headers.append((b"x-tenant-id", str(tenant_id).encode()))
+    return Request({"type": "http", "method": "GET", "path": path, "headers": headers})
+
+
+class FakeRedis:
+    """Records published messages"""
+    
+    def __init__(self):
+        self.published = []
+    
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+
+
+class TestTenantCache:
+    """Unit tests for TenantCache"""
+    
+    def test_put_serves_id_and_slug(self):
+        cache = TenantCache()
+        tenant = Tenant(name="Acme", slug="acme")
+        
+        assert cache.get_by_slug("acme") is MISSING
+        cache.put(tenant)
+        
+        assert cache.get_by_slug("acme") is tenant
+        assert cache.get_by_id(tenant.id) is tenant
+        assert cache.get_stats()["hit_rate"] == pytest.approx(2 / 3)
+    
+    def test_negative_entries_expire(self):
+        cache = TenantCache(negative_ttl=0)
+        cache.put_missing_slug("ghost")
+        
+        assert cache.get_by_slug("ghost") is MISSING
+    
+    def test_lru_bound(self):
+        cache = TenantCache(max_entries=2)
+        first = Tenant(name="First", slug="first")
+        second = Tenant(name="Second", slug="second")
+        cache.put(first)
+        cache.put(second)
+        
+        assert cache.get_by_id(first.id) is MISSING
+        assert cache.get_by_slug("second") is second
+    
+    def test_invalidate_by_id_drops_slug(self):
+        cache = TenantCache()
+        tenant = Tenant(name="Acme", slug="acme")
+        cache.put(tenant)
+        
+        cache.invalidate(tenant.id)
+        
+        assert cache.get_by_id(tenant.id) is MISSING
+        assert cache.get_by_slug("acme") is MISSING
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_publishes_invalidation(self):
+        redis = FakeRedis()
+        cache = TenantCache(redis_client=redis)
+        tenant = Tenant(name="Acme", slug="acme")
+        cache.put(tenant)
+        
+        await cache.broadcast_invalidation(tenant.id, ["acme", "acme-old"])
+        
+        assert cache.get_by_slug("acme") is MISSING
+        channel, message = redis.published[0]
+        assert channel == "tenants:invalidated"
+        assert '"acme-old"' in message
+
+
+class TestSQLAlchemyTenantRepository:
+    """Unit tests for SQLAlchemyTenantRepository cache invalidation"""
+    
+    @pytest.mark.asyncio
+    async def test_create_drops_negative_slug_entry(self, monkeypatch):
+        import sys
+        from types import ModuleType, SimpleNamespace
+        from unittest.mock import AsyncMock, Mock
+        
+        models = ModuleType("dashboard.backend.models")
+        models.TenantModel = SimpleNamespace
+        monkeypatch.setitem(sys.modules, "dashboard.backend.models", models)
+        redis = FakeRedis()
+        cache = TenantCache(redis_client=redis)
+        cache.put_missing_slug("acme")
+        session = Mock(commit=AsyncMock(), refresh=AsyncMock())
+        repository = SQLAlchemyTenantRepository(session, cache=cache)
+        
+        tenant = await repository.create(Tenant(name="Acme", slug="acme"))
+        
+        assert tenant.slug == "acme"
+        assert cache.get_by_slug("acme") is MISSING
+        assert '"acme"' in redis.published[0][1]
+
+
+class TestTenantContextMiddleware:
+    """Unit tests for TenantContextMiddleware tenant resolution"""
+    
+    @pytest.fixture
+    def repository(self):
+        return CountingTenantRepository()
+    
+    def make_middleware(self, repository, **kwargs):
+        return TenantContextMiddleware(None, repository, cache=TenantCache(), **kwargs)
+    
+    @pytest.mark.asyncio
+    async def test_repeat_requests_hit_cache(self, repository):
+        tenant = await repository.create(Tenant(name="Acme", slug="acme"))
+        middleware = self.make_middleware(repository)
+        
+        for _ in range(3):
+            resolved, source = await middleware.resolve_tenant(make_request())
+            assert (resolved, source) == (tenant, "subdomain")
+        resolved, source = await middleware.resolve_tenant(make_request("x.app.com", tenant.id))
+        
+        assert source == "header"
+        assert repository.lookups == 1
+        assert middleware.cache.get_stats()["hits"] == 3
+    
+    @pytest.mark.asyncio
+    async def test_unknown_tenants_are_negatively_cached(self, repository):
+        middleware = self.make_middleware(repository)
+        
+        for _ in range(3):
+            assert await middleware.resolve_tenant(make_request("ghost.app.com")) == (None, "none")
+        
+        assert repository.lookups == 1
+        assert middleware.cache.get_stats()["negative_hits"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_invalidation_picks_up_status_change(self, repository):
+        tenant = await repository.create(Tenant(name="Acme", slug="acme"))
+        middleware = self.make_middleware(repository)
+        await middleware.resolve_tenant(make_request())
+        
+        suspended = Tenant(id=tenant.id, name="Acme", slug="acme", status=TenantStatus.SUSPENDED)
+        await repository.update(suspended)
+        middleware.cache.invalidate(tenant.id)
+        resolved, _ = await middleware.resolve_tenant(make_request())
+        
+        assert resolved.is_suspended()
+    
+    def test_public_paths(self, repository):
+        middleware = self.make_middleware(repository, public_paths=["/", "/health", "/docs/*"])
+        
+        assert middleware.is_public_path("/")
+        assert middleware.is_public_path("/health")
+        assert middleware.is_public_path("/docs")
+        assert middleware.is_public_path("/docs/oauth2-redirect")
+        assert not middleware.is_public_path("/health/deep")
+        assert not middleware.is_public_path("/api/v1/tests")
+    
+    def test_compile_public_paths(self):
+        exact, prefixes = compile_public_paths(["/", "/static/*", "/*"])
+        
+        assert exact == {"/"}
+        assert prefixes == {"/static", "/"}
@@ -0,0 +1,167 @@
+"""
+Unit tests for batch contract validation of recorded traffic
+"""
+
+import io
+import json
+
+import pytest
+
+from src.adapters.api_contract.contract_validator import ContractCoverageChecker
+from src.adapters.api_contract.traffic_replay import (
+    TrafficAuditor,
+    TrafficAuditReport,
+    _JSONStream,
+    audit_traffic,
+    iter_har_exchanges,
+    iter_jsonl_exchanges,
+)
+
+
+SPEC = {
+    "openapi": "3.0.0",
+    "info": {"title": "Test API", "version": "1.0.0"},
+    "paths": {
+        "/users": {"get": {"responses": {"200": {"description": "Users", "content": {
+            "application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/User"}}},
+        }}}}},
+        "/users/{id}": {"get": {"responses": {"200": {"description": "User", "content": {
+            "application/json": {"schema": {"$ref": "#/components/schemas/User"}},
+        }}}}},
+        "/orders": {"post": {"responses": {"201": {"description": "Created"}}}},
+    },
+    "components": {"schemas": {"User": {
+        "type": "object", "required": ["id"], "properties": {"id": {"type": "integer"}},
+    }}},
+}
+
+
+def har_entry(method, url, status, body=None):
+    entry = {
+        "request": {"method": method, "url": url, "queryString": [], "headers": []},
+        "response": {"status": status, "headers": [], "content": {"mimeType": "application/json"}},
+    }
+    if body is not None:
+        entry["response"]["content"]["text"] = json.dumps(body)
+    return entry
+
+
+@pytest.fixture
+def spec_path(tmp_path):
+    path = tmp_path / "openapi.json"
+    path.write_text(json.dumps(SPEC))
+    return path
+
+
+@pytest.fixture
+def har_path(tmp_path):
+    entries = [
+        har_entry("GET", f"https://api.test/api/v1/users/{i}", 200, {"id": i}) for i in range(20)
+    ]
+    entries.append(har_entry("GET", "https://api.test/api/v1/users/99", 200, {"id": "bad"}))
+    entries.append(har_entry("GET", "https://api.test/api/v1/users", 500, None))
+    entries.append(har_entry("DELETE", "https://api.test/api/v1/users/1", 204, None))
+    har = {"log": {"version": "1.2", "creator": {"name": "entries"}, "pages": [], "entries": entries}}
+    path = tmp_path / "traffic.har"
+    path.write_text(json.dumps(har, indent=1))
+    return path
+
+
+class TestJSONStream:
+    """Tests for the incremental JSON reader"""
+
+    def test_reads_values_across_chunk_boundaries(self):
+        document = {"log": {"entries": [{"n": i, "text": "x" * i} for i in range(50)] + [12345]}}
+        stream = _JSONStream(io.StringIO(json.dumps(document)), chunk_size=7)
+
+        values = []
+        for key in stream.members():
+            for log_key in stream.members():
+                values.extend(stream.items())
+
+        assert values == document["log"]["entries"]
+
+
+class TestTrafficReaders:
+    """Tests for HAR and JSONL readers"""
+
+    def test_har_exchanges(self, har_path):
+        exchanges = list(iter_har_exchanges(har_path, base_path="/api/v1"))
+
+        assert len(exchanges) == 23
+        assert exchanges[0].path == "/users/0"
+        assert exchanges[0].response_body == {"id": 0}
+        assert exchanges[-1].method == "DELETE"
+
+    def test_jsonl_exchanges(self, tmp_path):
+        path = tmp_path / "traffic.jsonl"
+        path.write_text("\n".join([
+            json.dumps({"method": "get", "url": "http://h/users/1?expand=true", "status": 200,
+                        "response_body": {"id": 1}}),
+            "",
+            json.dumps({"method": "POST", "path": "/orders", "status_code": 201}),
+        ]))
+
+        exchanges = list(iter_jsonl_exchanges(path))
+
+        assert [(e.method, e.path, e.status_code) for e in exchanges] == [
+            ("GET", "/users/1", 200), ("POST", "/orders", 201),
+        ]
+        assert exchanges[0].query_params == {"expand": "true"}
+
+
+class TestTrafficAuditor:
+    """Tests for TrafficAuditor"""
+
+    @pytest.mark.parametrize("max_workers", [0, 2])
+    def test_audit_har(self, spec_path, har_path, max_workers):
+        auditor = TrafficAuditor(spec_path, max_workers=max_workers, chunk_size=4, base_path="/api/v1")
+        report = auditor.audit(har_path)
+
+        assert report.total_exchanges == 23
+        assert report.unmatched_exchanges == 1
+        assert report.unmatched_paths == {"DELETE /users/1": 1}
+        assert report.failed_exchanges == 2
+        assert report.endpoint_hits[("/users/{id}", "GET")] == 21
+
+        rules = {(v.rule, v.endpoint): v.count for v in report.violations.values()}
+        assert rules == {("schema_validation", "GET /users/{id}"): 1, ("status_code", "GET /users"): 1}
+
+        assert report.coverage["tested_endpoints"] == 2
+        assert report.coverage["untested"] == [("/orders", "POST")]
+        json.dumps(report.to_dict())
+
+    def test_audit_traffic_convenience(self, spec_path, har_path):
+        report = audit_traffic(spec_path, har_path, max_workers=0, base_path="/api/v1")
+        assert report.total_exchanges == 23
+
+
+class TestTrafficAuditReport:
+    """Tests for report aggregation"""
+
+    def test_merge_keeps_bounded_samples(self):
+        total = TrafficAuditReport()
+        for _ in range(3):
+            part = TrafficAuditReport(total_exchanges=2)
+            part.add_violation("schema_validation", "GET /users", "error", {"n": 1})
+            part.add_violation("schema_validation", "GET /users", "error", {"n": 2})
+            part.add_unmatched("GET", "/nope")
+            total.merge(part)
+
+        summary = total.violations[("schema_validation", "GET /users")]
+        assert total.total_exchanges == 6
+        assert summary.count == 6
+        assert len(summary.samples) == TrafficAuditReport.MAX_SAMPLES
+        assert total.unmatched_exchanges == 3
+
+
+class TestCoverageChecker:
+    """Tests for coverage of concrete request paths"""
+
+    def test_mark_tested_maps_concrete_paths(self, spec_path):
+        checker = ContractCoverageChecker(spec_path)
+        checker.mark_tested("/users/42", "get")
+        checker.mark_tested("/users/7", "GET")
+
+        coverage = checker.get_coverage()
+        assert coverage["tested"] == [("/users/{id}", "GET")]
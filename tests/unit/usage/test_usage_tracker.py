@@ -21,6 +21,12 @@ from src.infrastructure.usage.usage_tracker import (
     UsageTracker,
     get_usage_tracker,
 )
+from src.infrastructure.usage.usage_store import (
+    Granularity,
+    RedisUsageBackend,
+    UsageStore,
+    bucket_start,
+)
 
 
 # ============================================================================
@@ -343,6 +349,275 @@ class TestUsageTracker:
         assert "limit_status" in report
 
 
+# ============================================================================
+# UsageStore Tests
+# ============================================================================
+
+class FakePipeline:
+    """Collects pipelined commands for FakeRedis"""
+    
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+    
+    def hincrbyfloat(self, key, field, amount):
+        self.commands.append(("hincrbyfloat", key, field, amount))
+    
+    def expire(self, key, seconds):
+        self.commands.append(("expire", key, seconds))
+    
+    async def execute(self):
+        if self.redis.fail:
+            raise ConnectionError("redis down")
+        self.redis.executed += 1
+        for command in self.commands:
+            if command[0] == "hincrbyfloat":
+                _, key, field, amount = command
+                bucket = self.redis.hashes.setdefault(key, {})
+                bucket[field] = bucket.get(field, 0.0) + amount
+            else:
+                self.redis.expiry[command[1]] = command[2]
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis hash commands used by the backend"""
+    
+    def __init__(self):
+        self.hashes = {}
+        self.expiry = {}
+        self.executed = 0
+        self.fail = False
+    
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+    
+    async def hgetall(self, key):
+        return {field.encode(): str(value).encode() for field, value in self.hashes.get(key, {}).items()}
+
+
+class TestUsageStore:
+    """Tests for bucketed usage counters."""
+    
+    def test_totals_tile_coarsest_buckets(self):
+        """Range totals combine month, day and hour buckets."""
+        store = UsageStore()
+        for timestamp in (
+            datetime(2026, 1, 31, 23, 30, tzinfo=timezone.utc),
+            datetime(2026, 2, 1, 0, 5, tzinfo=timezone.utc),
+            datetime(2026, 2, 14, 10, 0, tzinfo=timezone.utc),
+            datetime(2026, 3, 1, 2, 0, tzinfo=timezone.utc),
+        ):
+            store.add("u1", ResourceType.API_CALLS, 1.0, timestamp)
+        
+        feb = datetime(2026, 2, 1, tzinfo=timezone.utc)
+        mar = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        assert store.total("u1", ResourceType.API_CALLS, feb, mar) == 2
+        assert store.total("u1", ResourceType.API_CALLS, feb - timedelta(hours=1), mar + timedelta(hours=3)) == 4
+        assert store.total("u1", ResourceType.API_CALLS, feb + timedelta(hours=1), mar) == 1
+        assert store.get("u1", ResourceType.API_CALLS, Granularity.MONTH, feb) == 2
+    
+    def test_bucket_start_normalizes_to_utc(self):
+        """Buckets are UTC regardless of the timestamp's zone."""
+        plus_two = timezone(timedelta(hours=2))
+        
+        start = bucket_start(datetime(2026, 3, 1, 1, 30, tzinfo=plus_two), Granularity.MONTH)
+        
+        assert start == datetime(2026, 2, 1, tzinfo=timezone.utc)
+    
+    def test_prune_keeps_month_buckets(self):
+        """Old hour buckets are dropped; month totals survive."""
+        store = UsageStore(hour_retention=timedelta(days=1))
+        old = datetime(2026, 1, 2, 5, tzinfo=timezone.utc)
+        store.add("u1", ResourceType.API_CALLS, 3.0, old)
+        
+        dropped = store.prune(now=datetime(2026, 1, 10, tzinfo=timezone.utc))
+        
+        assert dropped == 1
+        assert store.get("u1", ResourceType.API_CALLS, Granularity.MONTH, bucket_start(old, Granularity.MONTH)) == 3
+    
+    @pytest.mark.asyncio
+    async def test_flush_batches_into_redis_hashes(self):
+        """Pending deltas are written in one pipeline."""
+        redis = FakeRedis()
+        store = UsageStore(backend=RedisUsageBackend(redis))
+        timestamp = datetime(2026, 2, 14, 10, 15, tzinfo=timezone.utc)
+        for _ in range(5):
+            store.add("u1", ResourceType.API_CALLS, 1.0, timestamp)
+        store.add("u1", ResourceType.STORAGE_MB, 2.5, timestamp)
+        
+        written = await store.flush()
+        
+        assert written == 6
+        assert redis.executed == 1
+        assert redis.hashes["usage:u1:month:202602"] == {"api_calls": 5.0, "storage_mb": 2.5}
+        assert "usage:u1:hour:2026021410" in redis.expiry
+        assert "usage:u1:month:202602" not in redis.expiry
+        assert store.pending == 0
+    
+    @pytest.mark.asyncio
+    async def test_failed_flush_requeues_deltas(self):
+        """A failed write keeps its deltas for the next flush."""
+        redis = FakeRedis()
+        store = UsageStore(backend=RedisUsageBackend(redis))
+        timestamp = datetime(2026, 2, 14, 10, tzinfo=timezone.utc)
+        store.add("u1", ResourceType.API_CALLS, 2.0, timestamp)
+        
+        redis.fail = True
+        with pytest.raises(ConnectionError):
+            await store.flush()
+        store.add("u1", ResourceType.API_CALLS, 1.0, timestamp)
+        redis.fail = False
+        await store.flush()
+        
+        assert redis.hashes["usage:u1:day:20260214"] == {"api_calls": 3.0}
+    
+    @pytest.mark.asyncio
+    async def test_hydrate_restores_durable_counters(self):
+        """A fresh store loads counters flushed by another instance."""
+        redis = FakeRedis()
+        timestamp = datetime(2026, 2, 14, 10, tzinfo=timezone.utc)
+        month = bucket_start(timestamp, Granularity.MONTH)
+        first = UsageStore(backend=RedisUsageBackend(redis))
+        first.add("u1", ResourceType.API_CALLS, 7.0, timestamp)
+        await first.flush()
+        
+        second = UsageStore(backend=RedisUsageBackend(redis))
+        second.add("u1", ResourceType.API_CALLS, 1.0, timestamp)
+        await second.hydrate("u1", Granularity.MONTH, month)
+        
+        assert second.get("u1", ResourceType.API_CALLS, Granularity.MONTH, month) == 8
+
+
+class TestUsageTrackerBuckets:
+    """Tests for UsageTracker reads served from buckets."""
+    
+    def test_limit_check_without_raw_records(self, sample_user_id):
+        """Limits and summaries work with record retention disabled."""
+        tracker = UsageTracker(retain_records=False)
+        for _ in range(30):
+            tracker.track_usage(sample_user_id, ResourceType.AI_GENERATIONS, 1.0)
+        
+        status = tracker.check_usage_limit(sample_user_id, ResourceType.AI_GENERATIONS, "free")
+        
+        assert tracker.get_usage(sample_user_id) == []
+        assert status["current_usage"] == 30
+        assert status["is_within_limit"] is False
+        assert tracker.get_usage_summary(sample_user_id).ai_generations == 30
+    
+    def test_previous_periods_excluded(self, usage_tracker, sample_user_id):
+        """Usage from earlier months does not count toward the current one."""
+        last_year = datetime.now(timezone.utc) - timedelta(days=400)
+        usage_tracker.track_usage(sample_user_id, ResourceType.API_CALLS, 500.0, timestamp=last_year)
+        usage_tracker.track_usage(sample_user_id, ResourceType.API_CALLS, 1.0)
+        
+        assert usage_tracker.get_current_usage(sample_user_id, ResourceType.API_CALLS) == 1
+        assert usage_tracker.get_usage_summary(sample_user_id, BillingPeriod.DAILY).api_calls == 1
+        assert len(usage_tracker.get_usage(sample_user_id)) == 2
+    
+    def test_get_usage_date_range(self, usage_tracker, sample_user_id):
+        """Date filters select records by timestamp, inclusive."""
+        base = datetime(2026, 2, 14, tzinfo=timezone.utc)
+        for day in (3, 1, 2):
+            usage_tracker.track_usage(
+                sample_user_id, ResourceType.API_CALLS, 1.0, timestamp=base + timedelta(days=day)
+            )
+        
+        records = usage_tracker.get_usage(
+            sample_user_id,
+            start_date=base + timedelta(days=1),
+            end_date=base + timedelta(days=2),
+        )
+        
+        assert [r.timestamp.day for r in records] == [15, 16]
+
+
+class TestUsageMetering:
+    """Tests for hot-path metering and cached budgets."""
+    
+    def test_meter_counts_without_records(self, usage_tracker, sample_user_id):
+        """Metered usage is counted but creates no records."""
+        for _ in range(20):
+            usage_tracker.meter(sample_user_id, ResourceType.API_CALLS)
+        
+        assert usage_tracker.get_usage(sample_user_id) == []
+        assert usage_tracker.get_current_usage(sample_user_id, ResourceType.API_CALLS) == 20
+        assert usage_tracker.get_usage_summary(sample_user_id).api_calls == 20
+    
+    def test_meter_rollover_keeps_previous_hour(self, usage_tracker, sample_user_id):
+        """Counters metered before an hour boundary land in that hour's bucket."""
+        previous_hour = bucket_start(datetime.now(timezone.utc), Granularity.HOUR) - timedelta(hours=1)
+        usage_tracker._window_start = previous_hour
+        usage_tracker._window_end = (previous_hour + timedelta(hours=1)).timestamp()
+        usage_tracker._local[(sample_user_id, ResourceType.API_CALLS)] = 4.0
+        
+        usage_tracker.meter(sample_user_id, ResourceType.API_CALLS)
+        
+        store = usage_tracker.store
+        assert store.get(sample_user_id, ResourceType.API_CALLS, Granularity.HOUR, previous_hour) == 4
+        assert usage_tracker._local == {(sample_user_id, ResourceType.API_CALLS): 1.0}
+    
+    @pytest.mark.asyncio
+    async def test_budget_staleness_bounded_by_flush_cycles(self, sample_user_id):
+        """Other workers' usage is visible after their flush and our refresh."""
+        redis = FakeRedis()
+        worker_a = UsageTracker(store=UsageStore(backend=RedisUsageBackend(redis)))
+        worker_b = UsageTracker(store=UsageStore(backend=RedisUsageBackend(redis)))
+        check = lambda tracker: tracker.get_current_usage(sample_user_id, ResourceType.API_CALLS)
+        
+        for _ in range(5):
+            worker_a.meter(sample_user_id, ResourceType.API_CALLS)
+        assert check(worker_b) == 0
+        await worker_a.flush()
+        assert check(worker_b) == 0  # stale until worker B's next cycle
+        await worker_b.flush()
+        assert check(worker_b) == 5
+        
+        # Own usage is visible immediately and not double counted after a flush
+        worker_b.meter(sample_user_id, ResourceType.API_CALLS, 2.0)
+        assert check(worker_b) == 7
+        await worker_b.flush()
+        assert check(worker_b) == 7
+        assert check(worker_a) == 5
+    
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_budget_exact(self, sample_user_id):
+        """Unwritten usage still counts toward the cached budget."""
+        redis = FakeRedis()
+        tracker = UsageTracker(store=UsageStore(backend=RedisUsageBackend(redis)))
+        tracker.get_current_usage(sample_user_id, ResourceType.API_CALLS)
+        tracker.meter(sample_user_id, ResourceType.API_CALLS, 3.0)
+        await tracker.flush()
+        
+        redis.fail = True
+        tracker.meter(sample_user_id, ResourceType.API_CALLS, 2.0)
+        with pytest.raises(ConnectionError):
+            await tracker.flush()
+        
+        assert tracker.get_current_usage(sample_user_id, ResourceType.API_CALLS) == 5
+    
+    @pytest.mark.asyncio
+    async def test_background_flush(self, sample_user_id):
+        """The background task flushes on its interval and on stop."""
+        import asyncio
+        
+        redis = FakeRedis()
+        tracker = UsageTracker(
+            store=UsageStore(backend=RedisUsageBackend(redis)),
+            flush_interval=0.01,
+        )
+        tracker.start()
+        tracker.meter(sample_user_id, ResourceType.TEST_EXECUTIONS)
+        await asyncio.sleep(0.05)
+        tracker.meter(sample_user_id, ResourceType.TEST_EXECUTIONS)
+        await tracker.stop()
+        
+        month = bucket_start(datetime.now(timezone.utc), Granularity.MONTH)
+        key = RedisUsageBackend(redis).key(sample_user_id, Granularity.MONTH, month)
+        assert redis.hashes[key] == {"test_executions": 2.0}
+        assert redis.executed >= 2
+        assert not tracker.is_running
+
+
 # ============================================================================
 # ResourceType Tests
 # ============================================================================